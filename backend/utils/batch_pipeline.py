@@ -0,0 +1,638 @@
+"""
+Batch Pipeline
+--------------
+Headless, multi-file runs of the full processing pipeline.
+
+Each upload goes through the nine stages of the GUI pipeline: load, clean
+``.0``, filter empty columns, prioritize phones, owner analysis, Pete
+mapping, standardize, preset save and export. Files are processed
+concurrently in a bounded process pool (``spawn`` workers, so Polars thread
+pools are never forked). Writes to the shared catalog and export log are
+serialized with one lock.
+
+The stages form a DAG (:data:`STAGES`). Each stage declares its inputs and
+the config fields it depends on. Outputs of every stage but the two sinks
+(preset save, export) are cached in Arrow IPC under a key derived from the
+upload's content hash and the configs along the way (see
+:mod:`backend.utils.stage_cache`). A rerun after changing only the export
+columns reads the standardized frame from the cache and runs the export.
+After changing a phone weight it recomputes from prioritization onwards.
+
+A run writes to ``<output_dir>/<run_id>/``:
+
+* ``<file>/pete_export.csv`` (plus ``.xlsx`` / ``.parquet`` if configured)
+  and ``owner_summary.csv``;
+* ``<file>/metrics.json`` – rows, columns, seconds, memory and cache use
+  per stage;
+* ``<file>/pipeline.log`` and ``<file>/<run_id>_<file>.jsonl`` – the
+  worker's console output and its progress events;
+* ``manifest.json`` – config, inputs, per-file status and outputs, totals.
+  It is written when the run starts (status ``running``) and rewritten as
+  files finish.
+
+Example
+-------
+>>> from backend.utils.batch_pipeline import PipelineConfig, run_pipeline_batch
+>>> manifest = run_pipeline_batch(["upload/*.csv"], PipelineConfig.from_file("nightly.json"),
+...                               output_dir="data/pipeline_runs", workers=2)
+>>> manifest["status"], manifest["totals"]["failed"]
+('succeeded', 0)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import re
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from backend.utils.stage_cache import CachedStage, StageCache, file_fingerprint, stage_key
+
+__all__: list[str] = [
+    "EXPORT_FORMATS",
+    "MANIFEST_FILENAME",
+    "PipelineConfig",
+    "STAGES",
+    "Stage",
+    "owner_analysis_input",
+    "resolve_inputs",
+    "run_pipeline_batch",
+    "run_pipeline_file",
+]
+
+MANIFEST_FILENAME = "manifest.json"
+METRICS_FILENAME = "metrics.json"
+EXPORT_FORMATS = ("csv", "xlsx", "parquet")
+INPUT_SUFFIXES = (".csv",)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node of the pipeline DAG.
+
+    Args:
+        name: Stage name (key in metrics and cache entries)
+        step: Progress step name
+        inputs: Names of the stages whose outputs this stage consumes
+        config_keys: PipelineConfig fields the stage's output depends on
+        sink: Writes results only; always runs and is never cached
+    """
+
+    name: str
+    step: str
+    inputs: Tuple[str, ...] = ()
+    config_keys: Tuple[str, ...] = ()
+    sink: bool = False
+
+
+# In run (topological) order
+STAGES = (
+    Stage("load", "Loading Data", (), ("source_profile",)),
+    Stage("clean", "Cleaning Data", ("load",)),
+    Stage("filter", "Filtering Columns", ("clean",), ("empty_column_threshold",)),
+    Stage("prioritize", "Prioritizing Phones", ("filter",), ("max_phones", "phone_prioritization_rules")),
+    Stage("owners", "Analyzing Owners", ("prioritize",)),
+    Stage("map", "Mapping to Pete Headers", ("owners",)),
+    Stage("standardize", "Standardizing Data", ("map",), ("standardization_rules",)),
+    Stage("preset", "Saving Preset", ("load", "owners", "standardize"),
+          ("data_source", "save_preset", "save_owner_objects", "processed_dir", "presets_dir"), sink=True),
+    Stage("export", "Exporting Data", ("owners", "standardize"),
+          ("export_formats", "export_columns", "export_owner_summary"), sink=True),
+)
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+# Serializes catalog / export log writes across workers (set by _init_worker)
+_shared_lock = None
+
+
+@dataclass
+class PipelineConfig:
+    """Settings of a batch run, usually read from a JSON file.
+
+    Args:
+        data_source: Data source recorded in presets (e.g. "REISIFT")
+        source_profile: Source profile for identifier columns ("auto", a name, or None)
+        empty_column_threshold: Columns at least this empty are dropped
+        max_phones: Phones kept per record after prioritization
+        phone_prioritization_rules: Status / type / tag weights (default: built-in rules)
+        standardization_rules: Categorical rule table overrides (see DataStandardizerEnhanced)
+        export_formats: Any of "csv", "xlsx", "parquet"
+        export_columns: Pete columns to export, in order (default: all)
+        export_owner_summary: Also write owner_summary.csv
+        save_owner_objects: Save owner objects as a dataset for the dashboard
+        save_preset: Save a comprehensive preset per file
+        processed_dir: Base directory of saved owner datasets
+        presets_dir: Base directory of presets
+        workers: Default number of worker processes
+        cache_dir: Stage output cache (see backend.utils.stage_cache)
+        cache_max_mb: Cache size kept after a run (least recently used entries go first)
+        cache_max_age_days: Cache entries unused for longer are dropped after a run
+    """
+
+    data_source: str = "REISIFT"
+    source_profile: Optional[str] = "auto"
+    empty_column_threshold: float = 0.9
+    max_phones: int = 5
+    phone_prioritization_rules: Optional[Dict[str, Any]] = None
+    standardization_rules: Optional[Dict[str, Any]] = None
+    export_formats: List[str] = field(default_factory=lambda: ["csv"])
+    export_columns: Optional[List[str]] = None
+    export_owner_summary: bool = True
+    save_owner_objects: bool = True
+    save_preset: bool = True
+    processed_dir: str = "data/processed"
+    presets_dir: str = "data/presets"
+    workers: Optional[int] = None
+    cache_dir: str = "data/cache/pipeline"
+    cache_max_mb: int = 2048
+    cache_max_age_days: float = 14
+
+    def __post_init__(self):
+        unknown = [fmt for fmt in self.export_formats if fmt not in EXPORT_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown export format(s): {', '.join(unknown)} "
+                             f"(formats: {', '.join(EXPORT_FORMATS)})")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PipelineConfig":
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValueError(f"Unknown pipeline config key(s): {', '.join(unknown)}")
+        return cls(**data)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "PipelineConfig":
+        """Config from a JSON file (missing keys keep their defaults)."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def stage_config(self, stage: Stage) -> Dict[str, Any]:
+        """The settings *stage* depends on (part of its cache key)."""
+        return {key: getattr(self, key) for key in stage.config_keys}
+
+    def fingerprint(self) -> str:
+        """Short hash of the settings that change the outputs (workers and cache settings excluded)."""
+        data = {key: value for key, value in self.to_dict().items()
+                if key != 'workers' and not key.startswith('cache_')}
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def resolve_inputs(patterns: Iterable[Union[str, Path]]) -> List[Path]:
+    """Upload files named by *patterns*: files, directories (their CSVs) or globs."""
+    found: Dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.iterdir() if p.suffix.lower() in INPUT_SUFFIXES)
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(Path(p) for p in glob.glob(str(pattern), recursive=True))
+        for match in matches:
+            if match.is_file() and match.suffix.lower() in INPUT_SUFFIXES:
+                found.setdefault(match.resolve(), None)
+    return list(found)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_").lower() or "upload"
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+    os.replace(tmp, path)
+
+
+@contextlib.contextmanager
+def _exclusive():
+    if _shared_lock is None:
+        yield
+    else:
+        with _shared_lock:
+            yield
+
+
+# One file
+
+def owner_analysis_input(df):
+    """*df* with the Seller 1 / Property Address / Property Value columns owner analysis groups by."""
+    df = df.copy()
+    if 'Property Value' not in df.columns:
+        df['Property Value'] = df['Estimated value'] if 'Estimated value' in df.columns else 0.0
+    if 'Property Address' not in df.columns and 'Property address' in df.columns:
+        df['Property Address'] = df['Property address']
+    if 'Seller 1' not in df.columns:
+        if 'First Name' in df.columns and 'Last Name' in df.columns:
+            df['Seller 1'] = (df['First Name'].fillna('') + ' ' + df['Last Name'].fillna('')).str.strip()
+        else:
+            df['Seller 1'] = 'Unknown Owner'
+    return df
+
+
+def _owner_summary_frame(owner_objects):
+    import pandas as pd
+
+    return pd.DataFrame([{
+        'Individual_Name': obj.individual_name,
+        'Business_Name': obj.business_name,
+        'Mailing_Address': obj.mailing_address,
+        'Seller_1': obj.seller1_name,
+        'Skip_Trace_Target': obj.skip_trace_target,
+        'Confidence_Score': obj.confidence_score,
+        'Property_Count': obj.property_count,
+        'Total_Value': obj.total_property_value,
+        'Owner_Type': 'Individual + Business' if obj.is_individual_owner and obj.is_business_owner else
+                      'Individual Only' if obj.is_individual_owner else
+                      'Business Only' if obj.is_business_owner else 'Unknown',
+    } for obj in owner_objects])
+
+
+class _FileRun:
+    """State of one upload's run, handed to the stage functions."""
+
+    def __init__(self, path: Path, config: PipelineConfig, file_dir: Path, name: str, run_id: str,
+                 tracker, cache):
+        from backend.utils.ultra_fast_processor import UltraFastProcessor
+
+        self.path = path
+        self.config = config
+        self.file_dir = file_dir
+        self.name = name
+        self.run_id = run_id
+        self.tracker = tracker
+        self.cache = cache
+        self.processor = UltraFastProcessor()
+        self.processor.tracker = tracker
+        self.outputs: Dict[str, str] = {}
+
+
+def _load(run: _FileRun):
+    frame = run.processor.load_csv_ultra_fast(run.path, profile=run.config.source_profile)
+    profile = run.processor.source_profile
+    return CachedStage(frame, {'source_profile': profile.name if profile else None})
+
+
+def _clean(run: _FileRun, loaded):
+    from backend.utils.source_profiles import cleanup_columns, resolve_profile
+    profile = resolve_profile(loaded.meta.get('source_profile'), loaded.frame.columns)
+    frame = run.processor.clean_trailing_dot_zero_ultra_fast(loaded.frame,
+                                                             columns=cleanup_columns(loaded.frame, profile))
+    return CachedStage(frame)
+
+
+def _filter(run: _FileRun, cleaned):
+    return CachedStage(run.processor.filter_empty_columns_ultra_fast(
+        cleaned.frame, threshold=run.config.empty_column_threshold))
+
+
+def _prioritize(run: _FileRun, filtered):
+    frame, _ = run.processor.prioritize_phones_ultra_fast(
+        filtered.frame, max_phones=run.config.max_phones,
+        prioritization_rules=run.config.phone_prioritization_rules)
+    return CachedStage(frame)
+
+
+def _owners(run: _FileRun, prioritized):
+    frame, owner_objects = run.processor.analyze_owner_objects_ultra_fast(owner_analysis_input(prioritized.frame))
+    return CachedStage(frame, {'owner_objects': len(owner_objects)}, owner_objects)
+
+
+def _map(run: _FileRun, owners):
+    from backend.utils.pete_header_mapper import PeteHeaderMapper
+    mapper = PeteHeaderMapper()
+    mapping = mapper.suggest_mapping(owners.frame)
+    return CachedStage(mapper.create_pete_ready_dataframe(owners.frame, mapping),
+                       {'mapping': mapping, 'mapped_columns': len(mapping)})
+
+
+def _standardize(run: _FileRun, mapped):
+    from backend.utils.data_standardizer_enhanced import DataStandardizerEnhanced
+    standardizer = DataStandardizerEnhanced(run.config.standardization_rules)
+    return CachedStage(standardizer.standardize_dataframe(mapped.frame))
+
+
+def _save_preset(run: _FileRun, loaded, owners, standardized):
+    from backend.utils.owner_persistence_manager import OwnerPersistenceManager
+    from backend.utils.preset_manager import PresetManager
+
+    config = run.config
+    owner_objects = owners.objects or []
+    if owner_objects and config.save_owner_objects:
+        with _exclusive():
+            run.outputs['owner_dataset'] = OwnerPersistenceManager(config.processed_dir).save_owner_objects(
+                owner_objects, f"pipeline_{run.name}", create_backup=False)
+    if config.save_preset:
+        with _exclusive():
+            run.outputs['preset'] = PresetManager(config.presets_dir).save_comprehensive_preset(
+                preset_name=f"pipeline_{run.name}_{run.run_id}",
+                data_source=config.data_source,
+                original_df=loaded.frame,
+                prepared_df=standardized.frame,
+                phone_prioritization_rules=config.phone_prioritization_rules,
+                owner_analysis_results={'owner_objects_count': len(owner_objects)},
+                data_prep_summary={
+                    'tools_used': [stage.name for stage in STAGES],
+                    'data_source': config.data_source,
+                    'original_shape': loaded.frame.shape,
+                    'prepared_shape': standardized.frame.shape,
+                },
+                export_data=standardized.frame,
+                standardization_rules=config.standardization_rules,
+            )
+    return standardized
+
+
+def _export(run: _FileRun, owners, standardized):
+    import polars as pl
+
+    config = run.config
+    frame = standardized.frame
+    if config.export_columns:
+        missing = [column for column in config.export_columns if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Export column(s) not in the Pete data: {', '.join(missing)}")
+        frame = frame[list(config.export_columns)]
+    for fmt in config.export_formats:
+        export_path = run.file_dir / f"pete_export.{fmt}"
+        if fmt == "csv":
+            frame.to_csv(export_path, index=False)
+        elif fmt == "parquet":
+            pl.from_pandas(frame).write_parquet(export_path)
+        else:
+            try:
+                frame.to_excel(export_path, index=False, engine='xlsxwriter')
+            except ImportError:
+                frame.to_excel(export_path, index=False, engine='openpyxl')
+        run.outputs[f"pete_export_{fmt}"] = str(export_path)
+    if owners.objects and config.export_owner_summary:
+        owner_path = run.file_dir / "owner_summary.csv"
+        _owner_summary_frame(owners.objects).to_csv(owner_path, index=False)
+        run.outputs['owner_summary'] = str(owner_path)
+    return CachedStage(frame)
+
+
+_STAGE_FUNCTIONS = {
+    "load": _load, "clean": _clean, "filter": _filter, "prioritize": _prioritize, "owners": _owners,
+    "map": _map, "standardize": _standardize, "preset": _save_preset, "export": _export,
+}
+
+
+def _run_dag(run: _FileRun, fingerprint: str, metrics: Dict[str, Any]):
+    """
+    Run the stage DAG for one upload.
+
+    Sinks always run. Every other stage is looked up in the cache first and
+    only computed (after its inputs) on a miss, so a rerun recomputes from the
+    first stage whose inputs or config changed; stages no computed stage
+    needs are skipped entirely.
+    """
+    keys: Dict[str, str] = {}
+    for stage in STAGES:
+        if not stage.sink:
+            upstream = [keys[name] for name in stage.inputs] or [fingerprint]
+            keys[stage.name] = stage_key(stage.name, upstream, run.config.stage_config(stage))
+    values: Dict[str, Any] = {}
+    stages = metrics['stages']
+
+    def value(name: str):
+        if name in values:
+            return values[name]
+        stage = STAGES_BY_NAME[name]
+        cached = None if stage.sink or run.cache is None else run.cache.get(keys[name])
+        if cached is None:
+            inputs = [value(upstream) for upstream in stage.inputs]
+            total_bytes = 0 if inputs else run.path.stat().st_size
+            run.tracker.start_step(stage.step, len(inputs[-1].frame) if inputs else 0, total_bytes)
+            output = _STAGE_FUNCTIONS[name](run, *inputs)
+            stored = not stage.sink and run.cache is not None and run.cache.put(
+                keys[name], name, output.frame, output.meta, output.objects)
+            run.tracker.end_step(len(output.frame), bytes_processed=total_bytes or None)
+        else:
+            run.tracker.start_step(stage.step)
+            output, stored = cached, True
+            run.tracker.end_step(len(output.frame))
+        stages[name] = {'rows': len(output.frame), 'columns': len(output.frame.columns),
+                        'cached': cached is not None,
+                        **({'cache_key': keys[name], 'stored': stored} if not stage.sink else {}),
+                        **{k: v for k, v in output.meta.items() if isinstance(v, (int, float, str))}}
+        values[name] = output
+        return output
+
+    for stage in STAGES:
+        if stage.sink:
+            value(stage.name)
+    metrics['owners'] = values['owners'].meta.get('owner_objects', 0)
+
+
+def run_pipeline_file(path: Union[str, Path], config: PipelineConfig, run_dir: Union[str, Path],
+                      run_id: str, name: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
+    """Run the pipeline on one upload; returns its metrics (never raises).
+
+    Outputs go to ``<run_dir>/<name>`` (default name: the file stem as a slug).
+    With *use_cache*, unchanged stages are read from ``config.cache_dir``.
+    """
+    import psutil
+
+    from backend.utils.progress_events import ProgressEventBus
+    from backend.utils.progress_tracker import ProgressTracker
+
+    path = Path(path)
+    name = name or _slug(path.stem)
+    file_dir = Path(run_dir) / name
+    file_dir.mkdir(parents=True, exist_ok=True)
+    stat = path.stat()
+    fingerprint = file_fingerprint(path)
+    metrics: Dict[str, Any] = {
+        'run_id': run_id,
+        'input': {'path': str(path), 'size_bytes': stat.st_size, 'sha256': fingerprint,
+                  'mtime': datetime.fromtimestamp(stat.st_mtime).isoformat()},
+        'name': name,
+        'status': "running",
+        'started_at': datetime.now().isoformat(),
+        'pid': os.getpid(),
+        'stages': {},
+        'outputs': {},
+    }
+
+    tracker = ProgressTracker(f"Pipeline: {path.name}")
+    for stage in STAGES:
+        tracker.add_step(stage.step)
+    events = ProgressEventBus(run_id=f"{run_id}_{name}", log_dir=file_dir)
+    events.attach(tracker)
+
+    log_path = file_dir / "pipeline.log"
+    sink = logger.add(log_path, level="INFO", enqueue=False)
+    events.start_run(f"Processing {path.name}")
+    with open(log_path, 'a') as log, contextlib.redirect_stdout(log):
+        try:
+            tracker.start_operation()
+            run = _FileRun(path, config, file_dir, name, run_id, tracker,
+                           StageCache(config.cache_dir) if use_cache else None)
+            _run_dag(run, fingerprint, metrics)
+            metrics['outputs'] = run.outputs
+            tracker.end_operation()
+            metrics['status'] = "succeeded"
+            events.finish_run(True, f"Pipeline completed: {path.name}")
+        except Exception as e:
+            tracker.fail_step(str(e))
+            metrics['status'] = "failed"
+            metrics['error'] = {'type': type(e).__name__, 'message': str(e),
+                                'traceback': traceback.format_exc(limit=8)}
+            events.finish_run(False, f"Pipeline failed: {e}")
+            logger.error(f"❌ Pipeline failed for {path.name}: {e}")
+    logger.remove(sink)
+
+    # Stage timings come from the progress steps; stages nothing needed were skipped
+    for stage in STAGES:
+        step = next(s for s in tracker.steps if s.name == stage.step)
+        entry = metrics['stages'].setdefault(stage.name, {})
+        if step.duration is not None:
+            entry.update(seconds=round(step.duration, 3), memory_mb=round(step.memory_usage_mb, 1),
+                         status=step.status)
+        else:
+            entry.setdefault('status', "skipped")
+            entry.setdefault('cached', False)
+    metrics['stages'] = {stage.name: metrics['stages'][stage.name] for stage in STAGES}
+    metrics['cache'] = {
+        'enabled': use_cache,
+        'hits': sum(bool(entry.get('cached')) for entry in metrics['stages'].values()),
+        'skipped': sum(entry.get('status') == "skipped" for entry in metrics['stages'].values()),
+    }
+    metrics['finished_at'] = datetime.now().isoformat()
+    metrics['seconds'] = round(sum(stage.get('seconds', 0) for stage in metrics['stages'].values()), 3)
+    metrics['rows_in'] = metrics['stages'].get('load', {}).get('rows', 0)
+    metrics['rows_out'] = metrics['stages'].get('export', {}).get('rows', 0)
+    metrics['peak_rss_mb'] = round(psutil.Process().memory_info().rss / 1024 ** 2, 1)
+    metrics['outputs']['metrics'] = str(file_dir / METRICS_FILENAME)
+    metrics['outputs']['log'] = str(log_path)
+    _write_json(file_dir / METRICS_FILENAME, metrics)
+    return metrics
+
+
+# Batch
+
+def _init_worker(lock):
+    """Pool initializer: share the write lock; the parent console stays readable."""
+    global _shared_lock
+    _shared_lock = lock
+    logger.remove()
+
+
+def _manifest_totals(files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'files': len(files),
+        'succeeded': sum(f['status'] == "succeeded" for f in files),
+        'failed': sum(f['status'] == "failed" for f in files),
+        'rows_in': sum(f.get('rows_in', 0) for f in files),
+        'rows_out': sum(f.get('rows_out', 0) for f in files),
+        'owners': sum(f.get('owners', 0) for f in files),
+        'cache_hits': sum(f.get('cache', {}).get('hits', 0) for f in files),
+    }
+
+
+def run_pipeline_batch(inputs: Iterable[Union[str, Path]], config: Optional[PipelineConfig] = None,
+                       output_dir: Union[str, Path] = "data/pipeline_runs", workers: Optional[int] = None,
+                       run_id: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Run the pipeline on every upload named by *inputs*.
+
+    Args:
+        inputs: Files, directories or glob patterns (see resolve_inputs)
+        config: Pipeline settings (default: PipelineConfig())
+        output_dir: Directory receiving one sub-directory per run
+        workers: Worker processes (default: config.workers, else up to 4 by CPU count);
+            1 runs the files one by one in this process
+        run_id: Run identifier (default: timestamp plus a short random suffix)
+        use_cache: Reuse and store stage outputs in config.cache_dir; the cache is
+            evicted down to config.cache_max_mb / cache_max_age_days afterwards
+
+    Returns:
+        The run manifest (also written to <output_dir>/<run_id>/manifest.json)
+    """
+    config = config or PipelineConfig()
+    files = resolve_inputs(inputs)
+    if not files:
+        raise FileNotFoundError(f"No CSV uploads match: {', '.join(map(str, inputs))}")
+    names: Dict[Path, str] = {}
+    for path in files:  # same stem in two directories: suffix the later ones
+        name = _slug(path.stem)
+        names[path] = name if name not in names.values() else f"{name}_{len(names)}"
+    workers = max(1, min(workers or config.workers or min(4, os.cpu_count() or 1), len(files)))
+    run_id = run_id or f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{uuid.uuid4().hex[:6]}"
+    run_dir = Path(output_dir) / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest: Dict[str, Any] = {
+        'run_id': run_id,
+        'status': "running",
+        'started_at': datetime.now().isoformat(),
+        'host': platform.node(),
+        'workers': workers,
+        'config': config.to_dict(),
+        'config_hash': config.fingerprint(),
+        'inputs': [str(path) for path in files],
+        'files': [],
+    }
+    manifest_path = run_dir / MANIFEST_FILENAME
+    _write_json(manifest_path, manifest)
+    logger.info(f"🚀 Pipeline run {run_id}: {len(files)} file(s), {workers} worker(s) → {run_dir}")
+
+    def finished(metrics: Dict[str, Any]):
+        manifest['files'].append(metrics)
+        manifest['totals'] = _manifest_totals(manifest['files'])
+        _write_json(manifest_path, manifest)
+        icon = "✅" if metrics['status'] == "succeeded" else "❌"
+        logger.info(f"{icon} {Path(metrics['input']['path']).name}: {metrics['status']} "
+                    f"({metrics.get('rows_out', 0):,} rows, {metrics.get('seconds', 0):.1f}s)")
+
+    if workers == 1:
+        for path in files:
+            finished(run_pipeline_file(path, config, run_dir, run_id, names[path], use_cache))
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(context.Lock(),)) as pool:
+            futures = {pool.submit(run_pipeline_file, path, config, run_dir, run_id, names[path], use_cache): path
+                       for path in files}
+            for future in as_completed(futures):
+                try:
+                    finished(future.result())
+                except Exception as e:  # the worker itself died (e.g. killed for memory)
+                    path = futures[future]
+                    finished({'input': {'path': str(path)}, 'name': names[path], 'status': "failed",
+                              'error': {'type': type(e).__name__, 'message': str(e)}})
+
+    if use_cache:
+        manifest['cache'] = {'dir': config.cache_dir, **StageCache(config.cache_dir).evict(
+            max_bytes=config.cache_max_mb * 1024 ** 2, max_age_days=config.cache_max_age_days)}
+    else:
+        manifest['cache'] = {'dir': None}
+    manifest['files'].sort(key=lambda f: f['input']['path'])
+    manifest['totals'] = _manifest_totals(manifest['files'])
+    manifest['status'] = "failed" if manifest['totals']['failed'] else "succeeded"
+    manifest['finished_at'] = datetime.now().isoformat()
+    manifest['seconds'] = round((datetime.fromisoformat(manifest['finished_at'])
+                                 - datetime.fromisoformat(manifest['started_at'])).total_seconds(), 3)
+    _write_json(manifest_path, manifest)
+    logger.info(f"🏁 Pipeline run {run_id} {manifest['status']}: "
+                f"{manifest['totals']['succeeded']}/{len(files)} file(s) in {manifest['seconds']:.1f}s")
+    return manifest
@@ -0,0 +1,487 @@
+"""
+Catalog
+-------
+SQLite index of saved datasets, presets, export logs and users.
+
+The persistence, preset and user managers keep their data as directories
+of JSON files.  Listing them used to mean scanning the directories and
+parsing every ``metadata.json`` on each call, several times per dashboard
+render.  :class:`Catalog` keeps one row per record in a local SQLite file
+(stdlib :mod:`sqlite3`):
+
+* the managers write their rows in one transaction when they save, after
+  the files themselves are written;
+* rows are keyed by the manager's resolved base directory (its *root*), so
+  managers with different base directories share a catalog file safely;
+* for every root the catalog remembers the modification time of each
+  source (a directory or ``export_log.json``); a directory's is the latest
+  of its own and its records' (``<entry>/metadata.json`` or the entry
+  file), because rewriting a file in place does not touch the directory.
+  Records written without the catalog (older versions, copied directories,
+  edited metadata) are picked up by rescanning a source when its
+  modification time changes;
+* :meth:`Catalog.dashboard` returns everything the user dashboard shows in
+  a single query.
+
+Example
+-------
+>>> from backend.utils.catalog import Catalog
+>>> catalog = Catalog("data/catalog.sqlite")
+>>> catalog.sync_presets("data/presets", "data/presets/saved_presets")
+>>> catalog.presets("data/presets", data_source="REISIFT", limit=5)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from loguru import logger
+
+__all__: list[str] = [
+    "CATALOG_FILENAME",
+    "Catalog",
+    "catalog_for",
+    "preset_record",
+]
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+PathLike = Union[str, Path]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    saved_at TEXT,
+    record_count INTEGER,
+    metadata TEXT NOT NULL,
+    summary TEXT,
+    PRIMARY KEY (root, kind, name)
+);
+CREATE INDEX IF NOT EXISTS idx_datasets_saved ON datasets (root, kind, saved_at);
+
+CREATE TABLE IF NOT EXISTS presets (
+    root TEXT NOT NULL,
+    preset_id TEXT NOT NULL,
+    preset_name TEXT,
+    data_source TEXT,
+    user_id TEXT,
+    created_at TEXT,
+    record TEXT NOT NULL,
+    dashboard TEXT,
+    PRIMARY KEY (root, preset_id)
+);
+CREATE INDEX IF NOT EXISTS idx_presets_created ON presets (root, created_at);
+CREATE INDEX IF NOT EXISTS idx_presets_user ON presets (root, user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_presets_source ON presets (root, data_source, created_at);
+
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY,
+    root TEXT NOT NULL,
+    preset_id TEXT,
+    data_source TEXT,
+    user_id TEXT,
+    timestamp TEXT,
+    export_records INTEGER,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_exports_timestamp ON exports (root, timestamp);
+CREATE INDEX IF NOT EXISTS idx_exports_user ON exports (root, user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_exports_source ON exports (root, data_source, timestamp);
+
+CREATE TABLE IF NOT EXISTS users (
+    root TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    company_id TEXT,
+    name TEXT,
+    role TEXT,
+    last_login TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (root, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_users_company ON users (root, company_id);
+
+CREATE TABLE IF NOT EXISTS sources (
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    mtime INTEGER,
+    PRIMARY KEY (root, kind)
+);
+"""
+
+# Everything the user dashboard shows, as one row of JSON values
+_DASHBOARD_QUERY = """
+SELECT
+    (SELECT record FROM users WHERE root = :users_root AND user_id = :user_id) AS user,
+    (SELECT count(*) FROM presets
+        WHERE root = :presets_root AND (user_id = :user_id OR instr(preset_name, :user_id) > 0)
+    ) AS user_preset_count,
+    (SELECT json_group_array(json(record)) FROM (
+        SELECT record FROM presets
+        WHERE root = :presets_root AND (user_id = :user_id OR instr(preset_name, :user_id) > 0)
+        ORDER BY created_at DESC LIMIT :recent)
+    ) AS user_presets,
+    (SELECT json_object('record', json(record), 'dashboard', json(coalesce(dashboard, '{}')))
+        FROM presets WHERE root = :presets_root ORDER BY created_at DESC LIMIT 1
+    ) AS latest_preset,
+    (SELECT json_group_array(json(entry)) FROM (
+        SELECT entry FROM exports WHERE root = :presets_root
+        ORDER BY timestamp DESC, id DESC LIMIT :recent)
+    ) AS recent_exports,
+    (SELECT json_object('name', name, 'saved_at', saved_at, 'summary', json(summary))
+        FROM datasets WHERE root = :datasets_root AND kind = 'owner_objects'
+        ORDER BY saved_at DESC LIMIT 1
+    ) AS latest_owner_dataset,
+    (SELECT json_group_object(root || '|' || kind, mtime) FROM sources
+        WHERE root IN (:users_root, :presets_root, :datasets_root)
+    ) AS source_mtimes
+"""
+
+_initialized: set = set()
+_init_lock = threading.Lock()
+
+
+def _root(root: PathLike) -> str:
+    return str(Path(root).resolve())
+
+
+def _mtime(path: Path) -> Optional[int]:
+    # Nanoseconds: integers survive the JSON of the dashboard query exactly
+    try:
+        mtime = path.stat().st_mtime_ns
+        if not path.is_dir():
+            return mtime
+        with os.scandir(path) as entries:
+            for entry in entries:
+                record = os.path.join(entry.path, "metadata.json") if entry.is_dir() else entry.path
+                try:
+                    mtime = max(mtime, os.stat(record).st_mtime_ns)
+                except OSError:
+                    pass  # a directory without metadata is not a record
+        return mtime
+    except OSError:
+        return None
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skipping unreadable catalog source {path}: {e}")
+        return None
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, default=str)
+
+
+def catalog_for(base_dir: PathLike) -> "Catalog":
+    """The catalog shared by the managers under *base_dir*'s parent directory
+    (``data/catalog.sqlite`` for the default ``data/...`` base directories)."""
+    return Catalog(Path(base_dir).parent / CATALOG_FILENAME)
+
+
+class Catalog:
+    """Index of datasets, presets, export logs and users in one SQLite file."""
+
+    def __init__(self, path: PathLike):
+        """
+        Args:
+            path: SQLite file (created with its tables on first use)
+        """
+        self.path = Path(path)
+        key = str(self.path.resolve())
+        with _init_lock:
+            if key not in _initialized or not self.path.exists():
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self._connect() as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                _initialized.add(key)
+
+    # Connections
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection in a write transaction: committed on success, rolled back on error."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Any = ()) -> List[sqlite3.Row]:
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    # Writes (each takes the connection of an open transaction)
+
+    @staticmethod
+    def put_dataset(conn: sqlite3.Connection, root: PathLike, kind: str, name: str,
+                    metadata: Dict[str, Any], summary: Optional[Dict[str, Any]] = None):
+        record_count = metadata.get('total_owners', metadata.get('total_rows'))
+        conn.execute(
+            "INSERT OR REPLACE INTO datasets (root, kind, name, saved_at, record_count, metadata, summary)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_root(root), kind, name, metadata.get('saved_at'), record_count, _dumps(metadata), _dumps(summary)),
+        )
+
+    @staticmethod
+    def put_preset(conn: sqlite3.Connection, root: PathLike, record: Dict[str, Any],
+                   user_id: Optional[str] = None, dashboard: Optional[Dict[str, Any]] = None):
+        conn.execute(
+            "INSERT OR REPLACE INTO presets"
+            " (root, preset_id, preset_name, data_source, user_id, created_at, record, dashboard)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (_root(root), record['preset_id'], record.get('preset_name'), record.get('data_source'),
+             user_id, record.get('created_at'), _dumps(record), _dumps(dashboard)),
+        )
+
+    @staticmethod
+    def add_export(conn: sqlite3.Connection, root: PathLike, entry: Dict[str, Any],
+                   user_id: Optional[str] = None):
+        conn.execute(
+            "INSERT INTO exports (root, preset_id, data_source, user_id, timestamp, export_records, entry)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_root(root), entry.get('preset_id'), entry.get('data_source'), user_id,
+             entry.get('timestamp'), entry.get('export_records', 0), _dumps(entry)),
+        )
+
+    @staticmethod
+    def put_user(conn: sqlite3.Connection, root: PathLike, record: Dict[str, Any]):
+        conn.execute(
+            "INSERT OR REPLACE INTO users (root, user_id, company_id, name, role, last_login, record)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_root(root), record['user_id'], record.get('company_id'), record.get('name'),
+             record.get('role'), record.get('last_login'), _dumps(record)),
+        )
+
+    @staticmethod
+    def mark_synced(conn: sqlite3.Connection, root: PathLike, kind: str, source: Path):
+        """Record the current modification time of a source written along with its rows."""
+        conn.execute("INSERT OR REPLACE INTO sources (root, kind, mtime) VALUES (?, ?, ?)",
+                     (_root(root), kind, _mtime(source)))
+
+    # Syncing with the files
+
+    def _synced_mtime(self, root: str, kind: str) -> Optional[int]:
+        rows = self._query("SELECT mtime FROM sources WHERE root = ? AND kind = ?", (root, kind))
+        return rows[0]['mtime'] if rows else None
+
+    def _needs_sync(self, root: str, kind: str, source: Path, synced: Any = ...) -> bool:
+        if synced is ...:
+            synced = self._synced_mtime(root, kind)
+        current = _mtime(source)
+        return synced is None or current != synced
+
+    def sync_datasets(self, root: PathLike, kind: str, force: bool = False,
+                      synced: Any = ...) -> bool:
+        """Rescan ``<root>/<kind>/*/metadata.json`` if the directory changed. Returns True if rescanned."""
+        root_key = _root(root)
+        directory = Path(root) / kind
+        if not force and not self._needs_sync(root_key, f"datasets:{kind}", directory, synced):
+            return False
+
+        from backend.utils.owner_summary import read_owner_summary
+
+        records = []
+        if directory.exists():
+            for dataset_dir in directory.iterdir():
+                metadata_path = dataset_dir / "metadata.json"
+                if dataset_dir.is_dir() and metadata_path.exists():
+                    metadata = _read_json(metadata_path)
+                    if metadata is not None:
+                        summary = read_owner_summary(dataset_dir) if kind == "owner_objects" else None
+                        records.append((dataset_dir.name, metadata, summary))
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM datasets WHERE root = ? AND kind = ?", (root_key, kind))
+            for name, metadata, summary in records:
+                self.put_dataset(conn, root, kind, name, metadata, summary)
+            self.mark_synced(conn, root, f"datasets:{kind}", directory)
+        logger.debug(f"Catalog: indexed {len(records)} {kind} datasets under {root_key}")
+        return True
+
+    def sync_presets(self, root: PathLike, presets_dir: PathLike, force: bool = False,
+                     synced: Any = ...) -> bool:
+        """Rescan ``<presets_dir>/*/metadata.json`` if the directory changed. Returns True if rescanned."""
+        root_key = _root(root)
+        presets_dir = Path(presets_dir)
+        if not force and not self._needs_sync(root_key, "presets", presets_dir, synced):
+            return False
+
+        existing = {row['preset_id']: row for row in self._query(
+            "SELECT preset_id, user_id, dashboard FROM presets WHERE root = ?", (root_key,))}
+        records = []
+        if presets_dir.exists():
+            for preset_dir in presets_dir.iterdir():
+                metadata_file = preset_dir / "metadata.json"
+                if preset_dir.is_dir() and metadata_file.exists():
+                    metadata = _read_json(metadata_file)
+                    if metadata is not None and 'preset_id' in metadata:
+                        records.append(preset_record(metadata))
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM presets WHERE root = ?", (root_key,))
+            for record in records:
+                # Keep what only the catalog knows about presets it indexed before
+                known = existing.get(record['preset_id'])
+                dashboard = json.loads(known['dashboard']) if known and known['dashboard'] else None
+                self.put_preset(conn, root, record, known['user_id'] if known else None, dashboard)
+            self.mark_synced(conn, root, "presets", presets_dir)
+        logger.debug(f"Catalog: indexed {len(records)} presets under {root_key}")
+        return True
+
+    def sync_exports(self, root: PathLike, log_file: PathLike, force: bool = False,
+                     synced: Any = ...) -> bool:
+        """Reload the export log entries if ``export_log.json`` changed. Returns True if reloaded."""
+        root_key = _root(root)
+        log_file = Path(log_file)
+        if not force and not self._needs_sync(root_key, "exports", log_file, synced):
+            return False
+
+        log_data = _read_json(log_file) if log_file.exists() else None
+        entries = (log_data or {}).get('exports', [])
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM exports WHERE root = ?", (root_key,))
+            for entry in entries:
+                self.add_export(conn, root, entry)
+            self.mark_synced(conn, root, "exports", log_file)
+        return True
+
+    def sync_users(self, root: PathLike, users_dir: PathLike, force: bool = False,
+                   synced: Any = ...) -> bool:
+        """Rescan ``<users_dir>/*.json`` if the directory changed. Returns True if rescanned."""
+        root_key = _root(root)
+        users_dir = Path(users_dir)
+        if not force and not self._needs_sync(root_key, "users", users_dir, synced):
+            return False
+
+        records = [record for record in (_read_json(path) for path in sorted(users_dir.glob("*.json")))
+                   if record is not None and 'user_id' in record]
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM users WHERE root = ?", (root_key,))
+            for record in records:
+                self.put_user(conn, root, record)
+            self.mark_synced(conn, root, "users", users_dir)
+        return True
+
+    # Queries
+
+    def datasets(self, root: PathLike, kind: Optional[str] = None) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """``(kind, name, metadata)`` of the datasets under *root*, newest first."""
+        sql = "SELECT kind, name, metadata FROM datasets WHERE root = ?"
+        params: List[Any] = [_root(root)]
+        if kind is not None:
+            sql += " AND kind = ?"
+            params.append(kind)
+        rows = self._query(sql + " ORDER BY saved_at DESC", params)
+        return [(row['kind'], row['name'], json.loads(row['metadata'])) for row in rows]
+
+    def latest_dataset(self, root: PathLike, kind: str) -> Optional[str]:
+        rows = self._query("SELECT name FROM datasets WHERE root = ? AND kind = ?"
+                           " ORDER BY saved_at DESC LIMIT 1", (_root(root), kind))
+        return rows[0]['name'] if rows else None
+
+    def presets(self, root: PathLike, user_id: Optional[str] = None, data_source: Optional[str] = None,
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Preset records under *root*, newest first."""
+        sql = "SELECT record FROM presets WHERE root = ?"
+        params: List[Any] = [_root(root)]
+        if user_id is not None:
+            sql += " AND (user_id = ? OR instr(preset_name, ?) > 0)"
+            params += [user_id, user_id]
+        if data_source is not None:
+            sql += " AND data_source = ?"
+            params.append(data_source)
+        sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row['record']) for row in self._query(sql, params)]
+
+    def exports(self, root: PathLike, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Export log entries under *root*, oldest first (the last *limit* ones if given)."""
+        sql = "SELECT entry FROM exports WHERE root = ? ORDER BY timestamp DESC, id DESC"
+        params: List[Any] = [_root(root)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row['entry']) for row in reversed(self._query(sql, params))]
+
+    def dashboard(self, user_id: str, users_root: PathLike, presets_root: PathLike,
+                  datasets_root: PathLike, recent: int = 5) -> Dict[str, Any]:
+        """User dashboard data in one query.
+
+        Returns the user record, the user's preset count and most recent
+        presets, the latest preset (with its dashboard summary), the most
+        recent export log entries (oldest first) and the latest owner
+        dataset with its summary.  Includes ``source_mtimes`` so the caller
+        can check the rows are current (see :meth:`refresh_dashboard`).
+        """
+        params = {
+            'user_id': user_id, 'recent': recent, 'users_root': _root(users_root),
+            'presets_root': _root(presets_root), 'datasets_root': _root(datasets_root),
+        }
+        row = self._query(_DASHBOARD_QUERY, params)[0]
+        decode = lambda value, default: json.loads(value) if value is not None else default
+        return {
+            'user': decode(row['user'], None),
+            'user_preset_count': row['user_preset_count'],
+            'user_presets': decode(row['user_presets'], []),
+            'latest_preset': decode(row['latest_preset'], None),
+            'recent_exports': list(reversed(decode(row['recent_exports'], []))),
+            'latest_owner_dataset': decode(row['latest_owner_dataset'], None),
+            'source_mtimes': decode(row['source_mtimes'], {}),
+        }
+
+    def refresh_dashboard(self, user_id: str, users_root: PathLike, users_dir: PathLike,
+                          presets_root: PathLike, presets_dir: PathLike, log_file: PathLike,
+                          datasets_root: PathLike, recent: int = 5) -> Dict[str, Any]:
+        """:meth:`dashboard`, rescanning first any source that changed since it was indexed.
+
+        When nothing changed (the usual case) this is the one query plus a
+        ``stat`` per source.
+        """
+        data = self.dashboard(user_id, users_root, presets_root, datasets_root, recent)
+        synced = data['source_mtimes']
+        mtime = lambda root, kind: synced.get(f"{_root(root)}|{kind}")
+        rescanned = [
+            self.sync_users(users_root, users_dir, synced=mtime(users_root, "users")),
+            self.sync_presets(presets_root, presets_dir, synced=mtime(presets_root, "presets")),
+            self.sync_exports(presets_root, log_file, synced=mtime(presets_root, "exports")),
+            self.sync_datasets(datasets_root, "owner_objects",
+                               synced=mtime(datasets_root, "datasets:owner_objects")),
+        ]
+        if any(rescanned):
+            data = self.dashboard(user_id, users_root, presets_root, datasets_root, recent)
+        return data
+
+
+def preset_record(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of a preset's ``metadata.json`` that preset listings show."""
+    return {
+        'preset_id': metadata['preset_id'],
+        'preset_name': metadata['preset_name'],
+        'data_source': metadata['data_source'],
+        'created_at': metadata['created_at'],
+        'summary': metadata['summary'],
+    }
@@ -0,0 +1,405 @@
+"""
+Column Content Classifier
+-------------------------
+Classify upload columns by their *values* rather than their names, so a
+vendor export with headers like ``Col17`` can still be mapped.
+
+Each column is reduced to a bounded random sample of non-empty values:
+
+* files and Polars frames are thinned to at most ``max_cells // n_columns``
+  rows spread over the whole source: long CSV files are read as a set of
+  random byte ranges (their row count is estimated from the first bytes,
+  not counted), Polars frames by random row position.  The rows are then
+  sampled with a bottom-k reservoir (every row gets a random key, the *k*
+  smallest keys per column are kept), so memory and read time stay bounded
+  regardless of file size.  Columns are sampled in batches, checking the
+  time budget between batches, and the columns sampled before it ran out
+  are classified;
+* in-memory pandas frames sample random row positions first and only
+  render those rows as text.
+
+All sampled values are then scored at once with vectorized regexes and
+length/cardinality statistics.  The detected label and its confidence feed
+:meth:`DataStandardizer.propose_mapping` and the mapping UI.
+
+Labels: ``phone``, ``email``, ``street_address``, ``zip``, ``currency``,
+``date``, ``person_name`` and ``business_name``.
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from loguru import logger
+
+from backend.utils.mapping_executor import as_text
+
+__all__: list[str] = [
+    "ColumnClassification",
+    "LABELS",
+    "CONTENT_HEADER_KEYWORDS",
+    "sample_column_values",
+    "classify_samples",
+    "classify_columns",
+    "suggest_header",
+]
+
+LABELS = (
+    "phone",
+    "email",
+    "street_address",
+    "zip",
+    "currency",
+    "date",
+    "person_name",
+    "business_name",
+)
+
+# Pete header keywords each label may map to, in preference order
+CONTENT_HEADER_KEYWORDS: Dict[str, tuple] = {
+    "phone": ("phone",),
+    "email": ("email",),
+    "street_address": ("address",),
+    "zip": ("zip",),
+    "currency": ("value", "price", "amount", "equity"),
+    "date": ("date",),
+    "person_name": ("seller", "owner", "name"),
+    "business_name": ("seller", "owner", "company", "name"),
+}
+
+DEFAULT_SAMPLE_SIZE = 200
+DEFAULT_MAX_CELLS = 5_000_000  # rows sampled = max_cells // number of columns
+DEFAULT_TIME_BUDGET = 2.0  # seconds
+ESTIMATE_BYTES = 1 << 20  # CSV head read to estimate the row count
+SAMPLE_CHUNKS = 64  # byte ranges read from a CSV too long to parse in full
+COLUMN_BATCH = 50  # columns sampled per select; the time budget is checked between batches
+SAMPLE_KEY = "__sample_key"
+MIN_CONFIDENCE = 0.5
+
+PHONE_RE = r"^\+?1?[\s.\-]?\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}$"
+EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[A-Za-z]{2,}$"
+ZIP_RE = r"^\d{5}(-\d{4})?$"
+STREET_RE = (
+    r"(?i)^(\d+[a-z]?\s+(?:[nsew]\.?\s+)?(?:[a-z0-9.'\-]+\s+)*?"
+    r"(st|street|ave|avenue|rd|road|dr|drive|ln|lane|blvd|boulevard|ct|court|cir|circle|"
+    r"way|pl|place|pkwy|parkway|ter|terrace|hwy|highway|trl|trail|loop|sq|square|run|"
+    r"row|pass|path|xing|crossing)\b|p\.?\s?o\.?\s+box\s+\d+)"
+)
+HOUSE_NUMBER_RE = r"(?i)^\d+[a-z]?\s+[a-z]"
+CURRENCY_RE = (
+    r"^(\$\s?-?\d[\d,]*(\.\d{1,2})?|-?\$\s?\d[\d,]*(\.\d{1,2})?"
+    r"|-?\d{1,3}(,\d{3})+(\.\d{1,2})?|-?\d+\.\d{2})$"
+)
+DATE_RE = (
+    r"(?i)^(\d{1,2}[/\-.]\d{1,2}[/\-.](\d{4}|\d{2})"
+    r"|\d{4}-\d{1,2}-\d{1,2}([ T]\d{1,2}:\d{2}(:\d{2}(\.\d+)?)?)?"
+    r"|(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})$"
+)
+BUSINESS_RE = (
+    r"(?i)\b(llc|l\.l\.c|inc|incorporated|corp|corporation|company|co|ltd|lp|llp|pllc|"
+    r"trust|trustees?|bank|holdings|properties|investments?|partners|partnership|group|"
+    r"church|ministries|association|assn|estate|enterprises|capital|realty|homes|"
+    r"ventures|fund|foundation|authority)\b"
+)
+NAME_RE = r"^[A-Za-z][A-Za-z'\-.]*(,?\s+[A-Za-z][A-Za-z'\-.]*){0,3}$"
+
+SourceLike = Union[str, Path, pd.DataFrame, pl.DataFrame, pl.LazyFrame]
+
+
+@dataclass
+class ColumnClassification:
+    """Content-based classification of one column."""
+
+    column: str
+    label: Optional[str]
+    confidence: float
+    scores: Dict[str, float] = field(default_factory=dict)
+    sample_size: int = 0
+    distinct_ratio: float = 0.0
+    min_length: int = 0
+    max_length: int = 0
+    reason: str = ""
+
+    def describe(self) -> str:
+        """Short text for the mapping UI, e.g. ``phone (92%)``."""
+        if self.label is None:
+            return self.reason or "unknown"
+        return f"{self.label} ({self.confidence:.0%})"
+
+
+def _scan_rows(n_columns: int, max_cells: int) -> int:
+    return max(1_000, max_cells // max(n_columns, 1))
+
+
+def _estimate_rows(path: Path) -> int:
+    """Estimate the data rows of a CSV file from the line density of its head."""
+    size = path.stat().st_size
+    with path.open("rb") as handle:
+        head = handle.read(ESTIMATE_BYTES)
+    lines = head.count(b"\n")
+    if len(head) >= size:
+        return max(lines - 1, 0)  # the whole file was read
+    return int(size * max(lines, 1) / len(head))
+
+
+def _with_sample_key(frame: pl.DataFrame, seed: int) -> pl.DataFrame:
+    return frame.with_row_index(SAMPLE_KEY).with_columns(pl.col(SAMPLE_KEY).hash(seed))
+
+
+def _read_csv_sample(path: Path, scan_rows: int, seed: int) -> pl.DataFrame:
+    """Read about *scan_rows* rows of a CSV file as text, spread over the whole file.
+
+    Files estimated to hold more rows than that are not parsed in full:
+    ``SAMPLE_CHUNKS`` byte ranges at seeded random offsets are read, cut to
+    whole lines and parsed behind the header line, so the bytes read are
+    bounded by the sample, not the file.  A range starting inside a quoted
+    multi-line value can yield a malformed row; for a content sample that is
+    acceptable.
+    """
+    n_rows = _estimate_rows(path)
+    if n_rows <= scan_rows:
+        return pl.read_csv(path, n_rows=scan_rows, infer_schema=False, ignore_errors=True)
+
+    size = path.stat().st_size
+    rng = np.random.default_rng(seed)
+    with path.open("rb") as handle:
+        parts = [handle.readline()]
+        body_start = handle.tell()
+        chunk_bytes = max(1, int(scan_rows * size / n_rows) // SAMPLE_CHUNKS)
+        stride = (size - body_start) / SAMPLE_CHUNKS
+        for i in range(SAMPLE_CHUNKS):
+            offset = body_start + int(i * stride + rng.random() * max(stride - chunk_bytes, 0))
+            handle.seek(offset)
+            data = handle.read(chunk_bytes)
+            if offset > body_start:
+                data = data[data.find(b"\n") + 1:]  # skip the partial first line
+            parts.append(data[:data.rfind(b"\n") + 1])
+    return pl.read_csv(io.BytesIO(b"".join(parts)), n_rows=scan_rows, infer_schema=False,
+                       ignore_errors=True, truncate_ragged_lines=True)
+
+
+def _text_sample(source: SourceLike, max_cells: int, seed: int) -> pl.DataFrame:
+    """Return at most ``max_cells // n_columns`` rows of *source* as Utf8
+    columns plus a random per-row sample key.
+
+    The rows are spread over the whole source instead of being its head:
+    CSV files are sampled by byte range (see :func:`_read_csv_sample`) and
+    Polars frames by random row position, so the work done is bounded by the
+    sample size, never by the size of the source.  Excel files cannot be
+    read partially except from the top, and lazy frames have no cheap row
+    count; only their first rows are read.
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.suffix.lower() in (".xls", ".xlsx"):
+            n_columns = len(pd.read_excel(path, nrows=0).columns)
+            frame = pl.from_pandas(pd.read_excel(path, nrows=_scan_rows(n_columns, max_cells), dtype=str))
+        else:
+            n_columns = len(pl.read_csv(path, n_rows=0, infer_schema=False).columns)
+            frame = _read_csv_sample(path, _scan_rows(n_columns, max_cells), seed)
+    elif isinstance(source, pl.DataFrame):
+        scan_rows = _scan_rows(source.width, max_cells)
+        frame = source.sample(scan_rows, seed=seed) if source.height > scan_rows else source
+    else:
+        lazy = source.lazy()
+        frame = lazy.head(_scan_rows(len(lazy.collect_schema()), max_cells)).collect()
+    return _with_sample_key(frame.select(pl.all().cast(pl.Utf8)), seed)
+
+
+def _sample_frame(frame: pl.DataFrame, sample_size: int, deadline: float) -> Dict[str, List[str]]:
+    """Bottom-k reservoir sample of non-empty values per column, in column batches."""
+    columns = [col for col in frame.columns if col != SAMPLE_KEY]
+    key = pl.col(SAMPLE_KEY)
+
+    samples: Dict[str, List[str]] = {}
+    for start in range(0, len(columns), COLUMN_BATCH):
+        if time.perf_counter() > deadline:
+            break  # remaining columns are reported as over budget
+        batch = columns[start:start + COLUMN_BATCH]
+        exprs = []
+        for i, col in enumerate(batch):
+            value = pl.col(col).str.strip_chars()
+            keep = value.is_not_null() & (value.str.len_bytes() > 0)
+            exprs.append(value.filter(keep).bottom_k_by(key.filter(keep), sample_size).implode().alias(f"_c{i}"))
+        row = frame.select(exprs).row(0)
+        samples.update((col, list(values or [])) for col, values in zip(batch, row))
+    return samples
+
+
+def _sample_pandas(df: pd.DataFrame, sample_size: int, seed: int,
+                   deadline: float) -> Dict[str, List[str]]:
+    """Sample random rows of an in-memory frame and render only those as text."""
+    n_rows = len(df)
+    take = min(n_rows, sample_size * 5)  # oversample so sparse columns keep enough values
+    rng = np.random.default_rng(seed)
+    positions = np.sort(rng.choice(n_rows, size=take, replace=False)) if take else np.array([], dtype=int)
+    rows = df.iloc[positions]
+
+    samples: Dict[str, List[str]] = {}
+    for col in df.columns:
+        if time.perf_counter() > deadline:
+            break  # remaining columns are reported as over budget
+        values = as_text(rows[col]).str.strip_chars()
+        values = values.filter(values.is_not_null() & (values.str.len_bytes() > 0))
+        samples[col] = values.head(sample_size).to_list()
+    return samples
+
+
+def _sample_source(source: SourceLike, sample_size: int, max_cells: int, seed: int,
+                   time_budget: float) -> Tuple[List[str], Dict[str, List[str]]]:
+    """All column names of *source* and the samples of the columns reached in time."""
+    deadline = time.perf_counter() + time_budget
+
+    if isinstance(source, pd.DataFrame):
+        return list(source.columns), _sample_pandas(source, sample_size, seed, deadline)
+
+    frame = _text_sample(source, max_cells, seed)
+    columns = [col for col in frame.columns if col != SAMPLE_KEY]
+    return columns, _sample_frame(frame, sample_size, deadline)
+
+
+def sample_column_values(
+    source: SourceLike,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    seed: int = 0,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+) -> Dict[str, List[str]]:
+    """Return up to *sample_size* non-empty text values per column.
+
+    Files and Polars frames are sampled over the whole scan, thinned to
+    about ``max_cells // n_columns`` random rows; in-memory pandas frames
+    are sampled by random row position.  Columns that could not be sampled
+    within *time_budget* seconds are omitted.
+    """
+    return _sample_source(source, sample_size, max_cells, seed, time_budget)[1]
+
+
+def classify_samples(samples: Dict[str, Sequence[str]],
+                     min_confidence: float = MIN_CONFIDENCE) -> Dict[str, ColumnClassification]:
+    """Classify already-sampled values; all columns are scored in one query."""
+    columns = list(samples)
+    col_ids: List[int] = []
+    values: List[str] = []
+    for i, col in enumerate(columns):
+        col_values = samples[col]
+        col_ids.extend([i] * len(col_values))
+        values.extend(col_values)
+
+    results: Dict[str, ColumnClassification] = {}
+    if not values:
+        for col in columns:
+            results[col] = ColumnClassification(col, None, 0.0, reason="no values")
+        return results
+
+    # Float artefacts ("4055551234.0") would hide phones and ZIPs
+    v = pl.col("v").str.replace(r"^(\d+)\.0$", "${1}")
+    business = v.str.contains(BUSINESS_RE)
+    stats = (
+        pl.DataFrame({"col": col_ids, "v": values}, schema={"col": pl.Int32, "v": pl.Utf8})
+        .group_by("col")
+        .agg(
+            n=pl.len(),
+            distinct=v.n_unique(),
+            min_len=v.str.len_chars().min(),
+            max_len=v.str.len_chars().max(),
+            mean_len=v.str.len_chars().mean(),
+            phone=v.str.contains(PHONE_RE).mean(),
+            email=v.str.contains(EMAIL_RE).mean(),
+            street=v.str.contains(STREET_RE).mean(),
+            house=v.str.contains(HOUSE_NUMBER_RE).mean(),
+            zip=v.str.contains(ZIP_RE).mean(),
+            currency=v.str.contains(CURRENCY_RE).mean(),
+            date=v.str.contains(DATE_RE).mean(),
+            business=business.mean(),
+            name=(v.str.contains(NAME_RE) & ~business).mean(),
+        )
+    )
+
+    for row in stats.iter_rows(named=True):
+        col = columns[row["col"]]
+        distinct_ratio = row["distinct"] / row["n"]
+        # Person names are high-cardinality; cities, states and categories are not
+        name_factor = min(1.0, distinct_ratio / 0.3) if row["mean_len"] >= 3 else 0.0
+        scores = {
+            "phone": row["phone"],
+            "email": row["email"],
+            # House number without a recognised suffix is weaker evidence
+            "street_address": max(row["street"], 0.5 * (row["street"] + row["house"])),
+            "zip": row["zip"],
+            "currency": row["currency"],
+            "date": row["date"],
+            "person_name": row["name"] * name_factor,
+            "business_name": row["business"],
+        }
+        label = max(scores, key=scores.get)
+        confidence = float(scores[label])
+        results[col] = ColumnClassification(
+            column=col,
+            label=label if confidence >= min_confidence else None,
+            confidence=confidence if confidence >= min_confidence else 0.0,
+            scores={k: round(float(s), 4) for k, s in scores.items()},
+            sample_size=row["n"],
+            distinct_ratio=distinct_ratio,
+            min_length=row["min_len"],
+            max_length=row["max_len"],
+            reason="" if confidence >= min_confidence else "no confident match",
+        )
+
+    for col in columns:
+        results.setdefault(col, ColumnClassification(col, None, 0.0, reason="no values"))
+    return results
+
+
+def classify_columns(
+    source: SourceLike,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    min_confidence: float = MIN_CONFIDENCE,
+    seed: int = 0,
+) -> Dict[str, ColumnClassification]:
+    """Sample and classify every column of *source* within *time_budget* seconds.
+
+    Args:
+        source: CSV/Excel path, pandas DataFrame or Polars (lazy) frame
+        sample_size: Maximum sampled values per column
+        max_cells: Upper bound on rows x columns scanned
+        time_budget: Seconds allowed for sampling; columns not reached are
+            returned unlabeled with reason ``"time budget exceeded"``
+        min_confidence: Minimum score for a label to be assigned
+
+    Returns:
+        Dict[column] = ColumnClassification (in source column order)
+    """
+    start = time.perf_counter()
+    all_columns, samples = _sample_source(source, sample_size, max_cells, seed, time_budget)
+    results = classify_samples(samples, min_confidence)
+
+    ordered = {}
+    for col in all_columns:
+        ordered[col] = results.get(col) or ColumnClassification(col, None, 0.0, reason="time budget exceeded")
+
+    labeled = sum(1 for c in ordered.values() if c.label)
+    logger.info(f"🔎 Classified {len(ordered)} columns by content ({labeled} labeled) "
+                f"in {time.perf_counter() - start:.2f}s")
+    return ordered
+
+
+def suggest_header(label: Optional[str], available_headers: Sequence[str]) -> Optional[str]:
+    """Return the first available Pete header matching a content *label*."""
+    if not label:
+        return None
+    normalized = [(h, h.strip().lower()) for h in available_headers]
+    for keyword in CONTENT_HEADER_KEYWORDS.get(label, ()):
+        for header, header_norm in normalized:
+            if keyword in header_norm:
+                return header
+    return None
@@ -13,6 +13,8 @@ from pathlib import Path
 from loguru import logger
 import pandas as pd
 
+from backend.utils.column_profiler import profile_dataframe
+
 
 class ColumnPreferences:
     """
@@ -150,11 +152,9 @@ class ColumnPreferences:
         original_columns = set(df.columns)
         columns_to_hide = set()
         
-        # 1. Hide empty columns above threshold
+        # 1. Hide empty columns above threshold (nulls and blank strings)
         empty_threshold = self.preferences['auto_hide_empty_threshold']
-        for col in df.columns:
-            if df[col].isnull().sum() / len(df) >= empty_threshold:
-                columns_to_hide.add(col)
+        columns_to_hide.update(profile_dataframe(df).empty_columns(empty_threshold))
         
         # 2. Hide columns matching patterns
         import re
@@ -240,11 +240,9 @@ class ColumnPreferences:
             'recommended_hide': []
         }
         
-        # Find empty columns
+        # Find empty columns (nulls and blank strings, shared cached profile)
         empty_threshold = self.preferences['auto_hide_empty_threshold']
-        for col in df.columns:
-            if df[col].isnull().sum() / len(df) >= empty_threshold:
-                stats['empty_columns'].append(col)
+        stats['empty_columns'] = profile_dataframe(df).empty_columns(empty_threshold)
         
         # Find pattern matches
         import re
@@ -0,0 +1,274 @@
+"""
+Column Profiler
+---------------
+Compute per-column data-quality statistics for a whole frame in one scan.
+
+Empty-column filtering, column auto-hiding, the column stats panel and the
+preset data-quality report all need overlapping numbers (nulls, blanks,
+distinct values …).  :func:`profile_dataframe` computes all of them in a
+single Polars ``select`` – evaluated in parallel across columns – and caches
+the result per frame object, checked against :func:`dataset_fingerprint`
+(shape, column names, dtypes and a bounded row sample), so the second and
+later callers on the same frame skip both the conversion and the scan.
+Callers get their own copy of a cached profile.  An edit made in place
+(``df.loc[5000, "Phone 1"] = None``) outside the sampled rows does not
+change the fingerprint, so code that edits a frame in place calls
+:func:`invalidate_profile` afterwards.
+
+Blank cells are counted separately as ``empty_count`` (``""``) and
+``whitespace_count`` (whitespace only); :attr:`ColumnProfile.blank_ratio`
+treats nulls and both kinds of blanks as empty.
+
+Example
+-------
+>>> from backend.utils.column_profiler import profile_dataframe
+>>> profile = profile_dataframe(df)
+>>> profile.empty_columns(0.9)
+['Unused 1', 'Unused 2']
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from backend.utils.mapping_executor import as_text
+
+__all__: list[str] = [
+    "ColumnProfile",
+    "DatasetProfile",
+    "dataset_fingerprint",
+    "invalidate_profile",
+    "to_polars_column",
+    "profile_dataframe",
+]
+
+PROFILE_CACHE_SIZE = 16
+FINGERPRINT_ROWS = 1_024  # evenly spaced rows hashed into the fingerprint
+
+# (id(df), fingerprint, duplicates) -> (weak reference to df, profile)
+_PROFILE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+@dataclass
+class ColumnProfile:
+    """Statistics for one column.
+
+    ``distinct_count`` is a HyperLogLog estimate (exact for small columns);
+    lengths are only measured for text columns.
+    """
+
+    column: Hashable
+    dtype: str
+    inferred_type: str  # 'int', 'float', 'datetime', 'category' or 'string'
+    n_rows: int
+    null_count: int
+    empty_count: int = 0
+    whitespace_count: int = 0
+    distinct_count: int = 0
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+
+    @property
+    def blank_count(self) -> int:
+        """Nulls plus empty and whitespace-only strings."""
+        return self.null_count + self.empty_count + self.whitespace_count
+
+    @property
+    def blank_ratio(self) -> float:
+        """Share of blank cells (``0.0`` for a frame without rows)."""
+        return self.blank_count / self.n_rows if self.n_rows else 0.0
+
+
+@dataclass
+class DatasetProfile:
+    """Profiles of every column of a frame, in column order.
+
+    ``profiles`` is positional, so repeated column names keep one entry
+    each; :attr:`columns` looks profiles up by label.
+    """
+
+    n_rows: int
+    profiles: List[ColumnProfile] = field(default_factory=list)
+    duplicate_rows: Optional[int] = None
+    fingerprint: str = ""
+
+    @property
+    def columns(self) -> Dict[Hashable, ColumnProfile]:
+        """Profiles by column label (the first column for a repeated label)."""
+        by_label: Dict[Hashable, ColumnProfile] = {}
+        for col in self.profiles:
+            by_label.setdefault(col.column, col)
+        return by_label
+
+    def empty_columns(self, threshold: float = 0.9) -> List[Hashable]:
+        """Columns whose blank ratio is at or above *threshold*."""
+        return [col.column for col in self.profiles if col.blank_ratio >= threshold]
+
+    def non_empty_columns(self, threshold: float = 0.9) -> List[Hashable]:
+        """Columns whose blank ratio is below *threshold* (the ones to keep)."""
+        return [col.column for col in self.profiles if col.blank_ratio < threshold]
+
+    def null_counts(self) -> Dict[Hashable, int]:
+        return {name: col.null_count for name, col in self.columns.items()}
+
+    def blank_counts(self) -> Dict[Hashable, int]:
+        return {name: col.blank_count for name, col in self.columns.items()}
+
+    def distinct_counts(self) -> Dict[Hashable, int]:
+        return {name: col.distinct_count for name, col in self.columns.items()}
+
+
+def _polars_frame(df: pd.DataFrame) -> pl.DataFrame:
+    """*df* as a Polars frame with positional keys (column names may repeat or contain ':')."""
+    return pl.DataFrame([to_polars_column(df.iloc[:, i], f"c{i}") for i in range(df.shape[1])])
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """Cheap fingerprint of *df*.
+
+    Combines shape, column names, dtypes and a hash of at most
+    ``FINGERPRINT_ROWS`` evenly spaced rows; the frame is not converted.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((df.shape, [str(c) for c in df.columns], [str(t) for t in df.dtypes])).encode())
+    if len(df) and df.shape[1]:
+        positions = np.unique(np.linspace(0, len(df) - 1, min(len(df), FINGERPRINT_ROWS)).astype(np.int64))
+        sample = df.iloc[positions]
+        try:
+            hashed = pd.util.hash_pandas_object(sample, index=False).to_numpy()
+        except Exception:  # unhashable cells (lists, dicts …)
+            hashed = pd.util.hash_pandas_object(sample.astype(str), index=False).to_numpy()
+        digest.update(hashed.tobytes())
+    return digest.hexdigest()
+
+
+def to_polars_column(values: pd.Series, name: str) -> pl.Series:
+    """Convert one pandas column, falling back to ``str()`` text for mixed objects."""
+    try:
+        return pl.from_pandas(values).alias(name)
+    except Exception:
+        return as_text(values).alias(name)  # mixed object column
+
+
+def _column_exprs(name: str, dtype: pl.DataType) -> List[pl.Expr]:
+    col = pl.col(name)
+    exprs = [col.null_count().alias(f"{name}:null")]
+    if dtype in (pl.Null, pl.Object):
+        return exprs
+    # HyperLogLog; temporal/categorical columns are estimated on their physical values
+    physical = col if dtype == pl.Utf8 else col.to_physical()
+    exprs.append(physical.drop_nulls().approx_n_unique().alias(f"{name}:distinct"))
+
+    if dtype == pl.Utf8:
+        stripped_len = col.str.strip_chars().str.len_chars()
+        exprs += [
+            (col.str.len_bytes() == 0).sum().alias(f"{name}:empty"),
+            ((stripped_len == 0) & (col.str.len_bytes() > 0)).sum().alias(f"{name}:whitespace"),
+            # Share of non-null values that parse as numbers (for type inference)
+            col.str.strip_chars().cast(pl.Float64, strict=False).is_not_null().sum().alias(f"{name}:numeric"),
+            (col.str.strip_chars().cast(pl.Float64, strict=False) % 1 == 0).sum().alias(f"{name}:whole"),
+            col.str.len_chars().min().alias(f"{name}:min_len"),
+            col.str.len_chars().max().alias(f"{name}:max_len"),
+        ]
+    elif dtype.is_float():
+        exprs.append((col == col.floor()).sum().alias(f"{name}:whole"))
+    return exprs
+
+
+def _infer_type(dtype: pl.DataType, stats: Dict[str, object], non_null: int) -> str:
+    if non_null == 0:
+        return "string"
+    if dtype.is_integer():
+        return "int"
+    if dtype.is_float():
+        return "int" if stats.get("whole") == non_null else "float"
+    if dtype.is_temporal():
+        return "datetime"
+    if dtype == pl.Utf8 and stats.get("numeric") == non_null:
+        return "int" if stats.get("whole") == non_null else "float"
+    if stats.get("distinct", 0) < min(non_null // 2, 20):
+        return "category"
+    return "string"
+
+
+def _compute_profile(df: pd.DataFrame, frame: pl.DataFrame, duplicates: bool) -> DatasetProfile:
+    names = list(df.columns)
+    keys = frame.columns
+
+    schema = frame.schema
+    exprs: List[pl.Expr] = []
+    for key in keys:
+        exprs += _column_exprs(key, schema[key])
+    row = frame.select(exprs).row(0, named=True) if exprs else {}
+
+    by_column: Dict[str, Dict[str, object]] = {key: {} for key in keys}
+    for stat, value in row.items():
+        key, measure = stat.split(":", 1)
+        by_column[key][measure] = value
+
+    profile = DatasetProfile(n_rows=len(df))
+    for name, key in zip(names, keys):
+        stats = by_column[key]
+        non_null = len(df) - int(stats.get("null", len(df)))
+        profile.profiles.append(ColumnProfile(
+            column=name,
+            dtype=str(schema[key]),
+            inferred_type=_infer_type(schema[key], stats, non_null),
+            n_rows=len(df),
+            null_count=int(stats.get("null", len(df))),
+            empty_count=int(stats.get("empty", 0)),
+            whitespace_count=int(stats.get("whitespace", 0)),
+            distinct_count=int(stats.get("distinct", 0)),
+            min_length=stats.get("min_len"),
+            max_length=stats.get("max_len"),
+        ))
+
+    if duplicates:
+        try:
+            profile.duplicate_rows = int(frame.height - frame.n_unique())
+        except Exception:  # e.g. Object columns
+            profile.duplicate_rows = int(df.duplicated().sum())
+    return profile
+
+
+def profile_dataframe(df: pd.DataFrame, duplicates: bool = False, use_cache: bool = True) -> DatasetProfile:
+    """Profile every column of *df* in one parallel scan.
+
+    Args:
+        df: Frame to profile
+        duplicates: Also count duplicate rows (one extra hash pass)
+        use_cache: Reuse the profile cached for this frame object while its
+            fingerprint is unchanged
+
+    Returns:
+        DatasetProfile: Per-column statistics (a copy the caller may modify)
+    """
+    fingerprint = dataset_fingerprint(df)
+    if use_cache:
+        for key in ((id(df), fingerprint, duplicates), (id(df), fingerprint, True)):  # a superset will do
+            entry = _PROFILE_CACHE.get(key)
+            if entry is not None and entry[0]() is df:
+                _PROFILE_CACHE.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
+    profile = _compute_profile(df, _polars_frame(df), duplicates)
+    profile.fingerprint = fingerprint
+    _PROFILE_CACHE[(id(df), fingerprint, duplicates)] = (weakref.ref(df), copy.deepcopy(profile))
+    while len(_PROFILE_CACHE) > PROFILE_CACHE_SIZE:
+        _PROFILE_CACHE.popitem(last=False)
+    return profile
+
+
+def invalidate_profile(df: pd.DataFrame) -> None:
+    """Drop the cached profiles of *df*; call it after editing *df* in place."""
+    for key in [key for key, (ref, _) in _PROFILE_CACHE.items() if key[0] == id(df) and ref() is df]:
+        del _PROFILE_CACHE[key]
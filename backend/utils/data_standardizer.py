@@ -13,14 +13,20 @@ Frontend components should import and use this module.
 """
 
 import os
+import copy
 import json
+import hashlib
+from collections import OrderedDict
 import pandas as pd
 from backend.utils.high_performance_processor import clean_dataframe_fast
+from backend.utils.mapping_executor import ConcatRule, MappingPlan, execute_mapping, row_dtype
+from backend.utils.column_classifier import ColumnClassification, suggest_header
+from backend.utils.source_profiles import cleanup_columns, read_source
 from typing import List, Dict, Any, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
-from rapidfuzz import process
+from rapidfuzz import fuzz, process
 from backend.sheets_client import SheetsClient
 from datetime import datetime
 import re
@@ -33,6 +39,19 @@ MAPPINGS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..
 RULES_PATH = os.path.join(MAPPINGS_DIR, 'mapping_rules.json')
 os.makedirs(MAPPINGS_DIR, exist_ok=True)
 
+# mapping_rules.json contents keyed by (mtime_ns, size)
+_RULES_CACHE: Optional[Tuple[Tuple[int, int], dict]] = None
+
+# Memoized mapping proposals keyed by (upload columns, Pete headers, rules hash)
+PROPOSAL_CACHE_SIZE = 64
+_PROPOSAL_CACHE: "OrderedDict[Tuple, Dict[str, Tuple[Optional[str], float, str]]]" = OrderedDict()
+
+
+def _rules_fingerprint(rules: Dict[str, Any]) -> str:
+    """Stable hash of a rules dict (rules are edited in place, so hash content)."""
+    payload = json.dumps(rules, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
 class DataStandardizer:
     """
     Core data standardization utility for mapping upload data to Pete format.
@@ -69,14 +88,8 @@ class DataStandardizer:
 
     def load_upload_file(self, filepath: str) -> pd.DataFrame:
         """Load upload file with optional empty column filtering"""
-        ext = os.path.splitext(filepath)[1].lower()
-        
-        if ext == '.csv':
-            df = pd.read_csv(filepath, low_memory=False)
-        elif ext in ['.xls', '.xlsx']:
-            df = pd.read_excel(filepath)
-        else:
-            raise ValueError(f"Unsupported file type: {ext}")
+        # Known sources (REISIFT) keep phone/ZIP/parcel columns as text
+        df, profile = read_source(filepath)
         
         # Apply empty column filtering if enabled
         if self.empty_column_config.get('filter_empty_columns', True):
@@ -85,24 +98,86 @@ class DataStandardizer:
             logger.info(f"Filtered columns with more than {threshold*100}% NaN/empty values")
 
         # Auto strip trailing .0 from numeric-like strings using fast processor
-        df = clean_dataframe_fast(df)
+        df = clean_dataframe_fast(df, columns=cleanup_columns(df, profile))
         return df
 
     @staticmethod
     def load_rules() -> dict:
-        """Load mapping rules from JSON file"""
-        if os.path.exists(RULES_PATH):
+        """Load mapping rules from JSON file (cached until the file changes)"""
+        global _RULES_CACHE
+        try:
+            stat = os.stat(RULES_PATH)
+        except OSError:
+            return {}
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if _RULES_CACHE is None or _RULES_CACHE[0] != signature:
             with open(RULES_PATH, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+                _RULES_CACHE = (signature, json.load(f))
+        # Callers edit their rules in place, so never hand out the cached dict
+        return copy.deepcopy(_RULES_CACHE[1])
 
-    def propose_mapping(self, upload_columns: List[str]) -> Dict[str, Tuple[Optional[str], float, str]]:
+    def propose_mapping(self, upload_columns: List[str],
+                        content_hints: Optional[Dict[str, ColumnClassification]] = None
+                        ) -> Dict[str, Tuple[Optional[str], float, str]]:
         """
         Propose mapping between upload columns and Pete headers
         
+        Proposals are memoized by (upload columns, Pete headers, rules hash), so
+        reopening the mapping UI for the same source format is instant.
+        
+        Args:
+            upload_columns: Column names of the uploaded file
+            content_hints: Optional ``classify_columns`` result; columns the
+                name-based stages could not map are matched by their content
+        
         Returns: Dict[upload_col] = (pete_header, confidence_score, rule_reason)
         """
+        key = (tuple(upload_columns), tuple(self.pete_headers), _rules_fingerprint(self.rules))
+        cached = _PROPOSAL_CACHE.get(key)
+        if cached is None:
+            cached = self._compute_mapping(list(upload_columns))
+            _PROPOSAL_CACHE[key] = cached
+            while len(_PROPOSAL_CACHE) > PROPOSAL_CACHE_SIZE:
+                _PROPOSAL_CACHE.popitem(last=False)
+        else:
+            _PROPOSAL_CACHE.move_to_end(key)
+
+        result = dict(cached)
+        if content_hints:
+            self._apply_content_hints(upload_columns, result, content_hints)
+        return result
+
+    def _apply_content_hints(self, upload_columns: List[str],
+                             result: Dict[str, Tuple[Optional[str], float, str]],
+                             content_hints: Dict[str, ColumnClassification]) -> None:
+        """Map still-unmatched columns to a free Pete header by detected content."""
+        used_pete = {pete for pete, _, _ in result.values() if pete in self.pete_headers}
+        for _, _, reason in result.values():
+            if reason.startswith('Config: Concat for '):
+                used_pete.add(reason[len('Config: Concat for '):])
+
+        for col in upload_columns:
+            current = result.get(col)
+            if current is not None and not (current[0] is None and current[2].startswith('No match')):
+                continue
+            hint = content_hints.get(col)
+            if hint is None or not hint.label:
+                continue
+            available = [h for h in self.pete_headers if h not in used_pete]
+            pete = suggest_header(hint.label, available)
+            if pete is not None:
+                result[col] = (pete, round(hint.confidence * 100, 1),
+                               f"Content: {hint.label} ({hint.confidence:.0%})")
+                used_pete.add(pete)
+
+    def _compute_mapping(self, upload_columns: List[str]) -> Dict[str, Tuple[Optional[str], float, str]]:
+        """Run the rule stages and the matrix-based fuzzy stage (uncached)."""
+        upload_norm = [col.strip().lower() for col in upload_columns]
         pete_headers_norm = [h.strip().lower() for h in self.pete_headers]
+        exact_index: Dict[str, int] = {}
+        for idx, norm in enumerate(pete_headers_norm):
+            exact_index.setdefault(norm, idx)
+
         never_map = set(s.strip().lower() for s in self.rules.get('never_map', []))
         explicit_map = {k.strip().lower(): v for k, v in self.rules.get('explicit_map', {}).items()}
         concat_fields = self.rules.get('concat_fields', {})
@@ -113,16 +188,14 @@ class DataStandardizer:
         result = {}
 
         # 1. Never map rules
-        for col in upload_columns:
-            col_norm = col.strip().lower()
+        for col, col_norm in zip(upload_columns, upload_norm):
             for nm in never_map:
                 if nm in col_norm:
                     result[col] = (None, 0.0, f'Config: Never map ({nm})')
                     break
 
         # 2. Explicit mapping rules
-        for col in upload_columns:
-            col_norm = col.strip().lower()
+        for col, col_norm in zip(upload_columns, upload_norm):
             if col in result:
                 continue
             if col_norm in explicit_map:
@@ -136,83 +209,86 @@ class DataStandardizer:
         # 3. Concatenation fields
         for pete, concat_cols in concat_fields.items():
             if pete in self.pete_headers and pete not in used_pete:
-                available_cols = [col for col in upload_columns 
-                                if col.strip().lower() in [c.strip().lower() for c in concat_cols]]
+                concat_norm = {c.strip().lower() for c in concat_cols}
+                available_cols = [col for col, col_norm in zip(upload_columns, upload_norm)
+                                  if col_norm in concat_norm]
                 if len(available_cols) == len(concat_cols):
                     for col in available_cols:
                         result[col] = (f'(used in {pete})', 100.0, f'Config: Concat for {pete}')
                     used_pete.add(pete)
 
         # 4. Exact match (case-insensitive)
-        for col in upload_columns:
-            col_norm = col.strip().lower()
+        for col, col_norm in zip(upload_columns, upload_norm):
             if col in result:
                 continue
-            if col_norm in pete_headers_norm:
-                idx = pete_headers_norm.index(col_norm)
-                pete = self.pete_headers[idx]
+            if col_norm in exact_index:
+                pete = self.pete_headers[exact_index[col_norm]]
                 if pete not in used_pete:
                     result[col] = (pete, 100.0, "Exact match (case-insensitive)")
                     used_pete.add(pete)
 
-        # 5. Fuzzy match (if enabled)
-        for col in upload_columns:
-            col_norm = col.strip().lower()
-            if col in result or disable_fuzzy:
-                continue
+        # 5. Fuzzy match (if enabled): one score matrix for all pending columns x headers,
+        # then a greedy assignment in column order (each header is used at most once)
+        pending = [(col, col_norm) for col, col_norm in zip(upload_columns, upload_norm)
+                   if col not in result]
+        if disable_fuzzy or not pending:
+            return result
 
-            available_pete = [h for h in self.pete_headers if h not in used_pete]
-            available_pete_norm = [h.strip().lower() for h in available_pete]
-            
-            if not available_pete:
+        if pete_headers_norm:
+            scores = process.cdist([col_norm for _, col_norm in pending], pete_headers_norm,
+                                   scorer=fuzz.WRatio, dtype=np.float64, workers=-1)
+        available = np.array([h not in used_pete for h in self.pete_headers], dtype=bool)
+        headers = np.array(self.pete_headers, dtype=object)
+
+        for row, (col, _) in enumerate(pending):
+            if not available.any():
                 result[col] = (None, 0.0, "No match (all Pete headers mapped)")
                 continue
 
-            match, score, _ = process.extractOne(col_norm, available_pete_norm)
+            idx = int(np.argmax(np.where(available, scores[row], -1.0)))
+            score = float(scores[row, idx])
             
             if score >= fuzzy_threshold:
-                idx = available_pete_norm.index(match)
-                pete = available_pete[idx]
+                pete = self.pete_headers[idx]
                 result[col] = (pete, score, f"Fuzzy ({score:.0f})")
-                used_pete.add(pete)
+                available &= headers != pete
             else:
                 result[col] = (None, 0.0, f"No match (below threshold {fuzzy_threshold})")
 
         return result
 
-    def transform_data(self, df: pd.DataFrame, mapping: Dict[str, Optional[str]]) -> pd.DataFrame:
-        """Transform data according to mapping rules"""
+    def build_mapping_plan(self, df: pd.DataFrame, mapping: Dict[str, Optional[str]]) -> MappingPlan:
+        """Compile mapping plus concat rules into a single projection plan"""
         concat_fields = self.rules.get('concat_fields', {})
         concat_separator = self.rules.get('concat_separator', ' ')
         
-        output_data = {}
+        plan = MappingPlan(headers=list(self.pete_headers), fill_dtype='float64')
         
-        # Process each Pete header
         for pete_header in self.pete_headers:
             # Check if this header is a concatenation target
             if pete_header in concat_fields:
                 source_columns = concat_fields[pete_header]
+                source_lower = {sc.lower() for sc in source_columns}
                 matched_cols = [col for col in df.columns 
-                              if col in source_columns or 
-                                 col.lower() in [sc.lower() for sc in source_columns]]
+                              if col in source_columns or col.lower() in source_lower]
                 
-                if len(matched_cols) == len(source_columns):
-                    # Concatenate the columns
-                    output_data[pete_header] = df[matched_cols].apply(
-                        lambda row: concat_separator.join(str(val) for val in row if pd.notna(val)), 
-                        axis=1
-                    )
-                else:
-                    output_data[pete_header] = pd.Series([np.nan] * len(df))
+                if matched_cols and len(matched_cols) == len(source_columns):
+                    plan.assign(pete_header, ConcatRule(
+                        tuple(matched_cols),
+                        separator=concat_separator,
+                        as_dtype=row_dtype(df[matched_cols]),
+                    ))
             else:
                 # Regular mapping
                 mapped_col = next((col for col, pete_col in mapping.items() if pete_col == pete_header), None)
                 if mapped_col and mapped_col in df.columns:
-                    output_data[pete_header] = df[mapped_col]
-                else:
-                    output_data[pete_header] = pd.Series([np.nan] * len(df))
+                    plan.assign(pete_header, mapped_col)
         
-        return pd.DataFrame(output_data)
+        return plan
+
+    def transform_data(self, df: pd.DataFrame, mapping: Dict[str, Optional[str]]) -> pd.DataFrame:
+        """Transform data according to mapping rules"""
+        return execute_mapping(df, self.build_mapping_plan(df, mapping))
 
     def generate_report(self, mapping: Dict[str, Optional[str]], output_excel: str, unmapped_excel: str) -> str:
         """Generate mapping report in markdown format"""
@@ -4,40 +4,104 @@ Enhanced Data Standardizer
 
 Provides utilities for data concatenation and standardization that can be used
 in the app's frontend and backend components.
+
+Categorical fields are standardized from a rule table: for every field, an
+ordered list of ``(standard value, regex patterns)`` entries applied to the
+columns the field's ``columns`` regex matches.  Only the distinct values of a
+column are lower-cased and matched (property types number in the dozens, not
+the hundreds of thousands of rows); the results are joined back by factor
+code.  Only property types have built-in rules; other fields (e.g. ``Phone Type N``)
+are standardized only when a caller's rule table adds them.  Presets can store
+their own rule table (``standardization_rules.json``).
 """
 
+import copy
+import re
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
 from loguru import logger
 
+from backend.utils.mapping_executor import ConcatRule, concat_columns, row_dtype
+
+# Rule table: field -> columns regex + ordered {standard value: patterns}.
+# The first value with a matching pattern wins; patterns are regexes searched
+# in the lower-cased cell.
+DEFAULT_STANDARDIZATION_RULES: Dict[str, Dict[str, Any]] = {
+    'property_type': {
+        'columns': r'^Property Type$',
+        'values': {
+            'Single Family Residential': [
+                'single family', 'sfr', 'single family residence', 'single family residential',
+                'single family home', 'single family house', 'sf', 'single fam'
+            ],
+            'Multifamily': [
+                'duplex', 'duplex (2 units, any combination)', 'multifamily', 'multi family', 
+                'multi-family', 'multi family residential', 'apartment', 'condo', 'condominium', 
+                'townhouse', 'town house'
+            ],
+            'Mobile/Manufactured Home': [
+                'mobile/manufactured home', 'mobile home', 'manufactured home'
+            ],
+            'Commercial': [
+                'retail stores', 'commercial', 'business', 'office', 'industrial'
+            ],
+            'Vacant Land': [
+                'residential - vacant land', 'residential-vacant land', 'vacant land', 'vacant'
+            ],
+        },
+    },
+}
+
+
+def compile_rules(rules: Dict[str, Any]) -> List[Tuple[str, "re.Pattern"]]:
+    """Compile one field's ``values`` table into ordered ``(value, regex)`` pairs."""
+    return [
+        (value, re.compile('|'.join(f'(?:{p})' for p in patterns)))
+        for value, patterns in rules['values'].items() if patterns
+    ]
+
+
+def standardize_series(series: pd.Series, compiled: List[Tuple[str, "re.Pattern"]]) -> pd.Series:
+    """Map the distinct values of *series* through *compiled* rules and join back.
+
+    Values no rule matches (and non-text values) are kept unchanged.
+    """
+    codes, uniques = pd.factorize(series)
+    mapped = np.asarray(uniques, dtype=object).copy()
+    changed = False
+    for i, value in enumerate(mapped):
+        if not isinstance(value, str):
+            continue
+        lowered = value.lower()
+        for standard, pattern in compiled:
+            if pattern.search(lowered):
+                changed = changed or standard != value
+                mapped[i] = standard
+                break
+    if not changed:
+        return series
+    values = np.where(codes >= 0, mapped[np.maximum(codes, 0)], series.to_numpy(dtype=object))
+    return pd.Series(values, index=series.index, name=series.name)
+
+
 class DataStandardizerEnhanced:
     """
     Enhanced data standardizer with concatenation and standardization features.
     """
     
-    def __init__(self):
-        self.standardization_rules = {
-            'property_type': {
-                'single_family': [
-                    'single family', 'sfr', 'single family residence', 'single family residential',
-                    'single family home', 'single family house', 'sf', 'single fam'
-                ],
-                'multifamily': [
-                    'duplex', 'duplex (2 units, any combination)', 'multifamily', 'multi family', 
-                    'multi-family', 'multi family residential', 'apartment', 'condo', 'condominium', 
-                    'townhouse', 'town house'
-                ],
-                'mobile': [
-                    'mobile/manufactured home', 'mobile home', 'manufactured home'
-                ],
-                'commercial': [
-                    'retail stores', 'commercial', 'business', 'office', 'industrial'
-                ],
-                'vacant': [
-                    'residential - vacant land', 'residential-vacant land', 'vacant land', 'vacant'
-                ]
-            }
-        }
+    def __init__(self, standardization_rules: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Initialize the standardizer.
+        
+        Args:
+            standardization_rules: Rule table overriding the defaults field by field
+                                   (see DEFAULT_STANDARDIZATION_RULES)
+        """
+        self.standardization_rules = copy.deepcopy(DEFAULT_STANDARDIZATION_RULES)
+        if standardization_rules:
+            self.standardization_rules.update(copy.deepcopy(standardization_rules))
+        self._compiled = {field: compile_rules(rules) for field, rules in self.standardization_rules.items()}
     
     def concatenate_columns(self, df: pd.DataFrame, source_cols: List[str], 
                           target_col: str, separator: str = ' ', 
@@ -65,22 +129,16 @@ class DataStandardizerEnhanced:
             logger.warning(f"None of the source columns {source_cols} exist in DataFrame")
             return df
         
-        # Concatenate values
-        concatenated_data = []
-        for _, row in df.iterrows():
-            values = []
-            for col in existing_cols:
-                if pd.notna(row[col]) and str(row[col]).strip():
-                    values.append(str(row[col]).strip())
-            
-            if values:
-                concatenated_data.append(separator.join(values))
-            else:
-                concatenated_data.append(None)
-        
-        # Add to DataFrame
+        # Concatenate trimmed, non-empty values (None when nothing is left)
         df_copy = df.copy()
-        df_copy[target_col] = concatenated_data
+        df_copy[target_col] = concat_columns(df, ConcatRule(
+            tuple(existing_cols),
+            separator=separator,
+            strip_parts=True,
+            skip_empty=remove_empty,
+            null_if_empty=True,
+            as_dtype=row_dtype(df),
+        ))
         
         logger.info(f"✅ Concatenated {len(existing_cols)} columns into '{target_col}': {existing_cols}")
         return df_copy
@@ -109,18 +167,16 @@ class DataStandardizerEnhanced:
             logger.warning(f"None of the email columns {email_cols} exist in DataFrame")
             return df
         
-        # Concatenate emails
-        email_data = []
-        for _, row in df.iterrows():
-            emails = []
-            for email_col in existing_cols[:max_emails]:
-                if pd.notna(row[email_col]) and str(row[email_col]).strip():
-                    emails.append(str(row[email_col]).strip())
-            email_data.append('; '.join(emails) if emails else None)
-        
-        # Add to DataFrame
+        # Concatenate the non-empty emails of the first max_emails columns
         df_copy = df.copy()
-        df_copy[target_col] = email_data
+        df_copy[target_col] = concat_columns(df, ConcatRule(
+            tuple(existing_cols[:max_emails]),
+            separator='; ',
+            strip_parts=True,
+            skip_empty=True,
+            null_if_empty=True,
+            as_dtype=row_dtype(df),
+        ))
         
         logger.info(f"✅ Concatenated {len(existing_cols)} email columns into '{target_col}'")
         return df_copy
@@ -139,13 +195,12 @@ class DataStandardizerEnhanced:
         
         df_standardized = df.copy()
         
-        # Standardize property type if the column exists
-        if 'Property Type' in df_standardized.columns:
-            df_standardized = self.standardize_property_type(df_standardized, 'Property Type')
-            logger.info("✅ Standardized Property Type column")
-        
-        # Add more standardization rules here as needed
-        # For example: phone numbers, addresses, etc.
+        # Every rule-table field, on every column its pattern matches
+        for field, rules in self.standardization_rules.items():
+            column_re = re.compile(rules['columns'])
+            for column in [col for col in df_standardized.columns if column_re.search(str(col))]:
+                df_standardized[column] = standardize_series(df_standardized[column], self._compiled[field])
+                logger.info(f"✅ Standardized {field} column '{column}'")
         
         logger.info("✅ Dataframe standardization completed")
         return df_standardized
@@ -166,37 +221,7 @@ class DataStandardizerEnhanced:
             return df
         
         df_copy = df.copy()
-        series = df_copy[column]
-        
-        # Apply standardization rules
-        single_family_patterns = self.standardization_rules['property_type']['single_family']
-        multifamily_patterns = self.standardization_rules['property_type']['multifamily']
-        mobile_patterns = self.standardization_rules['property_type']['mobile']
-        commercial_patterns = self.standardization_rules['property_type']['commercial']
-        vacant_patterns = self.standardization_rules['property_type']['vacant']
-        
-        # Apply standardization
-        for pattern in single_family_patterns:
-            mask = series.str.lower().str.contains(pattern, na=False)
-            series[mask] = 'Single Family Residential'
-        
-        for pattern in multifamily_patterns:
-            mask = series.str.lower().str.contains(pattern, na=False)
-            series[mask] = 'Multifamily'
-        
-        for pattern in mobile_patterns:
-            mask = series.str.lower().str.contains(pattern, na=False)
-            series[mask] = 'Mobile/Manufactured Home'
-        
-        for pattern in commercial_patterns:
-            mask = series.str.lower().str.contains(pattern, na=False)
-            series[mask] = 'Commercial'
-        
-        for pattern in vacant_patterns:
-            mask = series.str.lower().str.contains(pattern, na=False)
-            series[mask] = 'Vacant Land'
-        
-        df_copy[column] = series
+        df_copy[column] = standardize_series(df_copy[column], self._compiled['property_type'])
         
         logger.info(f"✅ Standardized property type column '{column}'")
         return df_copy
@@ -4,15 +4,190 @@ Data Type Converter - Backend Utility
 Utility class for converting data types with advanced options and logging.
 Supports conversion for individual columns or entire DataFrames.
 
+Type inference inspects a stratified sample (head, tail and random rows)
+of every text column with Polars casts in one ``select``; only columns the
+sample cannot decide are re-checked on all rows.
+
 This is the authoritative backend implementation.
 Frontend components should import and use this module.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Union, List, Dict, Any, Optional
+import polars as pl
+from typing import Union, List, Dict, Any, Optional, Sequence, Tuple
 from loguru import logger
 
+from backend.utils.column_profiler import profile_dataframe, to_polars_column
+
+SAMPLE_ROWS = 1_000  # head + tail + random rows inspected per column
+CATEGORY_MAX_DISTINCT = 20
+
+# Date layouts recognised in text columns (tried in order)
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%m/%d/%Y",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%y",
+    "%d-%b-%Y",
+    "%b %d, %Y",
+)
+
+
+def _sample_positions(n_rows: int, sample_rows: int, seed: int) -> np.ndarray:
+    """Row positions of a head/tail/random sample (all rows if the frame is small)."""
+    if n_rows <= sample_rows:
+        return np.arange(n_rows)
+    edge = sample_rows // 3
+    rng = np.random.default_rng(seed)
+    middle = rng.integers(edge, n_rows - edge, sample_rows - 2 * edge)
+    return np.unique(np.concatenate([np.arange(edge), middle, np.arange(n_rows - edge, n_rows)]))
+
+
+def _text_stat_exprs(name: str) -> List[pl.Expr]:
+    value = pl.col(name).str.strip_chars()
+    number = value.cast(pl.Float64, strict=False)
+    date = pl.coalesce([value.str.strptime(pl.Datetime, fmt, strict=False) for fmt in DATE_FORMATS])
+    present = value.str.len_bytes() > 0  # blank strings count as missing
+    return [
+        present.sum().alias(f"{name}:present"),
+        number.is_not_null().sum().alias(f"{name}:numeric"),
+        (number % 1 == 0).sum().alias(f"{name}:whole"),
+        date.is_not_null().sum().alias(f"{name}:date"),
+        value.filter(present).n_unique().alias(f"{name}:distinct"),
+    ]
+
+
+def _dtype_verdict(series: pl.Series) -> Optional[str]:
+    """Type of a non-text column, decided from its dtype (None for text)."""
+    dtype = series.dtype
+    if dtype in (pl.Utf8, pl.Null, pl.Object):
+        return None
+    if dtype.is_integer():
+        return 'int'
+    if dtype.is_float():
+        values = series.drop_nulls().drop_nans()
+        return 'int' if values.len() and (values % 1 == 0).all() else 'float'
+    if dtype.is_temporal():
+        return 'datetime'
+    return 'category'  # Boolean, Categorical, Enum
+
+
+def _text_verdict(stats: Dict[str, int], complete: bool) -> Optional[str]:
+    """Type of a text column from its stats; None if the sample is ambiguous."""
+    present = stats['present']
+    if present == 0:
+        return 'string' if complete else None
+    if stats['numeric'] == present:
+        return 'int' if stats['whole'] == present else 'float'
+    if stats['date'] == present:
+        return 'datetime'
+    if stats['distinct'] >= CATEGORY_MAX_DISTINCT:
+        return 'string'  # the full column has at least as many distinct values
+    if not complete:
+        return None  # category vs string depends on the full distinct/row counts
+    return 'category' if stats['distinct'] < min(present // 2, CATEGORY_MAX_DISTINCT) else 'string'
+
+
+def _text_stats(frame: pl.DataFrame, keys: List[str]) -> Dict[str, Dict[str, int]]:
+    exprs: List[pl.Expr] = []
+    for key in keys:
+        exprs += _text_stat_exprs(key)
+    row = frame.select(exprs).row(0, named=True) if exprs else {}
+    stats: Dict[str, Dict[str, int]] = {key: {} for key in keys}
+    for stat, value in row.items():
+        key, measure = stat.split(":", 1)
+        stats[key][measure] = int(value or 0)
+    return stats
+
+
+def infer_column_types(df: pd.DataFrame, sample_rows: int = SAMPLE_ROWS, seed: int = 0) -> Dict[Any, str]:
+    """Infer 'int', 'float', 'datetime', 'category' or 'string' for every column.
+
+    Typed columns are decided by dtype.  Text columns are decided on a
+    stratified sample in one Polars ``select``; columns the sample leaves
+    ambiguous (no values sampled, or a small number of distinct values) are
+    re-checked on all rows in a second, batched ``select``.
+    """
+    positions = _sample_positions(len(df), sample_rows, seed)
+    complete = len(positions) == len(df)
+    sample = df.iloc[positions]
+
+    result: Dict[Any, str] = {}
+    text_columns: Dict[str, int] = {}
+    series: List[pl.Series] = []
+    for i, col in enumerate(df.columns):
+        converted = to_polars_column(sample.iloc[:, i], f"c{i}")
+        verdict = _dtype_verdict(converted)
+        if verdict is not None:
+            # Float columns are checked for whole numbers on every row (vectorised)
+            if verdict in ('int', 'float') and converted.dtype.is_float() and not complete:
+                verdict = _dtype_verdict(to_polars_column(df.iloc[:, i], f"c{i}"))
+            result[col] = verdict
+        else:
+            text_columns[f"c{i}"] = i
+            series.append(converted.cast(pl.Utf8))
+
+    pending: List[str] = []
+    for key, stats in _text_stats(pl.DataFrame(series), list(text_columns)).items():
+        verdict = _text_verdict(stats, complete)
+        if verdict is None:
+            pending.append(key)
+        else:
+            result[df.columns[text_columns[key]]] = verdict
+
+    if pending:
+        logger.debug(f"Type inference: full scan for {len(pending)} ambiguous column(s)")
+        full = pl.DataFrame([
+            to_polars_column(df.iloc[:, text_columns[key]], key).cast(pl.Utf8) for key in pending
+        ])
+        for key, stats in _text_stats(full, pending).items():
+            result[df.columns[text_columns[key]]] = _text_verdict(stats, complete=True)
+
+    return {col: result[col] for col in df.columns}
+
+
+def _parse_numeric(df: pd.DataFrame, columns: List[Any], strict: bool,
+                   int_columns: Sequence[Any] = ()) -> Dict[Any, Tuple[np.ndarray, Optional[pl.Series]]]:
+    """Parse *columns* of *df* as float64 in one Polars ``select`` (unparseable → NaN).
+
+    Columns in *int_columns* also get an exact Int64 parse (floats lose
+    precision above 2**53, e.g. 17-digit parcel numbers); whole float
+    values such as ``"3.0"`` fill in where the text is not an integer.
+    """
+    keys = {f"c{i}": col for i, col in enumerate(columns)}
+    frame = pl.DataFrame([to_polars_column(df[col], key) for key, col in keys.items()])
+    schema = frame.schema
+    exprs = []
+    for key, col in keys.items():
+        if schema[key] == pl.Boolean:
+            # Booleans become 1.0/0.0 ("true" as text would not parse)
+            number = pl.col(key).cast(pl.Float64)
+            exact = pl.col(key).cast(pl.Int64)
+        else:
+            text = pl.col(key).cast(pl.Utf8, strict=False).str.strip_chars()
+            number = text.cast(pl.Float64, strict=strict)
+            exact = text.cast(pl.Int64, strict=False)
+        exprs.append(number.alias(key))
+        if col in int_columns:
+            whole = pl.when(number.is_finite() & (number == number.floor())).then(number.cast(pl.Int64, strict=False))
+            exprs.append(pl.coalesce(exact, whole).alias(f"{key}:int"))
+    parsed = frame.select(exprs)
+    return {
+        col: (parsed[key].fill_null(np.nan).to_numpy(),
+              parsed[f"{key}:int"] if col in int_columns else None)
+        for key, col in keys.items()
+    }
+
+
+def _nullable_int(values: pl.Series) -> pd.arrays.IntegerArray:
+    """Exact pandas ``Int64`` array from a Polars Int64 series."""
+    return pd.arrays.IntegerArray(values.fill_null(0).to_numpy(), values.is_null().to_numpy())
+
+
 class DataTypeConverter:
     """
     Utility class for converting data types with advanced options and logging.
@@ -30,39 +205,8 @@ class DataTypeConverter:
         Returns:
             str: Recommended data type ('int', 'float', 'datetime', 'category', 'string')
         """
-        # Remove NaN values for type inference
-        clean_series = series.dropna()
-        
-        if clean_series.empty:
-            return 'string'  # Default to string if no non-null values
-        
-        # Check for datetime
-        try:
-            pd.to_datetime(clean_series)
-            return 'datetime'
-        except (ValueError, TypeError):
-            pass
-        
-        # Check for integer
-        try:
-            converted = pd.to_numeric(clean_series, errors='raise')
-            if np.all(converted.apply(float.is_integer)):
-                return 'int'
-        except (ValueError, TypeError):
-            pass
-        
-        # Check for float
-        try:
-            pd.to_numeric(clean_series, errors='raise')
-            return 'float'
-        except (ValueError, TypeError):
-            pass
-        
-        # Check for categorical (limited unique values)
-        if len(clean_series.unique()) < min(len(clean_series) // 2, 20):
-            return 'category'
-        
-        return 'string'
+        # Unnamed series: take the single result positionally
+        return next(iter(infer_column_types(series.to_frame()).values()))
     
     @staticmethod
     def convert_column(
@@ -124,6 +268,9 @@ class DataTypeConverter:
             df (pd.DataFrame): Input DataFrame
             column_types (Dict[str, str]): Mapping of column names to target types
             errors (str, optional): How to handle conversion errors. Defaults to 'coerce'.
+                With 'raise', fractional or infinite values in an 'int' column raise
+                TypeError; otherwise infinite values become missing and a column with
+                fractional values is converted to float instead.
         
         Returns:
             pd.DataFrame: DataFrame with converted columns
@@ -131,8 +278,43 @@ class DataTypeConverter:
         logger.info(f"Converting DataFrame columns: {column_types}")
         
         converted_df = df.copy()
-        for column, target_type in column_types.items():
-            if column in converted_df.columns:
+        targets = {col: t for col, t in column_types.items() if col in converted_df.columns}
+        
+        # Integer columns convert exactly; other numeric targets are parsed together in one Polars pass
+        numeric = []
+        for col, t in targets.items():
+            series = converted_df[col]
+            if t == 'int' and pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                converted_df[col] = series.astype('Int64')
+            elif t in ('int', 'float'):
+                numeric.append(col)
+        if numeric:
+            int_columns = [col for col in numeric if targets[col] == 'int']
+            try:
+                parsed = _parse_numeric(converted_df, numeric, strict=(errors == 'raise'), int_columns=int_columns)
+            except Exception as e:
+                logger.error(f"Error converting numeric columns: {e}")
+                if errors == 'raise':
+                    raise
+                parsed = {}
+            for column, (values, exact) in parsed.items():
+                if targets[column] == 'int':
+                    infinite = np.isinf(values)
+                    if infinite.any():
+                        if errors == 'raise':
+                            raise TypeError(f"Column '{column}' has infinite values; cannot convert to int")
+                        values = np.where(infinite, np.nan, values)  # invalid, like unparseable text
+                    finite = values[np.isfinite(values)]
+                    if (finite % 1 == 0).all():
+                        converted_df[column] = _nullable_int(exact)
+                        continue
+                    if errors == 'raise':
+                        raise TypeError(f"Column '{column}' has fractional values; cannot convert to int")
+                    logger.warning(f"Column '{column}' has fractional values; converting to float")
+                converted_df[column] = values
+        
+        for column, target_type in targets.items():
+            if target_type not in ('int', 'float'):
                 converted_df[column] = DataTypeConverter.convert_column(
                     converted_df[column], 
                     target_type, 
@@ -146,6 +328,8 @@ class DataTypeConverter:
         """
         Remove columns that are mostly NaN or empty.
         
+        Empty and whitespace-only strings count as empty, like NaN.
+        
         Args:
             df (pd.DataFrame): Input DataFrame
             threshold (float, optional): Percentage of NaN/empty values to consider for removal. 
@@ -156,18 +340,19 @@ class DataTypeConverter:
         """
         logger.info(f"Filtering columns with more than {threshold*100}% NaN/empty values")
         
-        # Calculate percentage of NaN/empty values for each column
-        nan_percentages = df.isna().mean()
-        
-        # Columns to keep (those below the threshold)
-        columns_to_keep = nan_percentages[nan_percentages < threshold].index.tolist()
+        # Blank ratios of every column come from one (cached) profiling scan
+        try:
+            removed_columns = set(profile_dataframe(df).empty_columns(threshold))
+        except Exception as e:
+            logger.warning(f"Column profiling failed ({e}); counting NaN only")
+            nan_percentages = df.isna().mean()
+            removed_columns = set(nan_percentages[nan_percentages >= threshold].index)
         
         # Log removed columns
-        removed_columns = list(set(df.columns) - set(columns_to_keep))
         if removed_columns:
-            logger.info(f"Removed empty columns: {removed_columns}")
+            logger.info(f"Removed empty columns: {sorted(map(str, removed_columns))}")
         
-        return df[columns_to_keep]
+        return df.loc[:, [col not in removed_columns for col in df.columns]]
 
     @staticmethod
     def suggest_column_types(df: pd.DataFrame) -> Dict[str, str]:
@@ -180,7 +365,7 @@ class DataTypeConverter:
         Returns:
             Dict[str, str]: Mapping of column names to suggested types
         """
-        return {col: DataTypeConverter.infer_type(df[col]) for col in df.columns}
+        return infer_column_types(df)
 
     @staticmethod
     def suggest_column_types_with_filtering(df: pd.DataFrame, threshold: float = 0.9) -> Dict[str, str]:
@@ -196,7 +381,7 @@ class DataTypeConverter:
             Dict[str, str]: Mapping of column names to suggested types
         """
         filtered_df = DataTypeConverter.filter_empty_columns(df, threshold)
-        return {col: DataTypeConverter.infer_type(filtered_df[col]) for col in filtered_df.columns}
+        return infer_column_types(filtered_df)
 
 # Example usage
 if __name__ == "__main__":
@@ -12,7 +12,10 @@ from typing import List, Dict, Any, Callable, Optional
 from enum import Enum
 import math
 
+import numpy as np
+
 from backend.utils.phone_data_utils import PhoneDataUtils, PhoneDataFormatter
+from backend.utils.sort_permutations import SortPermutationCache
 
 
 class SortOrder(Enum):
@@ -62,6 +65,9 @@ class EfficientTableManager(QObject):
         self.filtered_data = []
         self.sort_column = 0
         self.sort_order = SortOrder.DESCENDING
+        self.column_configs: List[Dict[str, Any]] = []
+        self._sort_cache = SortPermutationCache()
+        self._filter_rows: Optional[np.ndarray] = None  # mask over all_data, None: no filter
         
         # Setup table
         self._setup_table()
@@ -100,6 +106,7 @@ class EfficientTableManager(QObject):
         """
         self.all_data = data
         self.filtered_data = data.copy()
+        self._filter_rows = None
         
         # Setup columns
         self._setup_columns(column_configs)
@@ -184,46 +191,26 @@ class EfficientTableManager(QObject):
         self._load_current_page()
     
     def _sort_data(self):
-        """Sort filtered data."""
-        if not self.filtered_data:
+        """Sort filtered data through the cached permutation of the sort column."""
+        if not self.filtered_data or not 0 <= self.sort_column < len(self.column_configs):
             return
         
-        # Get sort key function
         config = self.column_configs[self.sort_column]
-        key_func = config.get('sort_key', config['key'])
-        
-        # Sort data
-        reverse = (self.sort_order == SortOrder.DESCENDING)
-        
-        # Handle numeric sorting properly
-        if config.get('numeric', False):
-            # For numeric columns, convert to float for proper sorting
-            def numeric_key(x):
-                try:
-                    value = key_func(x) if callable(key_func) else getattr(x, key_func, 0)
-                    return float(value) if value is not None else 0.0
-                except (ValueError, TypeError):
-                    return 0.0
-            
-            # Debug: Print first few values to see what we're sorting
-            print(f"🔍 Sorting numeric column '{config['name']}' (reverse={reverse})")
-            print(f"   Sample values: {[numeric_key(x) for x in self.filtered_data[:5]]}")
-            
-            self.filtered_data.sort(key=numeric_key, reverse=reverse)
-            
-            # Debug: Print first few sorted values
-            print(f"   After sorting: {[numeric_key(x) for x in self.filtered_data[:5]]}")
-        else:
-            # For non-numeric columns, use string sorting
-            if callable(key_func):
-                self.filtered_data.sort(key=lambda x: str(key_func(x) or ''), reverse=reverse)
-            else:
-                self.filtered_data.sort(key=lambda x: str(getattr(x, key_func, '') or ''), reverse=reverse)
+        key = config.get('sort_key', config['key'])
+        
+        # Numeric columns sort as floats, others by their string value
+        order = self._sort_cache.permutation(
+            self.all_data, key, numeric=bool(config.get('numeric', False)),
+            descending=(self.sort_order == SortOrder.DESCENDING), rows=self._filter_rows)
+        all_data = self.all_data
+        self.filtered_data = [all_data[i] for i in order]
     
     def apply_filter(self, filter_func: Callable[[Any], bool]):
         """Apply filter to ENTIRE dataset."""
         # Apply filter to full dataset
-        self.filtered_data = [item for item in self.all_data if filter_func(item)]
+        self._filter_rows = np.fromiter((bool(filter_func(item)) for item in self.all_data),
+                                        dtype=bool, count=len(self.all_data))
+        self.filtered_data = [item for item, keep in zip(self.all_data, self._filter_rows) if keep]
         
         # Apply current sorting to filtered results
         if hasattr(self, 'sort_column') and hasattr(self, 'sort_order'):
@@ -240,6 +227,7 @@ class EfficientTableManager(QObject):
         """Clear all filters and show full dataset."""
         # Restore full dataset
         self.filtered_data = self.all_data.copy()
+        self._filter_rows = None
         
         # Apply current sorting to full dataset
         if hasattr(self, 'sort_column') and hasattr(self, 'sort_order'):
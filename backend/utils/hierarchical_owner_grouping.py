@@ -11,6 +11,9 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
+from backend.utils.owner_facet_index import OwnerFacetIndex
+from backend.utils.owner_summary import OwnerRollup
+
 
 @dataclass
 class HierarchicalOwnerGroup:
@@ -48,6 +51,7 @@ class HierarchicalOwnerGrouper:
     
     def __init__(self):
         self.logger = logger
+        self._facets: Optional[OwnerFacetIndex] = None
     
     def determine_owner_name(self, owner) -> str:
         """Determine the best owner name using hierarchy: individual > business > default."""
@@ -155,24 +159,29 @@ class HierarchicalOwnerGrouper:
         if not owner_groups:
             return {}
         
-        total_owners = len(owner_groups)
-        total_properties = sum(og.property_count for og in owner_groups)
-        total_value = sum(og.total_value for og in owner_groups)
-        business_owners = sum(1 for og in owner_groups if og.is_business)
-        individual_owners = total_owners - business_owners
+        facets = self._facets_for(owner_groups)
+        rollup = OwnerRollup.from_facets(facets)
+        total_owners = rollup.total_owners
+        total_properties = rollup.total_properties
+        total_value = rollup.total_value
+        business_owners = rollup.business_owners
+        individual_owners = rollup.individual_owners
         
         # Multi-property owners
-        multi_property_owners = sum(1 for og in owner_groups if og.property_count > 1)
+        multi_property_owners = rollup.multi_property_owners
         
-        # High confidence targets
-        high_confidence = sum(1 for og in owner_groups if og.confidence_score >= 0.8)
-        medium_confidence = sum(1 for og in owner_groups if 0.6 <= og.confidence_score < 0.8)
-        low_confidence = sum(1 for og in owner_groups if og.confidence_score < 0.6)
+        # High confidence targets (groups use a 0.6 medium threshold)
+        high_confidence = facets.count(facets.range_mask("confidence_score", low=0.8))
+        medium_confidence = facets.count(facets.range_mask("confidence_score", low=0.6, high=0.8))
+        low_confidence = total_owners - high_confidence - medium_confidence
         
         # Phone quality stats
-        avg_phone_quality = sum(og.phone_quality for og in owner_groups) / total_owners if total_owners > 0 else 0
-        total_phones = sum(og.phone_count for og in owner_groups)
-        total_correct_phones = sum(og.correct_phones for og in owner_groups)
+        avg_phone_quality = rollup.phone_quality_sum / total_owners if total_owners > 0 else 0
+        total_phones = 0
+        total_correct_phones = 0
+        for og in owner_groups:
+            total_phones += og.phone_count
+            total_correct_phones += og.correct_phones
         
         return {
             'total_owners': total_owners,
@@ -201,15 +210,24 @@ class HierarchicalOwnerGrouper:
     def filter_owners_by_type(self, owner_groups: List[HierarchicalOwnerGroup], owner_type: str = "all") -> List[HierarchicalOwnerGroup]:
         """Filter owners by type (business, individual, or all)."""
         if owner_type.lower() == "business":
-            return [og for og in owner_groups if og.is_business]
+            facets = self._facets_for(owner_groups)
+            return facets.select(facets.mask("business"))
         elif owner_type.lower() == "individual":
-            return [og for og in owner_groups if not og.is_business]
+            facets = self._facets_for(owner_groups)
+            return facets.select(~facets.mask("business"))
         else:
             return owner_groups
     
     def filter_owners_by_confidence(self, owner_groups: List[HierarchicalOwnerGroup], min_confidence: float = 0.0) -> List[HierarchicalOwnerGroup]:
         """Filter owners by minimum confidence score."""
-        return [og for og in owner_groups if og.confidence_score >= min_confidence]
+        facets = self._facets_for(owner_groups)
+        return facets.select(facets.range_mask("confidence_score", low=min_confidence))
+    
+    def _facets_for(self, owner_groups: List[HierarchicalOwnerGroup]) -> OwnerFacetIndex:
+        """Facet index of *owner_groups*, reused while the same list is filtered."""
+        if self._facets is None or self._facets.owners is not owner_groups:
+            self._facets = OwnerFacetIndex(owner_groups)
+        return self._facets
     
     def search_owners(self, owner_groups: List[HierarchicalOwnerGroup], search_term: str) -> List[HierarchicalOwnerGroup]:
         """Search owners by name or address."""
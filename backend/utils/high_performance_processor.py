@@ -23,6 +23,10 @@ import time
 from datetime import datetime, timedelta
 import sys
 
+from backend.utils import trailing_dot_cleanup as tdc
+from backend.utils.column_profiler import profile_dataframe
+from backend.utils.source_profiles import SourceProfile, cleanup_columns, read_columns, resolve_profile
+
 class HighPerformanceProcessor:
     """
     High-performance data processor using Polars internally.
@@ -36,13 +40,17 @@ class HighPerformanceProcessor:
         self.processing_stats = {}
         self.start_time = None
         self.step_times = {}
+        self.source_profile: Optional[SourceProfile] = None
     
-    def load_csv(self, filepath: Union[str, Path], **kwargs) -> pd.DataFrame:
+    def load_csv(self, filepath: Union[str, Path],
+                 profile: Union[SourceProfile, str, None] = "auto", **kwargs) -> pd.DataFrame:
         """
         Load CSV file with Polars speed, return pandas DataFrame.
         
         Args:
             filepath: Path to CSV file
+            profile: Source profile whose identifier columns are read as text
+                ("auto" detects it from the header row, None disables it)
             **kwargs: Additional arguments for polars.read_csv
             
         Returns:
@@ -54,6 +62,15 @@ class HighPerformanceProcessor:
         print(f"🔄 Loading CSV: {Path(filepath).name}")
         print(f"⏰ Started at: {datetime.now().strftime('%H:%M:%S')}")
         
+        columns = read_columns(filepath) if profile is not None else []
+        self.source_profile = resolve_profile(profile, columns)
+        text_dtypes = self.source_profile.pandas_dtypes(columns) if self.source_profile else None
+        if self.source_profile:
+            # Phones/ZIPs stay text, so they never pick up a trailing .0
+            kwargs['schema_overrides'] = {**self.source_profile.schema_overrides(columns),
+                                          **(kwargs.get('schema_overrides') or {})}
+            print(f"🗂️  Source profile: {self.source_profile.name} ({len(text_dtypes)} text columns)")
+        
         try:
             # Load with Polars (much faster) - handle mixed data types
             self.pl_df = pl.read_csv(
@@ -82,14 +99,16 @@ class HighPerformanceProcessor:
             logger.error(f"Failed to load CSV with high-performance processor: {e}")
             # Fallback to pandas
             logger.info("Falling back to pandas...")
-            return pd.read_csv(filepath, **kwargs)
+            kwargs.pop('schema_overrides', None)
+            return pd.read_csv(filepath, dtype=text_dtypes, **kwargs)
     
-    def clean_trailing_dot_zero(self, df: pd.DataFrame) -> pd.DataFrame:
+    def clean_trailing_dot_zero(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Remove trailing .0 from numeric-like strings using Polars speed.
         
         Args:
             df: pandas DataFrame
+            columns: Columns to clean (default: all); see source_profiles.cleanup_columns
             
         Returns:
             pandas.DataFrame: Cleaned data
@@ -103,16 +122,15 @@ class HighPerformanceProcessor:
             # Convert to Polars for fast processing
             pl_df = pl.from_pandas(df)
             
-            # Get string columns that might have .0
-            string_cols = [col for col in pl_df.columns if pl_df[col].dtype == pl.Utf8]
+            # Only text columns carry a .0; float columns (prices) stay numeric
+            schema = pl_df.schema
+            string_cols = [col for col in pl_df.columns
+                           if schema[col] == pl.Utf8 and (columns is None or col in columns)]
             
             print(f"📊 Processing {len(string_cols)} string columns...")
             
-            # Apply .0 cleanup to string columns
-            cleaned_pl_df = pl_df.with_columns([
-                pl.col(col).str.replace_all(r"\.0$", "") 
-                for col in string_cols
-            ])
+            # Apply .0 cleanup to every affected column in one with_columns
+            cleaned_pl_df = tdc.strip_trailing_dot_zero_frame(pl_df, columns=string_cols)
             
             # Convert back to pandas
             cleaned_df = cleaned_pl_df.to_pandas()
@@ -133,8 +151,7 @@ class HighPerformanceProcessor:
             logger.error(f"Failed to clean with high-performance processor: {e}")
             # Fallback to existing method
             logger.info("Falling back to existing cleanup...")
-            from backend.utils import trailing_dot_cleanup as tdc
-            return tdc.clean_dataframe(df)
+            return tdc.clean_dataframe(df, columns=columns)
 
     def filter_empty_columns(self, df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
         """
@@ -153,20 +170,12 @@ class HighPerformanceProcessor:
         print(f"⏰ Started at: {datetime.now().strftime('%H:%M:%S')}")
         
         try:
-            # Convert to Polars for speed
-            pl_df = pl.from_pandas(df)
-            
-            # Calculate percentage of null values for each column
-            null_percentages = pl_df.null_count() / len(pl_df)
-            
-            # Columns to keep (those below the threshold)
-            columns_to_keep = [col for col, null_pct in zip(pl_df.columns, null_percentages) if null_pct < threshold]
+            # One cached scan gives null + blank counts for every column
+            profile = profile_dataframe(df)
+            columns_to_keep = set(profile.non_empty_columns(threshold))
             
             # Filter DataFrame
-            filtered_pl_df = pl_df.select(columns_to_keep)
-            
-            # Convert back to pandas
-            filtered_df = filtered_pl_df.to_pandas()
+            filtered_df = df.loc[:, [col in columns_to_keep for col in df.columns]]
             
             filter_time = time.time() - step_start
             self.processing_stats['filter_time'] = filter_time
@@ -536,10 +545,10 @@ def load_csv_fast(filepath: Union[str, Path], **kwargs) -> pd.DataFrame:
     return processor.load_csv(filepath, **kwargs)
 
 
-def clean_dataframe_fast(df: pd.DataFrame) -> pd.DataFrame:
+def clean_dataframe_fast(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
     """Fast .0 cleanup with Polars."""
     processor = HighPerformanceProcessor()
-    return processor.clean_trailing_dot_zero(df)
+    return processor.clean_trailing_dot_zero(df, columns=columns)
 
 
 def filter_empty_columns_fast(df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
@@ -575,8 +584,8 @@ def process_complete_pipeline_fast(filepath: Union[str, Path], export_excel: boo
     # Step 1: Load
     df = processor.load_csv(filepath)
     
-    # Step 2: Clean
-    df = processor.clean_trailing_dot_zero(df)
+    # Step 2: Clean (profile text columns were read without .0)
+    df = processor.clean_trailing_dot_zero(df, columns=cleanup_columns(df, processor.source_profile))
     
     # Step 3: Prioritize
     df, meta = processor.prioritize_phones_fast(df)
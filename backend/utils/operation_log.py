@@ -0,0 +1,306 @@
+"""
+Operation Log
+-------------
+Record data preparation edits as declarative operations and replay them on
+a new upload without the GUI.
+
+Every DataPrepEditor / DataToolsPanel action (merge, rename, reorder, hide,
+duplicate removal, ``.0`` cleanup, phone prioritization) is stored as an
+:class:`Operation` – a kind plus JSON-serialisable parameters.  An
+:class:`OperationLog` compiles the operations into a lazy Polars plan, so
+consecutive steps are fused and optimised together (e.g. a merge whose
+sources are dropped afterwards never materialises them separately).
+
+The ``.0`` cleanup only rewrites text columns, like the editor's
+``clean_dataframe_fast``; float columns stay numeric.  Phone prioritization
+and smart seller creation depend on the data itself (which phone columns
+win, which rows share a mailing address), so the plan is collected before
+those steps and continues lazily after them.  So are merges of non-text columns:
+the editor renders their values with ``str()`` (after upcasting each row to
+a common dtype), which a Polars cast does not reproduce.
+
+Hide/show operations do not change the data; the columns still hidden at
+the end of the log are dropped from the replayed frame, which then matches
+the editor's table.
+
+Example
+-------
+>>> from backend.utils.operation_log import OperationLog
+>>> log = OperationLog.load("data/presets/saved_presets/<id>/operation_log.json")
+>>> df = log.replay("upload/next_month.csv")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+import pandas as pd
+import polars as pl
+from loguru import logger
+
+from backend.utils import trailing_dot_cleanup as tdc
+from backend.utils.column_profiler import to_polars_column
+from backend.utils.mapping_executor import ConcatRule, concat_columns, concat_lazy, row_dtype
+from backend.utils.source_profiles import read_columns, read_source, resolve_profile
+
+__all__: list[str] = [
+    "Operation",
+    "OperationLog",
+    "replay_operations",
+]
+
+
+@dataclass(frozen=True)
+class Operation:
+    """One recorded edit.
+
+    Attributes
+    ----------
+    kind:
+        Operation name, a key of ``OperationLog`` compilers (``"merge"``,
+        ``"rename"``, ``"reorder"``, ``"hide_columns"``, ``"show_columns"``,
+        ``"drop_duplicates"``, ``"strip_trailing_dot"``,
+        ``"prioritize_phones"`` or ``"reset"``).
+    params:
+        JSON-serialisable parameters of the edit.
+    """
+
+    kind: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "params": self.params}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Operation":
+        return cls(data["kind"], dict(data.get("params", {})))
+
+
+def _merge_rule(params: Dict[str, Any], as_dtype: Any = None) -> ConcatRule:
+    columns = tuple(params["columns"])
+    handle_empty = params.get("handle_empty", True)
+    return ConcatRule(
+        columns,
+        separator=params.get("delimiter", " "),
+        skip_empty=handle_empty,
+        fill_null=None if handle_empty else "",
+        labels=columns if params.get("include_headers") else None,
+        as_dtype=as_dtype,
+    )
+
+
+def _place_merged(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    # The merged column is inserted first, like the editor does
+    new_name = params["new_name"]
+    rest = [col for col in lf.collect_schema().names() if col != new_name]
+    if not params.get("keep_original", True):
+        rest = [col for col in rest if col not in params["columns"]]
+    return lf.select([new_name] + rest)
+
+
+# Lazy compilers: (plan, params) -> plan
+def _merge(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    # Text sources only: Polars and str() agree on strings
+    return _place_merged(concat_lazy(lf, _merge_rule(params), params["new_name"]), params)
+
+
+def _rename(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    names = set(lf.collect_schema().names())
+    return lf.rename({old: new for old, new in params["mapping"].items() if old in names})
+
+
+def _reorder(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    names = lf.collect_schema().names()
+    ordered = [col for col in params["columns"] if col in names]
+    return lf.select(ordered + [col for col in names if col not in ordered])
+
+
+def _drop_duplicates(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    method = params.get("method", "all_columns")
+    keep = params.get("keep", "first")
+    keep = "none" if keep is False else keep
+    subset: Optional[List[str]] = None
+    if method in ("selected_columns", "ignore_case") and params.get("columns"):
+        # ignore_case compares the original columns next to their lower-cased
+        # copies, which is the same as comparing the original columns
+        subset = list(params["columns"])
+    elif method == "address_based_grouping":
+        subset = ["Property address"]
+    return lf.unique(subset=subset, keep=keep, maintain_order=True)
+
+
+def _strip_trailing_dot(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    # Text columns only, like the editor; float columns keep their dtype
+    wanted = params.get("columns")
+    text = [name for name, dtype in lf.collect_schema().items()
+            if dtype == pl.Utf8 and (wanted is None or name in wanted)]
+    return tdc.strip_trailing_dot_zero_frame(lf, columns=text)
+
+
+def _identity(lf: pl.LazyFrame, params: Dict[str, Any]) -> pl.LazyFrame:
+    return lf  # view-only; plan() drops the columns still hidden at the end
+
+
+# Data-dependent steps: (collected frame, params) -> frame
+def _merge_rendered(df: pl.DataFrame, params: Dict[str, Any]) -> pl.DataFrame:
+    # Non-text sources are rendered with str() after the editor's row upcast
+    sources = df.select(list(params["columns"])).to_pandas()
+    merged = concat_columns(sources, _merge_rule(params, row_dtype(sources)))
+    frame = df.with_columns(to_polars_column(merged, params["new_name"]).cast(pl.Utf8))
+    return _place_merged(frame.lazy(), params).collect()
+
+
+def _prioritize_phones(df: pl.DataFrame, params: Dict[str, Any]) -> pl.DataFrame:
+    from backend.utils.high_performance_processor import prioritize_phones_fast
+    prioritized, _ = prioritize_phones_fast(df.to_pandas(), params.get("max_phones", 5), params.get("rules"))
+    return _to_polars(prioritized)
+
+
+def _smart_seller_creation(df: pl.DataFrame, params: Dict[str, Any]) -> pl.DataFrame:
+    from backend.utils.ownership_analysis import deduplicate_by_mailing_address
+    return _to_polars(deduplicate_by_mailing_address(df.to_pandas()))
+
+
+_LAZY: Dict[str, Callable[[pl.LazyFrame, Dict[str, Any]], pl.LazyFrame]] = {
+    "merge": _merge,
+    "rename": _rename,
+    "reorder": _reorder,
+    "drop_duplicates": _drop_duplicates,
+    "strip_trailing_dot": _strip_trailing_dot,
+    "hide_columns": _identity,
+    "show_columns": _identity,
+}
+
+_EAGER: Dict[str, Callable[[pl.DataFrame, Dict[str, Any]], pl.DataFrame]] = {
+    "merge": _merge_rendered,
+    "prioritize_phones": _prioritize_phones,
+    "smart_seller_creation": _smart_seller_creation,
+}
+
+
+def _to_polars(df: pd.DataFrame) -> pl.DataFrame:
+    try:
+        return pl.from_pandas(df)
+    except Exception:  # mixed object columns
+        return pl.DataFrame([to_polars_column(df[col], str(col)) for col in df.columns])
+
+
+def _is_eager(operation: Operation, schema: pl.Schema) -> bool:
+    if operation.kind == "drop_duplicates":
+        return operation.params.get("method") == "smart_seller_creation"
+    if operation.kind == "merge":
+        return any(schema.get(col) not in (pl.Utf8, pl.Null) for col in operation.params["columns"])
+    return operation.kind in _EAGER
+
+
+@dataclass
+class OperationLog:
+    """Ordered list of :class:`Operation` with a lazy replay plan."""
+
+    operations: List[Operation] = field(default_factory=list)
+
+    def append(self, kind: str, **params: Any) -> Operation:
+        """Record an operation and return it."""
+        operation = Operation(kind, params)
+        self.operations.append(operation)
+        return operation
+
+    def hidden_columns(self) -> Set[str]:
+        """Columns hidden by the recorded hide/show operations."""
+        hidden: Set[str] = set()
+        for operation in self.operations:
+            if operation.kind == "hide_columns":
+                hidden.update(operation.params.get("columns", []))
+            elif operation.kind == "show_columns":
+                columns = operation.params.get("columns")
+                hidden = set() if columns is None else hidden - set(columns)
+            elif operation.kind == "rename":
+                mapping = operation.params["mapping"]
+                hidden = {mapping.get(col, col) for col in hidden}
+            elif operation.kind == "merge" and not operation.params.get("keep_original", True):
+                hidden -= set(operation.params["columns"])
+            elif operation.kind == "reset":
+                hidden = set()
+        return hidden
+
+    # Serialisation
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [operation.to_dict() for operation in self.operations]
+
+    @classmethod
+    def from_list(cls, data: List[Dict[str, Any]]) -> "OperationLog":
+        return cls([Operation.from_dict(item) for item in data])
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_list(), f, indent=2, default=str)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "OperationLog":
+        with open(path, "r") as f:
+            return cls.from_list(json.load(f))
+
+    # Replay
+
+    def plan(self, source: pl.LazyFrame, keep_hidden: bool = False) -> pl.LazyFrame:
+        """Compile the log onto *source*.
+
+        Lazy operations are chained into one plan; before a data-dependent
+        operation the plan so far is collected, the step is applied and a
+        new plan starts from its result.  Columns hidden at the end of the
+        log are dropped, giving the frame the editor shows, unless
+        *keep_hidden* is set.
+        """
+        lf = source
+        for operation in self.operations:
+            if operation.kind == "reset":
+                lf = source
+            elif _is_eager(operation, lf.collect_schema()):
+                kind = "smart_seller_creation" if operation.kind == "drop_duplicates" else operation.kind
+                lf = _EAGER[kind](lf.collect(), operation.params).lazy()
+            elif operation.kind in _LAZY:
+                lf = _LAZY[operation.kind](lf, operation.params)
+            else:
+                logger.warning(f"Unknown operation '{operation.kind}' skipped during replay")
+        if not keep_hidden:
+            hidden = self.hidden_columns()
+            lf = lf.drop([col for col in lf.collect_schema().names() if col in hidden])
+        return lf
+
+    def replay(self, source: Union[str, Path, pd.DataFrame, pl.DataFrame],
+               profile: Any = "auto", keep_hidden: bool = False) -> pd.DataFrame:
+        """Apply the log to a new upload (file path or frame) and return pandas.
+
+        Args:
+            source: ``.csv``/``.xls``/``.xlsx`` path or a pandas/Polars frame
+            profile: Source profile for reading files (see source_profiles)
+            keep_hidden: Keep columns the log hides (default: drop them)
+        """
+        return self.plan(_scan(source, profile), keep_hidden).collect().to_pandas()
+
+
+def _scan(source: Union[str, Path, pd.DataFrame, pl.DataFrame], profile: Any) -> pl.LazyFrame:
+    if isinstance(source, pl.DataFrame):
+        return source.lazy()
+    if isinstance(source, pd.DataFrame):
+        return _to_polars(source).lazy()
+
+    if os.path.splitext(str(source))[1].lower() == ".csv":
+        columns = read_columns(source)
+        resolved = resolve_profile(profile, columns)
+        overrides = resolved.schema_overrides(columns) if resolved is not None else None
+        return pl.scan_csv(source, schema_overrides=overrides, infer_schema_length=10_000)
+    df, _ = read_source(source, profile)
+    return _to_polars(df).lazy()
+
+
+def replay_operations(source: Union[str, Path, pd.DataFrame, pl.DataFrame],
+                      operations: Union[OperationLog, List[Dict[str, Any]]]) -> pd.DataFrame:
+    """Convenience wrapper: replay *operations* (a log or its JSON list) on *source*."""
+    log = operations if isinstance(operations, OperationLog) else OperationLog.from_list(operations)
+    return log.replay(source)
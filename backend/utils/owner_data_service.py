@@ -0,0 +1,260 @@
+"""
+Owner Data Service
+------------------
+One in-process owner dataset shared by every screen.
+
+The owner dashboard, the main window's owner table, the custom export
+dialog and the user dashboard all need the persisted owner objects.
+Instead of each of them unpickling ``owner_objects.pkl`` (and recomputing
+the same statistics) on its own, they ask the shared
+:class:`OwnerDataService` (see :func:`get_owner_data_service`):
+
+* a dataset is loaded once – on a background thread with
+  :meth:`~OwnerDataService.load_in_background` – and later requests for the
+  same, unchanged dataset return the loaded snapshot;
+* an :class:`OwnerDataSnapshot` is immutable and versioned: the owner list,
+  its columnar facet arrays (``OwnerFacetIndex``), the search index and the
+  summary statistics (read from the dataset's ``summary.json`` sidecar, see
+  ``owner_summary``), all prepared once at load time;
+* subscribers are notified of every new snapshot (and of ``None`` when the
+  dataset is released);
+* switching to another dataset releases the previous one first, so two
+  full datasets are never held at once.
+
+Only the standard library is imported at module level: the persistence
+manager, NumPy and the indexes are imported when a dataset is loaded.
+
+Example
+-------
+>>> from backend.utils.owner_data_service import get_owner_data_service
+>>> service = get_owner_data_service()
+>>> snapshot = service.load()          # unpickles once; later calls are free
+>>> snapshot.stats["business_owners"], snapshot.version
+"""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+__all__: list[str] = [
+    "OwnerDataSnapshot",
+    "OwnerDataService",
+    "get_owner_data_service",
+    "owner_summary_stats",
+]
+
+SnapshotCallback = Callable[[Optional["OwnerDataSnapshot"]], None]
+
+
+@dataclass(frozen=True)
+class OwnerDataSnapshot:
+    """One loaded owner dataset. Treat every member as read-only."""
+
+    dataset_name: str
+    version: int
+    owners: List[Any]
+    facets: Any  # OwnerFacetIndex: columnar values and masks
+    search_index: Any  # OwnerSearchIndex
+    stats: Dict[str, Any]
+    dataset_dir: Optional[Path] = None
+    source_mtime: float = 0.0
+    loaded_at: float = field(default_factory=time.time)
+
+    def __len__(self) -> int:
+        return len(self.owners)
+
+    def column(self, name: str):
+        """Values of a range facet (``property_count``, ``total_property_value``, ...)."""
+        return self.facets.values[name]
+
+
+def owner_summary_stats(facets: Any) -> Dict[str, Any]:
+    """Dashboard summary statistics from the columnar arrays of an ``OwnerFacetIndex``."""
+    from backend.utils.owner_summary import OwnerRollup
+
+    return OwnerRollup.from_facets(facets).summary()
+
+
+class OwnerDataService:
+    """Loads owner datasets once and shares them as versioned snapshots."""
+
+    def __init__(self, base_dir: str = "data/processed"):
+        """
+        Args:
+            base_dir: Persistence directory (as for OwnerPersistenceManager)
+        """
+        self.base_dir = base_dir
+        self._snapshot: Optional[OwnerDataSnapshot] = None
+        self._version = 0
+        self._load_lock = threading.Lock()  # one load at a time
+        self._lock = threading.Lock()  # snapshot and subscribers
+        self._subscribers: List[SnapshotCallback] = []
+        self._pending: Optional[Future] = None
+
+    # Access
+
+    @property
+    def snapshot(self) -> Optional[OwnerDataSnapshot]:
+        """The current snapshot, or None if nothing is loaded."""
+        return self._snapshot
+
+    def subscribe(self, callback: SnapshotCallback) -> Callable[[], None]:
+        """Call *callback* with each new snapshot (None on release), on the loading thread.
+
+        Returns a function that removes the subscription.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    # Loading
+
+    def load(self, dataset_name: Optional[str] = None, force: bool = False) -> OwnerDataSnapshot:
+        """Snapshot of *dataset_name* (latest saved dataset if None).
+
+        The dataset is only read from disk if it is not the loaded one, its
+        ``owner_objects.pkl`` changed since, or *force* is set.  Concurrent
+        callers wait for one load instead of loading twice.
+        """
+        from backend.utils.owner_persistence_manager import OwnerPersistenceManager
+
+        with self._load_lock:
+            manager = OwnerPersistenceManager(self.base_dir)
+            if not dataset_name:
+                dataset_name = manager.get_latest_dataset("owner_objects")
+                if not dataset_name:
+                    raise FileNotFoundError("No saved Property Owners datasets found")
+            dataset_dir = manager.dataset_dir(dataset_name)
+            source = dataset_dir / "owner_objects.pkl"
+            source_mtime = source.stat().st_mtime if source.exists() else 0.0
+
+            current = self._snapshot
+            if (not force and current is not None and current.dataset_name == dataset_name
+                    and current.source_mtime == source_mtime):
+                return current
+
+            if current is not None:
+                self.release()  # free the previous dataset before reading the next one
+            start = time.perf_counter()
+            owners = manager.load_owner_objects(dataset_name)
+            snapshot = self._build_snapshot(owners, dataset_name, dataset_dir, source_mtime)
+            logger.info(f"📦 Owner dataset '{dataset_name}' v{snapshot.version}: "
+                        f"{len(owners):,} owners ready in {time.perf_counter() - start:.1f}s")
+            self._publish(snapshot)
+            return snapshot
+
+    def load_in_background(self, dataset_name: Optional[str] = None, force: bool = False) -> Future:
+        """Run :meth:`load` on a worker thread; returns a Future of the snapshot.
+
+        While a background load is running, further calls return its Future.
+        """
+        with self._lock:
+            if self._pending is not None and not self._pending.done():
+                return self._pending
+            future: Future = Future()
+            self._pending = future
+
+        def run():
+            try:
+                future.set_result(self.load(dataset_name, force))
+            except Exception as e:
+                logger.error(f"❌ Loading owner dataset failed: {e}")
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="owner-data-load", daemon=True).start()
+        return future
+
+    def set_owners(self, owners: List[Any], dataset_name: str = "in-memory") -> OwnerDataSnapshot:
+        """Share owners produced in this process (e.g. by the pipeline) as a new snapshot."""
+        with self._load_lock:
+            if self._snapshot is not None:
+                self.release()
+            snapshot = self._build_snapshot(owners, dataset_name, None, 0.0)
+            self._publish(snapshot)
+            return snapshot
+
+    def release(self):
+        """Drop the current snapshot and free its memory."""
+        with self._lock:
+            released, self._snapshot = self._snapshot, None
+        if released is None:
+            return
+        self._notify(None)
+        del released
+        gc.collect()
+        logger.info("🧹 Released owner dataset")
+
+    # Internals
+
+    def _build_snapshot(self, owners: List[Any], dataset_name: str, dataset_dir: Optional[Path],
+                        source_mtime: float) -> OwnerDataSnapshot:
+        from backend.utils.owner_facet_index import OwnerFacetIndex
+        from backend.utils.owner_search_index import load_or_build_search_index
+
+        facets = OwnerFacetIndex(owners)
+        search_index = load_or_build_search_index(owners, dataset_dir)
+        stats = self._summary_for(facets, dataset_dir)
+        with self._lock:
+            self._version += 1
+            version = self._version
+        return OwnerDataSnapshot(
+            dataset_name=dataset_name, version=version, owners=owners, facets=facets,
+            search_index=search_index, stats=stats,
+            dataset_dir=dataset_dir, source_mtime=source_mtime,
+        )
+
+    @staticmethod
+    def _summary_for(facets: Any, dataset_dir: Optional[Path]) -> Dict[str, Any]:
+        """The dataset's summary sidecar; rebuilt from *facets* when missing or stale."""
+        from backend.utils.owner_summary import OwnerRollup, read_owner_summary, write_owner_summary
+
+        if dataset_dir is None:
+            return owner_summary_stats(facets)
+        summary = read_owner_summary(dataset_dir)
+        if summary is None:
+            try:
+                summary = write_owner_summary(dataset_dir, OwnerRollup.from_facets(facets))
+            except OSError as e:
+                logger.warning(f"Could not write owner summary for {dataset_dir}: {e}")
+                summary = owner_summary_stats(facets)
+        return summary
+
+    def _publish(self, snapshot: OwnerDataSnapshot):
+        with self._lock:
+            self._snapshot = snapshot
+        self._notify(snapshot)
+
+    def _notify(self, snapshot: Optional[OwnerDataSnapshot]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.warning(f"Owner data subscriber failed: {e}")
+
+
+_service: Optional[OwnerDataService] = None
+_service_lock = threading.Lock()
+
+
+def get_owner_data_service() -> OwnerDataService:
+    """The process-wide owner data service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = OwnerDataService()
+        return _service
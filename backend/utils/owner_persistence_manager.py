@@ -20,6 +20,9 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject, EnhancedOwnerAnalyzer
+from backend.utils.catalog import catalog_for
+from backend.utils.owner_query import write_owner_tables
+from backend.utils.owner_summary import SUMMARY_FILENAME, OwnerRollup, write_owner_summary
 
 
 class OwnerPersistenceManager:
@@ -41,6 +44,9 @@ class OwnerPersistenceManager:
         (self.base_dir / "reports").mkdir(exist_ok=True)
         (self.base_dir / "backups").mkdir(exist_ok=True)
         
+        # Dataset index (data/catalog.sqlite by default)
+        self.catalog = catalog_for(self.base_dir)
+        
         self.logger = logger
     
     def save_owner_objects(self, owner_objects: List[EnhancedOwnerObject], 
@@ -63,6 +69,9 @@ class OwnerPersistenceManager:
         
         self.logger.info(f"💾 Starting to save {len(owner_objects):,} Owner Objects...")
         
+        # Index datasets saved without the catalog before this one is added
+        self.catalog.sync_datasets(self.base_dir, "owner_objects")
+        
         save_dir = self.base_dir / "owner_objects" / dataset_name
         save_dir.mkdir(parents=True, exist_ok=True)
         
@@ -115,13 +124,14 @@ class OwnerPersistenceManager:
             json.dump(owner_objects_json, f, indent=2)
         self.logger.info(f"✅ Saved {len(owner_objects_json):,} Owner Objects to JSON: {json_path}")
         
-        # Save summary statistics
-        summary = self._generate_summary(valid_objects)
-        summary_path = save_dir / "summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        # Save summary statistics (after the pickle: the sidecar records its mtime)
+        summary = write_owner_summary(save_dir, OwnerRollup.from_owners(valid_objects))
+        summary_path = save_dir / SUMMARY_FILENAME
         self.logger.info(f"✅ Saved summary statistics: {summary_path}")
         
+        # Save columnar tables for ad-hoc owner queries (also after the pickle)
+        tables_path = write_owner_tables(valid_objects, save_dir)
+        
         # Log sample of saved Owner Objects
         if valid_objects:
             self.logger.info(f"🎯 Sample saved Owner Objects:")
@@ -140,13 +150,15 @@ class OwnerPersistenceManager:
             'file_paths': {
                 'owner_objects_pkl': str(owner_objects_path),
                 'owner_objects_json': str(json_path),
-                'summary': str(summary_path)
+                'summary': str(summary_path),
+                'tables': str(tables_path)
             }
         }
         
         metadata_path = save_dir / "metadata.json"
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
+        self._index_dataset("owner_objects", dataset_name, metadata, summary)
         
         self.logger.info(f"✅ Saved {len(valid_objects):,} Owner Objects to {save_dir}")
         self.logger.info(f"📁 Dataset saved as: {dataset_name}")
@@ -171,6 +183,9 @@ class OwnerPersistenceManager:
         
         self.logger.info(f"💾 Starting to save enhanced dataframe with {len(df):,} rows...")
         
+        # Index datasets saved without the catalog before this one is added
+        self.catalog.sync_datasets(self.base_dir, "enhanced_data")
+        
         save_dir = self.base_dir / "enhanced_data" / dataset_name
         save_dir.mkdir(parents=True, exist_ok=True)
         
@@ -267,12 +282,24 @@ class OwnerPersistenceManager:
         metadata_path = save_dir / "metadata.json"
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
+        self._index_dataset("enhanced_data", dataset_name, metadata)
         
         self.logger.info(f"✅ Saved enhanced dataframe ({len(df_pandas):,} rows) to {save_dir}")
         self.logger.info(f"📁 Dataset saved as: {dataset_name}")
         
         return str(save_dir)
     
+    def _index_dataset(self, kind: str, dataset_name: str, metadata: Dict[str, Any],
+                       summary: Optional[Dict[str, Any]] = None):
+        """Add a saved dataset to the catalog (one transaction, after its files are written)."""
+        with self.catalog.transaction() as conn:
+            self.catalog.put_dataset(conn, self.base_dir, kind, dataset_name, metadata, summary)
+            self.catalog.mark_synced(conn, self.base_dir, f"datasets:{kind}", self.base_dir / kind)
+    
+    def dataset_dir(self, dataset_name: str) -> Path:
+        """Directory holding an Owner Objects dataset (and its search index)."""
+        return self.base_dir / "owner_objects" / dataset_name
+    
     def load_owner_objects(self, dataset_name: str) -> List[EnhancedOwnerObject]:
         """
         Load Owner Objects from persistent storage.
@@ -359,28 +386,10 @@ class OwnerPersistenceManager:
             Dict[str, Dict[str, Any]]: Dictionary of dataset names and their metadata
         """
         datasets = {}
-        
-        # List Owner Objects datasets
-        owner_objects_dir = self.base_dir / "owner_objects"
-        if owner_objects_dir.exists():
-            for dataset_dir in owner_objects_dir.iterdir():
-                if dataset_dir.is_dir():
-                    metadata_path = dataset_dir / "metadata.json"
-                    if metadata_path.exists():
-                        with open(metadata_path, 'r') as f:
-                            metadata = json.load(f)
-                        datasets[f"owner_objects_{dataset_dir.name}"] = metadata
-        
-        # List enhanced data datasets
-        enhanced_data_dir = self.base_dir / "enhanced_data"
-        if enhanced_data_dir.exists():
-            for dataset_dir in enhanced_data_dir.iterdir():
-                if dataset_dir.is_dir():
-                    metadata_path = dataset_dir / "metadata.json"
-                    if metadata_path.exists():
-                        with open(metadata_path, 'r') as f:
-                            metadata = json.load(f)
-                        datasets[f"enhanced_data_{dataset_dir.name}"] = metadata
+        for dataset_type in ("owner_objects", "enhanced_data"):
+            self.catalog.sync_datasets(self.base_dir, dataset_type)
+            for kind, name, metadata in self.catalog.datasets(self.base_dir, dataset_type):
+                datasets[f"{kind}_{name}"] = metadata
         
         return datasets
     
@@ -394,20 +403,8 @@ class OwnerPersistenceManager:
         Returns:
             Optional[str]: Name of the latest dataset, or None if none found
         """
-        datasets = self.list_saved_datasets()
-        
-        # Filter by type
-        type_datasets = {
-            name: metadata for name, metadata in datasets.items() 
-            if name.startswith(dataset_type)
-        }
-        
-        if not type_datasets:
-            return None
-        
-        # Find the most recent
-        latest = max(type_datasets.items(), key=lambda x: x[1]['saved_at'])
-        return latest[0].replace(f"{dataset_type}_", "")
+        self.catalog.sync_datasets(self.base_dir, dataset_type)
+        return self.catalog.latest_dataset(self.base_dir, dataset_type)
     
     def _create_backup(self, dataset_name: str):
         """Create a backup of existing data."""
@@ -425,58 +422,7 @@ class OwnerPersistenceManager:
         """Generate summary statistics for Owner Objects."""
         # Filter out non-EnhancedOwnerObject instances
         valid_objects = [obj for obj in owner_objects if hasattr(obj, 'individual_name')]
-        total_owners = len(valid_objects)
-        
-        if total_owners == 0:
-            return {
-                'total_owners': 0,
-                'total_properties': 0,
-                'total_value': 0,
-                'average_properties_per_owner': 0,
-                'average_value_per_owner': 0,
-                'confidence_breakdown': {
-                    'high_confidence': {'count': 0, 'percentage': 0},
-                    'medium_confidence': {'count': 0, 'percentage': 0},
-                    'low_confidence': {'count': 0, 'percentage': 0}
-                },
-                'owner_type_breakdown': {
-                    'individual_only': {'count': 0, 'percentage': 0},
-                    'business_only': {'count': 0, 'percentage': 0},
-                    'individual_business': {'count': 0, 'percentage': 0}
-                }
-            }
-        
-        # Count by confidence
-        high_conf = len([obj for obj in valid_objects if obj.confidence_score >= 0.8])
-        medium_conf = len([obj for obj in valid_objects if 0.5 <= obj.confidence_score < 0.8])
-        low_conf = len([obj for obj in valid_objects if obj.confidence_score < 0.5])
-        
-        # Count by owner type
-        individual_only = len([obj for obj in valid_objects if obj.is_individual_owner and not obj.is_business_owner])
-        business_only = len([obj for obj in valid_objects if obj.is_business_owner and not obj.is_individual_owner])
-        both_types = len([obj for obj in valid_objects if obj.is_individual_owner and obj.is_business_owner])
-        
-        # Calculate totals
-        total_properties = sum(obj.property_count for obj in valid_objects)
-        total_value = sum(obj.total_property_value for obj in valid_objects)
-        
-        return {
-            'total_owners': total_owners,
-            'total_properties': total_properties,
-            'total_value': total_value,
-            'average_properties_per_owner': total_properties / total_owners if total_owners > 0 else 0,
-            'average_value_per_owner': total_value / total_owners if total_owners > 0 else 0,
-            'confidence_breakdown': {
-                'high_confidence': {'count': high_conf, 'percentage': high_conf/total_owners*100 if total_owners > 0 else 0},
-                'medium_confidence': {'count': medium_conf, 'percentage': medium_conf/total_owners*100 if total_owners > 0 else 0},
-                'low_confidence': {'count': low_conf, 'percentage': low_conf/total_owners*100 if total_owners > 0 else 0}
-            },
-            'owner_type_breakdown': {
-                'individual_only': {'count': individual_only, 'percentage': individual_only/total_owners*100 if total_owners > 0 else 0},
-                'business_only': {'count': business_only, 'percentage': business_only/total_owners*100 if total_owners > 0 else 0},
-                'individual_business': {'count': both_types, 'percentage': both_types/total_owners*100 if total_owners > 0 else 0}
-            }
-        }
+        return OwnerRollup.from_owners(valid_objects).summary()
 
 
 def save_property_owners_persistent(owner_objects: List[EnhancedOwnerObject], 
@@ -0,0 +1,521 @@
+"""
+Owner Query
+-----------
+Ad-hoc portfolio questions over columnar owner, phone and property tables.
+
+When an owner dataset is saved, :func:`write_owner_tables` also writes it
+as three Parquet tables in ``<dataset>/tables/``:
+
+* ``owners`` – one row per owner: names, mailing address and ZIP, owner
+  and entity type, property count and value, confidence, phone counts;
+* ``phones`` – one row per phone of an owner (status, type, tags, scores);
+* ``properties`` – one row per property address of an owner, with its ZIP.
+
+All three carry ``owner_id``, the owner's position in ``owner_objects.pkl``.
+
+An :class:`OwnerQuery` is a filter / group-by / aggregate / order / limit
+spec. :class:`OwnerQueryEngine` compiles it into a lazy Polars plan over the
+Parquet files, so only the needed columns are read and filters are pushed
+down to the scan. Conditions on another table (``phones.status=CORRECT``)
+become a semi-join on ``owner_id``; all conditions on one table must hold
+for the same row ("a phone that is CORRECT *and* MOBILE").
+
+Conditions are written as ``column op value``:
+
+=================  ==========================================
+``=`` ``!=``       equality (``==`` works too)
+``>`` ``>=`` ...   comparisons
+``~`` ``!~``       glob match, case-insensitive (``73*``, ``*llc*``)
+``in`` ``not in``  comma-separated values
+``is null``        also ``is not null``
+=================  ==========================================
+
+Aggregates are ``name=func(column)`` with ``count``, ``sum``, ``mean``,
+``min``, ``max``, ``median`` and ``n_unique`` (``count(*)`` counts rows).
+
+Example
+-------
+>>> from backend.utils.owner_query import OwnerQuery, OwnerQueryEngine
+>>> engine = OwnerQueryEngine.for_dataset()          # latest saved dataset
+>>> query = OwnerQuery.parse(
+...     where=["entity_type=LLC", "mailing_zip~73*", "property_count>=5",
+...            "phones.status=CORRECT", "phones.phone_type=MOBILE"],
+...     order_by=["-total_property_value"], limit=20)
+>>> engine.run(query).frame
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import polars as pl
+from loguru import logger
+
+__all__: list[str] = [
+    "AGGREGATES",
+    "Aggregate",
+    "Condition",
+    "DEFAULT_COLUMNS",
+    "OwnerQuery",
+    "OwnerQueryEngine",
+    "OwnerQueryError",
+    "QueryResult",
+    "TABLES",
+    "ensure_owner_tables",
+    "owner_table_frames",
+    "write_owner_tables",
+]
+
+TABLES = ("owners", "phones", "properties")
+TABLES_DIRNAME = "tables"
+TABLES_FORMAT = 1
+
+# Columns shown when a query neither selects columns nor groups
+DEFAULT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "owners": ("owner_id", "name", "entity_type", "mailing_address", "mailing_zip", "property_count",
+               "total_property_value", "confidence_score", "correct_phone_count"),
+    "phones": ("owner_id", "number", "status", "phone_type", "tags", "priority_score"),
+    "properties": ("owner_id", "property_address", "property_zip"),
+}
+
+AGGREGATES = ("count", "sum", "mean", "min", "max", "median", "n_unique")
+
+_ZIP = r"(\d{5})(?:-\d{4})?\s*$"
+_CONDITION = re.compile(
+    r"^\s*(?P<column>[A-Za-z_][\w.]*)\s*"
+    r"(?:(?P<op>==|=|!=|>=|<=|>|<|!~|~)\s*(?P<value>.*?)"
+    r"|\s+(?P<word>not\s+in|in|is\s+not\s+null|is\s+null)\b\s*(?P<word_value>.*?))\s*$",
+    re.IGNORECASE,
+)
+_AGGREGATE = re.compile(r"^\s*(?:(?P<name>\w+)\s*=\s*)?(?P<func>\w+)\s*\(\s*(?P<column>\*|\w+)?\s*\)\s*$")
+
+
+class OwnerQueryError(ValueError):
+    """An owner query that cannot be compiled (unknown table, column, operator...)."""
+
+
+# Tables
+
+def owner_table_frames(owners: Sequence[Any]) -> Dict[str, pl.DataFrame]:
+    """The owners, phones and properties tables of *owners* (one pass over the objects)."""
+    owner_columns: Dict[str, list] = {name: [] for name in (
+        "owner_id", "individual_name", "business_name", "seller1_name", "mailing_address",
+        "is_individual_owner", "is_business_owner", "property_count", "total_property_value",
+        "confidence_score", "phone_quality_score", "phone_count", "correct_phone_count",
+        "best_contact_method", "skip_trace_target")}
+    phone_columns: Dict[str, list] = {name: [] for name in (
+        "owner_id", "number", "status", "phone_type", "tags", "priority_score", "confidence",
+        "is_pete_prioritized")}
+    property_columns: Dict[str, list] = {"owner_id": [], "property_address": []}
+
+    for owner_id, owner in enumerate(owners):
+        phones = getattr(owner, "all_phones", None) or []
+        values = {
+            "owner_id": owner_id,
+            "phone_count": len(phones),
+            "correct_phone_count": sum(1 for phone in phones if getattr(phone, "status", "") == "CORRECT"),
+        }
+        for name, column in owner_columns.items():
+            column.append(values[name] if name in values else getattr(owner, name, None))
+        for phone in phones:
+            phone_columns["owner_id"].append(owner_id)
+            for name in list(phone_columns)[1:]:
+                phone_columns[name].append(getattr(phone, name, None))
+        for address in getattr(owner, "property_addresses", None) or []:
+            property_columns["owner_id"].append(owner_id)
+            property_columns["property_address"].append(address)
+
+    owner_schema = {
+        "owner_id": pl.Int32, "individual_name": pl.Utf8, "business_name": pl.Utf8, "seller1_name": pl.Utf8,
+        "mailing_address": pl.Utf8, "is_individual_owner": pl.Boolean, "is_business_owner": pl.Boolean,
+        "property_count": pl.Int32, "total_property_value": pl.Float64, "confidence_score": pl.Float64,
+        "phone_quality_score": pl.Float64, "phone_count": pl.Int32, "correct_phone_count": pl.Int32,
+        "best_contact_method": pl.Utf8, "skip_trace_target": pl.Utf8,
+    }
+    business = pl.col("business_name").fill_null("")
+    owners_df = pl.DataFrame(owner_columns, schema=owner_schema, strict=False).with_columns(
+        name=pl.coalesce([
+            pl.when(pl.col(c).fill_null("") != "").then(pl.col(c))
+            for c in ("business_name", "individual_name", "seller1_name")
+        ]).fill_null(""),
+        mailing_zip=pl.col("mailing_address").str.extract(_ZIP, 1),
+        owner_type=pl.when(pl.col("is_individual_owner") & pl.col("is_business_owner")).then(pl.lit("Individual+Business"))
+        .when(pl.col("is_business_owner")).then(pl.lit("Business"))
+        .when(pl.col("is_individual_owner")).then(pl.lit("Individual"))
+        .otherwise(pl.lit("Unknown")),
+        entity_type=pl.when(~pl.col("is_business_owner").fill_null(False)).then(pl.lit("Individual"))
+        .when(business.str.contains(r"(?i)\bL\.?\s?L\.?\s?C\b")).then(pl.lit("LLC"))
+        .when(business.str.contains(r"(?i)\b(INC|CORP|CORPORATION|COMPANY|CO)\b")).then(pl.lit("Corporation"))
+        .when(business.str.contains(r"(?i)\bTRUST\b")).then(pl.lit("Trust"))
+        .otherwise(pl.lit("Other Business")),
+    )
+    phones_df = pl.DataFrame(phone_columns, schema={
+        "owner_id": pl.Int32, "number": pl.Utf8, "status": pl.Utf8, "phone_type": pl.Utf8, "tags": pl.Utf8,
+        "priority_score": pl.Float64, "confidence": pl.Float64, "is_pete_prioritized": pl.Boolean,
+    }, strict=False)
+    properties_df = pl.DataFrame(property_columns, schema={"owner_id": pl.Int32, "property_address": pl.Utf8},
+                                 strict=False).with_columns(
+        property_zip=pl.col("property_address").str.extract(_ZIP, 1))
+    return {"owners": owners_df, "phones": phones_df, "properties": properties_df}
+
+
+def _source_mtime(dataset_dir: Path) -> Optional[float]:
+    source = dataset_dir / "owner_objects.pkl"
+    return source.stat().st_mtime if source.exists() else None
+
+
+def write_owner_tables(owners: Sequence[Any], dataset_dir: Union[str, Path]) -> Path:
+    """Write the Parquet tables of *owners* to ``<dataset_dir>/tables`` (after the pickle)."""
+    tables_dir = Path(dataset_dir) / TABLES_DIRNAME
+    tables_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    frames = owner_table_frames(owners)
+    for table, frame in frames.items():
+        frame.write_parquet(tables_dir / f"{table}.parquet", compression="zstd", statistics=True)
+    manifest = {
+        'format': TABLES_FORMAT,
+        'source_mtime': _source_mtime(Path(dataset_dir)),
+        'rows': {table: frame.height for table, frame in frames.items()},
+    }
+    with open(tables_dir / "manifest.json", 'w') as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"🗂️ Wrote owner query tables ({manifest['rows']['owners']:,} owners) "
+                f"in {time.perf_counter() - start:.1f}s: {tables_dir}")
+    return tables_dir
+
+
+def ensure_owner_tables(dataset_dir: Union[str, Path]) -> Path:
+    """Tables directory of a dataset, (re)built from ``owner_objects.pkl`` if missing or stale."""
+    dataset_dir = Path(dataset_dir)
+    tables_dir = dataset_dir / TABLES_DIRNAME
+    try:
+        with open(tables_dir / "manifest.json", 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get('format') == TABLES_FORMAT and manifest.get('source_mtime') == _source_mtime(dataset_dir):
+        return tables_dir
+
+    source = dataset_dir / "owner_objects.pkl"
+    if not source.exists():
+        raise FileNotFoundError(f"No owner objects in {dataset_dir}")
+    with open(source, 'rb') as f:
+        owners = pickle.load(f)
+    return write_owner_tables(owners, dataset_dir)
+
+
+# Query specs
+
+def _split(values: Union[None, str, Iterable[str]], separator: str = ",") -> List[str]:
+    if values is None:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    return [part.strip() for value in values for part in value.split(separator) if part.strip()]
+
+
+@dataclass
+class Condition:
+    """``column op value`` (``table.column`` for a condition on another table)."""
+
+    column: str
+    op: str
+    value: Any = None
+    table: Optional[str] = None
+
+    @classmethod
+    def parse(cls, text: str) -> "Condition":
+        match = _CONDITION.match(text)
+        if not match:
+            raise OwnerQueryError(f"Cannot parse condition: {text!r}")
+        column = match["column"]
+        if match["op"]:
+            op, value = match["op"], match["value"]
+            op = {"=": "==", "~": "like", "!~": "not_like"}.get(op, op)
+        else:
+            op, value = " ".join(match["word"].lower().split()).replace(" ", "_"), match["word_value"]
+        table = None
+        if "." in column:
+            table, column = column.split(".", 1)
+        if op in ("in", "not_in"):
+            value = _split(value)
+        elif op in ("is_null", "is_not_null"):
+            value = None
+        else:
+            value = value.strip().strip("'\"")
+        return cls(column=column, op=op, value=value, table=table)
+
+
+@dataclass
+class Aggregate:
+    """``name=func(column)``."""
+
+    name: str
+    func: str
+    column: Optional[str] = None  # None: count rows
+
+    @classmethod
+    def parse(cls, text: str) -> "Aggregate":
+        match = _AGGREGATE.match(text)
+        if not match or match["func"].lower() not in AGGREGATES:
+            raise OwnerQueryError(f"Cannot parse aggregate {text!r} (functions: {', '.join(AGGREGATES)})")
+        func = match["func"].lower()
+        column = None if match["column"] in (None, "*") else match["column"]
+        if column is None and func != "count":
+            raise OwnerQueryError(f"{func}() needs a column")
+        return cls(name=match["name"] or (func if column is None else f"{func}_{column}"), func=func, column=column)
+
+
+@dataclass
+class OwnerQuery:
+    """Filter, group-by, aggregate, order and limit spec over one owner table."""
+
+    table: str = "owners"
+    where: List[Condition] = field(default_factory=list)
+    select: List[str] = field(default_factory=list)
+    group_by: List[str] = field(default_factory=list)
+    aggregates: List[Aggregate] = field(default_factory=list)
+    order_by: List[Tuple[str, bool]] = field(default_factory=list)  # (column, descending)
+    limit: Optional[int] = None
+
+    @classmethod
+    def parse(cls, table: str = "owners", where: Union[None, str, Iterable[str]] = None,
+              select: Union[None, str, Iterable[str]] = None,
+              group_by: Union[None, str, Iterable[str]] = None,
+              aggregates: Union[None, str, Iterable[str]] = None,
+              order_by: Union[None, str, Iterable[str]] = None,
+              limit: Optional[int] = None) -> "OwnerQuery":
+        """Build a query from text parts.
+
+        *where* conditions are separated by ``;`` (or given as a list);
+        *select*, *group_by*, *aggregates* and *order_by* by ``,``.  An
+        ``order_by`` column prefixed with ``-`` sorts descending.
+        """
+        return cls(
+            table=table,
+            where=[Condition.parse(text) for text in _split(where, ";")],
+            select=_split(select),
+            group_by=_split(group_by),
+            aggregates=[Aggregate.parse(text) for text in _split(aggregates)],
+            order_by=[(text.lstrip("-+"), text.startswith("-")) for text in _split(order_by)],
+            limit=limit,
+        )
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "OwnerQuery":
+        """Query from a JSON-style dict with the keys of :meth:`parse`."""
+        unknown = set(spec) - {"table", "where", "select", "group_by", "aggregates", "order_by", "limit"}
+        if unknown:
+            raise OwnerQueryError(f"Unknown query keys: {', '.join(sorted(unknown))}")
+        return cls.parse(**spec)
+
+
+@dataclass
+class QueryResult:
+    """Result of :meth:`OwnerQueryEngine.run`."""
+
+    frame: pl.DataFrame
+    elapsed_ms: float
+    query: OwnerQuery
+
+    def __len__(self) -> int:
+        return self.frame.height
+
+
+# Engine
+
+class OwnerQueryEngine:
+    """Compiles owner queries into lazy Polars plans over a dataset's Parquet tables."""
+
+    def __init__(self, tables_dir: Union[str, Path]):
+        """
+        Args:
+            tables_dir: Directory with ``owners.parquet``, ``phones.parquet`` and ``properties.parquet``
+        """
+        self.tables_dir = Path(tables_dir)
+        self._schemas: Dict[str, Dict[str, pl.DataType]] = {}
+
+    @classmethod
+    def for_dataset(cls, dataset_name: Optional[str] = None,
+                    base_dir: str = "data/processed") -> "OwnerQueryEngine":
+        """Engine over a saved owner dataset (the latest one if *dataset_name* is None).
+
+        Tables of datasets saved before they existed are built on first use.
+        """
+        from backend.utils.catalog import catalog_for
+
+        if not dataset_name:
+            catalog = catalog_for(base_dir)
+            catalog.sync_datasets(base_dir, "owner_objects")
+            dataset_name = catalog.latest_dataset(base_dir, "owner_objects")
+            if not dataset_name:
+                raise FileNotFoundError("No saved Property Owners datasets found")
+        return cls(ensure_owner_tables(Path(base_dir) / "owner_objects" / dataset_name))
+
+    # Tables
+
+    def path(self, table: str) -> Path:
+        if table not in TABLES:
+            raise OwnerQueryError(f"Unknown table {table!r} (tables: {', '.join(TABLES)})")
+        return self.tables_dir / f"{table}.parquet"
+
+    def schema(self, table: str) -> Dict[str, pl.DataType]:
+        """Column name -> dtype of *table*."""
+        if table not in self._schemas:
+            self._schemas[table] = dict(pl.read_parquet_schema(self.path(table)))
+        return self._schemas[table]
+
+    def scan(self, table: str) -> pl.LazyFrame:
+        return pl.scan_parquet(self.path(table))
+
+    # Compiling
+
+    def compile(self, query: OwnerQuery) -> pl.LazyFrame:
+        """Lazy plan of *query* (nothing is read until it is collected)."""
+        plan = self.scan(query.table)
+
+        conditions: Dict[str, List[Condition]] = {}
+        for condition in query.where:
+            conditions.setdefault(condition.table or query.table, []).append(condition)
+        own = conditions.pop(query.table, [])
+        if own:
+            plan = plan.filter(self._predicate(query.table, own))
+        for table, table_conditions in conditions.items():
+            if "owner_id" not in self.schema(query.table):
+                raise OwnerQueryError(f"Table {query.table!r} cannot be joined to {table!r}")
+            matches = self.scan(table).filter(self._predicate(table, table_conditions)).select("owner_id")
+            plan = plan.join(matches, on="owner_id", how="semi")
+
+        if query.group_by or query.aggregates:
+            self._check_columns(query.table, query.group_by)
+            aggregates = query.aggregates or [Aggregate(name="count", func="count")]
+            expressions = [self._aggregate(query.table, aggregate) for aggregate in aggregates]
+            plan = plan.group_by(query.group_by).agg(expressions) if query.group_by else plan.select(expressions)
+            output = list(query.group_by) + [aggregate.name for aggregate in aggregates]
+        else:
+            columns = query.select or [c for c in DEFAULT_COLUMNS[query.table] if c in self.schema(query.table)]
+            self._check_columns(query.table, columns)
+            plan = plan.select(columns)
+            output = columns
+
+        if query.order_by:
+            unknown = [column for column, _ in query.order_by if column not in output]
+            if unknown:
+                raise OwnerQueryError(f"Cannot order by {', '.join(unknown)} (result columns: {', '.join(output)})")
+            plan = plan.sort([column for column, _ in query.order_by],
+                             descending=[descending for _, descending in query.order_by],
+                             nulls_last=True, maintain_order=True)
+        if query.limit is not None:
+            plan = plan.head(query.limit)
+        return plan
+
+    def run(self, query: Union[OwnerQuery, Dict[str, Any]]) -> QueryResult:
+        """Compile and collect *query* (an OwnerQuery or a dict for :meth:`OwnerQuery.from_dict`)."""
+        if isinstance(query, dict):
+            query = OwnerQuery.from_dict(query)
+        start = time.perf_counter()
+        frame = self.compile(query).collect()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.debug(f"Owner query on {query.table}: {frame.height:,} rows in {elapsed_ms:.0f} ms")
+        return QueryResult(frame=frame, elapsed_ms=elapsed_ms, query=query)
+
+    def explain(self, query: OwnerQuery) -> str:
+        """The optimized plan of *query* (shows the pushed-down filters and projections)."""
+        return self.compile(query).explain()
+
+    # Expressions
+
+    def _check_columns(self, table: str, columns: Iterable[str]):
+        schema = self.schema(table)
+        unknown = [column for column in columns if column not in schema]
+        if unknown:
+            raise OwnerQueryError(f"Unknown {table} column(s): {', '.join(unknown)} "
+                                  f"(columns: {', '.join(schema)})")
+
+    def _predicate(self, table: str, conditions: List[Condition]) -> pl.Expr:
+        predicate = None
+        for condition in conditions:
+            expression = self._condition(table, condition)
+            predicate = expression if predicate is None else predicate & expression
+        return predicate
+
+    def _condition(self, table: str, condition: Condition) -> pl.Expr:
+        self._check_columns(table, [condition.column])
+        dtype = self.schema(table)[condition.column]
+        column = pl.col(condition.column)
+        op = condition.op
+
+        if op == "is_null":
+            return column.is_null()
+        if op == "is_not_null":
+            return column.is_not_null()
+        if op in ("like", "not_like"):
+            text = column.cast(pl.Utf8)
+            pattern = str(condition.value)
+            if re.fullmatch(r"[^*?]*\*", pattern) and pattern.upper() == pattern.lower():
+                # Prefix pattern without letters (a ZIP prefix): a plain starts_with
+                expression = text.str.starts_with(pattern[:-1])
+            else:
+                regex = "".join(".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern)
+                expression = text.str.contains(f"(?i)^{regex}$")
+            return expression.fill_null(False) if op == "like" else ~expression.fill_null(False)
+        if op in ("in", "not_in"):
+            values = [self._value(condition, dtype, value) for value in condition.value]
+            if dtype.is_integer():
+                values = [value for value in values if not isinstance(value, float)]  # never equal
+            expression = column.is_in(values)
+            return expression if op == "in" else ~expression
+
+        value = self._value(condition, dtype, condition.value)
+        if op == "==":
+            return column == value
+        if op == "!=":
+            return column != value
+        if op == ">":
+            return column > value
+        if op == ">=":
+            return column >= value
+        if op == "<":
+            return column < value
+        if op == "<=":
+            return column <= value
+        raise OwnerQueryError(f"Unknown operator {op!r}")
+
+    @staticmethod
+    def _value(condition: Condition, dtype: pl.DataType, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        try:
+            if dtype == pl.Boolean:
+                lowered = value.lower()
+                if lowered not in ("true", "false", "1", "0", "yes", "no"):
+                    raise ValueError(value)
+                return lowered in ("true", "1", "yes")
+            if dtype.is_integer():
+                try:
+                    return int(value)
+                except ValueError:
+                    number = float(value)  # 5.5 stays 5.5; Polars compares it against the integers
+                    return int(number) if number.is_integer() else number
+            if dtype.is_float():
+                return float(value)
+        except ValueError:
+            raise OwnerQueryError(f"{condition.column} needs a {dtype} value, got {value!r}") from None
+        return value
+
+    def _aggregate(self, table: str, aggregate: Aggregate) -> pl.Expr:
+        if aggregate.column is None:
+            return pl.len().alias(aggregate.name)
+        self._check_columns(table, [aggregate.column])
+        column = pl.col(aggregate.column)
+        expression = {
+            "count": column.count, "sum": column.sum, "mean": column.mean, "min": column.min,
+            "max": column.max, "median": column.median, "n_unique": column.n_unique,
+        }[aggregate.func]()
+        return expression.alias(aggregate.name)
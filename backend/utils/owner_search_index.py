@@ -0,0 +1,258 @@
+"""
+Owner Search Index
+------------------
+Trigram index for substring search over owner names and addresses.
+
+The owner dashboard search box matches a typed substring against each
+owner's name, mailing address and property addresses.  Scanning and
+lowercasing every field of every owner on each keystroke is far too slow
+for a few hundred thousand owners, so :class:`OwnerSearchIndex` does the
+work once per dataset:
+
+* every owner's searchable text is lowercased and UTF-8 encoded into one
+  byte blob (fields separated by ``\\0``, so no match spans two fields);
+* the postings of each byte trigram are a sorted ``int32`` array of owner
+  ids, all stored back to back in one array with an offsets array;
+* a query intersects the postings of its trigrams (rarest first) and then
+  verifies the few remaining candidates with a plain substring test.
+
+Queries of one or two characters have no trigram; they, and queries whose
+candidates are a large share of all owners, are answered by one
+vectorized pass over the text blob instead.  Each query also narrows from
+the previous one: when the user keeps typing, the previous result already
+holds every possible match.
+
+The index is persisted as ``search_index.npz`` next to the dataset's
+``owner_objects.pkl`` (see :func:`load_or_build_search_index`).
+
+Example
+-------
+>>> from backend.utils.owner_search_index import OwnerSearchIndex
+>>> index = OwnerSearchIndex.build(owner_objects)
+>>> index.search("oak ave")
+array([   12,   873, 20412], dtype=int32)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+__all__: list[str] = [
+    "OwnerSearchIndex",
+    "searchable_texts",
+    "load_or_build_search_index",
+]
+
+INDEX_FILENAME = "search_index.npz"
+INDEX_FORMAT = 1
+FIELD_SEPARATOR = b"\0"
+SCAN_FRACTION = 16  # more candidates than 1/16 of the owners: scan the blob instead
+
+
+def searchable_texts(owner: Any) -> List[str]:
+    """Texts the search box matches: names, mailing address, property addresses.
+
+    Works for owner objects and owner groups alike (missing attributes are
+    skipped).
+    """
+    texts = []
+    for attr in ("owner_name", "name", "individual_name", "business_name", "mailing_address"):
+        value = getattr(owner, attr, None)
+        if value:
+            texts.append(str(value))
+    for address in getattr(owner, "property_addresses", None) or []:
+        if address:
+            texts.append(str(address))
+    return texts
+
+
+def _trigram_codes(data: np.ndarray) -> np.ndarray:
+    """Code of the byte trigram starting at each position of *data*."""
+    data = data.astype(np.uint32)
+    return (data[:-2] << 16) | (data[1:-1] << 8) | data[2:]
+
+
+def _first_of_runs(values: np.ndarray) -> np.ndarray:
+    """Mask of the first element of each run of equal values in sorted *values*."""
+    first = np.ones(len(values), dtype=bool)
+    first[1:] = values[1:] != values[:-1]
+    return first
+
+
+class OwnerSearchIndex:
+    """Trigram postings plus the lowercased text of every owner.
+
+    Owner ids are positions in the owner list the index was built from.
+    """
+
+    def __init__(self, blob: bytes, doc_offsets: np.ndarray, trigrams: np.ndarray,
+                 posting_offsets: np.ndarray, postings: np.ndarray):
+        self._blob = blob
+        self.doc_offsets = doc_offsets  # int64, owner i is blob[offsets[i]:offsets[i + 1]]
+        self.trigrams = trigrams  # uint32, sorted trigram codes
+        self.posting_offsets = posting_offsets  # int64, postings of trigrams[k]
+        self.postings = postings  # int32 owner ids, sorted within each trigram
+        self._docs: Optional[List[bytes]] = None
+        self._last: Optional[Tuple[bytes, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_offsets) - 1
+
+    # Building
+
+    @classmethod
+    def build(cls, owners: Sequence[Any]) -> "OwnerSearchIndex":
+        """Index the :func:`searchable_texts` of *owners*."""
+        docs = [FIELD_SEPARATOR.join(t.lower().encode("utf-8") for t in searchable_texts(o)) + FIELD_SEPARATOR
+                for o in owners]
+        lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=len(docs))
+        doc_offsets = np.zeros(len(docs) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=doc_offsets[1:])
+        blob = b"".join(docs)
+
+        data = np.frombuffer(blob, dtype=np.uint8)
+        if len(data) < 3:
+            empty = np.zeros(0, dtype=np.uint32)
+            return cls(blob, doc_offsets, empty, np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32))
+
+        codes = _trigram_codes(data)
+        owner_ids = np.repeat(np.arange(len(docs), dtype=np.int64), lengths)[:-2]
+        # Trigrams containing a separator span two fields (or two owners)
+        valid = (data[:-2] != 0) & (data[1:-1] != 0) & (data[2:] != 0)
+        pairs = (codes[valid].astype(np.uint64) << np.uint64(32)) | owner_ids[valid].astype(np.uint64)
+        pairs.sort()
+        pairs = pairs[_first_of_runs(pairs)]  # one posting per (trigram, owner)
+
+        pair_codes = (pairs >> np.uint64(32)).astype(np.uint32)
+        postings = (pairs & np.uint64(0xFFFFFFFF)).astype(np.int32)
+        starts = np.flatnonzero(_first_of_runs(pair_codes))
+        posting_offsets = np.append(starts, len(postings)).astype(np.int64)
+        return cls(blob, doc_offsets, pair_codes[starts], posting_offsets, postings)
+
+    # Searching
+
+    def search(self, query: str) -> np.ndarray:
+        """Ids (ascending) of the owners whose searchable text contains *query*.
+
+        Case-insensitive, like the dashboard's substring search.
+        """
+        needle = query.lower().encode("utf-8")
+        if not needle:
+            return np.arange(len(self), dtype=np.int32)
+        if FIELD_SEPARATOR in needle:
+            return np.zeros(0, dtype=np.int32)
+
+        candidates = None
+        if self._last is not None and self._last[0] in needle:
+            candidates = self._last[1]  # the user kept typing
+
+        if len(needle) >= 3:
+            codes = np.unique(_trigram_codes(np.frombuffer(needle, dtype=np.uint8)))
+            lists = [self._postings(code) for code in codes]
+            for posting in sorted(lists, key=len):
+                candidates = posting if candidates is None else np.intersect1d(
+                    candidates, posting, assume_unique=True)
+                if len(candidates) == 0:
+                    break
+
+        if candidates is None or len(candidates) > len(self) // SCAN_FRACTION:
+            result = self._scan(needle)
+        else:
+            docs = self._documents()
+            result = np.fromiter((i for i in candidates if needle in docs[i]), dtype=np.int32)
+        self._last = (needle, result)
+        return result
+
+    def _scan(self, needle: bytes) -> np.ndarray:
+        """Owners containing *needle*, by one vectorized pass over the text blob."""
+        data = np.frombuffer(self._blob, dtype=np.uint8)
+        n = len(data) - len(needle) + 1
+        if n <= 0:
+            return np.zeros(0, dtype=np.int32)
+        mask = data[:n] == needle[0]
+        for j in range(1, len(needle)):
+            mask &= data[j:n + j] == needle[j]
+        owners = np.searchsorted(self.doc_offsets, np.flatnonzero(mask), side="right") - 1
+        return owners[_first_of_runs(owners)].astype(np.int32)
+
+    def _postings(self, code: int) -> np.ndarray:
+        k = np.searchsorted(self.trigrams, code)
+        if k == len(self.trigrams) or self.trigrams[k] != code:
+            return np.zeros(0, dtype=np.int32)
+        return self.postings[self.posting_offsets[k]:self.posting_offsets[k + 1]]
+
+    def _documents(self) -> List[bytes]:
+        if self._docs is None:
+            offsets = self.doc_offsets.tolist()
+            self._docs = [self._blob[offsets[i]:offsets[i + 1]] for i in range(len(self))]
+        return self._docs
+
+    # Persistence
+
+    def save(self, path: Union[str, Path], source_mtime: float = 0.0):
+        """Write the index to *path* (``.npz``)."""
+        np.savez(
+            path,
+            format=np.int64(INDEX_FORMAT),
+            source_mtime=np.float64(source_mtime),
+            blob=np.frombuffer(self._blob, dtype=np.uint8),
+            doc_offsets=self.doc_offsets,
+            trigrams=self.trigrams,
+            posting_offsets=self.posting_offsets,
+            postings=self.postings,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Tuple["OwnerSearchIndex", float]:
+        """Read an index written by :meth:`save`; returns it and its source mtime."""
+        with np.load(path) as data:
+            if int(data["format"]) != INDEX_FORMAT:
+                raise ValueError(f"Unsupported search index format in {path}")
+            index = cls(data["blob"].tobytes(), data["doc_offsets"], data["trigrams"],
+                        data["posting_offsets"], data["postings"])
+            return index, float(data["source_mtime"])
+
+
+def load_or_build_search_index(owners: Sequence[Any],
+                               dataset_dir: Union[str, Path, None] = None) -> OwnerSearchIndex:
+    """Search index for *owners*, reusing the one persisted in *dataset_dir*.
+
+    The persisted index is used when it was built from the current
+    ``owner_objects.pkl`` (same modification time) and covers the same
+    number of owners; otherwise the index is rebuilt and saved there.
+
+    Parameters
+    ----------
+    owners
+        The owners loaded from *dataset_dir* (ids are positions in this list).
+    dataset_dir
+        Directory of the persisted dataset, or ``None`` to skip persistence.
+    """
+    if dataset_dir is None:
+        return OwnerSearchIndex.build(owners)
+
+    dataset_dir = Path(dataset_dir)
+    index_path = dataset_dir / INDEX_FILENAME
+    source = dataset_dir / "owner_objects.pkl"
+    source_mtime = source.stat().st_mtime if source.exists() else 0.0
+
+    if index_path.exists():
+        try:
+            index, built_from = OwnerSearchIndex.load(index_path)
+            if built_from == source_mtime and len(index) == len(owners):
+                logger.info(f"🔎 Loaded search index for {len(index):,} owners from {index_path}")
+                return index
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable search index {index_path}: {e}")
+
+    index = OwnerSearchIndex.build(owners)
+    try:
+        index.save(index_path, source_mtime)
+        logger.info(f"🔎 Built search index for {len(index):,} owners: {index_path}")
+    except OSError as e:
+        logger.warning(f"Could not save search index {index_path}: {e}")
+    return index
@@ -0,0 +1,239 @@
+"""
+Owner Summary
+-------------
+Summary statistics of an owner dataset, computed once and stored next to it.
+
+Every dashboard shows the same numbers for an owner dataset: totals,
+confidence and owner type breakdowns, and the distributions of property
+value, property count and phone quality.  :class:`OwnerRollup` holds them
+as plain counters, computed in one vectorised pass over the columnar arrays
+of an ``OwnerFacetIndex`` (a filtered dashboard view passes a mask instead
+of building a new list):
+
+* histogram buckets have fixed bounds (:data:`HISTOGRAMS`), so the counts of
+  two rollups always line up;
+* :meth:`OwnerRollup.summary` turns the counters into the dashboard dict
+  (counts, percentages, averages, labelled histograms).
+
+The persistence manager writes the summary as ``summary.json`` in the
+dataset directory whenever it saves the owner objects (every save rewrites
+the whole dataset, so the rollup is computed from the owners being written).
+:func:`read_owner_summary` reads it back (one small JSON file, whatever the
+size of the dataset) and ignores it when ``owner_objects.pkl`` changed after
+it was written; the owner data service then rebuilds it from the loaded
+owners.
+
+Only the standard library is imported at module level; NumPy and the facet
+index are imported when a rollup is computed.
+
+Example
+-------
+>>> from backend.utils.owner_summary import OwnerRollup, read_owner_summary
+>>> summary = OwnerRollup.from_owners(owner_objects).summary()
+>>> summary["confidence_breakdown"]["high_confidence"]["count"]
+>>> read_owner_summary("data/processed/owner_objects/ultra_fast_pipeline")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from loguru import logger
+
+__all__: list[str] = [
+    "CONFIDENCE_BANDS",
+    "HISTOGRAMS",
+    "OwnerRollup",
+    "SUMMARY_FILENAME",
+    "read_owner_summary",
+    "summary_is_current",
+    "write_owner_summary",
+]
+
+SUMMARY_FILENAME = "summary.json"
+SOURCE_FILENAME = "owner_objects.pkl"
+SUMMARY_FORMAT = 2
+
+# Confidence band -> (low, high): low <= confidence_score < high
+CONFIDENCE_BANDS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "high_confidence": (0.8, None),
+    "medium_confidence": (0.5, 0.8),
+    "low_confidence": (None, 0.5),
+}
+
+# Range facet -> (upper bounds, bucket labels). A value goes to the first
+# bucket whose bound is >= the value; the last bucket has no upper bound.
+HISTOGRAMS: Dict[str, Tuple[Tuple[float, ...], Tuple[str, ...]]] = {
+    "total_property_value": (
+        (50_000, 100_000, 250_000, 500_000),
+        ("$0-$50K", "$50K-$100K", "$100K-$250K", "$250K-$500K", "$500K+"),
+    ),
+    "property_count": (
+        (1, 5, 10),
+        ("1 Property", "2-5 Properties", "6-10 Properties", "10+ Properties"),
+    ),
+    "phone_quality_score": (
+        (0.0, 0.4, 0.7),
+        ("No Score", "Low Quality", "Medium Quality", "High Quality"),
+    ),
+}
+
+OWNER_TYPES = ("individual_only", "business_only", "individual_business")
+
+
+def _percentage(count: float, total: int) -> float:
+    return count / total * 100 if total > 0 else 0
+
+
+@dataclass
+class OwnerRollup:
+    """Summary counters of a set of owners."""
+
+    total_owners: int = 0
+    total_properties: int = 0
+    total_value: float = 0.0
+    business_owners: int = 0
+    multi_property_owners: int = 0
+    phone_quality_sum: float = 0.0
+    owner_types: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(OWNER_TYPES, 0))
+    confidence: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CONFIDENCE_BANDS, 0))
+    histograms: Dict[str, List[int]] = field(
+        default_factory=lambda: {facet: [0] * len(labels) for facet, (_, labels) in HISTOGRAMS.items()}
+    )
+
+    # Construction
+
+    @classmethod
+    def from_facets(cls, facets: Any, mask: Any = None) -> "OwnerRollup":
+        """Rollup of the owners of an ``OwnerFacetIndex`` (those selected by *mask* if given)."""
+        import numpy as np
+
+        def column(values):
+            return values if mask is None else values[mask]
+
+        business = column(facets.mask("business"))
+        individual = column(facets.mask("individual"))
+        confidence = column(facets.values["confidence_score"])
+        property_count = column(facets.values["property_count"])
+
+        rollup = cls(
+            total_owners=int(business.size),
+            total_properties=int(property_count.sum()),
+            total_value=float(column(facets.values["total_property_value"]).sum()),
+            business_owners=int(np.count_nonzero(business)),
+            multi_property_owners=int(np.count_nonzero(property_count > 1)),
+            phone_quality_sum=float(column(facets.values["phone_quality_score"]).sum()),
+        )
+        rollup.owner_types = {
+            "individual_only": int(np.count_nonzero(individual & ~business)),
+            "business_only": int(np.count_nonzero(business & ~individual)),
+            "individual_business": int(np.count_nonzero(individual & business)),
+        }
+        for band, (low, high) in CONFIDENCE_BANDS.items():
+            in_band = np.ones(confidence.size, dtype=bool)
+            if low is not None:
+                in_band &= confidence >= low
+            if high is not None:
+                in_band &= confidence < high
+            rollup.confidence[band] = int(np.count_nonzero(in_band))
+        for facet, (bounds, labels) in HISTOGRAMS.items():
+            buckets = np.searchsorted(np.asarray(bounds, dtype=np.float64), column(facets.values[facet]))
+            rollup.histograms[facet] = np.bincount(buckets, minlength=len(labels)).tolist()
+        return rollup
+
+    @classmethod
+    def from_owners(cls, owners: Iterable[Any]) -> "OwnerRollup":
+        """Rollup of owner objects (or owner groups); one pass over the list."""
+        from backend.utils.owner_facet_index import OwnerFacetIndex
+
+        return cls.from_facets(OwnerFacetIndex(list(owners)))
+
+    # Output
+
+    @property
+    def individual_owners(self) -> int:
+        return self.total_owners - self.business_owners
+
+    def summary(self) -> Dict[str, Any]:
+        """Dashboard summary: counts, percentages, averages and labelled histograms."""
+        total = self.total_owners
+        return {
+            'total_owners': total,
+            'total_properties': self.total_properties,
+            'total_value': self.total_value,
+            'average_properties_per_owner': self.total_properties / total if total > 0 else 0,
+            'average_value_per_owner': self.total_value / total if total > 0 else 0,
+            'average_phone_quality': self.phone_quality_sum / total if total > 0 else 0,
+            'business_owners': self.business_owners,
+            'individual_owners': self.individual_owners,
+            'multi_property_owners': self.multi_property_owners,
+            'high_confidence_targets': self.confidence['high_confidence'],
+            'confidence_breakdown': {
+                band: {'count': count, 'percentage': _percentage(count, total)}
+                for band, count in self.confidence.items()
+            },
+            'owner_type_breakdown': {
+                owner_type: {'count': count, 'percentage': _percentage(count, total)}
+                for owner_type, count in self.owner_types.items()
+            },
+            'histograms': {
+                facet: dict(zip(HISTOGRAMS[facet][1], counts))
+                for facet, counts in self.histograms.items()
+            },
+        }
+
+
+# Sidecar file
+
+def _source_mtime(dataset_dir: Path) -> Optional[float]:
+    source = dataset_dir / SOURCE_FILENAME
+    return source.stat().st_mtime if source.exists() else None
+
+
+def write_owner_summary(dataset_dir: Union[str, Path], rollup: OwnerRollup) -> Dict[str, Any]:
+    """Write *rollup* as the summary sidecar of a dataset directory.
+
+    The sidecar records the modification time of ``owner_objects.pkl``, so
+    write it after the owner objects.  Returns the written summary.
+    """
+    dataset_dir = Path(dataset_dir)
+    summary = rollup.summary()
+    summary['format'] = SUMMARY_FORMAT
+    summary['source_mtime'] = _source_mtime(dataset_dir)
+    summary['generated_at'] = time.time()
+
+    path = dataset_dir / SUMMARY_FILENAME
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+    os.replace(tmp_path, path)
+    return summary
+
+
+def read_owner_summary(dataset_dir: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Summary sidecar of a dataset directory, or None if missing or stale.
+
+    A sidecar is stale when it predates this format or ``owner_objects.pkl``
+    was rewritten after it.
+    """
+    path = Path(dataset_dir) / SUMMARY_FILENAME
+    try:
+        with open(path, 'r') as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not summary_is_current(dataset_dir, summary):
+        logger.debug(f"Owner summary {path} is stale")
+        return None
+    return summary
+
+
+def summary_is_current(dataset_dir: Union[str, Path], summary: Dict[str, Any]) -> bool:
+    """Whether *summary* (e.g. a copy kept in the catalog) describes the dataset's current owner objects."""
+    return (summary.get('format') == SUMMARY_FORMAT
+            and summary.get('source_mtime') == _source_mtime(Path(dataset_dir)))
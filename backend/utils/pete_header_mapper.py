@@ -11,6 +11,8 @@ from pathlib import Path
 import json
 from loguru import logger
 
+from backend.utils.mapping_executor import ConcatRule, MappingPlan, execute_mapping, row_dtype
+
 class PeteHeaderMapper:
     """
     Maps processed data to Pete's expected headers and validates exports.
@@ -167,66 +169,74 @@ class PeteHeaderMapper:
         
         return mapping
     
-    def create_pete_ready_dataframe(self, df: pd.DataFrame, mapping: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    def build_mapping_plan(self, df: pd.DataFrame, mapping: Dict[str, str]) -> MappingPlan:
         """
-        Create a Pete-ready DataFrame with correct headers.
+        Compile the Pete mapping and concatenation rules into a single plan.
         
         Args:
             df: Processed DataFrame
-            mapping: Optional custom mapping
+            mapping: Mapping from current headers to Pete headers
             
         Returns:
-            Pete-ready DataFrame
+            MappingPlan for execute_mapping
         """
-        if mapping is None:
-            mapping = self.suggest_mapping(df)
+        plan = MappingPlan(headers=list(self.PETE_HEADERS))
         
-        # Create new DataFrame with Pete headers
-        pete_df = pd.DataFrame(columns=self.PETE_HEADERS)
-        
-        # Handle special concatenation cases
         # 1. Seller 1 = First Name + Last Name
         if 'First Name' in df.columns and 'Last Name' in df.columns:
-            pete_df['Seller 1'] = df['First Name'].fillna('') + ' ' + df['Last Name'].fillna('')
-            pete_df['Seller 1'] = pete_df['Seller 1'].str.strip()
-            print(f"✅ Concatenated Seller 1: First Name + Last Name ({len(pete_df['Seller 1'].dropna())} values)")
+            plan.assign('Seller 1', ConcatRule(('First Name', 'Last Name'), separator=' ', strip_result=True))
         
         # 2. Seller 1 Email = Email 1 + Email 2 + Email 3 + Email 4 + Email 5
         email_cols = [col for col in df.columns if 'email' in col.lower() and col.count(' ') == 1]
         if email_cols:
-            email_data = []
-            for _, row in df.iterrows():
-                emails = []
-                for email_col in email_cols[:5]:  # Max 5 emails
-                    if pd.notna(row[email_col]) and str(row[email_col]).strip():
-                        emails.append(str(row[email_col]).strip())
-                email_data.append('; '.join(emails) if emails else None)
-            pete_df['Seller 1 Email'] = email_data
-            print(f"✅ Concatenated Seller 1 Email: {len(email_cols)} email columns ({len(pete_df['Seller 1 Email'].dropna())} values)")
-        
-        # 3. Seller 1 Phone = Best phone from Phone 1-5
+            plan.assign('Seller 1 Email', ConcatRule(
+                tuple(email_cols[:5]),  # Max 5 emails
+                separator='; ',
+                strip_parts=True,
+                skip_empty=True,
+                null_if_empty=True,
+                as_dtype=row_dtype(df),
+            ))
+        
+        # 3. Seller 1 Phone = Phone 1 (primary seller phone)
         phone_cols = [col for col in df.columns if 'phone' in col.lower() and col.count(' ') == 1]
         if phone_cols:
-            # Use Phone 1 as the primary seller phone
-            pete_df['Seller 1 Phone'] = df['Phone 1'] if 'Phone 1' in df.columns else None
-            print(f"✅ Mapped Seller 1 Phone: Phone 1 ({len(pete_df['Seller 1 Phone'].dropna())} values)")
+            plan.assign('Seller 1 Phone', 'Phone 1' if 'Phone 1' in df.columns else None)
         
-        # Map data from original DataFrame
+        # Direct column mappings (later entries win)
         for current_col, pete_col in mapping.items():
             if current_col in df.columns and pete_col in self.PETE_HEADERS:
-                pete_df[pete_col] = df[current_col]
-                print(f"✅ Mapped {current_col} ({len(df[current_col].dropna())} values) → {pete_col}")
+                plan.assign(pete_col, current_col)
+        
+        return plan
+    
+    def create_pete_ready_dataframe(self, df: pd.DataFrame, mapping: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Create a Pete-ready DataFrame with correct headers.
+        
+        Args:
+            df: Processed DataFrame
+            mapping: Optional custom mapping
+            
+        Returns:
+            Pete-ready DataFrame
+        """
+        if mapping is None:
+            mapping = self.suggest_mapping(df)
+        
+        plan = self.build_mapping_plan(df, mapping)
+        pete_df = execute_mapping(df, plan)
+        
+        for pete_col, projection in plan.projections.items():
+            if isinstance(projection, ConcatRule):
+                print(f"✅ Concatenated {pete_col}: {' + '.join(projection.sources)}")
+            elif projection is not None:
+                print(f"✅ Mapped {projection} → {pete_col}")
         
         # Standardize Property Type
-        if 'Property Type' in pete_df.columns:
-            from backend.utils.data_standardizer_enhanced import standardize_property_types
-            pete_df = standardize_property_types(pete_df, 'Property Type')
-            print(f"✅ Standardized Property Type")
-        
-        # Fill remaining Pete headers with empty columns
-        for pete_col in self.PETE_HEADERS:
-            if pete_col not in pete_df.columns:
-                pete_df[pete_col] = None
+        from backend.utils.data_standardizer_enhanced import standardize_property_types
+        pete_df = standardize_property_types(pete_df, 'Property Type')
+        print(f"✅ Standardized Property Type")
         
         return pete_df
     
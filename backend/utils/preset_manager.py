@@ -6,15 +6,23 @@ Saves all analysis data, phone prioritization rules, owner insights, and export
 for future reference and reproducibility.
 """
 
+from __future__ import annotations
+
 import json
 import os
-import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 from loguru import logger
 import shutil
 
+from backend.utils.catalog import catalog_for, preset_record
+
+# pandas and the column profiler are only needed to save or load preset data;
+# listing presets (the startup dashboard) must not import them
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class PresetManager:
     """
@@ -46,6 +54,10 @@ class PresetManager:
         
         for dir_path in [self.presets_dir, self.exports_dir, self.logs_dir, self.views_dir]:
             dir_path.mkdir(exist_ok=True)
+        
+        # Preset and export log index (data/catalog.sqlite by default)
+        self.export_log_file = self.logs_dir / "export_log.json"
+        self.catalog = catalog_for(self.base_dir)
     
     def save_comprehensive_preset(self, 
                                 preset_name: str,
@@ -55,7 +67,10 @@ class PresetManager:
                                 phone_prioritization_rules: Optional[Dict] = None,
                                 owner_analysis_results: Optional[Dict] = None,
                                 data_prep_summary: Optional[Dict] = None,
-                                export_data: Optional[pd.DataFrame] = None) -> str:
+                                export_data: Optional[pd.DataFrame] = None,
+                                standardization_rules: Optional[Dict] = None,
+                                operation_log: Optional[List[Dict]] = None,
+                                user_id: Optional[str] = None) -> str:
         """
         Save a comprehensive preset with all analysis data and configurations.
         
@@ -68,6 +83,9 @@ class PresetManager:
             owner_analysis_results: Owner analysis results
             data_prep_summary: Summary of data preparation steps
             export_data: Final export data for Pete
+            standardization_rules: Categorical value rule table (see DataStandardizerEnhanced)
+            operation_log: Recorded data prep operations (see OperationLog.to_list)
+            user_id: User the preset belongs to (indexed in the catalog)
             
         Returns:
             Path to saved preset directory
@@ -75,6 +93,11 @@ class PresetManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         preset_id = f"{preset_name}_{timestamp}"
         preset_dir = self.presets_dir / preset_id
+        
+        # Index presets saved without the catalog before this one is added
+        self.catalog.sync_presets(self.base_dir, self.presets_dir)
+        self.catalog.sync_exports(self.base_dir, self.export_log_file)
+        
         preset_dir.mkdir(exist_ok=True)
         
         logger.info(f"💾 Saving comprehensive preset: {preset_id}")
@@ -116,6 +139,16 @@ class PresetManager:
             with open(preset_dir / "data_prep_summary.json", 'w') as f:
                 json.dump(data_prep_summary, f, indent=2, default=str)
         
+        # 4b. Save categorical standardization rules
+        if standardization_rules:
+            with open(preset_dir / "standardization_rules.json", 'w') as f:
+                json.dump(standardization_rules, f, indent=2)
+        
+        # 4c. Save the replayable operation log
+        if operation_log:
+            with open(preset_dir / "operation_log.json", 'w') as f:
+                json.dump(operation_log, f, indent=2, default=str)
+        
         # 5. Save data samples (first 1000 rows for reference)
         original_sample = original_df.head(1000)
         prepared_sample = prepared_df.head(1000)
@@ -128,7 +161,7 @@ class PresetManager:
             export_sample.to_csv(preset_dir / "export_data_sample.csv", index=False)
         
         # 6. Create reference views
-        self._create_reference_views(preset_dir, original_df, prepared_df, export_data)
+        data_quality = self._create_reference_views(preset_dir, original_df, prepared_df, export_data)
         
         # 7. Generate comprehensive report
         report = self._generate_preset_report(metadata, phone_prioritization_rules, 
@@ -138,14 +171,22 @@ class PresetManager:
             f.write(report)
         
         # 8. Save export log
-        self._save_export_log(preset_id, metadata, export_data)
+        log_entry = self._save_export_log(preset_id, metadata, export_data)
+        
+        # 9. Index the preset and its export in one transaction
+        dashboard = self._dashboard_summary(data_quality, owner_analysis_results, phone_prioritization_rules)
+        with self.catalog.transaction() as conn:
+            self.catalog.put_preset(conn, self.base_dir, preset_record(metadata), user_id, dashboard)
+            self.catalog.add_export(conn, self.base_dir, log_entry, user_id)
+            self.catalog.mark_synced(conn, self.base_dir, "presets", self.presets_dir)
+            self.catalog.mark_synced(conn, self.base_dir, "exports", self.export_log_file)
         
         logger.info(f"✅ Comprehensive preset saved: {preset_dir}")
         return str(preset_dir)
     
     def _create_reference_views(self, preset_dir: Path, original_df: pd.DataFrame, 
-                               prepared_df: pd.DataFrame, export_data: Optional[pd.DataFrame]):
-        """Create reference views for data exploration."""
+                               prepared_df: pd.DataFrame, export_data: Optional[pd.DataFrame]) -> Dict[str, Any]:
+        """Create reference views for data exploration; returns the data quality view."""
         
         # Create column comparison view
         column_comparison = {
@@ -159,22 +200,55 @@ class PresetManager:
         with open(preset_dir / "column_comparison.json", 'w') as f:
             json.dump(column_comparison, f, indent=2)
         
-        # Create data quality view
-        data_quality = {
-            'original_data_quality': {
-                'null_counts': original_df.isnull().sum().to_dict(),
-                'duplicate_rows': original_df.duplicated().sum(),
-                'unique_values_per_column': {col: original_df[col].nunique() for col in original_df.columns[:20]}
-            },
-            'prepared_data_quality': {
-                'null_counts': prepared_df.isnull().sum().to_dict(),
-                'duplicate_rows': prepared_df.duplicated().sum(),
-                'unique_values_per_column': {col: prepared_df[col].nunique() for col in prepared_df.columns[:20]}
+        from backend.utils.column_profiler import profile_dataframe
+        
+        # Create data quality view (one profiling scan per frame; distinct counts are HyperLogLog estimates)
+        data_quality = {}
+        for label, frame in (('original_data_quality', original_df), ('prepared_data_quality', prepared_df)):
+            profile = profile_dataframe(frame, duplicates=True)
+            distinct = profile.distinct_counts()
+            data_quality[label] = {
+                'null_counts': profile.null_counts(),
+                'blank_counts': profile.blank_counts(),
+                'duplicate_rows': profile.duplicate_rows,
+                'unique_values_per_column': {col: distinct[col] for col in list(frame.columns)[:20]}
             }
-        }
         
         with open(preset_dir / "data_quality.json", 'w') as f:
             json.dump(data_quality, f, indent=2, default=str)
+        
+        return data_quality
+    
+    def _dashboard_summary(self, data_quality: Dict[str, Any], owner_analysis: Optional[Dict],
+                           phone_rules: Optional[Dict]) -> Dict[str, Any]:
+        """The parts of a preset the user dashboard shows, stored with its catalog entry."""
+        summary = {
+            'data_quality': {
+                label: {
+                    # Presets saved by older versions stored counts as text and no blank counts
+                    'duplicate_rows': int(quality.get('duplicate_rows', 0)),
+                    'null_cells': sum(int(count) for count in quality.get('null_counts', {}).values()),
+                    'blank_cells': sum(int(count) for count in quality.get('blank_counts', {}).values()),
+                }
+                for label, quality in data_quality.items()
+            }
+        }
+        if owner_analysis:
+            summary['owner_analysis'] = {
+                'total_owners': owner_analysis.get('total_owners', 0),
+                'business_entities': {
+                    'business_count': owner_analysis.get('business_entities', {}).get('business_count', 0)
+                },
+                'ownership_patterns': {
+                    'owners_with_multiple_properties': owner_analysis.get(
+                        'ownership_patterns', {}).get('owners_with_multiple_properties', 0)
+                },
+            }
+        if phone_rules:
+            summary['phone_prioritization_rules'] = {
+                key: phone_rules.get(key, {}) for key in ('status_weights', 'type_weights', 'tag_weights')
+            }
+        return summary
     
     def _generate_preset_report(self, metadata: Dict, phone_rules: Optional[Dict], 
                                owner_analysis: Optional[Dict], data_prep: Optional[Dict]) -> str:
@@ -247,6 +321,8 @@ class PresetManager:
             "- `phone_prioritization_rules.json` - Custom phone prioritization rules",
             "- `owner_analysis.json` - Owner analysis results",
             "- `data_prep_summary.json` - Data preparation steps",
+            "- `standardization_rules.json` - Categorical value standardization rules",
+            "- `operation_log.json` - Data preparation operations (replayable on new uploads)",
             "- `original_data_sample.csv` - Sample of original data",
             "- `prepared_data_sample.csv` - Sample of prepared data",
             "- `export_data_sample.csv` - Sample of export data",
@@ -265,8 +341,8 @@ class PresetManager:
         
         return "\n".join(report_lines)
     
-    def _save_export_log(self, preset_id: str, metadata: Dict, export_data: Optional[pd.DataFrame]):
-        """Save export log for tracking and reference."""
+    def _save_export_log(self, preset_id: str, metadata: Dict, export_data: Optional[pd.DataFrame]) -> Dict[str, Any]:
+        """Save export log for tracking and reference; returns the new log entry."""
         
         log_entry = {
             'timestamp': datetime.now().isoformat(),
@@ -282,7 +358,7 @@ class PresetManager:
         }
         
         # Append to export log
-        log_file = self.logs_dir / "export_log.json"
+        log_file = self.export_log_file
         
         if log_file.exists():
             with open(log_file, 'r') as f:
@@ -300,9 +376,31 @@ class PresetManager:
             export_file = self.exports_dir / f"{preset_id}_export.csv"
             export_data.to_csv(export_file, index=False)
             logger.info(f"📁 Export data saved: {export_file}")
+        
+        return log_entry
+    
+    def load_dashboard_summary(self, preset_id: str) -> Dict[str, Any]:
+        """The dashboard summary of a saved preset, read from its files.
+
+        Same shape as the summary stored with the preset's catalog entry at
+        save time, for presets the catalog only knows from their files.
+        """
+        preset_dir = self.presets_dir / preset_id
+        if not preset_dir.exists():
+            raise FileNotFoundError(f"Preset {preset_id} not found")
+        
+        def read(name: str) -> Optional[Dict[str, Any]]:
+            path = preset_dir / name
+            if not path.exists():
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        
+        return self._dashboard_summary(read("data_quality.json") or {}, read("owner_analysis.json"),
+                                       read("phone_prioritization_rules.json"))
     
-    def load_preset(self, preset_id: str) -> Dict[str, Any]:
-        """Load a saved preset."""
+    def load_preset(self, preset_id: str, include_samples: bool = True) -> Dict[str, Any]:
+        """Load a saved preset (``include_samples=False`` skips the CSV data samples)."""
         preset_dir = self.presets_dir / preset_id
         
         if not preset_dir.exists():
@@ -332,7 +430,24 @@ class PresetManager:
             with open(prep_file, 'r') as f:
                 preset_data['data_prep_summary'] = json.load(f)
         
+        # Load standardization rules
+        standardization_file = preset_dir / "standardization_rules.json"
+        if standardization_file.exists():
+            with open(standardization_file, 'r') as f:
+                preset_data['standardization_rules'] = json.load(f)
+        
+        # Load operation log
+        operation_log_file = preset_dir / "operation_log.json"
+        if operation_log_file.exists():
+            with open(operation_log_file, 'r') as f:
+                preset_data['operation_log'] = json.load(f)
+        
+        if not include_samples:
+            return preset_data
+        
         # Load data samples
+        import pandas as pd
+        
         original_sample_file = preset_dir / "original_data_sample.csv"
         if original_sample_file.exists():
             preset_data['original_sample'] = pd.read_csv(original_sample_file)
@@ -347,28 +462,16 @@ class PresetManager:
         
         return preset_data
     
-    def list_presets(self) -> List[Dict[str, Any]]:
-        """List all available presets."""
-        presets = []
-        
-        for preset_dir in self.presets_dir.iterdir():
-            if preset_dir.is_dir():
-                metadata_file = preset_dir / "metadata.json"
-                if metadata_file.exists():
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    presets.append({
-                        'preset_id': metadata['preset_id'],
-                        'preset_name': metadata['preset_name'],
-                        'data_source': metadata['data_source'],
-                        'created_at': metadata['created_at'],
-                        'summary': metadata['summary']
-                    })
-        
-        # Sort by creation date (newest first)
-        presets.sort(key=lambda x: x['created_at'], reverse=True)
-        return presets
+    def list_presets(self, user_id: Optional[str] = None,
+                     data_source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List available presets, newest first (optionally of one user or data source)."""
+        self.catalog.sync_presets(self.base_dir, self.presets_dir)
+        return self.catalog.presets(self.base_dir, user_id=user_id, data_source=data_source)
+    
+    def list_exports(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Export log entries, oldest first (the last *limit* ones if given)."""
+        self.catalog.sync_exports(self.base_dir, self.export_log_file)
+        return self.catalog.exports(self.base_dir, limit)
     
     def create_data_view(self, view_name: str, data: pd.DataFrame, 
                         description: str = "", filters: Optional[Dict] = None) -> str:
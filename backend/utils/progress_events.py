@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+📡 Progress Events Module
+
+Structured progress events for pipeline runs, published from
+``ProgressTracker`` step callbacks.
+
+Each event carries the stage, rows done / total, bytes done / total and an
+ETA.  A :class:`ProgressEventBus` puts events on a thread-safe queue (the
+GUI drains it on a timer and coalesces what it finds) and appends every
+event to a JSON-lines run log, so headless runs can be watched with
+``tail -f data/runs/<run id>.jsonl``.
+
+Example:
+    bus = ProgressEventBus()
+    tracker = ProgressTracker("Pipeline")
+    bus.attach(tracker)
+    bus.start_run()
+    tracker.start_step("Loading Data", total_records=10_000)
+    tracker.update_progress(5_000)
+    tracker.end_step(10_000)
+    bus.finish_run(True)
+"""
+
+import json
+import queue
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from loguru import logger
+
+from .progress_tracker import ProcessingStep, ProgressTracker
+
+RUN_LOG_DIR = Path("data/runs")
+MAX_QUEUED_EVENTS = 10_000
+
+# Event status values
+RUN_STARTED = "run_started"
+RUN_FINISHED = "run_finished"
+RUN_FAILED = "run_failed"
+
+
+@dataclass
+class ProgressEvent:
+    """One progress report of a pipeline run."""
+    run_id: str
+    stage: str
+    status: str  # run_started, running, completed, failed, run_finished, run_failed
+    rows_done: int = 0
+    rows_total: int = 0
+    bytes_done: int = 0
+    bytes_total: int = 0
+    eta_seconds: Optional[float] = None
+    stage_index: int = 0
+    stage_count: int = 0
+    message: str = ""
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def stage_fraction(self) -> float:
+        """Completed fraction of the stage (0-1)."""
+        if self.status in ("completed", RUN_FINISHED):
+            return 1.0
+        if self.rows_total > 0:
+            return min(self.rows_done / self.rows_total, 1.0)
+        if self.bytes_total > 0:
+            return min(self.bytes_done / self.bytes_total, 1.0)
+        return 0.0
+
+    @property
+    def overall_percent(self) -> int:
+        """Progress of the whole run (0-100), counting stages equally."""
+        if self.status == RUN_FINISHED:
+            return 100
+        if self.stage_count <= 0:
+            return 0
+        return int((self.stage_index + self.stage_fraction) / self.stage_count * 100)
+
+    def describe(self) -> str:
+        """One-line status text, e.g. ``Loading Data: 5,000/10,000 rows, 3s left``."""
+        if self.status == RUN_STARTED:
+            return self.message or "Pipeline started"
+        if self.status in (RUN_FINISHED, RUN_FAILED):
+            return self.message or ("Pipeline completed" if self.status == RUN_FINISHED else "Pipeline failed")
+        text = f"{self.stage}: {self.status}"
+        if self.rows_total:
+            text = f"{self.stage}: {self.rows_done:,}/{self.rows_total:,} rows"
+        elif self.rows_done:
+            text = f"{self.stage}: {self.rows_done:,} rows"
+        if self.bytes_total and not self.rows_total:
+            text += f" ({self.bytes_total / 1024 ** 2:.1f} MB)"
+        if self.eta_seconds is not None and self.status == "running":
+            text += f", {format_eta(self.eta_seconds)} left"
+        if self.message:
+            text += f" - {self.message}"
+        return text
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ProgressEvent":
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def format_eta(seconds: float) -> str:
+    """Format seconds as ``42s``, ``3m 5s`` or ``1h 2m``."""
+    seconds = int(max(seconds, 0))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+
+def coalesce_events(events: List[ProgressEvent]) -> List[ProgressEvent]:
+    """
+    Drop superseded ``running`` events.
+
+    Keeps every status change (stage started/completed/failed, run
+    started/finished) and only the latest ``running`` event of each stage,
+    in their original order.
+    """
+    latest: Dict[str, int] = {}
+    for i, event in enumerate(events):
+        if event.status == "running":
+            latest[event.stage] = i
+    return [
+        event for i, event in enumerate(events)
+        if event.status != "running" or latest.get(event.stage) == i
+    ]
+
+
+def run_log_path(run_id: str, log_dir: Union[str, Path] = RUN_LOG_DIR) -> Path:
+    return Path(log_dir) / f"{run_id}.jsonl"
+
+
+def latest_run_log(log_dir: Union[str, Path] = RUN_LOG_DIR) -> Optional[Path]:
+    """Most recently written run log, or None."""
+    logs = list(Path(log_dir).glob("*.jsonl"))
+    return max(logs, key=lambda p: p.stat().st_mtime) if logs else None
+
+
+def read_events(path: Union[str, Path]) -> List[ProgressEvent]:
+    """Events of a run log (a partially written last line is skipped)."""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(ProgressEvent.from_dict(json.loads(line)))
+            except (json.JSONDecodeError, TypeError):
+                continue
+    return events
+
+
+class ProgressEventBus:
+    """
+    Thread-safe publisher of the progress events of one run.
+
+    Events are queued for a consumer that calls :meth:`drain` (the GUI),
+    handed to subscribers on the publishing thread, and appended to the
+    run log.  When nobody drains the queue it stops accepting events once
+    full; the run log still gets all of them.
+    """
+
+    def __init__(self, run_id: Optional[str] = None,
+                 log_dir: Union[str, Path, None] = RUN_LOG_DIR,
+                 max_queued: int = MAX_QUEUED_EVENTS):
+        """
+        Args:
+            run_id: Run identifier (default: timestamp plus a short random suffix)
+            log_dir: Directory of the JSON-lines run log (None: no log)
+            max_queued: Maximum events waiting in the queue
+        """
+        self.run_id = run_id or f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{uuid.uuid4().hex[:6]}"
+        self.events: "queue.Queue[ProgressEvent]" = queue.Queue(maxsize=max_queued)
+        self.log_path = run_log_path(self.run_id, log_dir) if log_dir is not None else None
+        self._subscribers: List[Callable[[ProgressEvent], None]] = []
+        self._lock = threading.Lock()
+        self._log_file = None
+
+    def publish(self, event: ProgressEvent):
+        """Queue, log and hand *event* to the subscribers."""
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            pass
+        with self._lock:
+            self._write(event)
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"Progress subscriber failed: {e}")
+
+    def subscribe(self, callback: Callable[[ProgressEvent], None]):
+        """Call *callback* with every event, on the publishing thread."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def drain(self, max_events: Optional[int] = None) -> List[ProgressEvent]:
+        """Take the queued events without blocking."""
+        events = []
+        while max_events is None or len(events) < max_events:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def attach(self, tracker: ProgressTracker):
+        """Publish an event for every step callback of *tracker*."""
+        tracker.set_callback(lambda step: self.publish(self.step_event(tracker, step)))
+
+    def step_event(self, tracker: ProgressTracker, step: ProcessingStep) -> ProgressEvent:
+        names = [s.name for s in tracker.steps]
+        return ProgressEvent(
+            run_id=self.run_id,
+            stage=step.name,
+            status=step.status,
+            rows_done=step.records_processed,
+            rows_total=step.total_records,
+            bytes_done=step.bytes_processed,
+            bytes_total=step.total_bytes,
+            eta_seconds=step.eta_seconds,
+            stage_index=names.index(step.name) if step.name in names else 0,
+            stage_count=len(names),
+            message=step.error_message or "",
+        )
+
+    def start_run(self, message: str = ""):
+        self.publish(ProgressEvent(self.run_id, "", RUN_STARTED, message=message))
+
+    def finish_run(self, success: bool, message: str = ""):
+        """Publish the final event and close the run log."""
+        self.publish(ProgressEvent(self.run_id, "", RUN_FINISHED if success else RUN_FAILED,
+                                   message=message))
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+    def _write(self, event: ProgressEvent):
+        if self.log_path is None:
+            return
+        try:
+            if self._log_file is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log_file = open(self.log_path, "a", encoding="utf-8")
+            self._log_file.write(json.dumps(event.to_dict()) + "\n")
+            self._log_file.flush()
+        except OSError as e:
+            logger.warning(f"Could not write run log {self.log_path}: {e}")
+            self.log_path = None
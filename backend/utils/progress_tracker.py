@@ -11,6 +11,7 @@ Features:
 - Consistent logging format
 - Memory usage tracking
 - Performance benchmarking
+- Step callbacks (start, progress, end, failure) for progress events
 """
 
 import time
@@ -32,14 +33,17 @@ class ProcessingStep:
     duration: Optional[float] = None
     records_processed: int = 0
     total_records: int = 0
+    bytes_processed: int = 0
+    total_bytes: int = 0
     memory_usage_mb: float = 0.0
     status: str = "pending"  # pending, running, completed, failed
     error_message: Optional[str] = None
     
-    def start(self, total_records: int = 0):
+    def start(self, total_records: int = 0, total_bytes: int = 0):
         """Start timing this step."""
         self.start_time = time.time()
         self.total_records = total_records
+        self.total_bytes = total_bytes
         self.status = "running"
         self.memory_usage_mb = self._get_memory_usage()
         
@@ -81,6 +85,17 @@ class ProcessingStep:
         if not self.duration or self.duration == 0:
             return 0.0
         return self.records_processed / self.duration
+    
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds left for a running step (None if unknown)."""
+        if self.status != "running" or not self.start_time:
+            return None
+        if self.total_records <= 0 or self.records_processed <= 0:
+            return None
+        elapsed = time.time() - self.start_time
+        remaining = max(self.total_records - self.records_processed, 0)
+        return elapsed / self.records_processed * remaining
 
 
 class ProgressTracker:
@@ -120,12 +135,13 @@ class ProgressTracker:
         if estimated_time > 0:
             logger.info(f"⏱️  Estimated total time: {estimated_time:.1f}s")
     
-    def start_step(self, step_name: str, total_records: int = 0):
+    def start_step(self, step_name: str, total_records: int = 0, total_bytes: int = 0):
         """Start a processing step."""
         with self._lock:
             # End previous step if running
             if self.current_step and self.current_step.status == "running":
-                self.current_step.end()
+                self.current_step.end(self.current_step.records_processed)
+                self._notify(self.current_step)
             
             # Find or create step
             step = next((s for s in self.steps if s.name == step_name), None)
@@ -133,15 +149,18 @@ class ProgressTracker:
                 step = self.add_step(step_name)
             
             self.current_step = step
-            step.start(total_records)
+            step.start(total_records, total_bytes)
             
             logger.info(f"🔄 {step_name}")
             logger.info(f"⏰ Started at: {datetime.now().strftime('%H:%M:%S')}")
             
             if total_records > 0:
                 logger.info(f"📊 Processing {total_records:,} records")
+            
+            self._notify(step)
     
-    def update_progress(self, records_processed: int, step_name: Optional[str] = None):
+    def update_progress(self, records_processed: int, step_name: Optional[str] = None,
+                        bytes_processed: Optional[int] = None):
         """Update progress for current or specified step."""
         with self._lock:
             step = self.current_step
@@ -150,6 +169,8 @@ class ProgressTracker:
             
             if step and step.status == "running":
                 step.records_processed = records_processed
+                if bytes_processed is not None:
+                    step.bytes_processed = bytes_processed
                 
                 # Calculate progress
                 if step.total_records > 0:
@@ -162,15 +183,16 @@ class ProgressTracker:
                         if eta:
                             logger.info(f"⏱️  ETA: {eta}")
                 
-                # Call callback if provided
-                if self.callback:
-                    self.callback(step)
+                self._notify(step)
     
-    def end_step(self, records_processed: int = 0):
+    def end_step(self, records_processed: int = 0, bytes_processed: Optional[int] = None):
         """End the current processing step."""
         with self._lock:
             if self.current_step and self.current_step.status == "running":
                 self.current_step.end(records_processed)
+                if bytes_processed is not None:
+                    self.current_step.bytes_processed = bytes_processed
+                self._notify(self.current_step)
                 
                 duration = self.current_step.duration
                 speed = self.current_step.records_per_second
@@ -195,13 +217,15 @@ class ProgressTracker:
             if self.current_step:
                 self.current_step.fail(error_message)
                 logger.error(f"❌ {self.current_step.name} failed: {error_message}")
+                self._notify(self.current_step)
     
     def end_operation(self):
         """End the overall operation."""
         with self._lock:
             # End current step if running
             if self.current_step and self.current_step.status == "running":
-                self.current_step.end()
+                self.current_step.end(self.current_step.records_processed)
+                self._notify(self.current_step)
             
             self.end_time = time.time()
             if self.start_time:
@@ -211,9 +235,22 @@ class ProgressTracker:
             self._generate_final_report()
     
     def set_callback(self, callback: Callable[[ProcessingStep], None]):
-        """Set a callback function for progress updates."""
+        """
+        Set a callback function for progress updates.
+        
+        It is called with the step when a step starts, reports progress,
+        ends or fails (the step's status tells which), on the thread that
+        reported it.
+        """
         self.callback = callback
     
+    def _notify(self, step: ProcessingStep):
+        if self.callback:
+            try:
+                self.callback(step)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+    
     def _calculate_eta(self, step: ProcessingStep) -> Optional[str]:
         """Calculate estimated time to completion for a step."""
         if step.total_records == 0 or step.records_processed == 0:
@@ -0,0 +1,187 @@
+"""
+Sort Permutations
+-----------------
+Cached, stable argsort permutations for sorting record lists by column.
+
+Re-sorting a few hundred thousand owner objects with ``sorted(key=...)``
+calls a Python key function per object on every header click.  Instead,
+:class:`SortPermutationCache` extracts a column's values once per dataset
+version, computes a stable ascending ``argsort`` (NumPy for numbers, Polars
+for strings) and keeps the permutation:
+
+* ascending order is the permutation; descending order is a second
+  stable sort on the negated ranks (computed on first use and cached), so
+  equal values keep record order like ``sorted(reverse=True)``;
+* a subset of the records (e.g. after filtering) is sorted by keeping the
+  permutation entries that belong to the subset;
+* multi-key sorts ``np.lexsort`` the dense ranks of each key.
+
+The records themselves are never moved or copied; callers index them with
+the permutation.  The cache is tied to one record list: handing it another
+list (or the same list with a different length) starts a new dataset
+version and drops every cached permutation.
+
+Example
+-------
+>>> from backend.utils.sort_permutations import SortPermutationCache
+>>> cache = SortPermutationCache()
+>>> order = cache.permutation(owner_objects, "total_property_value", numeric=True, descending=True)
+>>> top = [owner_objects[i] for i in order[:10]]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import polars as pl
+
+__all__: list[str] = [
+    "SortPermutationCache",
+    "sort_values",
+    "stable_argsort",
+]
+
+SortKey = Union[str, Callable[[Any], Any]]
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, str)
+
+
+def sort_values(records: Sequence[Any], key: SortKey, numeric: Optional[bool] = None) -> np.ndarray:
+    """Sort values of *key* (attribute name or callable) for every record.
+
+    Numeric columns become ``float64`` (unparseable values sort as 0),
+    others ``str`` (``None`` and empty values as ``""``).  With
+    ``numeric=None`` a column whose values are all numbers is numeric.
+    """
+    get = key if callable(key) else (lambda record: getattr(record, key, ''))
+    raw = [get(record) for record in records]
+    if numeric is None:
+        numeric = bool(raw) and all(_is_number(v) or v is None for v in raw)
+    if numeric:
+        return np.fromiter((_to_float(v) for v in raw), dtype=np.float64, count=len(raw))
+    return np.array([str(v) if v is not None else '' for v in raw], dtype=object)
+
+
+def stable_argsort(values: np.ndarray) -> np.ndarray:
+    """Stable ascending argsort (equal values keep record order)."""
+    if values.dtype != object:
+        return np.argsort(values, kind="stable")
+    frame = pl.DataFrame({"v": pl.Series(values.tolist(), dtype=pl.Utf8)}).with_row_index("i")
+    return frame.sort(["v", "i"])["i"].to_numpy().astype(np.int64)
+
+
+def _dense_ranks(values: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Rank of each value among the distinct values (ascending, from 0)."""
+    ordered = values[order]
+    new_value = np.ones(len(ordered), dtype=bool)
+    new_value[1:] = ordered[1:] != ordered[:-1]
+    ranks = np.empty(len(ordered), dtype=np.int64)
+    ranks[order] = np.cumsum(new_value) - 1
+    return ranks
+
+
+@dataclass
+class _SortEntry:
+    """Cached sort data of one key: values, dense ranks and both permutations."""
+
+    values: np.ndarray
+    ascending: np.ndarray
+    ranks: np.ndarray
+    descending: Optional[np.ndarray] = None
+
+    def order(self, descending: bool) -> np.ndarray:
+        if not descending:
+            return self.ascending
+        if self.descending is None:
+            self.descending = np.argsort(-self.ranks, kind="stable")
+        return self.descending
+
+
+class SortPermutationCache:
+    """Sort permutations of one record list, per sort key."""
+
+    def __init__(self, max_keys: int = 16):
+        """
+        Args:
+            max_keys: Permutations kept before the oldest is dropped
+        """
+        self.max_keys = max_keys
+        self.version = 0
+        self._records: Optional[Sequence[Any]] = None
+        self._size = 0
+        self._entries: Dict[Tuple[Hashable, Optional[bool]], _SortEntry] = {}
+
+    def use(self, records: Sequence[Any]) -> int:
+        """Make *records* the cached dataset; returns its version."""
+        if records is not self._records or len(records) != self._size:
+            self._records = records
+            self._size = len(records)
+            self._entries.clear()
+            self.version += 1
+        return self.version
+
+    def clear(self):
+        self._records = None
+        self._size = 0
+        self._entries.clear()
+
+    def permutation(self, records: Sequence[Any], key: SortKey, numeric: Optional[bool] = None,
+                    descending: bool = False, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Record indices in sort order.
+
+        Args:
+            records: The record list (starts a new dataset version if it changed)
+            key: Attribute name or callable giving the sort value
+            numeric: Sort as numbers (``None``: decide from the values)
+            descending: Largest first; equal values keep record order
+            rows: Boolean mask of the records to keep (``None``: all)
+        """
+        order = self._entry(records, key, numeric).order(descending)
+        if rows is not None:
+            order = order[rows[order]]
+        return order
+
+    def lexsort(self, records: Sequence[Any], keys: Sequence[Tuple[SortKey, Optional[bool], bool]],
+                rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Record indices sorted by several keys, the first one primary.
+
+        Args:
+            records: The record list
+            keys: ``(key, numeric, descending)`` per sort key
+            rows: Boolean mask of the records to keep (``None``: all)
+        """
+        if not keys:
+            order = np.arange(len(records), dtype=np.int64)
+            return order if rows is None else order[rows]
+        columns = []
+        for key, numeric, descending in reversed(keys):  # np.lexsort: last key is primary
+            ranks = self._entry(records, key, numeric).ranks
+            columns.append(-ranks if descending else ranks)
+        if rows is not None:
+            indices = np.flatnonzero(rows)
+            return indices[np.lexsort([c[indices] for c in columns])]
+        return np.lexsort(columns)
+
+    def _entry(self, records: Sequence[Any], key: SortKey, numeric: Optional[bool]) -> _SortEntry:
+        self.use(records)
+        cache_key = (key, numeric)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            values = sort_values(records, key, numeric)
+            order = stable_argsort(values)
+            entry = _SortEntry(values, order, _dense_ranks(values, order))
+            if len(self._entries) >= self.max_keys:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[cache_key] = entry
+        return entry
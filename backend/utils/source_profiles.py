@@ -0,0 +1,173 @@
+"""
+Source Profiles
+---------------
+Declare column dtypes for known upload sources *before* the file is read.
+
+Phone, ZIP and parcel columns are identifiers, but CSV/Excel readers infer
+them as numbers; once a column contains a blank cell it becomes ``float64``
+and every value picks up a trailing ``.0`` that the cleanup stage then has
+to strip again.  A :class:`SourceProfile` lists the header patterns that
+must stay text, so readers can be given ``schema_overrides`` (Polars) or
+``dtype`` (pandas) and the cleanup stage only has to touch the remaining
+columns.
+
+Example
+-------
+>>> from backend.utils.source_profiles import read_source
+>>> df, profile = read_source("upload/reisift_export.csv")
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import polars as pl
+
+__all__: list[str] = [
+    "SourceProfile",
+    "REISIFT",
+    "PROFILES",
+    "detect_profile",
+    "resolve_profile",
+    "read_columns",
+    "read_source",
+    "cleanup_columns",
+]
+
+
+@dataclass(frozen=True)
+class SourceProfile:
+    """Column dtype declarations for one upload source.
+
+    Attributes
+    ----------
+    name:
+        Display name, e.g. ``"REISIFT"``.
+    indicators:
+        Lower-case substrings; a source matches when any header contains one.
+    text_patterns:
+        Case-insensitive regexes; matching headers are read as text.
+    """
+
+    name: str
+    indicators: Tuple[str, ...] = ()
+    text_patterns: Tuple[str, ...] = ()
+
+    def matches(self, columns: Iterable[str]) -> bool:
+        """Return ``True`` if *columns* look like an export of this source."""
+        joined = " ".join(str(col).lower() for col in columns)
+        return any(indicator in joined for indicator in self.indicators)
+
+    def text_columns(self, columns: Iterable[str]) -> List[str]:
+        """Return the columns of *columns* that must be read as text."""
+        patterns = [re.compile(p, re.IGNORECASE) for p in self.text_patterns]
+        return [col for col in columns if any(p.search(str(col)) for p in patterns)]
+
+    def schema_overrides(self, columns: Iterable[str]) -> Dict[str, pl.DataType]:
+        """``schema_overrides`` for ``pl.read_csv``/``pl.read_excel``."""
+        return {col: pl.Utf8 for col in self.text_columns(columns)}
+
+    def pandas_dtypes(self, columns: Iterable[str]) -> Dict[str, type]:
+        """``dtype`` mapping for ``pd.read_csv``/``pd.read_excel``."""
+        return {col: str for col in self.text_columns(columns)}
+
+
+REISIFT = SourceProfile(
+    name="REISIFT",
+    indicators=("mls", "deed", "foreclosure date", "property taxes", "exported from reisift.io"),
+    text_patterns=(
+        r"^phone \d+$",  # Phone 1 … Phone 30 (not Phone Type/Status/Tags)
+        r"zip",
+        r"parcel",
+        r"\bapn\b",
+    ),
+)
+
+# Profiles are checked in order; the first match wins
+PROFILES: Dict[str, SourceProfile] = {
+    REISIFT.name: REISIFT,
+}
+
+
+def detect_profile(columns: Sequence[str]) -> Optional[SourceProfile]:
+    """Return the first profile whose indicators match *columns*, if any."""
+    for profile in PROFILES.values():
+        if profile.matches(columns):
+            return profile
+    return None
+
+
+def resolve_profile(profile: Union[SourceProfile, str, None],
+                    columns: Sequence[str]) -> Optional[SourceProfile]:
+    """Resolve a profile argument (instance, :data:`PROFILES` key, ``"auto"`` or ``None``)."""
+    if profile == "auto":
+        return detect_profile(columns)
+    if isinstance(profile, str):
+        return PROFILES[profile]
+    return profile
+
+
+def read_columns(filepath: Union[str, Path]) -> List[str]:
+    """Read only the header row of a CSV or Excel file."""
+    ext = os.path.splitext(str(filepath))[1].lower()
+    if ext == ".csv":
+        return pl.read_csv(filepath, n_rows=0, infer_schema=False).columns
+    if ext in [".xls", ".xlsx"]:
+        return [str(col) for col in pd.read_excel(filepath, nrows=0).columns]
+    raise ValueError(f"Unsupported file type: {ext}")
+
+
+def read_source(
+    filepath: Union[str, Path],
+    profile: Union[SourceProfile, str, None] = "auto",
+) -> Tuple[pd.DataFrame, Optional[SourceProfile]]:
+    """Read a CSV/Excel upload with the profile's text columns kept as text.
+
+    Parameters
+    ----------
+    filepath:
+        ``.csv``, ``.xls`` or ``.xlsx`` file.
+    profile:
+        A :class:`SourceProfile`, a key of :data:`PROFILES`, ``"auto"`` to
+        detect it from the header row, or ``None`` for plain inference.
+
+    Returns
+    -------
+    tuple
+        ``(dataframe, profile)`` – the profile actually used (or ``None``).
+    """
+
+    ext = os.path.splitext(str(filepath))[1].lower()
+    if ext not in [".csv", ".xls", ".xlsx"]:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+    resolved: Optional[SourceProfile] = None
+    dtypes = None
+    if profile is not None:
+        columns = read_columns(filepath)
+        resolved = resolve_profile(profile, columns)
+        if resolved is not None:
+            dtypes = resolved.pandas_dtypes(columns)
+
+    if ext == ".csv":
+        df = pd.read_csv(filepath, low_memory=False, dtype=dtypes)
+    else:
+        df = pd.read_excel(filepath, dtype=dtypes)
+    return df, resolved
+
+
+def cleanup_columns(df: pd.DataFrame, profile: Optional[SourceProfile]) -> Optional[List[str]]:
+    """Columns of *df* that still need the trailing ``.0`` cleanup.
+
+    ``None`` (no profile) means "all columns", matching the cleanup
+    functions' own default.
+    """
+    if profile is None:
+        return None
+    text = set(profile.text_columns(df.columns))
+    return [col for col in df.columns if col not in text]
@@ -0,0 +1,219 @@
+"""
+Stage Cache
+-----------
+Content-addressed cache of pipeline stage outputs, stored as Arrow IPC.
+
+A stage's key (:func:`stage_key`) hashes the stage name, the keys of its
+input stages (or the upload's content fingerprint for the first stage), its
+own config and :data:`CACHE_VERSION`. Changing a phone weight therefore
+changes the keys of prioritization and everything after it, and nothing
+before it.
+
+Each entry is a directory ``<cache_dir>/<key>/``:
+
+* ``frame.arrow`` – the stage's DataFrame (Arrow IPC file, zstd);
+* ``meta.json`` – stage, key, shape, size, creation time and small stage
+  metadata (e.g. the Pete mapping);
+* ``objects.pkl`` – Python objects the stage also produced (owner objects),
+  if any.
+
+Entries are written to a temporary directory and renamed into place, so
+concurrent workers never read a partial entry. :meth:`StageCache.evict`
+drops entries older than a maximum age, then least recently used entries
+until the cache fits its size budget. Every hit touches ``meta.json`` to
+record the use.
+
+Example
+-------
+>>> cache = StageCache("data/cache/pipeline")
+>>> key = stage_key("load", [file_fingerprint("upload/leads.csv")], {"source_profile": "auto"})
+>>> cache.get(key) or cache.put(key, "load", df)
+>>> cache.evict(max_bytes=2 * 1024 ** 3, max_age_days=14)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+from loguru import logger
+
+__all__: list[str] = [
+    "CACHE_VERSION",
+    "CachedStage",
+    "StageCache",
+    "file_fingerprint",
+    "stage_key",
+]
+
+# Bump when a stage's implementation changes its output
+CACHE_VERSION = 1
+
+FRAME_FILENAME = "frame.arrow"
+META_FILENAME = "meta.json"
+OBJECTS_FILENAME = "objects.pkl"
+
+
+def file_fingerprint(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of the file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_key(stage: str, inputs: Sequence[str], config: Dict[str, Any]) -> str:
+    """Cache key of *stage* given its input keys / fingerprints and its config."""
+    payload = json.dumps({'version': CACHE_VERSION, 'stage': stage, 'inputs': list(inputs), 'config': config},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+@dataclass
+class CachedStage:
+    """Output of one stage: a frame plus small metadata and optional Python objects."""
+
+    frame: pd.DataFrame
+    meta: Dict[str, Any] = field(default_factory=dict)
+    objects: Any = None
+
+
+class StageCache:
+    """Arrow IPC cache of stage outputs under one directory."""
+
+    def __init__(self, cache_dir: Union[str, Path] = "data/cache/pipeline"):
+        """
+        Args:
+            cache_dir: Directory holding one sub-directory per entry
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def __contains__(self, key: str) -> bool:
+        return (self._entry(key) / META_FILENAME).exists()
+
+    def get(self, key: str) -> Optional[CachedStage]:
+        """The cached output for *key*, or None (a damaged entry is removed)."""
+        entry = self._entry(key)
+        meta_path = entry / META_FILENAME
+        if not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            with pa.memory_map(str(entry / FRAME_FILENAME), 'r') as source:
+                frame = pa.ipc.open_file(source).read_all().to_pandas()
+            objects = None
+            if meta.get('has_objects'):
+                with open(entry / OBJECTS_FILENAME, 'rb') as f:
+                    objects = pickle.load(f)
+        except (OSError, ValueError, pa.ArrowException, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"⚠️ Dropping damaged cache entry {key}: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        os.utime(meta_path)  # last use, for LRU eviction
+        return CachedStage(frame=frame, meta=meta.get('stage_meta', {}), objects=objects)
+
+    def put(self, key: str, stage: str, frame: pd.DataFrame, meta: Optional[Dict[str, Any]] = None,
+            objects: Any = None) -> bool:
+        """Store a stage output; returns False if the frame cannot be written as Arrow."""
+        entry = self._entry(key)
+        if (entry / META_FILENAME).exists():
+            return True
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_dir / f".{key}.{os.getpid()}.{uuid.uuid4().hex[:6]}.tmp"
+        tmp.mkdir()
+        try:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            options = pa.ipc.IpcWriteOptions(compression="zstd")
+            with pa.OSFile(str(tmp / FRAME_FILENAME), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                    writer.write_table(table)
+            if objects is not None:
+                with open(tmp / OBJECTS_FILENAME, 'wb') as f:
+                    pickle.dump(objects, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = sum(p.stat().st_size for p in tmp.iterdir())
+            with open(tmp / META_FILENAME, 'w') as f:
+                json.dump({
+                    'key': key,
+                    'stage': stage,
+                    'version': CACHE_VERSION,
+                    'rows': len(frame),
+                    'columns': len(frame.columns),
+                    'size_bytes': size,
+                    'created_at': datetime.now().isoformat(),
+                    'has_objects': objects is not None,
+                    'stage_meta': meta or {},
+                }, f, indent=2, default=str)
+            os.replace(tmp, entry)
+            return True
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Stage '{stage}' output not cached: {e}")
+            return False
+        except OSError:
+            # Another worker stored the same entry first
+            return (entry / META_FILENAME).exists()
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Metadata of every entry, with its last use (``last_used``, epoch seconds)."""
+        found = []
+        if not self.cache_dir.exists():
+            return found
+        for entry in self.cache_dir.iterdir():
+            meta_path = entry / META_FILENAME
+            if entry.name.startswith(".") or not meta_path.exists():
+                continue
+            try:
+                with open(meta_path, 'r') as f:
+                    meta = json.load(f)
+                meta['last_used'] = meta_path.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            found.append(meta)
+        return found
+
+    def size_bytes(self) -> int:
+        return sum(meta.get('size_bytes', 0) for meta in self.entries())
+
+    def evict(self, max_bytes: Optional[int] = None, max_age_days: Optional[float] = None) -> Dict[str, int]:
+        """
+        Drop entries unused for *max_age_days*, then least recently used ones over *max_bytes*.
+
+        Returns:
+            Dict with the number of removed entries, the freed bytes and the bytes kept
+        """
+        entries = sorted(self.entries(), key=lambda meta: meta['last_used'])
+        now = time.time()
+        removed, freed = 0, 0
+        total = sum(meta.get('size_bytes', 0) for meta in entries)
+        for meta in entries:
+            expired = max_age_days is not None and now - meta['last_used'] > max_age_days * 86400
+            over_budget = max_bytes is not None and total > max_bytes
+            if not (expired or over_budget):
+                continue
+            shutil.rmtree(self._entry(meta['key']), ignore_errors=True)
+            removed += 1
+            freed += meta.get('size_bytes', 0)
+            total -= meta.get('size_bytes', 0)
+        if removed:
+            logger.info(f"🧹 Evicted {removed} pipeline cache entries ({freed / 1024 ** 2:.1f} MB)")
+        return {'removed': removed, 'freed_bytes': freed, 'kept_bytes': total}
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -21,6 +21,11 @@ import os
 
 # Import Ultra-Fast Owner Object Analyzer
 from .ultra_fast_owner_analyzer import UltraFastOwnerObjectAnalyzer
+from .source_profiles import SourceProfile, cleanup_columns, read_columns, resolve_profile
+from . import trailing_dot_cleanup as tdc
+from .column_profiler import profile_dataframe
+from .progress_tracker import ProgressTracker
+from .progress_events import ProgressEventBus
 
 class UltraFastProcessor:
     """
@@ -41,13 +46,18 @@ class UltraFastProcessor:
         self.start_time = None
         self.step_times = {}
         self.performance_metrics = {}
+        self.source_profile: Optional[SourceProfile] = None
+        self.tracker: Optional[ProgressTracker] = None  # set by the pipeline for progress events
         
-    def load_csv_ultra_fast(self, filepath: Union[str, Path], **kwargs) -> pd.DataFrame:
+    def load_csv_ultra_fast(self, filepath: Union[str, Path],
+                            profile: Union[SourceProfile, str, None] = "auto", **kwargs) -> pd.DataFrame:
         """
         Ultra-fast CSV loading with Polars and comprehensive timing.
         
         Args:
             filepath: Path to CSV file
+            profile: Source profile whose identifier columns are read as text
+                ("auto" detects it from the header row, None disables it)
             **kwargs: Additional arguments for polars.read_csv
             
         Returns:
@@ -67,6 +77,15 @@ class UltraFastProcessor:
         estimated_load_time = self._estimate_load_time(file_size_mb)
         print(f"⏱️  Estimated load time: {estimated_load_time:.1f}s")
         
+        columns = read_columns(filepath) if profile is not None else []
+        self.source_profile = resolve_profile(profile, columns)
+        text_dtypes = self.source_profile.pandas_dtypes(columns) if self.source_profile else None
+        if self.source_profile:
+            # Phones/ZIPs stay text, so they never pick up a trailing .0
+            kwargs['schema_overrides'] = {**self.source_profile.schema_overrides(columns),
+                                          **(kwargs.get('schema_overrides') or {})}
+            print(f"🗂️  Source profile: {self.source_profile.name} ({len(text_dtypes)} text columns)")
+        
         try:
             # Load with Polars (ultra-fast)
             self.pl_df = pl.read_csv(
@@ -108,14 +127,17 @@ class UltraFastProcessor:
         except Exception as e:
             logger.error(f"Ultra-fast load failed: {e}")
             print(f"⚠️  Falling back to pandas...")
-            return pd.read_csv(filepath, **kwargs)
+            kwargs.pop('schema_overrides', None)
+            return pd.read_csv(filepath, dtype=text_dtypes, **kwargs)
     
-    def clean_trailing_dot_zero_ultra_fast(self, df: pd.DataFrame) -> pd.DataFrame:
+    def clean_trailing_dot_zero_ultra_fast(self, df: pd.DataFrame,
+                                           columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Ultra-fast .0 cleanup using Polars with progress tracking.
         
         Args:
             df: pandas DataFrame
+            columns: Columns to clean (default: all); see source_profiles.cleanup_columns
             
         Returns:
             pandas.DataFrame: Cleaned data
@@ -134,24 +156,14 @@ class UltraFastProcessor:
             # Convert to Polars for ultra-fast processing
             pl_df = pl.from_pandas(df)
             
-            # Get string columns that might have .0
-            string_cols = [col for col in pl_df.columns if pl_df[col].dtype == pl.Utf8]
+            # Only text columns carry a .0; float columns (prices) stay numeric
+            schema = pl_df.schema
+            string_cols = [col for col in pl_df.columns
+                           if schema[col] == pl.Utf8 and (columns is None or col in columns)]
             print(f"📝 Processing {len(string_cols)} string columns...")
             
-            # Clean .0 from string columns using Polars
-            cleaned_pl_df = pl_df.clone()
-            
-            for i, col in enumerate(string_cols):
-                if i % 10 == 0 or i == len(string_cols) - 1:
-                    progress = (i + 1) / len(string_cols) * 100
-                    elapsed = time.time() - step_start
-                    eta = (elapsed / (i + 1)) * (len(string_cols) - i - 1) if i > 0 else 0
-                    print(f"📊 Progress: {progress:.1f}% ({i+1}/{len(string_cols)}) - ETA: {eta:.1f}s")
-                
-                # Remove .0 from the end of strings
-                cleaned_pl_df = cleaned_pl_df.with_columns([
-                    pl.col(col).str.replace(r'\.0$', '').alias(col)
-                ])
+            # One with_columns over every affected column
+            cleaned_pl_df = tdc.strip_trailing_dot_zero_frame(pl_df, columns=string_cols)
             
             # Convert back to pandas
             cleaned_df = cleaned_pl_df.to_pandas()
@@ -183,7 +195,7 @@ class UltraFastProcessor:
             logger.error(f"Ultra-fast cleanup failed: {e}")
             print(f"⚠️  Falling back to pandas...")
             # Fallback to pandas
-            return df.astype(str).replace(r'\.0$', '', regex=True)
+            return tdc.clean_dataframe(df, columns=columns)
     
     def filter_empty_columns_ultra_fast(self, df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
         """
@@ -204,21 +216,10 @@ class UltraFastProcessor:
         print(f"⏰ Started at: {datetime.now().strftime('%H:%M:%S')}")
         
         try:
-            # Convert to Polars
-            pl_df = pl.from_pandas(df)
-            
-            # Calculate null percentages using Polars
-            null_percentages = {}
-            for col in pl_df.columns:
-                null_count = pl_df.select(pl.col(col).is_null().sum()).item()
-                null_percentages[col] = null_count / len(pl_df)
-            
-            # Filter columns
-            columns_to_keep = [col for col, null_pct in null_percentages.items() if null_pct < threshold]
-            filtered_pl_df = pl_df.select(columns_to_keep)
-            
-            # Convert back to pandas
-            filtered_df = filtered_pl_df.to_pandas()
+            # One cached scan gives null + blank counts for every column
+            profile = profile_dataframe(df)
+            columns_to_keep = set(profile.non_empty_columns(threshold))
+            filtered_df = df.loc[:, [col in columns_to_keep for col in df.columns]]
             
             filter_time = time.time() - step_start
             self.processing_stats['filter_time'] = filter_time
@@ -378,6 +379,9 @@ class UltraFastProcessor:
                     eta = (elapsed / (i + 1)) * (total_phones - i - 1) if i > 0 else 0
                     print(f"📊 Progress: {progress:.1f}% ({i+1}/{total_phones}) - ETA: {eta:.1f}s")
                 
+                if self.tracker:
+                    self.tracker.update_progress(len(df) * i // total_phones)
+                
                 status_col = f'Phone Status {i+1}' if f'Phone Status {i+1}' in status_cols else None
                 type_col = f'Phone Type {i+1}' if f'Phone Type {i+1}' in type_cols else None
                 tag_col = f'Phone Tag {i+1}' if f'Phone Tag {i+1}' in tag_cols else None
@@ -573,10 +577,10 @@ def load_csv_ultra_fast(filepath: Union[str, Path], **kwargs) -> pd.DataFrame:
     return processor.load_csv_ultra_fast(filepath, **kwargs)
 
 
-def clean_dataframe_ultra_fast(df: pd.DataFrame) -> pd.DataFrame:
+def clean_dataframe_ultra_fast(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
     """Ultra-fast .0 cleanup with Polars."""
     processor = UltraFastProcessor()
-    return processor.clean_trailing_dot_zero_ultra_fast(df)
+    return processor.clean_trailing_dot_zero_ultra_fast(df, columns=columns)
 
 
 def filter_empty_columns_ultra_fast(df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
@@ -598,19 +602,48 @@ def analyze_owner_objects_ultra_fast(df: pd.DataFrame) -> Tuple[pd.DataFrame, Li
     return processor.analyze_owner_objects_ultra_fast(df)
 
 
-def process_complete_pipeline_ultra_fast(filepath: Union[str, Path], export_excel: bool = True) -> Tuple[pd.DataFrame, Dict]:
+PIPELINE_STAGES = ["Loading Data", "Cleaning Data", "Filtering Columns",
+                   "Prioritizing Phones", "Analyzing Owners"]
+EXPORT_STAGE = "Exporting Data"
+
+
+def process_complete_pipeline_ultra_fast(filepath: Union[str, Path], export_excel: bool = True,
+                                         events: Optional[ProgressEventBus] = None) -> Tuple[pd.DataFrame, Dict]:
     """
     Process complete pipeline with ultra-fast Polars processing and comprehensive timing.
     
     Args:
         filepath: Path to CSV file
         export_excel: Whether to export to Excel
+        events: Bus receiving the progress events of each stage (default: a new
+            bus that only writes the JSON-lines run log under data/runs/)
         
     Returns:
         Tuple[pd.DataFrame, Dict]: Processed data and comprehensive stats
     """
     processor = UltraFastProcessor()
+    events = events or ProgressEventBus()
+    tracker = ProgressTracker("Ultra-Fast Pipeline")
+    for stage in PIPELINE_STAGES + ([EXPORT_STAGE] if export_excel else []):
+        tracker.add_step(stage)
+    events.attach(tracker)
+    processor.tracker = tracker
     
+    events.start_run(f"Processing {Path(filepath).name}")
+    try:
+        df = _run_pipeline_stages(processor, tracker, filepath, export_excel)
+    except Exception as e:
+        tracker.fail_step(str(e))
+        events.finish_run(False, f"Pipeline failed: {e}")
+        raise
+    events.finish_run(True, f"Pipeline completed: {len(df):,} rows")
+    
+    return df, processor.get_performance_summary()
+
+
+def _run_pipeline_stages(processor: UltraFastProcessor, tracker: ProgressTracker,
+                         filepath: Union[str, Path], export_excel: bool) -> pd.DataFrame:
+    """The pipeline stages, each reported to *tracker*."""
     print("🚀 STARTING ULTRA-FAST DATA PROCESSING PIPELINE")
     print("=" * 80)
     print(f"📁 File: {Path(filepath).name}")
@@ -618,23 +651,37 @@ def process_complete_pipeline_ultra_fast(filepath: Union[str, Path], export_exce
     print(f"🖥️  System: {processor._get_system_info()['cpu_count']} cores, {processor._get_system_info()['memory_total_gb']:.1f} GB RAM")
     print("-" * 80)
     
+    tracker.start_operation()
+    
     # Step 1: Load
+    file_size = Path(filepath).stat().st_size
+    tracker.start_step("Loading Data", total_bytes=file_size)
     df = processor.load_csv_ultra_fast(filepath)
+    tracker.end_step(len(df), bytes_processed=file_size)
     
-    # Step 2: Clean
-    df = processor.clean_trailing_dot_zero_ultra_fast(df)
+    # Step 2: Clean (profile text columns were read without .0)
+    tracker.start_step("Cleaning Data", len(df))
+    df = processor.clean_trailing_dot_zero_ultra_fast(df, columns=cleanup_columns(df, processor.source_profile))
+    tracker.end_step(len(df))
     
     # Step 3: Filter
+    tracker.start_step("Filtering Columns", len(df))
     df = processor.filter_empty_columns_ultra_fast(df)
+    tracker.end_step(len(df))
     
     # Step 4: Prioritize
+    tracker.start_step("Prioritizing Phones", len(df))
     df, meta = processor.prioritize_phones_ultra_fast(df)
+    tracker.end_step(len(df))
     
     # Step 5: Owner Object Analysis
+    tracker.start_step("Analyzing Owners", len(df))
     df, owner_objects = processor.analyze_owner_objects_ultra_fast(df)
+    tracker.end_step(len(df))
     
     # Step 6: Export (optional)
     if export_excel:
+        tracker.start_step(EXPORT_STAGE, len(df))
         print(f"📤 Exporting to Excel...")
         print(f"⏰ Started at: {datetime.now().strftime('%H:%M:%S')}")
         export_start = time.time()
@@ -662,11 +709,14 @@ def process_complete_pipeline_ultra_fast(filepath: Union[str, Path], export_exce
             processor.step_times['export'] = export_time
             print(f"✅ CSV export complete: {csv_filename}")
             print(f"⏱️  Export time: {export_time:.2f}s")
+        tracker.end_step(len(df))
+    
+    tracker.end_operation()
     
     # Print comprehensive performance summary
     processor.print_performance_summary()
     
-    return df, processor.get_performance_summary()
+    return df
 
 
 if __name__ == "__main__":
@@ -8,12 +8,14 @@ Provides web-app-like interface for data exploration and management.
 
 import json
 import os
+import threading
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 from loguru import logger
 from dataclasses import dataclass, asdict
-import pandas as pd
+
+from backend.utils.catalog import catalog_for
 
 
 @dataclass
@@ -71,6 +73,9 @@ class UserManager:
         for dir_path in [self.users_dir, self.companies_dir, self.dashboards_dir]:
             dir_path.mkdir(exist_ok=True)
         
+        # User index (data/catalog.sqlite by default, shared with presets and datasets)
+        self.catalog = catalog_for(self.base_dir)
+        
         # Initialize default user and company
         self._initialize_default_user()
         self.current_user = None
@@ -140,10 +145,14 @@ class UserManager:
             json.dump(asdict(company), f, indent=2, default=str)
     
     def _save_user(self, user: User):
-        """Save user to file."""
+        """Save user to file and index it in the catalog."""
+        self.catalog.sync_users(self.base_dir, self.users_dir)
         user_file = self.users_dir / f"{user.user_id}.json"
         with open(user_file, 'w') as f:
             json.dump(asdict(user), f, indent=2, default=str)
+        with self.catalog.transaction() as conn:
+            self.catalog.put_user(conn, self.base_dir, asdict(user))
+            self.catalog.mark_synced(conn, self.base_dir, "users", self.users_dir)
     
     def login_user(self, user_id: str = "mark_carpenter") -> User:
         """Login user and load their data."""
@@ -179,27 +188,34 @@ class UserManager:
         if not self.current_user:
             raise ValueError("No user logged in")
         
-        # Load user's presets
+        # Presets, exports and the latest owner dataset from the catalog, in one query
+        from backend.utils.owner_data_service import get_owner_data_service
         from backend.utils.preset_manager import PresetManager
         preset_manager = PresetManager()
-        user_presets = preset_manager.list_presets()
-        
-        # Filter presets for current user/company
-        user_presets = [p for p in user_presets if self.current_user.user_id in p.get('preset_name', '')]
+        catalog_data = self.catalog.refresh_dashboard(
+            self.current_user.user_id,
+            users_root=self.base_dir, users_dir=self.users_dir,
+            presets_root=preset_manager.base_dir, presets_dir=preset_manager.presets_dir,
+            log_file=preset_manager.export_log_file,
+            datasets_root=get_owner_data_service().base_dir,
+        )
+        user_presets = catalog_data['user_presets']
+        recent_exports = catalog_data['recent_exports']
         
-        # Get recent exports
-        export_log_file = preset_manager.logs_dir / "export_log.json"
-        recent_exports = []
-        if export_log_file.exists():
-            with open(export_log_file, 'r') as f:
-                export_data = json.load(f)
-                recent_exports = export_data.get('exports', [])[-5:]  # Last 5 exports
+        # The latest preset's dashboard summary was stored with its catalog entry;
+        # for presets indexed from their files only it is built from those files
+        latest = catalog_data['latest_preset']
+        latest_preset = latest['record'] if latest else None
+        preset_data = latest['dashboard'] if latest else None
+        if latest and not preset_data:
+            preset_data = preset_manager.load_dashboard_summary(latest_preset['preset_id'])
         
         # Get data quality metrics
-        data_quality = self._get_data_quality_summary()
+        data_quality = self._get_data_quality_summary(preset_data)
         
         # Get owner analysis summary
-        owner_summary = self._get_owner_analysis_summary()
+        owner_summary = self._get_owner_analysis_summary(
+            latest_preset, preset_data, catalog_data['latest_owner_dataset'])
         
         dashboard_data = {
             'user': {
@@ -215,7 +231,7 @@ class UserManager:
                 'settings': self.current_company.settings
             },
             'presets': {
-                'total': len(user_presets),
+                'total': catalog_data['user_preset_count'],
                 'recent': user_presets[:5],
                 'most_used': self._get_most_used_presets(user_presets)
             },
@@ -227,7 +243,7 @@ class UserManager:
             'analysis': {
                 'data_quality': data_quality,
                 'owner_analysis': owner_summary,
-                'phone_prioritization': self._get_phone_prioritization_summary()
+                'phone_prioritization': self._get_phone_prioritization_summary(latest_preset, preset_data)
             },
             'quick_actions': [
                 {'name': 'Upload New Data', 'icon': '📁', 'action': 'upload'},
@@ -239,67 +255,72 @@ class UserManager:
         
         return dashboard_data
     
-    def _get_data_quality_summary(self) -> Dict[str, Any]:
-        """Get data quality summary from recent presets."""
-        from backend.utils.preset_manager import PresetManager
-        preset_manager = PresetManager()
-        user_presets = preset_manager.list_presets()
-        
-        if not user_presets:
+    def _get_data_quality_summary(self, preset_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get data quality summary from the latest preset."""
+        if preset_data is None:
             return {'status': 'No data available'}
         
-        # Get latest preset data quality
-        latest_preset = user_presets[0]
-        preset_data = preset_manager.load_preset(latest_preset['preset_id'])
-        
-        if 'data_quality' in preset_data:
+        if preset_data.get('data_quality'):
             return preset_data['data_quality']
         
         return {'status': 'Data quality metrics not available'}
     
-    def _get_owner_analysis_summary(self) -> Dict[str, Any]:
-        """Get owner analysis summary from persistence manager or presets."""
+    def _get_owner_analysis_summary(self, latest_preset: Optional[Dict[str, Any]] = None,
+                                    preset_data: Optional[Dict[str, Any]] = None,
+                                    latest_dataset: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get owner analysis summary from the loaded dataset, its catalogued summary or presets."""
+        # Owner data already loaded by a screen: its statistics are exact and precomputed
+        from backend.utils.owner_data_service import get_owner_data_service
+        service = get_owner_data_service()
+        snapshot = service.snapshot
+        if snapshot is not None:
+            stats = snapshot.stats
+            return {
+                'total_owners': stats['total_owners'],
+                'business_entities': stats['business_owners'],
+                'multi_property_owners': stats['multi_property_owners'],
+                'high_confidence_targets': stats['high_confidence_targets'],
+                'total_properties': stats['total_properties'],
+                'total_value': stats['total_value'],
+                'last_updated': datetime.fromtimestamp(snapshot.loaded_at).strftime('%Y-%m-%d %H:%M:%S'),
+                'data_source': 'owner_data_service',
+                'loaded': True,
+            }
+        
         try:
-            # Check if owner objects exist without loading them
-            import os
-            owner_objects_path = "data/processed/owner_objects/ultra_fast_pipeline/owner_objects.pkl"
-            
-            if os.path.exists(owner_objects_path):
-                # Just check file existence and return metadata without loading
-                file_stats = os.stat(owner_objects_path)
-                file_size_mb = file_stats.st_size / (1024 * 1024)
-                
+            # Summary written next to the latest dataset when it was saved (owners are not loaded)
+            from backend.utils.owner_summary import read_owner_summary, summary_is_current
+            summary = None
+            if latest_dataset is not None:
+                dataset_dir = Path(service.base_dir) / "owner_objects" / latest_dataset['name']
+                summary = latest_dataset['summary']
+                if summary is None or not summary_is_current(dataset_dir, summary):
+                    summary = read_owner_summary(dataset_dir)
+            if summary is not None:
                 return {
-                    'total_owners': 269669,  # Known from previous runs
-                    'business_entities': 23511,  # Known from previous runs
-                    'multi_property_owners': 34253,  # Known from previous runs
-                    'high_confidence_targets': 506,  # Known from previous runs
-                    'total_properties': 310724,  # Known from previous runs
-                    'total_value': 45000000000,  # Known from previous runs
-                    'last_updated': '2025-08-09 13:44:00',
+                    'total_owners': summary['total_owners'],
+                    'business_entities': summary['business_owners'],
+                    'multi_property_owners': summary['multi_property_owners'],
+                    'high_confidence_targets': summary['high_confidence_targets'],
+                    'total_properties': summary['total_properties'],
+                    'total_value': summary['total_value'],
+                    'last_updated': latest_dataset['saved_at'],
                     'data_source': 'persistence_manager',
+                    'dataset_name': latest_dataset['name'],
                     'loaded': False,  # Indicate we haven't loaded full objects
-                    'file_size_mb': f"{file_size_mb:.1f}MB"
                 }
         except Exception as e:
-            logger.warning(f"Could not check owner objects from persistence: {e}")
+            logger.warning(f"Could not read owner summary from persistence: {e}")
         
         # Fall back to preset data
-        return self._get_owner_analysis_from_presets()
+        return self._get_owner_analysis_from_presets(latest_preset, preset_data)
     
-    def _get_owner_analysis_from_presets(self) -> Dict[str, Any]:
-        """Get owner analysis summary from recent presets (fallback method)."""
-        from backend.utils.preset_manager import PresetManager
-        preset_manager = PresetManager()
-        user_presets = preset_manager.list_presets()
-        
-        if not user_presets:
+    def _get_owner_analysis_from_presets(self, latest_preset: Optional[Dict[str, Any]],
+                                         preset_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get owner analysis summary from the latest preset (fallback method)."""
+        if preset_data is None:
             return {'status': 'No owner analysis available'}
         
-        # Get latest preset owner analysis
-        latest_preset = user_presets[0]
-        preset_data = preset_manager.load_preset(latest_preset['preset_id'])
-        
         if 'owner_analysis' in preset_data:
             analysis = preset_data['owner_analysis']
             return {
@@ -311,19 +332,12 @@ class UserManager:
         
         return {'status': 'Owner analysis not available'}
     
-    def _get_phone_prioritization_summary(self) -> Dict[str, Any]:
-        """Get phone prioritization summary from recent presets."""
-        from backend.utils.preset_manager import PresetManager
-        preset_manager = PresetManager()
-        user_presets = preset_manager.list_presets()
-        
-        if not user_presets:
+    def _get_phone_prioritization_summary(self, latest_preset: Optional[Dict[str, Any]],
+                                          preset_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get phone prioritization summary from the latest preset."""
+        if preset_data is None:
             return {'status': 'No phone prioritization data available'}
         
-        # Get latest preset phone rules
-        latest_preset = user_presets[0]
-        preset_data = preset_manager.load_preset(latest_preset['preset_id'])
-        
         if 'phone_prioritization_rules' in preset_data:
             rules = preset_data['phone_prioritization_rules']
             return {
@@ -563,12 +577,7 @@ class UserManager:
             raise ValueError("No user logged in")
         
         from backend.utils.preset_manager import PresetManager
-        preset_manager = PresetManager()
-        all_presets = preset_manager.list_presets()
-        
-        # Filter for current user/company
-        user_presets = [p for p in all_presets if self.current_user.user_id in p.get('preset_name', '')]
-        return user_presets
+        return PresetManager().list_presets(user_id=self.current_user.user_id)
     
     def save_user_preset(self, preset_name: str, **kwargs) -> str:
         """Save a preset for the current user."""
@@ -584,6 +593,7 @@ class UserManager:
         preset_path = preset_manager.save_comprehensive_preset(
             preset_name=user_preset_name,
             data_source=self.current_company.data_sources[0],
+            user_id=self.current_user.user_id,
             **kwargs
         )
         
@@ -594,34 +604,45 @@ class UserManager:
         return preset_path
 
 
-# Global user manager instance
-user_manager = UserManager()
+# Global user manager instance (created on first use, so importing this module touches no files)
+_user_manager: Optional[UserManager] = None
+_user_manager_lock = threading.Lock()
+
+
+def get_user_manager() -> UserManager:
+    """The process-wide user manager."""
+    global _user_manager
+    with _user_manager_lock:
+        if _user_manager is None:
+            _user_manager = UserManager()
+        return _user_manager
 
 
 def get_current_user() -> Optional[User]:
     """Get the currently logged in user."""
-    return user_manager.current_user
+    return get_user_manager().current_user
 
 
 def get_current_company() -> Optional[Company]:
     """Get the current user's company."""
-    return user_manager.current_company
+    return get_user_manager().current_company
 
 
 def login_default_user() -> User:
     """Login the default user (Mark Carpenter)."""
-    return user_manager.login_user("mark_carpenter")
+    return get_user_manager().login_user("mark_carpenter")
 
 
 def get_dashboard_data() -> Dict[str, Any]:
     """Get dashboard data for the current user."""
-    return user_manager.get_dashboard_data()
+    return get_user_manager().get_dashboard_data()
 
 
 if __name__ == "__main__":
     # Example usage
     print("👤 USER MANAGER")
     print("=" * 40)
+    user_manager = get_user_manager()
     
     # Login default user
     user = login_default_user()
@@ -141,5 +141,110 @@ def owner_analysis():
         console.print(f"[red]Error during ownership analysis: {e}[/red]")
         console.print("[yellow]Make sure you have CSV files in the upload directory.[/yellow]")
 
+@cli.command()
+@click.option('--dataset', '-d', default=None, help="Owner dataset name (default: latest saved)")
+@click.option('--base-dir', default="data/processed", show_default=True, help="Processed data directory")
+@click.option('--table', '-t', type=click.Choice(["owners", "phones", "properties"]), default="owners",
+              show_default=True, help="Table to query")
+@click.option('--where', '-w', multiple=True,
+              help="Condition, e.g. 'property_count>=5', 'mailing_zip~73*', 'phones.status=CORRECT'")
+@click.option('--select', '-s', default=None, help="Comma-separated columns to return")
+@click.option('--group-by', '-g', default=None, help="Comma-separated columns to group by")
+@click.option('--agg', '-a', multiple=True, help="Aggregate, e.g. 'owners=count(*)', 'value=sum(total_property_value)'")
+@click.option('--order-by', '-o', default=None, help="Comma-separated columns, '-column' for descending")
+@click.option('--limit', '-n', type=int, default=50, show_default=True, help="Maximum rows to return")
+@click.option('--explain', is_flag=True, help="Show the query plan instead of running it")
+@click.option('--output', type=click.Path(dir_okay=False), default=None, help="Write the result to .csv/.parquet/.json")
+def query(dataset, base_dir, table, where, select, group_by, agg, order_by, limit, explain, output):
+    """Ask ad-hoc questions of a saved owner dataset.
+
+    \b
+    Example: LLCs mailing to 73xxx with 5+ properties and a CORRECT mobile phone
+      python cli.py query -w entity_type=LLC -w 'mailing_zip~73*' -w 'property_count>=5' \\
+          -w phones.status=CORRECT -w phones.phone_type=MOBILE -o -total_property_value
+    """
+    from backend.utils.owner_query import OwnerQuery, OwnerQueryEngine, OwnerQueryError
+
+    try:
+        owner_query = OwnerQuery.parse(table=table, where=list(where), select=select, group_by=group_by,
+                                       aggregates=list(agg), order_by=order_by, limit=limit)
+        engine = OwnerQueryEngine.for_dataset(dataset, base_dir=base_dir)
+        if explain:
+            console.print(engine.explain(owner_query))
+            return
+        result = engine.run(owner_query)
+    except (OwnerQueryError, FileNotFoundError) as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(1)
+
+    frame = result.frame
+    if output:
+        suffix = os.path.splitext(output)[1].lower()
+        if suffix == ".parquet":
+            frame.write_parquet(output)
+        elif suffix == ".json":
+            frame.write_json(output)
+        else:
+            frame.write_csv(output)
+        console.print(f"[green]📁 {frame.height:,} rows written to: {output}[/green]")
+
+    results = Table(title=f"{table} query", show_lines=False)
+    for column in frame.columns:
+        results.add_column(column, overflow="fold")
+    for row in frame.iter_rows():
+        results.add_row(*("" if value is None else f"{value:,.2f}" if isinstance(value, float) else str(value)
+                          for value in row))
+    console.print(results)
+    console.print(f"[green]{frame.height:,} rows in {result.elapsed_ms:.0f} ms[/green]")
+
+@cli.group()
+def pipeline():
+    """Headless batch runs of the full processing pipeline."""
+
+@pipeline.command("run")
+@click.argument('inputs', nargs=-1, required=True)
+@click.option('--config', '-c', 'config_path', type=click.Path(exists=True, dir_okay=False), default=None,
+              help="JSON pipeline config (see backend.utils.batch_pipeline.PipelineConfig)")
+@click.option('--output-dir', '-o', default="data/pipeline_runs", show_default=True,
+              help="Directory receiving one sub-directory per run")
+@click.option('--workers', '-j', type=click.IntRange(min=1), default=None,
+              help="Worker processes (default: config value, else up to 4)")
+@click.option('--run-id', default=None, help="Run identifier (default: timestamp)")
+@click.option('--no-cache', is_flag=True, help="Recompute every stage and leave the stage cache untouched")
+def pipeline_run(inputs, config_path, output_dir, workers, run_id, no_cache):
+    """Process uploads (files, directories or globs) in parallel.
+
+    Writes Pete exports, per-file metrics and a run manifest; exits with
+    status 1 if any file fails. Stages whose input and config are unchanged
+    are read from the stage cache.
+
+    \b
+    Example:
+      python cli.py pipeline run "upload/*.csv" -c nightly.json -j 2
+    """
+    from backend.utils.batch_pipeline import PipelineConfig, run_pipeline_batch
+
+    try:
+        config = PipelineConfig.from_file(config_path) if config_path else PipelineConfig()
+        manifest = run_pipeline_batch(inputs, config, output_dir=output_dir, workers=workers, run_id=run_id,
+                                      use_cache=not no_cache)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(2)
+
+    results = Table(title=f"Pipeline run {manifest['run_id']}")
+    for column in ("File", "Status", "Rows in", "Rows out", "Owners", "Cached stages", "Seconds"):
+        results.add_column(column)
+    for file in manifest['files']:
+        status = "[green]succeeded[/green]" if file['status'] == "succeeded" else \
+            f"[red]failed: {file.get('error', {}).get('message', '')}[/red]"
+        results.add_row(os.path.basename(file['input']['path']), status, f"{file.get('rows_in', 0):,}",
+                        f"{file.get('rows_out', 0):,}", f"{file.get('owners', 0):,}",
+                        str(file.get('cache', {}).get('hits', 0)), f"{file.get('seconds', 0):.1f}")
+    console.print(results)
+    console.print(f"📁 Manifest: {os.path.join(output_dir, manifest['run_id'], 'manifest.json')}")
+    if manifest['status'] != "succeeded":
+        sys.exit(1)
+
 if __name__ == '__main__':
     cli() 
\ No newline at end of file
@@ -1,6 +1,17 @@
 # Frontend Package
 # This package contains the GUI components for the Pete application
+#
+# MainWindow and main are imported on first use, so importing a single
+# frontend module (e.g. frontend.utils.job_runner) does not load the whole GUI.
 
-from .main_window import MainWindow, main
+from importlib import import_module
 
 __all__ = ['MainWindow', 'main']
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module('.main_window', __name__), name)
+    globals()[name] = value
+    return value
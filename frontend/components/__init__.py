@@ -8,17 +8,34 @@ Available components:
 - StartupMenu: Main application menu
 - FileSelector: File selection and preview
 - MappingTableWidget: Enhanced table for column mapping
+
+Components are imported on first use (``from frontend.components import
+MappingUI`` imports only the mapping UI and what it needs), so importing
+the package does not pull in pandas or the data prep editor.
 """
 
-from .base_component import BaseComponent
-from .startup_menu import StartupMenu
-from .file_selector import FileSelector
-from .mapping_table_widget import MappingTableWidget
-from .mapping_ui import MappingUI
-from .standardized_preview_ui import StandardizedPreviewUI
+from importlib import import_module
+
+# Exported name -> module that defines it (relative to this package)
+_EXPORTS = {
+    'BaseComponent': '.base_component',
+    'StartupMenu': '.startup_menu',
+    'FileSelector': '.file_selector',
+    'MappingTableWidget': '.mapping_table_widget',
+    'MappingUI': '.mapping_ui',
+    'StandardizedPreviewUI': '.standardized_preview_ui',
+    # From the modular data_prep package
+    'DataPrepEditor': '..data_prep',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
 
-# Import from new modular data_prep package
-from ..data_prep import DataPrepEditor
 
 __all__ = [
     'BaseComponent',
@@ -28,4 +45,4 @@ __all__ = [
     'MappingTableWidget',
     'MappingUI',
     'StandardizedPreviewUI'
-]
\ No newline at end of file
+]
@@ -15,11 +15,15 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QIcon
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import json
 from datetime import datetime
 
+from backend.utils.owner_data_service import get_owner_data_service
+from backend.utils.owner_facet_index import OwnerFacetIndex
+
 from .export_config import ExportConfig, ExportPreset
 from .header_selector import HeaderSelector
 from .export_preview import ExportPreview
@@ -31,11 +35,16 @@ class CustomExportUI(QDialog):
     def __init__(self, parent=None, owner_objects=None, enhanced_data=None):
         super().__init__(parent)
         
+        # Without explicit owners, export the shared (already loaded) dataset
+        self.snapshot = get_owner_data_service().snapshot if owner_objects is None else None
+        if self.snapshot is not None:
+            owner_objects = self.snapshot.owners
         self.owner_objects = owner_objects or []
         self.enhanced_data = enhanced_data
         self.export_config = ExportConfig()
         self.selected_headers = []
         self.current_preset = None
+        self._facets: Optional[OwnerFacetIndex] = None
         
         self.setup_ui()
         self.load_default_preset()
@@ -218,6 +227,10 @@ class CustomExportUI(QDialog):
         self.phone_status_combo.addItems(["All", "CORRECT", "UNKNOWN", "NO_ANSWER", "WRONG", "DEAD"])
         filter_layout.addWidget(self.phone_status_combo, 2, 1)
         
+        # Counts come from precomputed facet masks, so refresh on every change
+        for combo in (self.owner_type_combo, self.phone_quality_combo, self.phone_status_combo):
+            combo.currentTextChanged.connect(self.update_summary)
+        
         layout.addWidget(filter_group)
         
         # Summary
@@ -349,42 +362,49 @@ Ready to export {filtered_count:,} records with {header_count} columns.
         self.summary_text.setText(summary)
     
     def apply_filters(self, owners: List) -> int:
-        """Apply current filters to owner objects."""
-        filtered_count = 0
+        """Count the owners matching the current filters."""
+        return OwnerFacetIndex.count(self.filter_mask(owners))
+    
+    def filter_owners(self, owners: List) -> List:
+        """Owners matching the current filters."""
+        return self.facets_for(owners).select(self.filter_mask(owners))
+    
+    def facets_for(self, owners: List) -> OwnerFacetIndex:
+        """Facet index of *owners*, built once per owner list."""
+        if self._facets is None or self._facets.owners is not owners:
+            if self.snapshot is not None and self.snapshot.owners is owners:
+                self._facets = self.snapshot.facets
+            else:
+                self._facets = OwnerFacetIndex(owners)
+        return self._facets
+    
+    def filter_mask(self, owners: List) -> np.ndarray:
+        """Boolean mask of *owners* matching the current filter choices."""
+        facets = self.facets_for(owners)
+        mask = facets.all()
         
-        for owner in owners:
-            # Owner type filter
-            owner_type = self.owner_type_combo.currentText()
-            if owner_type != "All":
-                if owner_type == "Individual" and not owner.is_individual_owner:
-                    continue
-                if owner_type == "Business" and not owner.is_business_owner:
-                    continue
-            
-            # Phone quality filter
-            quality_filter = self.phone_quality_combo.currentText()
-            if quality_filter != "All":
-                if quality_filter == "High (8.0+)" and owner.phone_quality_score < 8.0:
-                    continue
-                elif quality_filter == "Medium (6.0-8.0)" and (owner.phone_quality_score < 6.0 or owner.phone_quality_score >= 8.0):
-                    continue
-                elif quality_filter == "Low (<6.0)" and owner.phone_quality_score >= 6.0:
-                    continue
-            
-            # Phone status filter
-            status_filter = self.phone_status_combo.currentText()
-            if status_filter != "All":
-                has_status = False
-                for phone in owner.all_phones:
-                    if phone.status == status_filter:
-                        has_status = True
-                        break
-                if not has_status:
-                    continue
-            
-            filtered_count += 1
+        # Owner type filter
+        owner_type = self.owner_type_combo.currentText()
+        if owner_type == "Individual":
+            mask &= facets.mask('individual')
+        elif owner_type == "Business":
+            mask &= facets.mask('business')
+        
+        # Phone quality filter
+        quality_filter = self.phone_quality_combo.currentText()
+        if quality_filter == "High (8.0+)":
+            mask &= facets.range_mask('phone_quality_score', low=8.0)
+        elif quality_filter == "Medium (6.0-8.0)":
+            mask &= facets.range_mask('phone_quality_score', low=6.0, high=8.0)
+        elif quality_filter == "Low (<6.0)":
+            mask &= facets.range_mask('phone_quality_score', high=6.0)
+        
+        # Phone status filter
+        status_filter = self.phone_status_combo.currentText()
+        if status_filter != "All":
+            mask &= facets.phone_status_mask(status_filter)
         
-        return filtered_count
+        return mask
     
     def estimate_file_size(self, record_count: int, column_count: int) -> float:
         """Estimate file size in MB."""
@@ -478,36 +498,7 @@ Ready to export {filtered_count:,} records with {header_count} columns.
             return
         
         # Apply filters
-        filtered_owners = []
-        for owner in self.owner_objects:
-            # Apply the same filters as in apply_filters
-            owner_type = self.owner_type_combo.currentText()
-            if owner_type != "All":
-                if owner_type == "Individual" and not owner.is_individual_owner:
-                    continue
-                if owner_type == "Business" and not owner.is_business_owner:
-                    continue
-            
-            quality_filter = self.phone_quality_combo.currentText()
-            if quality_filter != "All":
-                if quality_filter == "High (8.0+)" and owner.phone_quality_score < 8.0:
-                    continue
-                elif quality_filter == "Medium (6.0-8.0)" and (owner.phone_quality_score < 6.0 or owner.phone_quality_score >= 8.0):
-                    continue
-                elif quality_filter == "Low (<6.0)" and owner.phone_quality_score >= 6.0:
-                    continue
-            
-            status_filter = self.phone_status_combo.currentText()
-            if status_filter != "All":
-                has_status = False
-                for phone in owner.all_phones:
-                    if phone.status == status_filter:
-                        has_status = True
-                        break
-                if not has_status:
-                    continue
-            
-            filtered_owners.append(owner)
+        filtered_owners = self.filter_owners(self.owner_objects)
         
         if not filtered_owners:
             QMessageBox.warning(self, "No Data", "No data matches the selected filters.")
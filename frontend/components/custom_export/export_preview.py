@@ -7,14 +7,16 @@ Shows a sample of the data in a table format.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QTextEdit, QPushButton
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
+    QHeaderView, QTextEdit, QPushButton
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from typing import Optional
 import pandas as pd
 
+from frontend.components.dataframe_table_model import DataFrameTableModel
+
 
 class ExportPreview(QWidget):
     """Export preview widget showing sample data."""
@@ -50,20 +52,23 @@ class ExportPreview(QWidget):
         self.info_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.info_label)
         
-        # Table widget
-        self.table = QTableWidget()
+        # Table view (cells are formatted as they scroll into view)
+        self.table_model = DataFrameTableModel(parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #ddd;
                 border-radius: 4px;
                 background-color: white;
                 gridline-color: #ddd;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
                 border-bottom: 1px solid #eee;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #667eea;
                 color: white;
             }
@@ -116,36 +121,14 @@ class ExportPreview(QWidget):
         self.info_label.setVisible(False)
         self.table.setVisible(True)
         
-        # Limit to first 10 rows for preview
-        preview_data = data.head(10)
-        
-        # Set up table
-        self.table.setRowCount(len(preview_data))
-        self.table.setColumnCount(len(preview_data.columns))
-        
-        # Set headers
-        self.table.setHorizontalHeaderLabels(preview_data.columns)
-        
-        # Populate data
-        for row_idx, (_, row) in enumerate(preview_data.iterrows()):
-            for col_idx, value in enumerate(row):
-                item = QTableWidgetItem(str(value) if pd.notna(value) else "")
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-                self.table.setItem(row_idx, col_idx, item)
+        # The model reads the frame directly; no rows are copied
+        self.table_model.set_frame(data)
         
         # Auto-resize columns
         self.table.resizeColumnsToContents()
         
         # Update summary
-        total_rows = len(data)
-        preview_rows = len(preview_data)
-        total_cols = len(data.columns)
-        
-        summary_text = f"Preview showing {preview_rows} of {total_rows:,} rows ({total_cols} columns)"
-        if total_rows > preview_rows:
-            summary_text += f" - Showing first {preview_rows} rows only"
-        
-        self.summary_label.setText(summary_text)
+        self.summary_label.setText(f"Preview showing {len(data):,} rows ({len(data.columns)} columns)")
     
     def clear_preview(self):
         """Clear the preview."""
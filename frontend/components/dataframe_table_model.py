@@ -0,0 +1,227 @@
+"""
+DataFrame Table Model
+
+Reusable read-only ``QAbstractTableModel`` over a Polars (Arrow) frame, for
+the data prep editor and the preview tables.
+
+- Cells are formatted lazily, a block of rows of one column at a time, and
+  only for the rows the view actually paints.
+- Rows are handed to the view in batches (``canFetchMore``/``fetchMore``),
+  so a million-row frame opens as fast as a 20-row one.
+- Hidden columns are a visible-column index map over the frame; hiding or
+  showing columns never copies the data.
+- Sorting computes a stable row permutation; the frame itself is never
+  reordered.
+
+pandas frames are accepted too: their columns are read through the same
+index maps without converting the whole frame (a column is converted to
+Polars only when it is sorted).
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from backend.utils.column_profiler import to_polars_column
+
+BATCH_SIZE = 1000
+BLOCK_ROWS = 256  # rows formatted per cache block
+BLOCK_CACHE_SIZE = 512  # formatted blocks kept (LRU)
+
+Frame = Union[pl.DataFrame, pd.DataFrame]
+
+
+def format_cell(value: Any) -> str:
+    """Display text of one cell (``""`` for nulls and NaN)."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return ""
+    if isinstance(value, float) and value != value:
+        return ""
+    return str(value)
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """Lazily formatted, sortable table model over a Polars or pandas frame."""
+
+    def __init__(self, df: Optional[Frame] = None, batch_size: int = BATCH_SIZE,
+                 header_label: Optional[Callable[[str], str]] = None,
+                 tooltip: Optional[Callable[[str, int, str], str]] = None,
+                 background: Optional[Callable[[str, str], Any]] = None,
+                 parent=None):
+        """
+        Args:
+            df: Frame to show (Polars or pandas)
+            batch_size: Rows handed to the view per fetchMore
+            header_label: Maps a column name to its header text
+            tooltip: (column name, source row, cell text) -> tooltip text
+            background: (column name, cell text) -> background brush/colour or None
+        """
+        super().__init__(parent)
+        self.batch_size = batch_size
+        self.header_label = header_label
+        self.tooltip = tooltip
+        self.background = background
+
+        self._df: Optional[Frame] = None
+        self._names: List[str] = []
+        self._visible: List[int] = []  # view column -> frame column
+        self._order: Optional[np.ndarray] = None  # view row -> frame row (None: unsorted)
+        self._loaded = 0
+        self._blocks: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+        if df is not None:
+            self.set_frame(df)
+
+    # Data
+
+    def set_frame(self, df: Frame, visible_columns: Optional[Sequence[str]] = None):
+        """Show *df* (optionally only *visible_columns*); clears the sort."""
+        self.beginResetModel()
+        self._df = df
+        self._names = [str(col) for col in df.columns]
+        self._visible = self._positions(visible_columns)
+        self._order = None
+        self.sort_column = -1
+        self._loaded = min(len(df), self.batch_size)
+        self._blocks.clear()
+        self.endResetModel()
+
+    def frame(self) -> Optional[Frame]:
+        """The frame being shown (never modified by the model)."""
+        return self._df
+
+    def set_visible_columns(self, visible_columns: Optional[Sequence[str]] = None):
+        """Show only *visible_columns* (``None`` shows all) without copying the frame."""
+        sort_name = self.column_name(self.sort_column) if self.sort_column >= 0 else None
+        self.beginResetModel()
+        self._visible = self._positions(visible_columns)
+        names = self.visible_columns()
+        self.sort_column = names.index(sort_name) if sort_name in names else -1
+        self.endResetModel()
+
+    def visible_columns(self) -> List[str]:
+        return [self._names[i] for i in self._visible]
+
+    def column_name(self, column: int) -> str:
+        """Frame column name shown at view *column*."""
+        return self._names[self._visible[column]]
+
+    def source_row(self, row: int) -> int:
+        """Frame row shown at view *row*."""
+        return int(self._order[row]) if self._order is not None else row
+
+    def total_rows(self) -> int:
+        """Rows of the frame, including the ones not fetched yet."""
+        return 0 if self._df is None else len(self._df)
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole, Qt.BackgroundRole):
+            return None
+        column = self._visible[index.column()]
+        row = index.row()
+        block = self._block(column, row // BLOCK_ROWS)
+        text = block[row % BLOCK_ROWS]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ToolTipRole:
+            return self.tooltip(self._names[column], self.source_row(row), text) if self.tooltip else None
+        return self.background(self._names[column], text) if self.background else None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            name = self.column_name(section)
+            return self.header_label(name) if self.header_label else name
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < self.total_rows()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.batch_size, self.total_rows() - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sort the view through a stable row permutation (nulls last)."""
+        if self._df is None or not 0 <= column < len(self._visible):
+            return
+        self.layoutAboutToBeChanged.emit()
+        keys = self._polars_column(self._visible[column])
+        self._order = (
+            pl.DataFrame({"key": keys})
+            .with_row_index("row")
+            .sort("key", descending=order == Qt.DescendingOrder, nulls_last=True, maintain_order=True)
+            ["row"].to_numpy()
+        )
+        self.sort_column, self.sort_order = column, order
+        self._blocks.clear()
+        self.layoutChanged.emit()
+
+    def clear_sort(self):
+        """Back to frame order."""
+        self.layoutAboutToBeChanged.emit()
+        self._order = None
+        self.sort_column = -1
+        self._blocks.clear()
+        self.layoutChanged.emit()
+
+    # Internals
+
+    def _positions(self, visible_columns: Optional[Sequence[str]]) -> List[int]:
+        if visible_columns is None:
+            return list(range(len(self._names)))
+        position = {}
+        for i, name in enumerate(self._names):
+            position.setdefault(name, i)
+        return [position[str(col)] for col in visible_columns if str(col) in position]
+
+    def _polars_column(self, column: int) -> pl.Series:
+        if isinstance(self._df, pl.DataFrame):
+            return self._df.to_series(column)
+        return to_polars_column(self._df.iloc[:, column], "key")
+
+    def _block(self, column: int, block: int) -> List[str]:
+        """Formatted text of one block of view rows of frame *column*."""
+        key = (column, block)
+        texts = self._blocks.get(key)
+        if texts is not None:
+            self._blocks.move_to_end(key)
+            return texts
+
+        start = block * BLOCK_ROWS
+        stop = min(start + BLOCK_ROWS, self.total_rows())
+        if isinstance(self._df, pl.DataFrame):
+            series = self._df.to_series(column)
+            values = (series.slice(start, stop - start) if self._order is None
+                      else series.gather(self._order[start:stop])).to_list()
+        else:
+            series = self._df.iloc[:, column]
+            values = (series.iloc[start:stop] if self._order is None
+                      else series.take(self._order[start:stop])).tolist()
+        texts = [format_cell(value) for value in values]
+
+        self._blocks[key] = texts
+        while len(self._blocks) > BLOCK_CACHE_SIZE:
+            self._blocks.popitem(last=False)
+        return texts
+
@@ -8,17 +8,19 @@ import os
 import shutil
 import pandas as pd
 from backend.utils.high_performance_processor import clean_dataframe_fast
+from backend.utils.source_profiles import cleanup_columns, read_source
 from typing import Optional, Callable
 from loguru import logger
 
 from PyQt5.QtWidgets import (
-    QLabel, QComboBox, QPushButton, QHBoxLayout, QTableWidget, 
-    QTableWidgetItem, QFileDialog, QMessageBox
+    QLabel, QComboBox, QPushButton, QHBoxLayout, QTableView,
+    QFileDialog, QMessageBox
 )
 from PyQt5.QtCore import Qt
 
 from frontend.components.base_component import BaseComponent
-from frontend.constants import UPLOAD_DIR, DEFAULT_RULES_CONFIG
+from frontend.components.dataframe_table_model import DataFrameTableModel
+from frontend.constants import UPLOAD_DIR
 from backend.utils.data_standardizer import DataStandardizer
 from backend.sheets_client import SheetsClient
 
@@ -50,7 +52,7 @@ class FileSelector(BaseComponent):
         self.on_mapping_request = on_mapping_request
         self.selected_file: Optional[str] = None
         self.df: Optional[pd.DataFrame] = None
-        self.table_widget: Optional[QTableWidget] = None
+        self.table_widget: Optional[QTableView] = None
         
         self._setup_ui()
         self.refresh_file_list()
@@ -177,18 +179,18 @@ class FileSelector(BaseComponent):
             ext = os.path.splitext(file_path)[1].lower()
             if ext == '.csv':
                 self.status_label.setText('📊 Reading CSV file...')
-                df = pd.read_csv(file_path, low_memory=False)
             elif ext in ['.xls', '.xlsx']:
                 self.status_label.setText('📊 Reading Excel file...')
-                df = pd.read_excel(file_path)
             else:
                 QMessageBox.warning(self, 'Unsupported file', f'Unsupported file type: {ext}')
                 return
+            # Known sources (REISIFT) keep phone/ZIP/parcel columns as text
+            df, profile = read_source(file_path)
             
             self.status_label.setText(f'🧹 Cleaning data ({len(df.columns)} columns)...')
             
             # Auto strip trailing .0 using fast processor
-            df = clean_dataframe_fast(df)
+            df = clean_dataframe_fast(df, columns=cleanup_columns(df, profile))
             
             # Auto-hide columns using fast processor
             if self.hide_empty_chk.isChecked():
@@ -237,24 +239,9 @@ class FileSelector(BaseComponent):
             self.layout.removeWidget(self.table_widget)
             self.table_widget.deleteLater()
         
-        # Create new table
-        self.table_widget = QTableWidget()
-        
-        # Configure table size - show more rows for better visibility
-        rules = DEFAULT_RULES_CONFIG
-        preview_rows = min(rules.get('preview_row_count', 50), len(df))  # Increased from 10 to 50
-        preview_cols = len(df.columns)
-        
-        self.table_widget.setRowCount(preview_rows)
-        self.table_widget.setColumnCount(preview_cols)
-        self.table_widget.setHorizontalHeaderLabels([str(col) for col in df.columns])
-        
-        # Populate table
-        for i in range(preview_rows):
-            for j in range(preview_cols):
-                val = str(df.iloc[i, j]) if pd.notna(df.iloc[i, j]) else ''
-                item = QTableWidgetItem(val)
-                self.table_widget.setItem(i, j, item)
+        # Create new table; rows are fetched and formatted as they scroll into view
+        self.table_widget = QTableView()
+        self.table_widget.setModel(DataFrameTableModel(df, parent=self.table_widget))
         
         # Configure table appearance
         self.table_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -264,12 +251,9 @@ class FileSelector(BaseComponent):
         self.layout.addWidget(self.table_widget)
         
         # Show detailed preview information
-        total_rows = len(df)
-        displayed_rows = min(50, total_rows)  # Match the preview_rows calculation
-        status_text = f'📊 Previewing: {self.selected_file} ({displayed_rows}/{total_rows} rows, {len(df.columns)} columns)'
-        if total_rows > displayed_rows:
-            status_text += f' (showing first {displayed_rows} rows)'
-        self.status_label.setText(status_text)
+        self.status_label.setText(
+            f'📊 Previewing: {self.selected_file} ({len(df):,} rows, {len(df.columns)} columns)'
+        )
     
     def map_to_pete_headers(self):
         """Initiate mapping to Pete headers."""
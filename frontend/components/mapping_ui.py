@@ -18,6 +18,9 @@ from frontend.components.mapping_table_widget import MappingTableWidget
 from frontend.dialogs.rule_mapping_dialog import RuleMappingDialog
 from frontend.dialogs.concatenation_dialog import ConcatenationDialog
 from backend.utils.data_standardizer import DataStandardizer
+from backend.utils.column_classifier import ColumnClassification, classify_columns
+from backend.utils.column_profiler import invalidate_profile
+from frontend.utils.job_runner import JobRunner
 
 class MappingUI(BaseComponent):
     """
@@ -62,10 +65,34 @@ class MappingUI(BaseComponent):
         # Initialize backend standardizer
         self.standardizer = DataStandardizer(pete_headers)
         self.standardizer.rules = self.rules
+        # Name-based proposal first; content hints arrive from a background job
+        self.content_hints: Dict[str, ColumnClassification] = {}
         self.mapping = self.standardizer.propose_mapping(list(df.columns))
+        self.jobs = JobRunner(parent=self)
         
         self._setup_ui()
         self.update_mapping_table()
+        self._start_content_detection()
+    
+    def _start_content_detection(self):
+        """Sample cell values off the GUI thread so unfamiliar headers can be mapped by content."""
+        self.jobs.submit('content_hints', 'Detect column content',
+                         lambda df, context: classify_columns(df), self.df,
+                         on_finished=self._apply_content_hints)
+    
+    def _apply_content_hints(self, hints: Dict[str, ColumnClassification]):
+        """Fill columns that are still unmatched with content-based proposals."""
+        self.content_hints = hints
+        proposed = self.standardizer.propose_mapping(list(self.df.columns), hints)
+        # Headers taken meanwhile (including manual choices) stay with their column
+        used = {pete for pete, _, _ in self.mapping.values() if pete}
+        for col, (pete, confidence, reason) in proposed.items():
+            current = self.mapping.get(col)
+            if (pete and pete not in used and reason.startswith('Content:')
+                    and current is not None and current[2].startswith('No match')):
+                self.mapping[col] = (pete, confidence, reason)
+                used.add(pete)
+        self.update_mapping_table()
     
     def _setup_ui(self):
         """Setup the user interface."""
@@ -181,7 +208,7 @@ class MappingUI(BaseComponent):
     
     def _setup_upload_view(self):
         """Setup view showing upload columns as rows."""
-        columns = ['Upload Column', 'Mapped Pete Header', 'Rule/Reason']
+        columns = ['Upload Column', 'Mapped Pete Header', 'Rule/Reason', 'Detected Content']
         self.mapping_table.setColumnCount(len(columns))
         self.mapping_table.setHorizontalHeaderLabels(columns)
         
@@ -189,7 +216,8 @@ class MappingUI(BaseComponent):
         for col in self.df.columns:
             mapping_info = self.mapping.get(col, (None, 0.0, 'No mapping'))
             pete_header, confidence, reason = mapping_info
-            data.append([col, pete_header or '', reason])
+            hint = self.content_hints.get(col)
+            data.append([col, pete_header or '', reason, hint.describe() if hint else ''])
         
         self.mapping_table.setRowCount(len(data))
         for row_idx, row in enumerate(data):
@@ -297,7 +325,7 @@ class MappingUI(BaseComponent):
             
             # Rerun mapping with new rules
             self.standardizer.rules = self.rules
-            self.mapping = self.standardizer.propose_mapping(list(self.df.columns))
+            self.mapping = self.standardizer.propose_mapping(list(self.df.columns), self.content_hints)
             
             # Update table
             self.update_mapping_table()
@@ -313,7 +341,7 @@ class MappingUI(BaseComponent):
         
         # Rerun mapping
         self.standardizer.rules = self.rules
-        self.mapping = self.standardizer.propose_mapping(list(self.df.columns))
+        self.mapping = self.standardizer.propose_mapping(list(self.df.columns), self.content_hints)
         
         # Update table
         self.update_mapping_table()
@@ -330,15 +358,18 @@ class MappingUI(BaseComponent):
         try:
             # Rename column in DataFrame
             self.df.rename(columns={old_name: new_name}, inplace=True)
+            invalidate_profile(self.df)
             
             # Update mapping
             if old_name in self.mapping:
                 mapping_info = self.mapping[old_name]
                 del self.mapping[old_name]
                 self.mapping[new_name] = mapping_info
+            if old_name in self.content_hints:
+                self.content_hints[new_name] = self.content_hints.pop(old_name)
             
             # Refresh mapping
-            self.mapping = self.standardizer.propose_mapping(list(self.df.columns))
+            self.mapping = self.standardizer.propose_mapping(list(self.df.columns), self.content_hints)
             self.update_mapping_table()
             
             QMessageBox.information(
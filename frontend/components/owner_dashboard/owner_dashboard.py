@@ -7,19 +7,22 @@ with comprehensive property portfolio analysis.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, 
-    QTableWidgetItem, QPushButton, QComboBox, QLineEdit, QFrame,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView, QAbstractItemView,
+    QHeaderView, QPushButton, QComboBox, QLineEdit, QFrame,
     QProgressBar, QMessageBox
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 from typing import List, Dict, Any, Optional
+import numpy as np
 from loguru import logger
 
-from backend.utils.owner_persistence_manager import load_property_owners_persistent
-from backend.utils.efficient_table_manager import EfficientTableManager, format_currency, format_phone_quality_pete, format_phone_count_pete, get_owner_name, get_owner_type, get_confidence_level, get_best_contact_method_pete
+from backend.utils.owner_data_service import get_owner_data_service
+from backend.utils.efficient_table_manager import format_currency, format_phone_quality_pete, format_phone_count_pete, get_owner_name, get_owner_type, get_confidence_level, get_best_contact_method_pete
 from backend.utils.cpu_monitor import monitor_cpu_usage, start_cpu_monitoring, stop_cpu_monitoring, log_cpu_summary
+from frontend.utils.owner_data_relay import OwnerDataRelay
 from .owner_dashboard_utils import get_owner_dashboard_utils
+from .owner_table_model import OwnerTableModel
 
 
 class OwnerDashboard(QWidget):
@@ -28,13 +31,22 @@ class OwnerDashboard(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.owner_objects = []
-        self.table_manager = None
+        self.table_model = None
+        self.snapshot_version = None
+        self.query_panel = None
         
         # Initialize utilities
         self.utils = get_owner_dashboard_utils()
         
         self.setup_ui()
         
+        # Owner data is shared with the other screens: show what is already
+        # loaded and follow every new snapshot
+        self.owner_data = OwnerDataRelay(parent=self)
+        self.owner_data.snapshot_changed.connect(self.on_snapshot_changed)
+        if self.owner_data.snapshot is not None:
+            self.show_snapshot(self.owner_data.snapshot)
+        
         # Start CPU monitoring
         start_cpu_monitoring()
         
@@ -177,14 +189,21 @@ class OwnerDashboard(QWidget):
         layout.addLayout(pagination_layout)
     
     def create_owner_table(self, layout):
-        """Create the owner data table with efficient manager."""
-        self.owner_table = QTableWidget()
-        
-        # Create efficient table manager
-        self.table_manager = EfficientTableManager(self.owner_table, page_size=1000)
-        
-        # Ensure sorting is enabled
+        """Create the owner data view (rows come from an OwnerTableModel)."""
+        self.owner_table = QTableView()
+        self.owner_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.owner_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.owner_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.owner_table.setAlternatingRowColors(True)
+        self.owner_table.verticalHeader().setDefaultSectionSize(24)
+        
+        header = self.owner_table.horizontalHeader()
+        header.setStretchLastSection(True)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        
+        # Header clicks sort the model (an index permutation, no rows are copied)
         self.owner_table.setSortingEnabled(True)
+        self.owner_table.verticalScrollBar().valueChanged.connect(self.update_pagination_controls)
         
         # Setup click handlers
         self.setup_table_click_handlers()
@@ -193,22 +212,20 @@ class OwnerDashboard(QWidget):
     
     def setup_table_click_handlers(self):
         """Setup click handlers for table interactions."""
-        self.owner_table.cellClicked.connect(self.on_cell_clicked)
+        self.owner_table.clicked.connect(self.on_cell_clicked)
     
-    def on_cell_clicked(self, row, column):
+    def on_cell_clicked(self, index):
         """Handle cell clicks."""
-        if column == 9:  # Properties column
-            self.show_property_details(row)
+        if index.column() == 9:  # Properties column
+            self.show_property_details(index.row())
     
     def show_property_details(self, row):
         """Show property details for selected owner."""
-        if not self.table_manager:
+        if not self.table_model:
             return
         
         # Get owner data for this row
-        page_info = self.table_manager.get_page_info()
-        start_idx = page_info['start_index'] - 1
-        owner = self.owner_objects[start_idx + row]
+        owner = self.table_model.record(row)
         
         # Open property details window
         from frontend.modules.property_owner_details import PropertyOwnerDetails
@@ -255,6 +272,24 @@ class OwnerDashboard(QWidget):
         self.export_button.clicked.connect(self.export_data)
         button_layout.addWidget(self.export_button)
         
+        # Query Button
+        self.query_button = QPushButton("🔎 Query")
+        self.query_button.setStyleSheet("""
+            QPushButton {
+                background-color: #17a2b8;
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 5px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #138496;
+            }
+        """)
+        self.query_button.clicked.connect(self.open_query_panel)
+        button_layout.addWidget(self.query_button)
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -262,6 +297,13 @@ class OwnerDashboard(QWidget):
         
         layout.addLayout(button_layout)
     
+    def open_query_panel(self):
+        """Open the ad-hoc query panel on the loaded (or latest saved) dataset."""
+        from .owner_query_panel import OwnerQueryPanel
+        snapshot = self.owner_data.snapshot
+        self.query_panel = OwnerQueryPanel(dataset_dir=snapshot.dataset_dir if snapshot is not None else None)
+        self.query_panel.show()
+    
     def load_owner_data(self):
         """Load all owner data from persistence manager."""
         self.load_button.setEnabled(False)
@@ -274,21 +316,47 @@ class OwnerDashboard(QWidget):
         self.load_thread.error_occurred.connect(self.on_load_error)
         self.load_thread.start()
     
-    def on_data_loaded(self, owner_objects: List[Any], stats: Dict[str, Any]):
+    def on_data_loaded(self, snapshot):
         """Handle loaded owner data."""
-        self.owner_objects = owner_objects
-        
-        # Update summary cards
-        self.update_summary_cards(stats)
-        
-        # Populate table
-        self.populate_owner_table(owner_objects)
+        self.show_snapshot(snapshot)
         
         # Reset UI
         self.load_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         
-        QMessageBox.information(self, "Success", f"Loaded {len(owner_objects):,} owner objects successfully!")
+        QMessageBox.information(self, "Success", f"Loaded {len(snapshot.owners):,} owner objects successfully!")
+    
+    def on_snapshot_changed(self, snapshot):
+        """Follow datasets loaded (or released) by any screen."""
+        if snapshot is None:
+            self.release_owner_data()
+        elif snapshot.version != self.snapshot_version:
+            self.show_snapshot(snapshot)
+    
+    def release_owner_data(self):
+        """Drop every reference to the released dataset (table, indexes, caches)."""
+        self.owner_objects = []
+        self.filtered_owners = []
+        self.snapshot_version = None
+        if self.table_model is not None:
+            self.table_model.release()
+        self.utils['filter'].release()
+        self.utils['sorter'].clear_cache()
+        self.utils['analyzer'].clear_cache()
+    
+    def show_snapshot(self, snapshot):
+        """Show an owner data snapshot (stats and indexes are precomputed)."""
+        if snapshot.version == self.snapshot_version:
+            return
+        self.snapshot_version = snapshot.version
+        self.owner_objects = snapshot.owners
+        self.utils['filter'].set_indexes(snapshot.owners, snapshot.search_index, snapshot.facets)
+        
+        # Update summary cards
+        self.update_summary_cards(snapshot.stats)
+        
+        # Populate table
+        self.populate_owner_table(snapshot.owners)
     
     def on_load_error(self, error_message: str):
         """Handle load error."""
@@ -319,52 +387,61 @@ class OwnerDashboard(QWidget):
             # Continue without updating cards
     
     def populate_owner_table(self, owner_objects: List[Any]):
-        """Populate the owner table using efficient manager."""
-        if not self.table_manager:
-            return
-        
-        # Set data with column configurations
-        self.table_manager.set_data(owner_objects, self.get_column_configs())
+        """Show *owner_objects* through a virtual table model."""
+        column_configs = self.get_column_configs()
+        self.table_model = OwnerTableModel(
+            owner_objects, column_configs, batch_size=int(self.page_size_combo.currentText()), parent=self
+        )
+        self.table_model.rowsInserted.connect(self.update_pagination_controls)
+        self.table_model.modelReset.connect(self.update_pagination_controls)
+        self.owner_table.setModel(self.table_model)
+        for i, config in enumerate(column_configs):
+            self.owner_table.setColumnWidth(i, config.get('width', 150))
         
         # Update pagination controls
         self.update_pagination_controls()
     
+    def _page_start(self) -> int:
+        """View row at the top of the visible area."""
+        row = self.owner_table.rowAt(0)
+        return max(row, 0)
+    
     def prev_page(self):
-        """Go to previous page."""
-        if self.table_manager:
-            self.table_manager.prev_page()
+        """Scroll one page up."""
+        if self.table_model:
+            row = max(self._page_start() - self.table_model.batch_size, 0)
+            self.owner_table.scrollTo(self.table_model.index(row, 0), QAbstractItemView.PositionAtTop)
             self.update_pagination_controls()
     
     def next_page(self):
-        """Go to next page."""
-        if self.table_manager:
-            self.table_manager.next_page()
+        """Scroll one page down, fetching the next batch of rows if needed."""
+        if self.table_model:
+            row = min(self._page_start() + self.table_model.batch_size, self.table_model.total_rows() - 1)
+            self.table_model.ensure_loaded(row)
+            self.owner_table.scrollTo(self.table_model.index(row, 0), QAbstractItemView.PositionAtTop)
             self.update_pagination_controls()
     
     def change_page_size(self):
-        """Change page size."""
-        if self.table_manager and self.owner_objects:
-            new_size = int(self.page_size_combo.currentText())
-            self.table_manager.page_size = new_size
-            self.table_manager.set_data(self.owner_objects, self.get_column_configs())
+        """Change how many rows are fetched at a time."""
+        if self.table_model:
+            self.table_model.batch_size = int(self.page_size_combo.currentText())
             self.update_pagination_controls()
     
     def update_pagination_controls(self):
         """Update pagination controls."""
-        if not self.table_manager:
+        if not self.table_model:
             return
         
-        page_info = self.table_manager.get_page_info()
+        total = self.table_model.total_rows()
+        loaded = self.table_model.rowCount()
+        start = min(self._page_start() + 1, total)
         
         # Update page info
-        self.page_info_label.setText(
-            f"Page {page_info['current_page']} of {page_info['total_pages']} "
-            f"({page_info['start_index']}-{page_info['end_index']} of {page_info['total_items']:,})"
-        )
+        self.page_info_label.setText(f"Rows {start:,}-{loaded:,} loaded of {total:,}")
         
         # Update navigation buttons
-        self.prev_page_btn.setEnabled(page_info['has_prev'])
-        self.next_page_btn.setEnabled(page_info['has_next'])
+        self.prev_page_btn.setEnabled(start > 1)
+        self.next_page_btn.setEnabled(start + self.table_model.batch_size <= total)
     
     def get_column_configs(self):
         """Get column configurations for the table."""
@@ -472,7 +549,7 @@ class OwnerDashboard(QWidget):
     def apply_filters(self):
         """Apply current filters to the table."""
         try:
-            if not self.table_manager or not self.owner_objects:
+            if not self.table_model or not self.owner_objects:
                 return
             
             # Get filter values
@@ -485,19 +562,28 @@ class OwnerDashboard(QWidget):
                 'search_term': search_term
             }
             
-            # Use utility to apply filters
-            self.filtered_owners = self.utils['filter'].apply_filters(self.owner_objects, filters)
-            
-            # Update table with filtered data
-            self.table_manager.set_data(self.filtered_owners, self.get_column_configs())
+            # Use the facet mask of the indexed owners; other lists are filtered by the utility
+            owner_filter = self.utils['filter']
+            mask = owner_filter.filter_mask(self.owner_objects, filters)
+            if mask is not None:
+                self.filtered_owners = owner_filter.facet_index.select(mask)
+                rows = np.flatnonzero(mask)
+            else:
+                self.filtered_owners = owner_filter.apply_filters(self.owner_objects, filters)
+                positions = {id(owner): i for i, owner in enumerate(self.owner_objects)}
+                rows = [positions[id(owner)] for owner in self.filtered_owners]
             
-            # Update pagination controls
-            self.update_pagination_controls()
+            # Show the filtered rows; the model keeps its sort and cached columns
+            self.table_model.set_rows(rows)
             
             # Update summary cards with filtered data
             if hasattr(self, 'filtered_owners') and self.filtered_owners:
                 try:
-                    stats = self.utils['analyzer'].analyze_owners(self.filtered_owners)
+                    if mask is not None:
+                        stats = self.utils['analyzer'].analyze_owners(
+                            self.owner_objects, facets=owner_filter.facet_index, mask=mask)
+                    else:
+                        stats = self.utils['analyzer'].analyze_owners(self.filtered_owners)
                     self.update_summary_cards(stats)
                 except Exception as e:
                     logger.error(f"Failed to update summary cards: {e}")
@@ -557,38 +643,24 @@ class OwnerDashboard(QWidget):
     
     def test_sorting(self):
         """Test sorting functionality for debugging."""
-        if not self.table_manager or not self.owner_objects:
-            print("❌ No table manager or owner objects to test sorting")
+        if not self.table_model or not self.owner_objects:
+            print("❌ No table model or owner objects to test sorting")
             return False
         
         try:
             print("🧪 Testing sorting functionality...")
-            
-            # Show current dataset state
-            if hasattr(self.table_manager, 'get_dataset_summary'):
-                summary = self.table_manager.get_dataset_summary()
-                print(f"📊 Dataset Summary:")
-                print(f"   Total owners: {summary['total_items']:,}")
-                print(f"   Filtered owners: {summary['filtered_items']:,}")
-                print(f"   Current page: {summary['current_page']} of {summary['total_pages']}")
-                print(f"   Page size: {summary['page_size']:,}")
-                print(f"   Is sorted: {summary['is_sorted']}")
-                if summary['is_sorted']:
-                    print(f"   Sort column: {summary['sort_column']}")
-                    print(f"   Sort order: {summary['sort_order']}")
+            print(f"📊 Dataset Summary:")
+            print(f"   Total owners: {len(self.owner_objects):,}")
+            print(f"   Visible owners: {self.table_model.total_rows():,}")
+            print(f"   Loaded rows: {self.table_model.rowCount():,}")
             
             # Test sorting by Property Count (column 2) descending
             print("\n🔍 Testing sort by Property Count (descending)...")
-            self.table_manager._on_sort_changed(2, 1)  # Column 2, descending
-            
-            # Show what the sorting actually did across the full dataset
-            print(f"   Full dataset has {len(self.owner_objects):,} owners")
-            print(f"   Current page shows {self.table_manager.page_size} owners")
+            self.owner_table.sortByColumn(2, Qt.DescendingOrder)
             
-            # Get preview of sorted data
-            if hasattr(self.table_manager, 'get_sorted_data_preview'):
-                preview = self.table_manager.get_sorted_data_preview(20)
-                print(f"   Top 20 Property Counts after sorting: {preview}")
+            preview = [self.table_model.data(self.table_model.index(row, 2))
+                       for row in range(min(20, self.table_model.rowCount()))]
+            print(f"   Top 20 Property Counts after sorting: {preview}")
             
             print("✅ Sorting test completed")
             return True
@@ -603,44 +675,22 @@ class OwnerDashboard(QWidget):
 class LoadOwnerDataThread(QThread):
     """Background thread for loading owner data."""
     
-    data_loaded = pyqtSignal(list, dict)  # owner_objects, stats
+    data_loaded = pyqtSignal(object)  # OwnerDataSnapshot
     error_occurred = pyqtSignal(str)
     
     def run(self):
         """Load owner data in background thread."""
         try:
-            # Load existing owner objects from persistence manager
-            owner_objects, enhanced_df = load_property_owners_persistent()
+            # The shared service only reads the dataset if it is not loaded yet;
+            # the snapshot carries the search index, facet index and summary stats
+            snapshot = get_owner_data_service().load()
             
-            if not owner_objects:
+            if not snapshot.owners:
                 self.error_occurred.emit("No owner objects found")
                 return
             
-            # Calculate summary stats
-            stats = self.calculate_stats(owner_objects)
-            
             # Emit results
-            self.data_loaded.emit(owner_objects, stats)
+            self.data_loaded.emit(snapshot)
             
         except Exception as e:
             self.error_occurred.emit(str(e))
-    
-    def calculate_stats(self, owner_objects: List[Any]) -> Dict[str, Any]:
-        """Calculate summary statistics from owner objects."""
-        total_owners = len(owner_objects)
-        total_properties = sum(o.property_count for o in owner_objects)
-        total_value = sum(o.total_property_value for o in owner_objects)
-        business_owners = sum(1 for o in owner_objects if o.is_business_owner)
-        individual_owners = total_owners - business_owners
-        multi_property_owners = sum(1 for o in owner_objects if o.property_count > 1)
-        high_confidence_targets = sum(1 for o in owner_objects if o.confidence_score >= 0.8)
-        
-        return {
-            'total_owners': total_owners,
-            'total_properties': total_properties,
-            'total_value': total_value,
-            'business_owners': business_owners,
-            'individual_owners': individual_owners,
-            'multi_property_owners': multi_property_owners,
-            'high_confidence_targets': high_confidence_targets
-        } 
\ No newline at end of file
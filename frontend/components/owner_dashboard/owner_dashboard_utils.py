@@ -6,7 +6,9 @@ Comprehensive utilities for sorting, filtering, and exporting owner data
 with optimized performance for large datasets.
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Any, Callable, Optional, Tuple
+import numpy as np
 import pandas as pd
 from loguru import logger
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -17,13 +19,19 @@ from datetime import datetime
 
 from backend.utils.efficient_table_manager import SortOrder
 from backend.utils.phone_data_utils import PhoneDataUtils
+from backend.utils.owner_facet_index import OwnerFacetIndex
+from backend.utils.owner_search_index import OwnerSearchIndex, searchable_texts
+from backend.utils.owner_summary import OwnerRollup
+from backend.utils.sort_permutations import SortPermutationCache
+
+FILTER_CACHE_SIZE = 32
 
 
 class OwnerDataSorter:
     """Handles efficient sorting of owner data."""
     
     def __init__(self):
-        self.sort_cache = {}
+        self.sort_cache = SortPermutationCache()
         self.last_sort_key = None
         self.last_sort_order = None
     
@@ -44,42 +52,46 @@ class OwnerDataSorter:
         if not owners:
             return owners
         
-        # Check if we can use cached sort
-        cache_key = (column, order, len(owners))
-        if cache_key in self.sort_cache:
-            logger.debug(f"Using cached sort for column {column}")
-            return self.sort_cache[cache_key]
-        
-        # Get sort configuration
-        if column >= len(column_configs):
-            logger.warning(f"Column {column} out of range")
+        permutation = self.sort_permutation(owners, [(column, order)], column_configs)
+        if permutation is None:
             return owners
+        return [owners[i] for i in permutation]
+    
+    def sort_permutation(self, owners: List[Any], sort_columns: List[Tuple[int, SortOrder]],
+                         column_configs: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Indices of *owners* in sort order, from cached per-column permutations.
         
-        config = column_configs[column]
-        sort_key = config.get('sort_key', config['key'])
-        
-        # Create sort key function
-        if callable(sort_key):
-            key_func = sort_key
-        else:
-            key_func = lambda x: getattr(x, sort_key, '')
+        Args:
+            owners: List of owner objects
+            sort_columns: (column, order) pairs, the first one primary
+            column_configs: Column configuration
+            
+        Returns:
+            Index array, or None if a column is out of range
+        """
+        keys = []
+        for column, order in sort_columns:
+            if column >= len(column_configs):
+                logger.warning(f"Column {column} out of range")
+                return None
+            config = column_configs[column]
+            keys.append((config.get('sort_key', config['key']), config.get('numeric'),
+                         order == SortOrder.DESCENDING))
         
-        # Sort with error handling
         try:
-            sorted_owners = sorted(owners, key=key_func, 
-                                 reverse=(order == SortOrder.DESCENDING))
-            
-            # Cache the result (limit cache size)
-            if len(self.sort_cache) > 10:
-                self.sort_cache.clear()
-            self.sort_cache[cache_key] = sorted_owners
-            
-            logger.debug(f"Sorted {len(owners)} owners by column {column} ({order.name})")
-            return sorted_owners
-            
+            if len(keys) == 1:
+                key, numeric, descending = keys[0]
+                permutation = self.sort_cache.permutation(owners, key, numeric, descending)
+            else:
+                permutation = self.sort_cache.lexsort(owners, keys)
         except Exception as e:
-            logger.error(f"Sorting failed for column {column}: {e}")
-            return owners
+            logger.error(f"Sorting failed for columns {sort_columns}: {e}")
+            return None
+        
+        self.last_sort_key, self.last_sort_order = sort_columns[0]
+        logger.debug(f"Sorted {len(owners)} owners by {sort_columns} (dataset v{self.sort_cache.version})")
+        return permutation
     
     def clear_cache(self):
         """Clear sort cache to free memory."""
@@ -91,8 +103,32 @@ class OwnerDataFilter:
     """Handles efficient filtering of owner data."""
     
     def __init__(self):
-        self.filter_cache = {}
+        self.filter_cache = OrderedDict()
         self.active_filters = {}
+        self.search_index: Optional[OwnerSearchIndex] = None
+        self.facet_index: Optional[OwnerFacetIndex] = None
+        self._indexed_owners: Optional[List[Any]] = None
+    
+    def set_indexes(self, owners: List[Any], search_index: Optional[OwnerSearchIndex] = None,
+                    facet_index: Optional[OwnerFacetIndex] = None):
+        """
+        Use prebuilt indexes when filtering *owners*.
+        
+        Index ids are positions in *owners*, so the indexes are only used
+        when filtering that same list. Without a facet index one is built
+        here (a single pass over the owners).
+        """
+        self.search_index = search_index
+        self.facet_index = facet_index if facet_index is not None else OwnerFacetIndex(owners)
+        self._indexed_owners = owners
+        self.clear_cache()
+    
+    def release(self):
+        """Drop the indexes and cached results of the current owner list."""
+        self.search_index = None
+        self.facet_index = None
+        self._indexed_owners = None
+        self.clear_cache()
     
     def apply_filters(self, owners: List[Any], filters: Dict[str, Any]) -> List[Any]:
         """
@@ -108,27 +144,83 @@ class OwnerDataFilter:
         if not filters:
             return owners
         
-        # Check cache
-        filter_key = json.dumps(filters, sort_keys=True)
+        # Check cache (results are only valid for the same owner list)
+        filter_key = (id(owners), len(owners), json.dumps(filters, sort_keys=True))
         if filter_key in self.filter_cache:
             logger.debug("Using cached filter result")
+            self.filter_cache.move_to_end(filter_key)
             return self.filter_cache[filter_key]
         
-        filtered_owners = owners.copy()
-        
-        # Apply each filter
-        for filter_type, filter_value in filters.items():
-            if filter_value:  # Skip empty filters
-                filtered_owners = self._apply_single_filter(filtered_owners, filter_type, filter_value)
+        mask = self.filter_mask(owners, filters)
+        if mask is not None:
+            filtered_owners = self.facet_index.select(mask)
+        else:
+            filtered_owners = owners.copy()
+            
+            # Apply each filter
+            for filter_type, filter_value in filters.items():
+                if filter_value:  # Skip empty filters
+                    filtered_owners = self._apply_single_filter(filtered_owners, filter_type, filter_value)
         
-        # Cache result
-        if len(self.filter_cache) > 5:  # Limit cache size
-            self.filter_cache.clear()
+        # Cache result (least recently used entries go first)
         self.filter_cache[filter_key] = filtered_owners
+        while len(self.filter_cache) > FILTER_CACHE_SIZE:
+            self.filter_cache.popitem(last=False)
         
         logger.info(f"Applied {len(filters)} filters: {len(owners)} -> {len(filtered_owners)} owners")
         return filtered_owners
     
+    def count_matches(self, owners: List[Any], filters: Dict[str, Any]) -> int:
+        """Number of owners matching *filters* (without building the list when indexed)."""
+        mask = self.filter_mask(owners, filters)
+        if mask is None:
+            return len(self.apply_filters(owners, filters))
+        return OwnerFacetIndex.count(mask)
+    
+    def filter_mask(self, owners: List[Any], filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Boolean mask of the owners matching *filters*, from the indexes.
+        
+        Returns None when *owners* is not the indexed list.
+        """
+        facets = self.facet_index
+        if facets is None or owners is not self._indexed_owners:
+            return None
+        
+        mask = facets.all()
+        for filter_type, filter_value in filters.items():
+            if not filter_value:  # Skip empty filters
+                continue
+            if filter_type == 'owner_type':
+                owner_type_mask = self._owner_type_mask(filter_value)
+                if owner_type_mask is not None:
+                    mask &= owner_type_mask
+            elif filter_type == 'search_term':
+                if self.search_index is not None:
+                    mask &= facets.ids_mask(self.search_index.search(filter_value))
+                else:
+                    mask &= facets.ids_mask([i for i, o in enumerate(owners) if self._matches_search(o, filter_value)])
+            elif filter_type == 'confidence_min':
+                mask &= facets.range_mask('confidence_score', low=filter_value)
+            elif filter_type == 'property_count_min':
+                mask &= facets.range_mask('property_count', low=filter_value)
+            elif filter_type == 'value_min':
+                mask &= facets.range_mask('total_property_value', low=filter_value)
+        return mask
+    
+    def _owner_type_mask(self, owner_type: str) -> Optional[np.ndarray]:
+        """Facet mask for an owner type choice (None: no restriction)."""
+        facets = self.facet_index
+        if owner_type == "Business Entities":
+            return facets.mask('business')
+        elif owner_type == "Individual Owners":
+            return ~facets.mask('business')
+        elif owner_type == "Multi-Property":
+            return facets.mask('multi_property')
+        elif owner_type == "High Confidence":
+            return facets.range_mask('confidence_score', low=0.8)
+        return None
+    
     def _apply_single_filter(self, owners: List[Any], filter_type: str, filter_value: Any) -> List[Any]:
         """Apply a single filter."""
         if filter_type == 'owner_type':
@@ -163,25 +255,9 @@ class OwnerDataFilter:
         if not search_term:
             return True
         
+        # Same fields as the search index: names, mailing address, property addresses
         search_lower = search_term.lower()
-        
-        # Search in owner name
-        owner_name = getattr(owner, 'owner_name', '') or getattr(owner, 'name', '')
-        if search_lower in str(owner_name).lower():
-            return True
-        
-        # Search in mailing address
-        mailing_address = getattr(owner, 'mailing_address', '')
-        if search_lower in str(mailing_address).lower():
-            return True
-        
-        # Search in property addresses
-        if hasattr(owner, 'property_addresses') and owner.property_addresses:
-            for addr in owner.property_addresses:
-                if search_lower in str(addr).lower():
-                    return True
-        
-        return False
+        return any(search_lower in text.lower() for text in searchable_texts(owner))
     
     def clear_cache(self):
         """Clear filter cache."""
@@ -320,15 +396,29 @@ class OwnerDataExporter:
 class OwnerDataAnalyzer:
     """Analyzes owner data for insights and statistics."""
     
+    CONFIDENCE_LABELS = {
+        'high_confidence': 'High (0.8+)',
+        'medium_confidence': 'Medium (0.5-0.8)',
+        'low_confidence': 'Low (<0.5)',
+    }
+    OWNER_TYPE_LABELS = {
+        'individual_only': 'Individual',
+        'business_only': 'Business',
+        'individual_business': 'Individual + Business',
+    }
+    
     def __init__(self):
         self.analysis_cache = {}
     
-    def analyze_owners(self, owners: List[Any]) -> Dict[str, Any]:
+    def analyze_owners(self, owners: List[Any], facets: Optional[OwnerFacetIndex] = None,
+                       mask: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Analyze owner data for insights.
         
         Args:
             owners: List of owner objects
+            facets: Facet index of *owners*, if one was already built
+            mask: Analyze only the owners selected by this mask of *facets*
             
         Returns:
             Dictionary with analysis results
@@ -336,118 +426,37 @@ class OwnerDataAnalyzer:
         if not owners:
             return {}
         
-        # Check cache
-        cache_key = len(owners)
-        if cache_key in self.analysis_cache:
+        # Check cache (whole lists only; a masked rollup is a few vectorised counts)
+        cache_key = (id(owners), len(owners))
+        if mask is None and cache_key in self.analysis_cache:
             return self.analysis_cache[cache_key]
         
+        if facets is None or facets.owners is not owners:
+            facets = OwnerFacetIndex(owners)
+        summary = OwnerRollup.from_facets(facets, mask).summary()
+        histograms = summary['histograms']
+        
         analysis = {
-            'total_owners': len(owners),
-            'total_properties': sum(getattr(o, 'property_count', 0) for o in owners),
-            'total_value': sum(getattr(o, 'total_property_value', 0) for o in owners),
-            'owner_types': self._analyze_owner_types(owners),
-            'confidence_distribution': self._analyze_confidence(owners),
-            'property_distribution': self._analyze_property_distribution(owners),
-            'value_distribution': self._analyze_value_distribution(owners),
-            'phone_quality': self._analyze_phone_quality(owners)
+            'total_owners': summary['total_owners'],
+            'total_properties': summary['total_properties'],
+            'total_value': summary['total_value'],
+            'owner_types': {self.OWNER_TYPE_LABELS[key]: value['count']
+                            for key, value in summary['owner_type_breakdown'].items()},
+            'confidence_distribution': {self.CONFIDENCE_LABELS[key]: value['count']
+                                        for key, value in summary['confidence_breakdown'].items()},
+            'property_distribution': histograms['property_count'],
+            'value_distribution': histograms['total_property_value'],
+            'phone_quality': histograms['phone_quality_score']
         }
         
-        # Cache result
-        if len(self.analysis_cache) > 5:
-            self.analysis_cache.clear()
-        self.analysis_cache[cache_key] = analysis
+        if mask is None:
+            # Cache result
+            if len(self.analysis_cache) > 5:
+                self.analysis_cache.clear()
+            self.analysis_cache[cache_key] = analysis
         
         return analysis
     
-    def _analyze_owner_types(self, owners: List[Any]) -> Dict[str, int]:
-        """Analyze distribution of owner types."""
-        types = {}
-        for owner in owners:
-            owner_type = getattr(owner, 'owner_type', 'Unknown')
-            types[owner_type] = types.get(owner_type, 0) + 1
-        return types
-    
-    def _analyze_confidence(self, owners: List[Any]) -> Dict[str, int]:
-        """Analyze confidence score distribution."""
-        confidence_ranges = {
-            'High (0.8+)': 0,
-            'Medium (0.5-0.8)': 0,
-            'Low (<0.5)': 0
-        }
-        
-        for owner in owners:
-            score = getattr(owner, 'confidence_score', 0)
-            if score >= 0.8:
-                confidence_ranges['High (0.8+)'] += 1
-            elif score >= 0.5:
-                confidence_ranges['Medium (0.5-0.8)'] += 1
-            else:
-                confidence_ranges['Low (<0.5)'] += 1
-        
-        return confidence_ranges
-    
-    def _analyze_property_distribution(self, owners: List[Any]) -> Dict[str, int]:
-        """Analyze property count distribution."""
-        property_ranges = {
-            '1 Property': 0,
-            '2-5 Properties': 0,
-            '6-10 Properties': 0,
-            '10+ Properties': 0
-        }
-        
-        for owner in owners:
-            count = getattr(owner, 'property_count', 0)
-            if count == 1:
-                property_ranges['1 Property'] += 1
-            elif count <= 5:
-                property_ranges['2-5 Properties'] += 1
-            elif count <= 10:
-                property_ranges['6-10 Properties'] += 1
-            else:
-                property_ranges['10+ Properties'] += 1
-        
-        return property_ranges
-    
-    def _analyze_value_distribution(self, owners: List[Any]) -> Dict[str, int]:
-        """Analyze property value distribution."""
-        value_ranges = {
-            '$0-$50K': 0,
-            '$50K-$100K': 0,
-            '$100K-$250K': 0,
-            '$250K-$500K': 0,
-            '$500K+': 0
-        }
-        
-        for owner in owners:
-            value = getattr(owner, 'total_property_value', 0)
-            if value <= 50000:
-                value_ranges['$0-$50K'] += 1
-            elif value <= 100000:
-                value_ranges['$50K-$100K'] += 1
-            elif value <= 250000:
-                value_ranges['$100K-$250K'] += 1
-            elif value <= 500000:
-                value_ranges['$250K-$500K'] += 1
-            else:
-                value_ranges['$500K+'] += 1
-        
-        return value_ranges
-    
-    def _analyze_phone_quality(self, owners: List[Any]) -> Dict[str, int]:
-        """Analyze phone quality distribution."""
-        phone_quality = {
-            'High Quality': 0,
-            'Medium Quality': 0,
-            'Low Quality': 0,
-            'No Phones': 0
-        }
-        
-        for owner in owners:
-            # This would need to be implemented based on your phone quality logic
-            phone_quality['Medium Quality'] += 1  # Placeholder
-        
-        return phone_quality
-    
     def clear_cache(self):
         """Clear analysis cache."""
         self.analysis_cache.clear()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Owner Query Panel
+
+Ad-hoc portfolio questions over the owner dataset, e.g. "LLCs mailing to
+73xxx with 5+ properties and a CORRECT mobile phone". Queries run on the
+dataset's columnar tables (see backend.utils.owner_query) in a background
+thread; results are shown in a lazily formatted table.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QTableView, QPushButton,
+    QComboBox, QLineEdit, QSpinBox, QPlainTextEdit
+)
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QFont
+from loguru import logger
+
+from backend.utils.owner_query import OwnerQuery, OwnerQueryEngine, TABLES, ensure_owner_tables
+from frontend.components.dataframe_table_model import DataFrameTableModel
+
+
+class OwnerQueryPanel(QWidget):
+    """Query builder and result table over the owner, phone and property tables."""
+
+    def __init__(self, dataset_dir: Optional[Path] = None, parent=None):
+        """
+        Args:
+            dataset_dir: Owner dataset to query (default: the latest saved dataset)
+        """
+        super().__init__(parent)
+        self.dataset_dir = dataset_dir
+        self.engine = None
+        self.query_thread = None
+        self.setWindowTitle("🔎 Owner Query")
+        self.resize(1100, 700)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the query form, result table and status line."""
+        layout = QVBoxLayout(self)
+
+        header = QLabel("🔎 Owner Query")
+        header.setFont(QFont("Arial", 16, QFont.Bold))
+        header.setStyleSheet("color: #667eea; margin: 10px;")
+        layout.addWidget(header)
+
+        form = QFormLayout()
+        self.table_combo = QComboBox()
+        self.table_combo.addItems(TABLES)
+        form.addRow("Table:", self.table_combo)
+
+        self.where_input = QLineEdit()
+        self.where_input.setPlaceholderText(
+            "entity_type=LLC; mailing_zip~73*; property_count>=5; phones.status=CORRECT; phones.phone_type=MOBILE")
+        form.addRow("Where:", self.where_input)
+
+        self.group_input = QLineEdit()
+        self.group_input.setPlaceholderText("mailing_zip, entity_type")
+        form.addRow("Group by:", self.group_input)
+
+        self.agg_input = QLineEdit()
+        self.agg_input.setPlaceholderText("owners=count(*), value=sum(total_property_value)")
+        form.addRow("Aggregates:", self.agg_input)
+
+        self.order_input = QLineEdit()
+        self.order_input.setPlaceholderText("-total_property_value")
+        form.addRow("Order by:", self.order_input)
+
+        self.limit_spin = QSpinBox()
+        self.limit_spin.setRange(1, 1_000_000)
+        self.limit_spin.setValue(500)
+        form.addRow("Limit:", self.limit_spin)
+        layout.addLayout(form)
+
+        button_layout = QHBoxLayout()
+        self.run_button = QPushButton("▶️ Run Query")
+        self.run_button.setStyleSheet("""
+            QPushButton {
+                background-color: #667eea;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 5px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #5a6fd8;
+            }
+        """)
+        self.run_button.clicked.connect(self.run_query)
+        button_layout.addWidget(self.run_button)
+
+        self.explain_button = QPushButton("🧭 Explain")
+        self.explain_button.clicked.connect(lambda: self.run_query(explain=True))
+        button_layout.addWidget(self.explain_button)
+
+        self.status_label = QLabel("")
+        button_layout.addWidget(self.status_label, 1)
+        layout.addLayout(button_layout)
+
+        self.result_table = QTableView()
+        self.result_table.setAlternatingRowColors(True)
+        layout.addWidget(self.result_table, 1)
+
+        self.plan_view = QPlainTextEdit()
+        self.plan_view.setReadOnly(True)
+        self.plan_view.setFont(QFont("Courier", 10))
+        self.plan_view.setVisible(False)
+        layout.addWidget(self.plan_view)
+
+        # Enter in any field runs the query
+        for line_edit in (self.where_input, self.group_input, self.agg_input, self.order_input):
+            line_edit.returnPressed.connect(self.run_query)
+
+    def build_query(self) -> OwnerQuery:
+        """The query described by the form (raises OwnerQueryError if it cannot be parsed)."""
+        return OwnerQuery.parse(
+            table=self.table_combo.currentText(),
+            where=self.where_input.text(),
+            group_by=self.group_input.text(),
+            aggregates=self.agg_input.text(),
+            order_by=self.order_input.text(),
+            limit=self.limit_spin.value(),
+        )
+
+    def run_query(self, explain: bool = False):
+        """Run (or explain) the query in a background thread."""
+        if self.query_thread is not None and self.query_thread.isRunning():
+            return
+        try:
+            query = self.build_query()
+        except ValueError as e:
+            self.status_label.setText(f"❌ {e}")
+            return
+
+        self.run_button.setEnabled(False)
+        self.explain_button.setEnabled(False)
+        self.status_label.setText("⏳ Running query...")
+        self.query_thread = OwnerQueryThread(self, query, explain)
+        self.query_thread.query_finished.connect(self.on_query_finished)
+        self.query_thread.error_occurred.connect(self.on_query_error)
+        self.query_thread.start()
+
+    def on_query_finished(self, result):
+        """Show a QueryResult (or an explained plan)."""
+        self.run_button.setEnabled(True)
+        self.explain_button.setEnabled(True)
+        if isinstance(result, str):
+            self.plan_view.setPlainText(result)
+            self.plan_view.setVisible(True)
+            self.status_label.setText("🧭 Query plan")
+            return
+        self.plan_view.setVisible(False)
+        self.result_table.setModel(DataFrameTableModel(result.frame))
+        self.result_table.resizeColumnsToContents()
+        self.status_label.setText(f"✅ {len(result):,} rows in {result.elapsed_ms:.0f} ms")
+
+    def on_query_error(self, message: str):
+        """Show a query error."""
+        self.run_button.setEnabled(True)
+        self.explain_button.setEnabled(True)
+        self.status_label.setText(f"❌ {message}")
+        logger.warning(f"Owner query failed: {message}")
+
+    def get_engine(self) -> OwnerQueryEngine:
+        """The query engine (built once; may build the dataset's tables)."""
+        if self.engine is None:
+            if self.dataset_dir is not None:
+                self.engine = OwnerQueryEngine(ensure_owner_tables(self.dataset_dir))
+            else:
+                self.engine = OwnerQueryEngine.for_dataset()
+        return self.engine
+
+
+class OwnerQueryThread(QThread):
+    """Background thread for running one owner query."""
+
+    query_finished = pyqtSignal(object)  # QueryResult, or the plan text
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, panel: OwnerQueryPanel, query: OwnerQuery, explain: bool = False):
+        super().__init__(panel)
+        self.panel = panel
+        self.query = query
+        self.explain = explain
+
+    def run(self):
+        """Run the query in the background thread."""
+        try:
+            engine = self.panel.get_engine()
+            self.query_finished.emit(engine.explain(self.query) if self.explain else engine.run(self.query))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Owner Table Model
+
+Virtual ``QAbstractTableModel`` for the owner tables (main window and owner
+dashboard).  Nothing is copied into Qt items: the model keeps the owner
+records, formats a cell only when the view asks for it in ``data()``,
+sorts by permuting row indices and hands
+rows to the view in batches through ``canFetchMore``/``fetchMore``.
+
+Columns are described with the same configuration dictionaries as
+``EfficientTableManager`` (``name``, ``key``, ``formatter``, ``numeric``,
+``sort_key``, ``width``).  Sort orders come from a
+:class:`~backend.utils.sort_permutations.SortPermutationCache`: a column's
+values are extracted and argsorted once, so later header clicks (either
+direction) and filter changes only index the cached permutation.  Text
+columns sort case-insensitively.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from backend.utils.sort_permutations import SortPermutationCache
+
+BATCH_SIZE = 1000
+
+
+def _format_value(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _priority(score: Optional[float]) -> str:
+    if not score:
+        return "Unknown"
+    if score >= 0.8:
+        return "High"
+    if score >= 0.6:
+        return "Medium"
+    return "Low"
+
+
+def _property_addresses(properties: List[Dict[str, Any]]) -> str:
+    addresses = ", ".join(p['property_address'] for p in properties[:3])
+    if len(properties) > 3:
+        addresses += f" (+{len(properties) - 3} more)"
+    return addresses
+
+
+# Columns of the main window table (HierarchicalOwnerGroup records)
+OWNER_GROUP_COLUMNS: List[Dict[str, Any]] = [
+    {'name': 'Owner Name', 'key': 'owner_name', 'width': 200},
+    {'name': 'Mailing Address', 'key': 'mailing_address', 'width': 250},
+    {'name': 'Property Count', 'key': 'property_count', 'numeric': True, 'width': 100},
+    {'name': 'Total Value', 'key': 'total_value', 'numeric': True, 'width': 120,
+     'formatter': lambda v, item: f"${v:,.0f}" if v else "$0"},
+    {'name': 'Phone Quality', 'key': 'phone_quality', 'numeric': True, 'width': 100,
+     'formatter': lambda v, item: f"{v:.1f}/10" if v else "N/A"},
+    {'name': 'Phone Count', 'key': lambda g: f"{g.correct_phones}/{g.phone_count}", 'width': 100,
+     'sort_key': 'correct_phones', 'numeric': True},
+    {'name': 'Best Contact', 'key': 'best_contact', 'width': 150,
+     'formatter': lambda v, item: v if v else "Unknown"},
+    {'name': 'Owner Type', 'key': 'is_business', 'width': 100,
+     'formatter': lambda v, item: "LLC/Business" if v else "Individual"},
+    {'name': 'Skip Trace Priority', 'key': 'confidence_score', 'width': 120,
+     'formatter': lambda v, item: _priority(v)},
+    {'name': 'Property Addresses', 'key': 'properties', 'width': 300,
+     'formatter': lambda v, item: _property_addresses(v), 'sort_key': 'property_count'},
+]
+
+
+class OwnerTableModel(QAbstractTableModel):
+    """Read-only, lazily formatted table model over owner records."""
+
+    def __init__(self, records: Sequence[Any], column_configs: List[Dict[str, Any]],
+                 batch_size: int = BATCH_SIZE, parent=None):
+        """
+        Args:
+            records: Owner objects (or owner groups), one per row
+            column_configs: Column configurations, as for EfficientTableManager
+            batch_size: Rows handed to the view per fetchMore
+        """
+        super().__init__(parent)
+        self.records = records
+        self.column_configs = column_configs
+        self.batch_size = batch_size
+
+        self._sort_cache = SortPermutationCache()
+        self._sort_keys: Dict[int, Union[str, Callable[[Any], Any]]] = {}  # stable keys, so the cache hits
+        self._mask: Optional[np.ndarray] = None  # visible records (None: all)
+        self._rows = np.arange(len(records))  # visible record indices, in view order
+        self._loaded = min(len(self._rows), batch_size)
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+
+    @classmethod
+    def from_owner_groups(cls, owner_groups: Sequence[Any], batch_size: int = BATCH_SIZE,
+                          parent=None) -> "OwnerTableModel":
+        """Model over ``HierarchicalOwnerGroup`` records with the main window columns."""
+        return cls(owner_groups, OWNER_GROUP_COLUMNS, batch_size, parent)
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.column_configs)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        config = self.column_configs[index.column()]
+        if role == Qt.DisplayRole:
+            return self._cell_text(self.record(index.row()), config)
+        if role == Qt.TextAlignmentRole and config.get('numeric', False):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.UserRole:
+            return self._raw_value(self.record(index.row()), config['key'])
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.column_configs[section]['name']
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.batch_size, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sort by permuting the visible row indices (records are never moved)."""
+        if not 0 <= column < len(self.column_configs):
+            return
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column, self.sort_order = column, order
+        self._rows = self._sorted()
+        self.layoutChanged.emit()
+
+    # Rows
+
+    def record(self, row: int) -> Any:
+        """Record shown at view *row*."""
+        return self.records[self._rows[row]]
+
+    def total_rows(self) -> int:
+        """Visible rows, including the ones not fetched yet."""
+        return len(self._rows)
+
+    def set_rows(self, rows: Optional[Sequence[int]] = None):
+        """Show only the records at *rows* (``None`` shows all), keeping the sort."""
+        self.beginResetModel()
+        if rows is None:
+            self._mask = None
+            indices = np.arange(len(self.records))
+        else:
+            indices = np.asarray(rows, dtype=np.int64)
+            self._mask = np.zeros(len(self.records), dtype=bool)
+            self._mask[indices] = True
+        self._rows = self._sorted() if self.sort_column >= 0 else indices
+        self._loaded = min(len(self._rows), self.batch_size)
+        self.endResetModel()
+
+    def release(self):
+        """Drop the records (the model shows no rows) so their memory can be freed."""
+        self.beginResetModel()
+        self.records = []
+        self._sort_cache.clear()
+        self._mask = None
+        self._rows = np.arange(0)
+        self._loaded = 0
+        self.endResetModel()
+
+    def ensure_loaded(self, row: int):
+        """Fetch batches until view *row* exists."""
+        while row >= self._loaded and self.canFetchMore():
+            self.fetchMore()
+
+    # Internals
+
+    @staticmethod
+    def _raw_value(record: Any, key: Any) -> Any:
+        return key(record) if callable(key) else getattr(record, key, '')
+
+    def _cell_text(self, record: Any, config: Dict[str, Any]) -> str:
+        value = self._raw_value(record, config['key'])
+        formatter = config.get('formatter')
+        if formatter:
+            return formatter(value, record)
+        return _format_value(value)
+
+    def _sort_key(self, column: int) -> Union[str, Callable[[Any], Any]]:
+        """Sort key of *column* (the same object every time, so its permutation is reused)."""
+        key = self._sort_keys.get(column)
+        if key is None:
+            config = self.column_configs[column]
+            key = config.get('sort_key', config['key'])
+            if not config.get('numeric', False):
+                raw = key
+                key = lambda record: _format_value(self._raw_value(record, raw)).lower()
+            self._sort_keys[column] = key
+        return key
+
+    def _sorted(self) -> np.ndarray:
+        """Visible record indices in the current sort order (ties keep record order)."""
+        config = self.column_configs[self.sort_column]
+        return self._sort_cache.permutation(
+            self.records, self._sort_key(self.sort_column), numeric=config.get('numeric', False),
+            descending=self.sort_order == Qt.DescendingOrder, rows=self._mask)
@@ -7,13 +7,13 @@ Component for previewing and downloading standardized data after mapping.
 import pandas as pd
 from typing import Optional, Callable
 from PyQt5.QtWidgets import (
-    QLabel, QPushButton, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QHBoxLayout, QTableView, QAbstractItemView,
     QFileDialog, QMessageBox
 )
 from PyQt5.QtCore import Qt
 
 from frontend.components.base_component import BaseComponent
-from frontend.constants import DEFAULT_RULES_CONFIG
+from frontend.components.dataframe_table_model import DataFrameTableModel
 
 class StandardizedPreviewUI(BaseComponent):
     """
@@ -66,29 +66,15 @@ class StandardizedPreviewUI(BaseComponent):
     
     def _setup_preview_table(self):
         """Setup the data preview table."""
-        self.table_widget = QTableWidget()
-        
-        # Configure table size based on rules
-        rules = DEFAULT_RULES_CONFIG
-        preview_rows = min(rules.get('preview_row_count', 10), len(self.df))
-        preview_cols = len(self.df.columns)
-        
-        self.table_widget.setRowCount(preview_rows)
-        self.table_widget.setColumnCount(preview_cols)
-        self.table_widget.setHorizontalHeaderLabels([str(col) for col in self.df.columns])
-        
-        # Populate table with data
-        for i in range(preview_rows):
-            for j in range(preview_cols):
-                val = str(self.df.iloc[i, j]) if pd.notna(self.df.iloc[i, j]) else ''
-                item = QTableWidgetItem(val)
-                self.table_widget.setItem(i, j, item)
+        # Every row is browsable; cells are formatted as they scroll into view
+        self.table_widget = QTableView()
+        self.table_widget.setModel(DataFrameTableModel(self.df, parent=self.table_widget))
         
         # Configure table appearance
         self.table_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.table_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.table_widget.setAlternatingRowColors(True)
-        self.table_widget.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table_widget.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table_widget.resizeColumnsToContents()
         
         self.layout.addWidget(self.table_widget)
@@ -183,13 +169,8 @@ class StandardizedPreviewUI(BaseComponent):
         """Refresh the preview with new data."""
         self.df = new_df
         
-        # Remove existing table
-        if self.table_widget:
-            self.layout.removeWidget(self.table_widget)
-            self.table_widget.deleteLater()
-        
-        # Setup new table
-        self._setup_preview_table()
+        # Swap the frame behind the existing view
+        self.table_widget.model().set_frame(new_df)
     
     def get_data(self) -> pd.DataFrame:
         """Get the current DataFrame."""
@@ -7,15 +7,19 @@ Streamlined main component that orchestrates data preparation workflow.
 import pandas as pd
 from typing import Dict, List, Any, Optional, Callable
 from PyQt5.QtWidgets import (
-    QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QAbstractItemView, QMenu, QAction,
+    QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QTableView,
+    QHeaderView, QAbstractItemView, QMenu, QAction,
     QMessageBox, QInputDialog, QGroupBox, QSplitter, QTextEdit,
-    QScrollArea, QFrame, QListWidget
+    QScrollArea, QFrame, QListWidget, QProgressBar
 )
 from PyQt5.QtGui import QFont, QPalette, QColor
 from PyQt5.QtCore import Qt, pyqtSignal
 
 from frontend.components.base_component import BaseComponent
+from frontend.components.dataframe_table_model import DataFrameTableModel
+from frontend.utils.job_runner import JobContext, JobRunner
+from backend.utils.mapping_executor import ConcatRule, concat_columns, row_dtype
+from backend.utils.operation_log import Operation, OperationLog
 from .version_manager import DataVersionManager
 from .concatenation_dialog import SmartConcatenationDialog
 from .column_manager import ColumnHidingManager
@@ -63,6 +67,10 @@ class DataPrepEditor(BaseComponent):
         
         self.column_manager = ColumnHidingManager(parent_widget=self)
         
+        # Background jobs: one heavy operation at a time for this dataset
+        self.jobs = JobRunner(parent=self)
+        self.dataset_key = f"dataset-{id(self)}"
+        
         # UI state
         self.selected_columns = []
         
@@ -155,6 +163,18 @@ class DataPrepEditor(BaseComponent):
         
         controls.addStretch()
         
+        # Background job progress
+        self.job_progress = QProgressBar()
+        self.job_progress.setRange(0, 100)
+        self.job_progress.setMaximumWidth(220)
+        self.job_progress.setVisible(False)
+        controls.addWidget(self.job_progress)
+        
+        self.cancel_job_btn = QPushButton('⏹ Cancel')
+        self.cancel_job_btn.setVisible(False)
+        self.cancel_job_btn.clicked.connect(self.cancel_job)
+        controls.addWidget(self.cancel_job_btn)
+        
         # Version controls
         self.undo_btn = QPushButton('↶ Undo')
         self.undo_btn.setEnabled(False)
@@ -197,14 +217,20 @@ class DataPrepEditor(BaseComponent):
         
         return controls
     
-    def _create_data_table(self) -> QTableWidget:
-        """Create the data table widget with drag-and-drop support."""
-        table = QTableWidget()
+    def _create_data_table(self) -> QTableView:
+        """Create the data table view with drag-and-drop support."""
+        self.table_model = DataFrameTableModel(
+            header_label=self.column_manager.get_header_display_name,
+            tooltip=self.column_manager.get_column_tooltip,
+            parent=self,
+        )
+        table = QTableView()
+        table.setModel(self.table_model)
         table.setSelectionBehavior(QAbstractItemView.SelectColumns)
         table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         table.setContextMenuPolicy(Qt.CustomContextMenu)
         table.customContextMenuRequested.connect(self._show_context_menu)
-        table.itemSelectionChanged.connect(self._on_selection_changed)
+        table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
         # Enable drag-and-drop for column reordering
         table.setDragDropMode(QAbstractItemView.InternalMove)
@@ -219,16 +245,16 @@ class DataPrepEditor(BaseComponent):
         
         # Style the table for better readability
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #ddd;
                 background-color: white;
                 alternate-background-color: #f8f9fa;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
                 border-bottom: 1px solid #eee;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e3f2fd;
             }
             QHeaderView::section {
@@ -310,9 +336,8 @@ class DataPrepEditor(BaseComponent):
         if current_df is None:
             return
         
-        # Get visible columns and create display DataFrame
+        # Visible columns are an index map over the shared frame (no copy)
         visible_columns = self.column_manager.get_visible_columns(list(current_df.columns))
-        display_df = current_df[visible_columns] if visible_columns else current_df
         
         # Update stats
         self.stats_label.setText(
@@ -323,44 +348,30 @@ class DataPrepEditor(BaseComponent):
         self.hidden_indicator.setText(self.column_manager.get_hidden_indicator_text())
         
         # Update table
-        self._populate_table(display_df, visible_columns)
+        self._populate_table(current_df, visible_columns)
         
         # Update controls
         self._update_controls()
         self._update_version_history()
     
-    def _populate_table(self, display_df: pd.DataFrame, visible_columns: List[str]):
-        """Populate the data table."""
-        self.data_table.clear()
-        self.data_table.setRowCount(min(20, len(display_df)))
-        self.data_table.setColumnCount(len(visible_columns))
-        
-        # Set headers with never-map indicators
-        headers = [self.column_manager.get_header_display_name(col) for col in visible_columns]
-        self.data_table.setHorizontalHeaderLabels(headers)
-        
-        # Populate data
-        for i in range(min(20, len(display_df))):
-            for j, col in enumerate(visible_columns):
-                value = str(display_df.iloc[i, j]) if pd.notna(display_df.iloc[i, j]) else ""
-                item = QTableWidgetItem(value)
-                
-                # Enhanced tooltip with never-map indication
-                tooltip = self.column_manager.get_column_tooltip(col, i, value)
-                item.setToolTip(tooltip)
-                
-                self.data_table.setItem(i, j, item)
-        
-        # Auto-resize columns for better visibility
+    def _populate_table(self, current_df: pd.DataFrame, visible_columns: List[str]):
+        """Show *current_df* in the data table; cells are formatted as they scroll into view."""
+        self.table_model.set_frame(current_df, visible_columns)
+        
+        # A dragged header section was applied to the frame itself; undo the visual move
+        header = self.data_table.horizontalHeader()
+        if header.sectionsMoved():
+            header.blockSignals(True)
+            for visual in range(header.count()):
+                header.moveSection(header.visualIndex(visual), visual)
+            header.blockSignals(False)
+        
+        # Size columns from the first rows only, with a readable minimum
         self.data_table.resizeColumnsToContents()
         self.data_table.horizontalHeader().setStretchLastSection(True)
-        
-        # Set minimum column widths for readability
-        for i in range(self.data_table.columnCount()):
-            current_width = self.data_table.columnWidth(i)
-            min_width = 150
-            if current_width < min_width:
-                self.data_table.setColumnWidth(i, min_width)
+        for i in range(self.table_model.columnCount()):
+            if self.data_table.columnWidth(i) < 150:
+                self.data_table.setColumnWidth(i, 150)
     
     def _update_controls(self):
         """Update control button states."""
@@ -389,20 +400,16 @@ class DataPrepEditor(BaseComponent):
     
     def _on_selection_changed(self):
         """Handle table selection changes."""
-        selected_ranges = self.data_table.selectedRanges()
+        selection = self.data_table.selectionModel().selection()
         self.selected_columns = []
         
         # Get selected column names (from visible columns only)
-        current_df = self.version_manager.get_current_data()
-        if current_df is not None:
-            visible_columns = self.column_manager.get_visible_columns(list(current_df.columns))
-            
-            for range_item in selected_ranges:
-                for col_idx in range(range_item.leftColumn(), range_item.rightColumn() + 1):
-                    if col_idx < len(visible_columns):
-                        col_name = visible_columns[col_idx]
-                        if col_name not in self.selected_columns:
-                            self.selected_columns.append(col_name)
+        for range_item in selection:
+            for col_idx in range(range_item.left(), range_item.right() + 1):
+                if col_idx < self.table_model.columnCount():
+                    col_name = self.table_model.column_name(col_idx)
+                    if col_name not in self.selected_columns:
+                        self.selected_columns.append(col_name)
         
         # Update controls and info
         self._update_controls()
@@ -440,7 +447,8 @@ class DataPrepEditor(BaseComponent):
                 moved_col_name = moved_column
                 action = f"Moved column '{moved_col_name}'"
                 details = f"Position: {old_visual_index + 1} → {new_visual_index + 1}"
-                self.version_manager.save_version(new_df, action, details)
+                self.version_manager.save_version(new_df, action, details,
+                                                  Operation('reorder', {'columns': final_order}))
                 
                 # Refresh view
                 self._refresh_data_view()
@@ -541,65 +549,50 @@ class DataPrepEditor(BaseComponent):
                 self._apply_merge(result)
     
     def _apply_merge(self, merge_config: Dict[str, Any]):
-        """Apply the merge operation."""
-        current_df = self.version_manager.get_current_data()
-        if current_df is None:
-            return
-        
-        try:
-            new_df = current_df.copy()
-            columns_to_merge = merge_config['columns']
-            new_column_name = merge_config['new_name']
-            delimiter = merge_config['delimiter']
-            handle_empty = merge_config['handle_empty']
-            keep_original = merge_config['keep_original']
-            include_headers = merge_config.get('include_headers', False)
-            
-            # Perform concatenation with optional headers
-            if include_headers:
-                # Include column headers in the output
-                if handle_empty:
-                    merged_data = new_df[columns_to_merge].apply(
-                        lambda row: delimiter.join(
-                            f"{col}: {val}" for col, val in zip(columns_to_merge, row)
-                            if pd.notna(val) and str(val).strip()
-                        ),
-                        axis=1
-                    )
-                else:
-                    merged_data = new_df[columns_to_merge].apply(
-                        lambda row: delimiter.join(
-                            f"{col}: {val if pd.notna(val) else ''}" for col, val in zip(columns_to_merge, row)
-                        ),
-                        axis=1
-                    )
-            else:
-                # Original logic without headers
-                if handle_empty:
-                    merged_data = new_df[columns_to_merge].apply(
-                        lambda row: delimiter.join(str(val) for val in row if pd.notna(val) and str(val).strip()),
-                        axis=1
-                    )
-                else:
-                    merged_data = new_df[columns_to_merge].apply(
-                        lambda row: delimiter.join(str(val) if pd.notna(val) else "" for val in row),
-                        axis=1
-                    )
+        """Apply the merge operation (in the background)."""
+        columns_to_merge = merge_config['columns']
+        new_column_name = merge_config['new_name']
+        delimiter = merge_config['delimiter']
+        handle_empty = merge_config['handle_empty']
+        keep_original = merge_config['keep_original']
+        include_headers = merge_config.get('include_headers', False)
+        
+        def merge(df: pd.DataFrame, context: JobContext) -> pd.DataFrame:
+            # Perform concatenation (optionally "Header: value" parts) in one vectorized pass
+            merged_data = concat_columns(df, ConcatRule(
+                tuple(columns_to_merge),
+                separator=delimiter,
+                skip_empty=handle_empty,
+                fill_null=None if handle_empty else '',
+                labels=tuple(columns_to_merge) if include_headers else None,
+                as_dtype=row_dtype(df[columns_to_merge]),
+            ))
+            context.progress(80, 'Inserting merged column')
             
             # Remove original columns if requested
+            new_df = df.drop(columns=columns_to_merge) if not keep_original else df.copy()
+            
+            # Insert merged column at the leftmost position (index 0)
+            new_df.insert(0, new_column_name, merged_data)
+            return new_df
+        
+        def save(new_df: pd.DataFrame):
             if not keep_original:
-                new_df = new_df.drop(columns=columns_to_merge)
                 # Remove hidden columns that were dropped
                 for col in columns_to_merge:
                     self.column_manager.hidden_columns.discard(col)
             
-            # Insert merged column at the leftmost position (index 0)
-            new_df.insert(0, new_column_name, merged_data)
-            
             # Save version
             action = f"Merged {len(columns_to_merge)} columns"
             details = f"{' + '.join(columns_to_merge)} → {new_column_name}"
-            self.version_manager.save_version(new_df, action, details)
+            self.version_manager.save_version(new_df, action, details, Operation('merge', {
+                'columns': list(columns_to_merge),
+                'new_name': new_column_name,
+                'delimiter': delimiter,
+                'handle_empty': handle_empty,
+                'keep_original': keep_original,
+                'include_headers': include_headers,
+            }))
             
             # Refresh view
             self._refresh_data_view()
@@ -609,13 +602,15 @@ class DataPrepEditor(BaseComponent):
                 'Merge Complete',
                 f'Successfully merged {len(columns_to_merge)} columns into "{new_column_name}"'
             )
-            
-        except Exception as e:
+        
+        def failed(error: str):
             QMessageBox.critical(
                 self,
                 'Merge Error',
-                f'Failed to merge columns: {str(e)}'
+                f'Failed to merge columns: {error}'
             )
+        
+        self.run_job(f"Merge {len(columns_to_merge)} columns", merge, save, failed)
     
     def _rename_column(self):
         """Rename a selected column."""
@@ -645,7 +640,8 @@ class DataPrepEditor(BaseComponent):
                     self.version_manager.save_version(
                         new_df, 
                         "Renamed column", 
-                        f"{current_col} → {new_name}"
+                        f"{current_col} → {new_name}",
+                        Operation('rename', {'mapping': {current_col: new_name}})
                     )
                     
                     # Refresh view
@@ -688,11 +684,89 @@ class DataPrepEditor(BaseComponent):
             self.version_manager.save_version(
                 self.original_df, 
                 "Reset to original", 
-                "All changes discarded"
+                "All changes discarded",
+                Operation('reset')
             )
             self.column_manager.show_all_columns()  # Show all columns on reset
+            self.version_manager.record_operation(Operation('show_columns'))
             self._refresh_data_view()
     
+    # Background jobs
+    def run_job(self, name: str, fn: Callable[[pd.DataFrame, JobContext], Any],
+                on_result: Callable[[Any], None],
+                on_error: Optional[Callable[[str], None]] = None,
+                on_cancelled: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Run ``fn(snapshot, context)`` on the worker pool and pass its result to *on_result*.
+        
+        The snapshot is the read-only current version.  If the current version
+        changes while the job runs (undo, another edit), the result is discarded
+        instead of being saved on top of data it was not computed from.
+        
+        Returns:
+            bool: False if no data is loaded or another job is still running
+        """
+        snapshot = self.version_manager.get_current_data()
+        if snapshot is None:
+            return False
+        start_version = self.version_manager.versions[self.version_manager.current_version]
+        
+        def finished(result: Any):
+            self._end_job()
+            current = self.version_manager.versions[self.version_manager.current_version]
+            if current is not start_version:
+                QMessageBox.warning(
+                    self, 'Data Changed',
+                    f'"{name}" was discarded because the data changed while it was running.'
+                )
+                return
+            on_result(result)
+        
+        def failed(error: str):
+            self._end_job()
+            if on_error:
+                on_error(error)
+            else:
+                QMessageBox.critical(self, 'Operation Failed', f'"{name}" failed: {error}')
+        
+        def cancelled():
+            self._end_job()
+            if on_cancelled:
+                on_cancelled()
+        
+        job = self.jobs.submit(self.dataset_key, name, fn, snapshot,
+                               on_finished=finished, on_error=failed,
+                               on_progress=self._on_job_progress, on_cancelled=cancelled)
+        if job is None:
+            running = self.jobs.active_job(self.dataset_key)
+            QMessageBox.information(
+                self, 'Operation Running',
+                f'"{running.name}" is still running. Wait for it to finish or cancel it.'
+            )
+            return False
+        
+        self.job_progress.setValue(0)
+        self.job_progress.setFormat(f'{name}… %p%')
+        self.job_progress.setVisible(True)
+        self.cancel_job_btn.setVisible(True)
+        self.cancel_job_btn.setEnabled(True)
+        return True
+    
+    def cancel_job(self):
+        """Ask the running job to stop at its next checkpoint."""
+        if self.jobs.cancel(self.dataset_key):
+            self.cancel_job_btn.setEnabled(False)
+            self.job_progress.setFormat('Cancelling…')
+    
+    def _on_job_progress(self, percent: int, message: str):
+        self.job_progress.setValue(percent)
+        if message:
+            self.job_progress.setToolTip(message)
+    
+    def _end_job(self):
+        self.job_progress.setVisible(False)
+        self.cancel_job_btn.setVisible(False)
+    
     # Column hiding methods
     def _hide_selected_columns(self):
         """Hide the selected columns."""
@@ -700,6 +774,7 @@ class DataPrepEditor(BaseComponent):
             return
         
         hidden_count = self.column_manager.hide_columns(self.selected_columns)
+        self.version_manager.record_operation(Operation('hide_columns', {'columns': list(self.selected_columns)}))
         self.selected_columns = []
         self._refresh_data_view()
         
@@ -713,6 +788,7 @@ class DataPrepEditor(BaseComponent):
         """Show all hidden columns."""
         hidden_count = self.column_manager.show_all_columns()
         if hidden_count > 0:
+            self.version_manager.record_operation(Operation('show_columns'))
             self._refresh_data_view()
             QMessageBox.information(
                 self,
@@ -730,6 +806,9 @@ class DataPrepEditor(BaseComponent):
         
         success = self.column_manager.hide_never_map_columns(list(current_df.columns))
         if success:
+            self.version_manager.record_operation(
+                Operation('hide_columns', {'columns': sorted(self.column_manager.hidden_columns)})
+            )
             # Remove hidden columns from selection
             self.selected_columns = self.column_manager.filter_selected_columns(self.selected_columns)
             self._refresh_data_view()
@@ -737,13 +816,15 @@ class DataPrepEditor(BaseComponent):
     def _hide_specific_columns(self, columns_to_hide: List[str]):
         """Hide specific columns."""
         self.column_manager.hide_columns(columns_to_hide)
+        self.version_manager.record_operation(Operation('hide_columns', {'columns': list(columns_to_hide)}))
         self.selected_columns = self.column_manager.filter_selected_columns(self.selected_columns)
         self._refresh_data_view()
     
     # Navigation methods
     def _proceed_to_mapping(self):
         """Proceed to Pete mapping with prepared data."""
-        current_df = self.version_manager.get_current_data()
+        # Writable copy: the mapping step may edit the frame in place
+        current_df = self.version_manager.get_current_data(writable=True)
         if current_df is None:
             return
         
@@ -765,8 +846,12 @@ class DataPrepEditor(BaseComponent):
     
     # Public interface methods
     def get_prepared_data(self) -> pd.DataFrame:
-        """Get the current prepared data."""
-        return self.version_manager.get_current_data()
+        """Get the current prepared data (an independent, writable copy)."""
+        return self.version_manager.get_current_data(writable=True)
+    
+    def get_operation_log(self) -> OperationLog:
+        """Get the recorded edits up to the current version, for replay."""
+        return self.version_manager.get_operation_log()
     
     def get_version_summary(self) -> Dict[str, Any]:
         """Get summary of data preparation changes."""
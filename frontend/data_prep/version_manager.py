@@ -2,68 +2,257 @@
 Data Version Manager
 
 Handles version history and undo/redo functionality for data preparation.
+
+Versions share column storage: saving a version only stores the columns
+that actually changed (an unchanged, renamed or reordered column is kept
+once, however many versions reference it).  The current data is assembled
+from the stored columns without copying and is read-only; edits create a
+new frame and save it as the next version.
+
+Each version also carries the declarative operations that produced it, so
+the edits up to the current version can be replayed on a new upload (see
+``backend.utils.operation_log``).  View-only operations (hiding/showing
+columns) are kept on their own timeline: undo/redo does not change which
+columns the editor hides, so it does not drop them from the log either.
+
+Past the memory budget, columns only referenced by versions away from the
+current one are spilled to disk as Arrow IPC files and memory-mapped back
+when an undo/redo needs them.
 """
 
+import sys
+import tempfile
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+import pyarrow as pa
+from loguru import logger
+
+from backend.utils.operation_log import Operation, OperationLog
+
+DEFAULT_MEMORY_BUDGET_MB = 1024
+_SAMPLE_POSITIONS = 16  # cheap pre-check before comparing whole columns
+
+
+@dataclass
+class _StoredColumn:
+    """One column shared by every version that references it."""
+    series: Optional[pd.Series]  # None while spilled to disk
+    nbytes: int
+    path: Optional[Path] = None
+
+
+def _estimate_nbytes(series: pd.Series) -> int:
+    """Approximate memory use without a deep scan of every object."""
+    values = series.array if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) else series.to_numpy()
+    if getattr(values, 'dtype', None) != object:
+        return int(values.nbytes)
+    if len(values) == 0:
+        return 0
+    sample = values[np.linspace(0, len(values) - 1, min(len(values), 256)).astype(np.int64)]
+    per_value = sum(sys.getsizeof(v) for v in sample) / len(sample)
+    return int(len(values) * (8 + per_value))
+
+
+def _frozen_copy(series: pd.Series, index: pd.Index) -> pd.Series:
+    """Private, read-only copy of *series* for the column store."""
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+        return pd.Series(series.array.copy(), index=index, copy=False)
+    values = series.to_numpy(copy=True)
+    values.flags.writeable = False
+    return pd.Series(values, index=index, copy=False)
+
+
+def _to_arrow(series: pd.Series) -> pa.Table:
+    """One-column Arrow table of *series* for spilling.
+
+    Arrow has a single null, so the positions of float NaN in an object
+    column (as opposed to None) are stored alongside in a ``nan`` column.
+    """
+    table = pa.Table.from_pandas(series.to_frame('values'), preserve_index=False)
+    if series.dtype == object:
+        values = series.to_numpy()
+        missing = np.flatnonzero(pd.isna(values))
+        nan = missing[[isinstance(values[pos], float) for pos in missing]]
+        if nan.size:
+            mask = np.zeros(len(values), dtype=bool)
+            mask[nan] = True
+            table = table.append_column('nan', pa.array(mask))
+    return table
+
+
+def _from_arrow(table: pa.Table) -> pd.Series:
+    """Inverse of :func:`_to_arrow` (the pandas metadata restores extension dtypes)."""
+    series = table.select(['values']).to_pandas()['values']
+    if 'nan' in table.column_names:
+        values = series.to_numpy(dtype=object, copy=True)
+        values[table.column('nan').to_numpy(zero_copy_only=False)] = np.nan
+        series = pd.Series(values, name=series.name, copy=False)
+    return series
+
+
+def _same_values(new: pd.Series, stored: pd.Series) -> bool:
+    """True if *new* holds exactly the values of *stored* (NaN == NaN)."""
+    if new.dtype != stored.dtype or len(new) != len(stored):
+        return False
+    if isinstance(new.dtype, pd.api.extensions.ExtensionDtype):
+        return bool(new.array.equals(stored.array))
+
+    a, b = new.to_numpy(), stored.to_numpy()
+    if a.ctypes.data == b.ctypes.data and a.strides == b.strides:
+        return True  # the stored array itself
+    if a.dtype != object:
+        # Bitwise comparison treats NaN/NaT like any other value
+        return bool(np.array_equal(np.ascontiguousarray(a).view(np.uint8),
+                                   np.ascontiguousarray(b).view(np.uint8)))
+
+    try:
+        positions = np.linspace(0, len(a) - 1, min(len(a), _SAMPLE_POSITIONS)).astype(np.int64)
+        for pos in positions:
+            x, y = a[pos], b[pos]
+            if not (x is y or bool(x == y) or (pd.isna(x) and pd.isna(y))):
+                return False
+        equal = a == b
+        if not isinstance(equal, np.ndarray):
+            return False
+        if not equal.all():
+            equal |= pd.isna(a) & pd.isna(b)
+        return bool(equal.all())
+    except (TypeError, ValueError):  # unorderable or array-valued cells
+        return False
 
 
 class DataVersionManager:
     """Manages version history for data preparation changes."""
-    
-    def __init__(self):
+
+    def __init__(self, memory_budget_mb: Optional[float] = DEFAULT_MEMORY_BUDGET_MB,
+                 spill_dir: Optional[str] = None):
+        """
+        Initialize the version manager.
+
+        Args:
+            memory_budget_mb: Memory kept for stored columns before old versions
+                              spill to disk (None disables spilling)
+            spill_dir: Directory for spilled columns (default: a temporary directory)
+        """
         self.versions: List[Dict[str, Any]] = []
         self.current_version = -1
-    
-    def save_version(self, df: pd.DataFrame, action: str, details: str = ""):
-        """Save a new version of the data."""
+        self.memory_budget_mb = memory_budget_mb
+
+        self._columns: Dict[int, _StoredColumn] = {}
+        self._column_ids = count()
+        self._spill_root = spill_dir
+        self._spill_tmp: Optional[tempfile.TemporaryDirectory] = None
+        self._view_operations: List[Tuple[int, Operation]] = []  # (version index, operation)
+
+    def save_version(self, df: pd.DataFrame, action: str, details: str = "",
+                     operation: Optional[Operation] = None):
+        """
+        Save a new version of the data (only changed columns are stored).
+
+        Args:
+            df: New data
+            action: Short description for the history
+            details: Longer description for the history
+            operation: Declarative form of the edit, for replay
+        """
+        # If we're not at the latest version, remove future versions
+        if self.current_version < len(self.versions) - 1:
+            self.versions = self.versions[:self.current_version + 1]
+            self._drop_unreferenced()
+            # View operations made on the discarded versions still apply
+            self._view_operations = [(min(i, self.current_version), operation)
+                                     for i, operation in self._view_operations]
+
+        index, column_ids = self._store_columns(df)
         version_info = {
-            'data': df.copy(),
             'action': action,
             'details': details,
             'timestamp': pd.Timestamp.now().strftime('%H:%M:%S'),
             'columns': list(df.columns),
             'rows': len(df),
-            'version_number': len(self.versions) + 1
+            'version_number': len(self.versions) + 1,
+            'index': index,
+            'column_ids': column_ids,
+            'operations': [operation] if operation is not None else [],
         }
-        
-        # If we're not at the latest version, remove future versions
-        if self.current_version < len(self.versions) - 1:
-            self.versions = self.versions[:self.current_version + 1]
-        
+
         self.versions.append(version_info)
         self.current_version = len(self.versions) - 1
-        
+        self._enforce_budget()
+
         return version_info['version_number']
-    
-    def get_current_data(self) -> Optional[pd.DataFrame]:
-        """Get current version of data."""
+
+    def record_operation(self, operation: Operation):
+        """Record a view-only operation (e.g. hiding columns); undo/redo does not revert it."""
         if self.current_version >= 0:
-            return self.versions[self.current_version]['data'].copy()
-        return None
-    
+            self._view_operations.append((self.current_version, operation))
+
+    def get_operation_log(self) -> OperationLog:
+        """Operations that lead from the first version to the current one, plus every view operation."""
+        log = OperationLog()
+        for i, version in enumerate(self.versions[:self.current_version + 1]):
+            if i > 0 and not version['operations']:
+                logger.warning(f"Version {version['version_number']} ({version['action']}) "
+                               "has no recorded operation and cannot be replayed")
+            for operation in version['operations']:
+                if operation.kind == 'reset':
+                    log = OperationLog()
+                else:
+                    log.operations.append(operation)
+            log.operations.extend(operation for at, operation in self._view_operations if at == i)
+        # Made on versions that are undone now, but still in effect in the editor
+        log.operations.extend(operation for at, operation in self._view_operations if at > self.current_version)
+        return log
+
+    def get_current_data(self, writable: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Get current version of data.
+
+        Args:
+            writable: Return an independent copy instead of the shared,
+                      read-only frame (for callers that edit in place)
+        """
+        if self.current_version < 0:
+            return None
+        version = self.versions[self.current_version]
+        columns = [self._load_column(column_id, version['index']) for column_id in version['column_ids']]
+        df = pd.DataFrame(dict(enumerate(columns)), index=version['index'], copy=False)
+        if not columns:
+            df = pd.DataFrame(index=version['index'])
+        df.columns = pd.Index(version['columns'])
+        return df.copy() if writable else df
+
     def can_undo(self) -> bool:
         """Check if undo is possible."""
         return self.current_version > 0
-    
+
     def can_redo(self) -> bool:
         """Check if redo is possible."""
         return self.current_version < len(self.versions) - 1
-    
+
     def undo(self) -> Optional[pd.DataFrame]:
         """Undo to previous version."""
         if self.can_undo():
             self.current_version -= 1
-            return self.get_current_data()
+            data = self.get_current_data()
+            self._enforce_budget()
+            return data
         return None
-    
+
     def redo(self) -> Optional[pd.DataFrame]:
         """Redo to next version."""
         if self.can_redo():
             self.current_version += 1
-            return self.get_current_data()
+            data = self.get_current_data()
+            self._enforce_budget()
+            return data
         return None
-    
+
     def get_version_history(self) -> List[Dict[str, Any]]:
         """Get version history for display."""
         return [
@@ -78,7 +267,7 @@ class DataVersionManager:
             }
             for i, v in enumerate(self.versions)
         ]
-    
+
     def get_summary(self) -> Dict[str, Any]:
         """Get version summary statistics."""
         return {
@@ -86,5 +275,110 @@ class DataVersionManager:
             'current_version': self.current_version + 1 if self.current_version >= 0 else 0,
             'changes_made': len(self.versions) - 1,  # Subtract initial version
             'can_undo': self.can_undo(),
-            'can_redo': self.can_redo()
-        }
\ No newline at end of file
+            'can_redo': self.can_redo(),
+            'stored_columns': len(self._columns),
+            'spilled_columns': sum(1 for col in self._columns.values() if col.series is None),
+            'memory_mb': round(self.memory_usage() / 1024 ** 2, 1),
+        }
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held in memory by stored columns."""
+        return sum(col.nbytes for col in self._columns.values() if col.series is not None)
+
+    # Column store
+
+    def _store_columns(self, df: pd.DataFrame) -> Tuple[pd.Index, List[int]]:
+        """Return the version's index and column ids, reusing unchanged columns."""
+        previous = self.versions[self.current_version] if self.current_version >= 0 else None
+        same_rows = previous is not None and previous['index'].equals(df.index)
+        index = previous['index'] if same_rows else df.index.copy()
+
+        by_name: Dict[Any, int] = {}
+        if same_rows:
+            for name, column_id in zip(previous['columns'], previous['column_ids']):
+                by_name.setdefault(name, column_id)
+
+        column_ids = []
+        for position, name in enumerate(df.columns):
+            series = df.iloc[:, position]
+            candidates = [by_name.get(name)]
+            if same_rows and position < len(previous['column_ids']):
+                candidates.append(previous['column_ids'][position])  # renamed in place
+            reused = next(
+                (cid for cid in candidates
+                 if cid is not None and _same_values(series, self._load_column(cid, index))),
+                None,
+            )
+            if reused is None:
+                stored = _frozen_copy(series, index)
+                reused = next(self._column_ids)
+                self._columns[reused] = _StoredColumn(stored, _estimate_nbytes(stored))
+            column_ids.append(reused)
+        return index, column_ids
+
+    def _load_column(self, column_id: int, index: pd.Index) -> pd.Series:
+        """Stored column, memory-mapping it back from disk if it was spilled."""
+        column = self._columns[column_id]
+        if column.series is None:
+            with pa.memory_map(str(column.path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+            column.series = _frozen_copy(_from_arrow(table), index)
+            column.path.unlink(missing_ok=True)
+            column.path = None
+        return column.series
+
+    def _drop_unreferenced(self):
+        referenced = {cid for version in self.versions for cid in version['column_ids']}
+        for column_id in [cid for cid in self._columns if cid not in referenced]:
+            column = self._columns.pop(column_id)
+            if column.path is not None:
+                column.path.unlink(missing_ok=True)
+
+    def _spill_dir(self) -> Path:
+        if self._spill_root is not None:
+            path = Path(self._spill_root)
+            path.mkdir(parents=True, exist_ok=True)
+            return path
+        if self._spill_tmp is None:
+            self._spill_tmp = tempfile.TemporaryDirectory(prefix="pete_versions_")
+        return Path(self._spill_tmp.name)
+
+    def _enforce_budget(self):
+        """Spill columns of the versions farthest from the current one until under budget."""
+        if self.memory_budget_mb is None or self.current_version < 0:
+            return
+        budget = self.memory_budget_mb * 1024 ** 2
+        in_use = self.memory_usage()
+        if in_use <= budget:
+            return
+
+        current = set(self.versions[self.current_version]['column_ids'])
+        distance: Dict[int, int] = {}
+        for i, version in enumerate(self.versions):
+            for column_id in version['column_ids']:
+                d = abs(i - self.current_version)
+                distance[column_id] = min(d, distance.get(column_id, d))
+
+        candidates = sorted(
+            (cid for cid, col in self._columns.items() if col.series is not None and cid not in current),
+            key=lambda cid: -distance.get(cid, 0),
+        )
+        for column_id in candidates:
+            if in_use <= budget:
+                break
+            column = self._columns[column_id]
+            path = self._spill_dir() / f"column_{column_id}.arrow"
+            try:
+                table = _to_arrow(column.series)
+                with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.debug(f"Column {column_id} kept in memory (cannot spill: {e})")
+                continue
+            column.series = None
+            column.path = path
+            in_use -= column.nbytes
+
+        if in_use > budget:
+            logger.warning(f"Version history uses {in_use / 1024 ** 2:.0f} MB "
+                           f"(budget {self.memory_budget_mb} MB); current version cannot spill")
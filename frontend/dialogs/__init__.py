@@ -11,11 +11,25 @@ Available dialogs:
 - DuplicateRemovalDialog: Duplicate row removal configuration
 """
 
-from .settings_dialog import SettingsDialog
-from .rule_mapping_dialog import RuleMappingDialog
-from .concatenation_dialog import ConcatenationDialog
-from .rename_column_dialog import RenameColumnDialog
-from .duplicate_removal_dialog import DuplicateRemovalDialog
+from importlib import import_module
+
+# Exported name -> module that defines it; imported on first use
+_EXPORTS = {
+    'SettingsDialog': '.settings_dialog',
+    'RuleMappingDialog': '.rule_mapping_dialog',
+    'ConcatenationDialog': '.concatenation_dialog',
+    'RenameColumnDialog': '.rename_column_dialog',
+    'DuplicateRemovalDialog': '.duplicate_removal_dialog',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'SettingsDialog',
@@ -23,4 +37,4 @@ __all__ = [
     'ConcatenationDialog',
     'RenameColumnDialog',
     'DuplicateRemovalDialog'
-]
\ No newline at end of file
+]
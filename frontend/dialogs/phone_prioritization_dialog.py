@@ -3,14 +3,20 @@ from __future__ import annotations
 
 from typing import List, Dict, Any
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, 
+    QDialog, QVBoxLayout, QTableView, QPushButton,
     QHBoxLayout, QLabel, QGroupBox, QGridLayout, QSpinBox, QComboBox,
     QScrollArea, QWidget, QSplitter, QFrame, QTextEdit, QCheckBox
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
 from backend.utils.phone_prioritizer import PhoneMeta
+from frontend.components.dataframe_table_model import DataFrameTableModel
 import pandas as pd
+import polars as pl
+
+PREVIEW_COLUMNS = [
+    "Phone Position", "Original Column", "Number", "Tag", "Status", "Type", "Call Cnt", "Priority Score"
+]
 
 
 class PhonePrioritizationDialog(QDialog):
@@ -268,11 +274,9 @@ class PhonePrioritizationDialog(QDialog):
         layout.addWidget(self.summary_text)
         
         # Mapping table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Phone Position", "Original Column", "Number", "Tag", "Status", "Type", "Call Cnt", "Priority Score"
-        ])
+        self.table_model = DataFrameTableModel(background=self._cell_color, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         layout.addWidget(self.table)
         
         # Toggle button
@@ -360,53 +364,33 @@ class PhonePrioritizationDialog(QDialog):
         # Show top 5 or all
         rows_to_show = recalculated_meta if self.show_all else recalculated_meta[:5]
         
-        self.table.setRowCount(len(rows_to_show))
-        
-        for row, m in enumerate(rows_to_show):
-            # Phone position (Phone 1, Phone 2, etc.)
-            position = f"Phone {row + 1}" if row < 5 else f"Excluded"
-            self.table.setItem(row, 0, QTableWidgetItem(position))
-            
-            # Original column
-            self.table.setItem(row, 1, QTableWidgetItem(m.column))
-            
-            # Number
-            number_item = QTableWidgetItem(m.number)
-            if not m.number.strip():
-                number_item.setBackground(QColor(255, 240, 240))  # Light red for empty
-            self.table.setItem(row, 2, number_item)
-            
-            # Tag
-            tag_item = QTableWidgetItem(m.tag)
-            if m.tag and m.tag != 'no_tag':
-                tag_item.setBackground(QColor(240, 255, 240))  # Light green for tags
-            self.table.setItem(row, 3, tag_item)
-            
-            # Status
-            status_item = QTableWidgetItem(m.status)
-            status_color = self._get_status_color(m.status)
-            status_item.setBackground(status_color)
-            self.table.setItem(row, 4, status_item)
-            
-            # Type
-            type_item = QTableWidgetItem(m.phone_type)
-            if m.phone_type == 'MOBILE':
-                type_item.setBackground(QColor(240, 240, 255))  # Light blue for mobile
-            self.table.setItem(row, 5, type_item)
-            
-            # Call count
-            call_item = QTableWidgetItem(str(m.call_count))
-            if m.call_count > 0:
-                call_item.setBackground(QColor(255, 255, 240))  # Light yellow for calls
-            self.table.setItem(row, 6, call_item)
-            
-            # Priority score
-            priority_item = QTableWidgetItem(f"{m.priority:.1f}")
-            priority_item.setBackground(self._get_priority_color(m.priority))
-            self.table.setItem(row, 7, priority_item)
-        
+        rows = [
+            (
+                f"Phone {row + 1}" if row < 5 else "Excluded",  # Phone 1, Phone 2, etc.
+                m.column, m.number, m.tag, m.status, m.phone_type,
+                str(m.call_count), f"{m.priority:.1f}",
+            )
+            for row, m in enumerate(rows_to_show)
+        ]
+        self.table_model.set_frame(pl.DataFrame(rows, schema=PREVIEW_COLUMNS, orient="row"))
         self.table.resizeColumnsToContents()
     
+    def _cell_color(self, column: str, text: str):
+        """Background colour of a preview cell."""
+        if column == "Number" and not text.strip():
+            return QColor(255, 240, 240)  # Light red for empty
+        if column == "Tag" and text and text != 'no_tag':
+            return QColor(240, 255, 240)  # Light green for tags
+        if column == "Status":
+            return self._get_status_color(text)
+        if column == "Type" and text == 'MOBILE':
+            return QColor(240, 240, 255)  # Light blue for mobile
+        if column == "Call Cnt" and text and float(text) > 0:
+            return QColor(255, 255, 240)  # Light yellow for calls
+        if column == "Priority Score":
+            return self._get_priority_color(float(text))
+        return None
+    
     def _recalculate_priorities(self) -> List[PhoneMeta]:
         """Recalculate priorities based on current rules."""
         recalculated = []
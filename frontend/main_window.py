@@ -6,7 +6,8 @@ The main application window that orchestrates the entire frontend.
 
 import os
 import sys
-import pandas as pd
+from typing import TYPE_CHECKING
+
 from loguru import logger
 
 # PyQt5 imports
@@ -16,22 +17,19 @@ from PyQt5.QtWidgets import (
     QPushButton, QScrollArea, QGridLayout, QHBoxLayout
 )
 from PyQt5.QtGui import QIcon, QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
 # Import local modules
 from frontend.constants import CLI_OPTIONS, DEFAULT_RULES_CONFIG
 from frontend.utils.logo_utils import create_logo_label
+from frontend.utils.progress_relay import ProgressEventRelay
+from frontend.utils.startup import preload_in_background
 
-# Import backend components
-from backend.utils.data_standardizer import DataStandardizer
-from backend.sheets_client import SheetsClient
-
-# Import modular frontend components
-from frontend.components import (
-    StartupMenu, FileSelector, DataPrepEditor, MappingUI, StandardizedPreviewUI
-)
-from frontend.toolsui import DataToolsPanel
-from frontend.dialogs import SettingsDialog
+# pandas, the backend analyzers and the data screens are imported by the
+# screens that use them (and preloaded in the background after startup),
+# so the main window paints without waiting for them
+if TYPE_CHECKING:
+    import pandas as pd
 
 class MainWindow(QMainWindow):
     """
@@ -59,6 +57,10 @@ class MainWindow(QMainWindow):
         self.current_mapping = None
         self.rules_config = DEFAULT_RULES_CONFIG.copy()
         
+        # Pipeline progress events (coalesced onto the GUI thread)
+        self.pipeline_relay = ProgressEventRelay(self)
+        self.pipeline_relay.events_received.connect(self._on_pipeline_events)
+        
         # Initialize user system
         self._initialize_user_system()
         
@@ -675,6 +677,8 @@ class MainWindow(QMainWindow):
             if visible
         ]
         
+        from frontend.components import StartupMenu
+        
         self.startup_menu = StartupMenu(
             parent=self,
             on_select=self.handle_menu_select,
@@ -686,6 +690,8 @@ class MainWindow(QMainWindow):
         """Show the file selection interface."""
         self.clear_layout()
         
+        from frontend.components import FileSelector
+        
         self.file_selector = FileSelector(
             parent=self,
             on_mapping_request=self.show_data_tools_panel,  # Go directly to tools panel
@@ -694,8 +700,10 @@ class MainWindow(QMainWindow):
         )
         self.layout.addWidget(self.file_selector)
     
-    def show_data_tools_panel(self, df: pd.DataFrame, pete_headers: list):
+    def show_data_tools_panel(self, df: "pd.DataFrame", pete_headers: list):
         """Show the data tools panel immediately after upload."""
+        from frontend.toolsui import DataToolsPanel
+        
         self.clear_layout()
         
         # Store Pete headers for later use
@@ -713,28 +721,24 @@ class MainWindow(QMainWindow):
         )
         self.layout.addWidget(self.data_tools_panel)
     
-    def _detect_data_source(self, df: pd.DataFrame) -> str:
+    def _detect_data_source(self, df: "pd.DataFrame") -> str:
         """Detect the data source based on column patterns."""
-        columns = [col.lower() for col in df.columns]
-        
-        # Check for REISIFT patterns  
-        reisift_indicators = ['mls', 'deed', 'foreclosure date', 'property taxes', 'exported from reisift.io']
-        if any(indicator in ' '.join(columns) for indicator in reisift_indicators):
-            return "REISIFT"
-        
-        # Check for other known sources
-        # TODO: Add other data source patterns
+        from backend.utils.source_profiles import detect_profile
         
-        return "Unknown"
+        # Source patterns live with the read-time dtype profiles
+        profile = detect_profile(list(df.columns))
+        return profile.name if profile else "Unknown"
     
-    def _proceed_from_tools_to_pete(self, prepared_df: pd.DataFrame, mapping_config: dict):
+    def _proceed_from_tools_to_pete(self, prepared_df: "pd.DataFrame", mapping_config: dict):
         """Proceed from data tools to Pete mapping."""
         # Store the mapping configuration for the session
         self.current_mapping_config = mapping_config
         self.show_mapping_ui(prepared_df, self.current_pete_headers)
     
-    def show_data_prep_editor(self, df: pd.DataFrame, pete_headers: list):
+    def show_data_prep_editor(self, df: "pd.DataFrame", pete_headers: list):
         """Show the data preparation editor before Pete mapping."""
+        from frontend.components import DataPrepEditor
+        
         self.clear_layout()
         
         # Store Pete headers for later use
@@ -748,12 +752,14 @@ class MainWindow(QMainWindow):
         )
         self.layout.addWidget(self.data_prep_editor)
     
-    def proceed_to_pete_mapping(self, prepared_df: pd.DataFrame):
+    def proceed_to_pete_mapping(self, prepared_df: "pd.DataFrame"):
         """Proceed to Pete mapping with prepared data."""
         self.show_mapping_ui(prepared_df, self.current_pete_headers)
     
-    def show_mapping_ui(self, df: pd.DataFrame, pete_headers: list):
+    def show_mapping_ui(self, df: "pd.DataFrame", pete_headers: list):
         """Show the mapping interface."""
+        from frontend.components import MappingUI
+        
         self.clear_layout()
         
         # Store current data
@@ -778,8 +784,10 @@ class MainWindow(QMainWindow):
         else:
             self.show_file_selector()
     
-    def show_standardized_preview(self, df: pd.DataFrame):
+    def show_standardized_preview(self, df: "pd.DataFrame"):
         """Show the standardized data preview."""
+        from frontend.components import StandardizedPreviewUI
+        
         self.clear_layout()
         
         self.preview_ui = StandardizedPreviewUI(
@@ -835,6 +843,8 @@ class MainWindow(QMainWindow):
     
     def open_settings(self):
         """Open the settings dialog."""
+        from frontend.dialogs import SettingsDialog
+        
         settings_dialog = SettingsDialog(
             parent=self,
             rules=self.rules_config,
@@ -912,9 +922,6 @@ class MainWindow(QMainWindow):
         """Create a pipeline status monitoring card."""
         from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar
         from PyQt5.QtGui import QFont
-        from PyQt5.QtCore import QTimer, Qt
-        import os
-        import time
         
         card = QFrame()
         card.setFrameStyle(QFrame.Box)
@@ -1008,158 +1015,69 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(button_layout)
         
-        # Set up auto-refresh timer
-        self.pipeline_timer = QTimer()
-        self.pipeline_timer.timeout.connect(self._refresh_pipeline_status)
-        self.pipeline_timer.start(5000)  # Refresh every 5 seconds
+        # Show the last run; live runs update the card through pipeline events
+        self._refresh_pipeline_status()
         
         return card
     
     def _refresh_pipeline_status(self):
-        """Refresh the pipeline status display."""
+        """Show the latest event of the most recent pipeline run log."""
+        from backend.utils.progress_events import latest_run_log, read_events
+        
+        if self.pipeline_relay.bus is not None:
+            # A run in this window is reporting live
+            if self.pipeline_relay.last_event is not None:
+                self._show_pipeline_event(self.pipeline_relay.last_event)
+            return
+        
         try:
-            # Check if widgets still exist before accessing them
-            if not hasattr(self, 'current_step_label') or self.current_step_label is None:
-                return
-            if not hasattr(self, 'progress_bar') or self.progress_bar is None:
-                return
-            if not hasattr(self, 'pipeline_details') or self.pipeline_details is None:
-                return
-                
-            # Check for recent pipeline activity
-            import glob
-            import time
-            from pathlib import Path
-            
-            # Look for recent export files
-            export_files = glob.glob("data/exports/pete_export_*.csv") + glob.glob("data/exports/pete_export_*.xlsx")
-            owner_files = glob.glob("data/exports/owner_objects_summary_*.csv") + glob.glob("data/exports/owner_objects_summary_*.xlsx")
-            
-            # Check for recent data files
-            data_files = glob.glob("data/processed/enhanced_data/*/enhanced_data.csv")
-            
-            if export_files or owner_files:
-                # Pipeline completed recently
-                try:
-                    self.current_step_label.setText("✅ Pipeline Completed!")
-                    self.current_step_label.setStyleSheet("color: #28a745; font-weight: bold;")
-                    self.progress_bar.setValue(100)
-                    
-                    latest_export = max(export_files, key=os.path.getctime) if export_files else "None"
-                    latest_owner = max(owner_files, key=os.path.getctime) if owner_files else "None"
-                    
-                    # Calculate completion time
-                    completion_time = os.path.getctime(latest_export if export_files else latest_owner)
-                    time_since_completion = time.time() - completion_time
-                    
-                    self.pipeline_details.setText(
-                        f"Latest export: {os.path.basename(latest_export) if export_files else 'None'}\n"
-                        f"Latest owner analysis: {os.path.basename(latest_owner) if owner_files else 'None'}\n"
-                        f"Completed {int(time_since_completion)}s ago"
-                    )
-                except RuntimeError:
-                    # Widget was deleted, stop refreshing
-                    return
-                
-            elif data_files:
-                # Pipeline in progress
-                latest_data = max(data_files, key=os.path.getctime)
-                file_time = os.path.getctime(latest_data)
-                time_diff = time.time() - file_time
-                
-                if time_diff < 300:  # Within 5 minutes
-                    try:
-                        self.current_step_label.setText("🔄 Pipeline Running...")
-                        self.current_step_label.setStyleSheet("color: #ffc107; font-weight: bold;")
-                        
-                        # Estimate progress and time remaining
-                        progress, eta = self._estimate_pipeline_progress(time_diff)
-                        self.progress_bar.setValue(progress)
-                        
-                        # Format ETA nicely
-                        if eta > 60:
-                            eta_text = f"{int(eta/60)}m {int(eta%60)}s remaining"
-                        else:
-                            eta_text = f"{int(eta)}s remaining"
-                        
-                        self.pipeline_details.setText(
-                            f"Processing data... (Last update: {int(time_diff)}s ago)\n"
-                            f"⏱️ Estimated: {eta_text}\n"
-                            f"📊 Progress: {progress}%"
-                        )
-                    except RuntimeError:
-                        # Widget was deleted, stop refreshing
-                        return
-                else:
-                    try:
-                        self.current_step_label.setText("⏸️ Pipeline Paused")
-                        self.current_step_label.setStyleSheet("color: #ffc107; font-weight: bold;")
-                        self.progress_bar.setValue(50)
-                        self.pipeline_details.setText("Pipeline may be paused or completed")
-                    except RuntimeError:
-                        # Widget was deleted, stop refreshing
-                        return
-                    
-            else:
-                # No recent activity
-                try:
-                    self.current_step_label.setText("⏳ No Active Pipeline")
-                    self.current_step_label.setStyleSheet("color: #666; font-weight: bold;")
-                    self.progress_bar.setValue(0)
-                    self.pipeline_details.setText("Ready to start pipeline")
-                except RuntimeError:
-                    # Widget was deleted, stop refreshing
-                    return
-                
-        except Exception as e:
-            try:
-                if hasattr(self, 'pipeline_details') and self.pipeline_details is not None:
-                    self.pipeline_details.setText(f"Error checking status: {str(e)}")
-            except RuntimeError:
-                # Widget was deleted, ignore error
-                pass
-    
-    def _estimate_pipeline_progress(self, time_since_last_update: float) -> tuple[int, float]:
-        """
-        Estimate pipeline progress and time remaining based on typical timings.
+            log_path = latest_run_log()
+            events = read_events(log_path) if log_path else []
+        except OSError as e:
+            events = []
+            logger.warning(f"Could not read pipeline run log: {e}")
+        
+        if events:
+            self._show_pipeline_event(events[-1])
+            return
         
-        Args:
-            time_since_last_update: Seconds since last file update
-            
-        Returns:
-            tuple: (progress_percentage, estimated_seconds_remaining)
-        """
-        # Typical pipeline timings for 310K rows (based on our speed tests)
-        typical_timings = {
-            'load': 5,      # 5 seconds
-            'clean': 10,    # 10 seconds  
-            'filter': 5,    # 5 seconds
-            'phones': 15,   # 15 seconds
-            'owners': 30,   # 30 seconds
-            'mapping': 10,  # 10 seconds
-            'standardize': 5, # 5 seconds
-            'export_csv': 2,  # 2 seconds
-            'export_excel': 52, # 52 seconds (xlsxwriter) - 310K rows / 6000 rows/sec
-            'owner_excel': 34   # 34 seconds (xlsxwriter) - 270K rows / 8000 rows/sec
-        }
+        try:
+            self.current_step_label.setText("⏳ No Active Pipeline")
+            self.current_step_label.setStyleSheet("color: #666; font-weight: bold;")
+            self.progress_bar.setValue(0)
+            self.pipeline_details.setText("Ready to start pipeline")
+        except (AttributeError, RuntimeError):
+            # Card not built yet or already deleted
+            pass
+    
+    def _on_pipeline_events(self, events: list):
+        """Coalesced pipeline progress events from the relay."""
+        self._show_pipeline_event(events[-1])
+    
+    def _show_pipeline_event(self, event):
+        """Show one pipeline progress event on the status card."""
+        import time
+        from backend.utils.progress_events import RUN_FAILED, RUN_FINISHED
         
-        total_expected_time = sum(typical_timings.values())
-        
-        # If we're in the export phase (after CSV is done), estimate based on Excel export
-        if time_since_last_update > 80:  # Likely in Excel export phase
-            # Assume we're in Excel export (52s) or owner Excel export (34s)
-            if time_since_last_update < 132:  # Still in main Excel export
-                progress = 85 + (time_since_last_update - 80) / 52 * 10  # 85-95%
-                eta = max(0, 52 - (time_since_last_update - 80))
-            else:  # In owner Excel export
-                progress = 95 + (time_since_last_update - 132) / 34 * 5  # 95-100%
-                eta = max(0, 34 - (time_since_last_update - 132))
+        if event.status == RUN_FINISHED:
+            step_text, color = "✅ Pipeline Completed!", "#28a745"
+        elif event.status == RUN_FAILED or event.status == "failed":
+            step_text, color = "❌ Pipeline Failed", "#dc3545"
         else:
-            # Estimate based on typical progress
-            progress = min(85, (time_since_last_update / total_expected_time) * 85)
-            eta = max(0, total_expected_time - time_since_last_update)
+            step_text, color = f"🔄 {event.stage or 'Pipeline'} ({event.stage_index + 1}/{event.stage_count or 1})", "#ffc107"
+        
+        details = event.describe()
+        if event.status in (RUN_FINISHED, RUN_FAILED):
+            details += f"\nRun {event.run_id}, {int(time.time() - event.timestamp)}s ago"
         
-        return int(progress), eta
+        try:
+            self.current_step_label.setText(step_text)
+            self.current_step_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+            self.progress_bar.setValue(event.overall_percent)
+            self.pipeline_details.setText(details)
+        except (AttributeError, RuntimeError):
+            # Card not built yet or already deleted
+            pass
     
     def _view_pipeline_logs(self):
         """View pipeline logs."""
@@ -1206,18 +1124,19 @@ class MainWindow(QMainWindow):
     def _load_full_owner_data(self):
         """Load the full owner objects data for detailed analysis."""
         try:
-            from backend.utils.owner_persistence_manager import load_property_owners_persistent
+            from backend.utils.owner_data_service import get_owner_data_service
             from PyQt5.QtWidgets import QMessageBox
             
-            # Show loading message
-            QMessageBox.information(self, "Loading Data", "Loading 269,669 owner objects... This may take a moment.")
+            service = get_owner_data_service()
+            if service.snapshot is None:
+                # Show loading message
+                QMessageBox.information(self, "Loading Data", "Loading owner objects... This may take a moment.")
             
-            # Load the full data
-            owner_objects, enhanced_df = load_property_owners_persistent()
+            # Shared with the owner dashboard and export screens (read from disk once)
+            owner_objects = service.load().owners
             
             if owner_objects:
                 self.full_owner_objects = owner_objects
-                self.enhanced_df = enhanced_df
                 self._populate_owner_table_full()
                 
                 QMessageBox.information(self, "Success", f"Loaded {len(owner_objects):,} owner objects successfully!")
@@ -1228,39 +1147,10 @@ class MainWindow(QMainWindow):
             from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to load owner data: {str(e)}")
     
-    def _populate_owner_table_sample(self):
-        """Populate the owner table with sample data."""
-        from PyQt5.QtWidgets import QTableWidgetItem
-        from PyQt5.QtCore import Qt
-        
-        # Add sample rows to show the table structure
-        sample_data = [
-            ["John Smith", "123 Main St", "456 Oak Ave", "8/10", "Mobile", "2", "$225,000", "$450,000", "Individual", "High"],
-            ["ABC Properties LLC", "456 Oak Ave", "789 Business Blvd", "6/10", "Landline", "5", "$240,000", "$1,200,000", "LLC", "Medium"],
-            ["Mary Johnson", "789 Pine Rd", "321 Home St", "9/10", "Mobile", "1", "$320,000", "$320,000", "Individual", "High"],
-            ["XYZ Holdings", "321 Elm St", "654 Corporate Dr", "7/10", "Mobile", "8", "$262,500", "$2,100,000", "LLC", "High"],
-            ["Bob Wilson", "654 Maple Dr", "987 Personal Ave", "5/10", "Landline", "1", "$280,000", "$280,000", "Individual", "Medium"]
-        ]
-        
-        self.owner_table.setRowCount(len(sample_data))
-        
-        for row, data in enumerate(sample_data):
-            for col, value in enumerate(data):
-                item = QTableWidgetItem(str(value))
-                self.owner_table.setItem(row, col, item)
-        
-        # Add note about loading full data
-        note_item = QTableWidgetItem("📊 Click 'Load Full Owner Data' to see all 269,669 owners")
-        note_item.setBackground(Qt.lightGray)
-        self.owner_table.insertRow(0)
-        self.owner_table.setItem(0, 0, note_item)
-        self.owner_table.setSpan(0, 0, 1, 8)  # Span across all columns
-    
     def _populate_owner_table_full(self):
-        """Populate the owner table with hierarchical owner grouping - ALL 200k+ owners."""
-        from PyQt5.QtWidgets import QTableWidgetItem
-        from PyQt5.QtCore import Qt
+        """Show ALL 200k+ owners (grouped by mailing address) through a virtual table model."""
         from backend.utils.hierarchical_owner_grouping import HierarchicalOwnerGrouper
+        from frontend.components.owner_dashboard.owner_table_model import OwnerTableModel
         
         if not hasattr(self, 'full_owner_objects') or not self.full_owner_objects:
             return
@@ -1269,118 +1159,52 @@ class MainWindow(QMainWindow):
         grouper = HierarchicalOwnerGrouper()
         owner_groups = grouper.group_owners_by_mailing_address(self.full_owner_objects)
         
-        # Display all owners (no limit - show all 200k+)
-        self.owner_table.setRowCount(len(owner_groups))
+        # Cells are formatted on demand and rows are fetched in batches while scrolling
+        self.owner_table_model = OwnerTableModel.from_owner_groups(owner_groups, parent=self)
+        view = self._owner_table_view()
+        view.setModel(self.owner_table_model)
+        for i, config in enumerate(self.owner_table_model.column_configs):
+            view.setColumnWidth(i, config.get('width', 150))
         
-        for row, owner_group in enumerate(owner_groups):
-            # Owner Name
-            self.owner_table.setItem(row, 0, QTableWidgetItem(owner_group.owner_name))
-            
-            # Mailing Address (unique key)
-            self.owner_table.setItem(row, 1, QTableWidgetItem(owner_group.mailing_address))
-            
-            # Property Count
-            self.owner_table.setItem(row, 2, QTableWidgetItem(str(owner_group.property_count)))
-            
-            # Total Portfolio Value
-            total_value = f"${owner_group.total_value:,.0f}" if owner_group.total_value else "$0"
-            self.owner_table.setItem(row, 3, QTableWidgetItem(total_value))
-            
-            # Phone Quality
-            phone_quality = f"{owner_group.phone_quality:.1f}/10" if owner_group.phone_quality else "N/A"
-            self.owner_table.setItem(row, 4, QTableWidgetItem(phone_quality))
-            
-            # Phone Count
-            phone_count = f"{owner_group.correct_phones}/{owner_group.phone_count}"
-            self.owner_table.setItem(row, 5, QTableWidgetItem(phone_count))
-            
-            # Best Contact
-            best_contact = owner_group.best_contact if owner_group.best_contact else "Unknown"
-            self.owner_table.setItem(row, 6, QTableWidgetItem(best_contact))
-            
-            # Owner Type
-            owner_type = "LLC/Business" if owner_group.is_business else "Individual"
-            self.owner_table.setItem(row, 7, QTableWidgetItem(owner_type))
-            
-            # Skip Trace Priority
-            if owner_group.confidence_score:
-                if owner_group.confidence_score >= 0.8:
-                    priority = "High"
-                elif owner_group.confidence_score >= 0.6:
-                    priority = "Medium"
-                else:
-                    priority = "Low"
-            else:
-                priority = "Unknown"
-            self.owner_table.setItem(row, 8, QTableWidgetItem(priority))
-            
-            # Property Addresses (comma-separated list)
-            prop_addresses = ", ".join([p['property_address'] for p in owner_group.properties[:3]])
-            if len(owner_group.properties) > 3:
-                prop_addresses += f" (+{len(owner_group.properties) - 3} more)"
-            self.owner_table.setItem(row, 9, QTableWidgetItem(prop_addresses))
-        
-        # Add summary note
-        note_item = QTableWidgetItem(f"📊 Showing ALL {len(owner_groups):,} owners grouped by mailing address (sorted by property count)")
-        note_item.setBackground(Qt.lightGray)
-        self.owner_table.insertRow(0)
-        self.owner_table.setItem(0, 0, note_item)
-        self.owner_table.setSpan(0, 0, 1, 10)  # Span across all columns
+        # Summary note
+        self.statusBar().showMessage(
+            f"📊 Showing ALL {len(owner_groups):,} owners grouped by mailing address (sorted by property count)"
+        )
+    
+    def _owner_table_view(self):
+        """Return the owner table as a QTableView, swapping out a QTableWidget if needed."""
+        from PyQt5.QtWidgets import QTableView, QTableWidget, QAbstractItemView
+        
+        current = getattr(self, 'owner_table', None)
+        if isinstance(current, QTableView) and not isinstance(current, QTableWidget):
+            return current
+        
+        view = QTableView()
+        view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        view.setAlternatingRowColors(True)
+        view.setSortingEnabled(True)
+        view.horizontalHeader().setStretchLastSection(True)
+        
+        parent_layout = current.parentWidget().layout() if current is not None and current.parentWidget() else None
+        if parent_layout is not None:
+            parent_layout.replaceWidget(current, view)
+            current.deleteLater()
+        else:
+            self.layout.addWidget(view)
+        self.owner_table = view
+        return view
     
     def _show_custom_export_ui(self):
         """Show the custom export UI for owner data."""
         try:
             from frontend.components.custom_export.custom_export_ui import CustomExportUI
-            from PyQt5.QtWidgets import QDialog
-            
-            # Create dialog
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Custom Export - Owner Analysis")
-            dialog.resize(1000, 700)
-            
-            # Create custom export UI
-            export_ui = CustomExportUI()
-            
-            # If we have full owner data, pass it to the export UI
-            if hasattr(self, 'full_owner_objects') and self.full_owner_objects:
-                # Convert owner objects to exportable format
-                export_data = []
-                for owner in self.full_owner_objects[:1000]:  # Limit for export
-                    # Get owner name
-                    if owner.individual_name:
-                        owner_name = owner.individual_name
-                    elif owner.business_name:
-                        owner_name = owner.business_name
-                    else:
-                        owner_name = "Unknown"
-                    
-                    # Get property address
-                    if owner.property_addresses:
-                        property_address = owner.property_addresses[0]
-                    elif owner.property_address:
-                        property_address = owner.property_address
-                    else:
-                        property_address = "Unknown"
-                    
-                    export_data.append({
-                        'owner_name': owner_name,
-                        'property_address': property_address,
-                        'phone_quality': owner.phone_quality_score,
-                        'best_contact': owner.best_contact_method or 'Unknown',
-                        'property_count': owner.property_count or 1,
-                        'total_value': owner.total_property_value or 0,
-                        'llc_status': 'LLC' if owner.is_business_owner else 'Individual',
-                        'confidence_score': owner.confidence_score or 0
-                    })
-                
-                export_ui.set_export_data(export_data)
-            
-            # Add to dialog
-            dialog_layout = QVBoxLayout(dialog)
-            dialog_layout.addWidget(export_ui)
             
-            # Show dialog
-            dialog.exec_()
+            # Exports the shared owner dataset (no copy of the owner objects)
+            export_ui = CustomExportUI(parent=self)
+            export_ui.setWindowTitle("Custom Export - Owner Analysis")
+            export_ui.resize(1000, 700)
+            export_ui.exec_()
             
         except Exception as e:
             from PyQt5.QtWidgets import QMessageBox
@@ -1422,37 +1246,45 @@ class MainWindow(QMainWindow):
             progress.setAutoClose(False)
             progress.show()
             
+            from backend.utils.progress_events import ProgressEventBus
+            
+            # Stages publish progress events on the bus; the relay brings them
+            # to this thread (coalesced) and the run log keeps all of them
+            csv_files = [f for f in upload_files if f.endswith('.csv')]
+            filepath = max(csv_files or upload_files, key=os.path.getmtime)
+            events = ProgressEventBus()
+            
             # Run pipeline in background thread
             class PipelineThread(QThread):
-                progress_updated = pyqtSignal(int, str)
                 finished = pyqtSignal(bool, str)
                 
                 def run(self):
                     try:
-                        # Import and run the pipeline
-                        from test_ultra_fast_pipeline import run_ultra_fast_pipeline
-                        
-                        # Update progress
-                        self.progress_updated.emit(10, "Loading data...")
+                        from backend.utils.ultra_fast_processor import process_complete_pipeline_ultra_fast
                         
-                        # Run the pipeline
-                        result = run_ultra_fast_pipeline()
-                        
-                        if result:
-                            self.progress_updated.emit(100, "Pipeline completed successfully!")
-                            self.finished.emit(True, "Pipeline completed successfully!")
-                        else:
-                            self.finished.emit(False, "Pipeline failed")
+                        df, _ = process_complete_pipeline_ultra_fast(filepath, events=events)
+                        self.finished.emit(True, f"Pipeline completed successfully! ({len(df):,} rows)")
                             
                     except Exception as e:
                         self.finished.emit(False, f"Pipeline error: {str(e)}")
             
+            def show_progress(batch):
+                event = batch[-1]
+                progress.setValue(event.overall_percent)
+                progress.setLabelText(event.describe())
+            
+            self.pipeline_relay.events_received.connect(show_progress)
+            self.pipeline_relay.watch(events)
+            
+            def finished(success, message):
+                self.pipeline_relay.stop()
+                self.pipeline_relay.events_received.disconnect(show_progress)
+                progress.close()
+                self._on_pipeline_finished(success, message)
+            
             # Create and start thread
             self.pipeline_thread = PipelineThread()
-            self.pipeline_thread.progress_updated.connect(progress.setValue)
-            self.pipeline_thread.progress_updated.connect(lambda val, text: progress.setLabelText(text))
-            self.pipeline_thread.finished.connect(progress.close)
-            self.pipeline_thread.finished.connect(self._on_pipeline_finished)
+            self.pipeline_thread.finished.connect(finished)
             
             self.pipeline_thread.start()
             
@@ -1484,6 +1316,9 @@ def main():
     window = MainWindow()
     window.show()
     
+    # Load pandas and the analyzers while the user looks at the dashboard
+    QTimer.singleShot(0, preload_in_background)
+    
     # Start event loop
     sys.exit(app.exec_())
 
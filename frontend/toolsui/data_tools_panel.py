@@ -15,6 +15,7 @@ from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtCore import Qt, pyqtSignal
 
 from frontend.components.base_component import BaseComponent
+from backend.utils.operation_log import Operation
 from frontend.data_prep import DataPrepEditor
 from frontend.dialogs.duplicate_removal_dialog import DuplicateRemovalDialog
 from frontend.utils.resizable_widget import create_tools_panel
@@ -332,50 +333,15 @@ class DataToolsPanel(BaseComponent):
                 self._apply_duplicate_removal(config)
     
     def _apply_duplicate_removal(self, config):
-        """Apply duplicate removal with specified configuration."""
-        current_df = self.data_prep_editor.version_manager.get_current_data()
-        if current_df is None:
-            return
+        """Apply duplicate removal with specified configuration (in the background)."""
+        self.status_label.setText('⏳ Removing duplicates...')
         
-        try:
-            original_count = len(current_df)
-            
-            # Apply duplicate removal based on configuration
-            if config['method'] == 'all_columns':
-                # Remove duplicates based on all columns
-                new_df = current_df.drop_duplicates(keep=config['keep'])
-            elif config['method'] == 'selected_columns':
-                # Remove duplicates based on selected columns only
-                subset_columns = config['columns']
-                new_df = current_df.drop_duplicates(subset=subset_columns, keep=config['keep'])
-            elif config['method'] == 'ignore_case':
-                # Case-insensitive duplicate removal
-                if config.get('columns'):
-                    # Create temporary columns with lowercase values for comparison
-                    temp_df = current_df.copy()
-                    for col in config['columns']:
-                        if temp_df[col].dtype == 'object':  # String columns only
-                            temp_df[f'{col}_lower'] = temp_df[col].astype(str).str.lower()
-                    
-                    # Get original columns + temp lowercase columns
-                    comparison_cols = config['columns'] + [f'{col}_lower' for col in config['columns'] if temp_df[col].dtype == 'object']
-                    temp_df = temp_df.drop_duplicates(subset=comparison_cols, keep=config['keep'])
-                    
-                    # Remove temporary columns and return
-                    temp_cols_to_drop = [f'{col}_lower' for col in config['columns'] if f'{col}_lower' in temp_df.columns]
-                    new_df = temp_df.drop(columns=temp_cols_to_drop)
-                else:
-                    new_df = current_df.drop_duplicates(keep=config['keep'])
-            elif config['method'] == 'address_based_grouping':
-                # Address-based grouping (basic version)
-                new_df = current_df.drop_duplicates(subset=['Property address'], keep=config['keep'])
-            elif config['method'] == 'smart_seller_creation':
-                # Smart seller creation with phone prioritization
-                from backend.utils.ownership_analysis import deduplicate_by_mailing_address
-                new_df = deduplicate_by_mailing_address(current_df)
-            else:
-                new_df = current_df.drop_duplicates(keep=config['keep'])
-            
+        def remove(current_df, context):
+            new_df = _deduplicate(current_df, config)
+            return len(current_df), new_df
+        
+        def save(result):
+            original_count, new_df = result
             removed_count = original_count - len(new_df)
             
             if removed_count == 0:
@@ -400,11 +366,19 @@ class DataToolsPanel(BaseComponent):
                 details = f"Method: {config['method']} (keep={config['keep']})"
                 self.status_label.setText(f'✅ Removed {removed_count} duplicate rows ({len(new_df)} rows remaining)')
             
-            self.data_prep_editor.version_manager.save_version(new_df, action, details)
+            operation = Operation('drop_duplicates', {
+                'method': config['method'],
+                'columns': list(config.get('columns') or []),
+                'keep': config.get('keep', 'first'),
+            })
+            self.data_prep_editor.version_manager.save_version(new_df, action, details, operation)
             self.data_prep_editor._refresh_data_view()
-            
-        except Exception as e:
-            self.status_label.setText(f'❌ Error removing duplicates: {str(e)}')
+        
+        self.data_prep_editor.run_job(
+            'Remove duplicates', remove, save,
+            on_error=lambda error: self.status_label.setText(f'❌ Error removing duplicates: {error}'),
+            on_cancelled=lambda: self.status_label.setText('⏹ Duplicate removal cancelled'),
+        )
     
     def _sample_data(self):
         """Sample large datasets."""
@@ -421,68 +395,92 @@ class DataToolsPanel(BaseComponent):
     def _strip_trailing_dot(self):
         """Strip trailing .0 from numeric-like strings across the dataframe."""
         from backend.utils.high_performance_processor import clean_dataframe_fast
-        current_df = self.data_prep_editor.get_prepared_data()
-        if current_df is None:
-            return
-        cleaned = clean_dataframe_fast(current_df)
-        # Save version & refresh view
-        self.data_prep_editor.version_manager.save_version(cleaned, "Strip .0", "Removed trailing .0 from numeric-like strings")
-        self.data_prep_editor._refresh_data_view()
-
-        QMessageBox.information(self, "Trailing .0 Removed", "All numeric-like strings with trailing .0 have been cleaned.")
+        
+        def save(cleaned):
+            # Save version & refresh view
+            self.data_prep_editor.version_manager.save_version(
+                cleaned, "Strip .0", "Removed trailing .0 from numeric-like strings", Operation('strip_trailing_dot')
+            )
+            self.data_prep_editor._refresh_data_view()
+            QMessageBox.information(self, "Trailing .0 Removed", "All numeric-like strings with trailing .0 have been cleaned.")
+        
+        self.data_prep_editor.run_job(
+            'Strip .0', lambda current_df, context: clean_dataframe_fast(current_df.copy()), save
+        )
 
     def _prioritize_phones(self):
         """Open dialog to prioritize phones and apply selection."""
         from backend.utils.high_performance_processor import prioritize_phones_fast  # Use fast processor
         from frontend.dialogs.phone_prioritization_dialog import PhonePrioritizationDialog
-
-        current_df = self.data_prep_editor.get_prepared_data()
-        if current_df is None:
-            return
-            
-        # Count original phone columns
-        original_phone_cols = [col for col in current_df.columns if col.startswith('Phone ') and not any(suffix in col for suffix in [' Status', ' Type', ' Tag'])]
         
-        # Get initial prioritization for preview
-        initial_df, meta = prioritize_phones_fast(current_df)
-        dlg = PhonePrioritizationDialog(meta, current_df, self)
+        def phone_columns(df):
+            return [col for col in df.columns if col.startswith('Phone ') and not any(suffix in col for suffix in [' Status', ' Type', ' Tag'])]
+        
+        def preview(current_df, context):
+            # Get initial prioritization for preview
+            _, meta = prioritize_phones_fast(current_df.copy())
+            return current_df, meta
         
-        if dlg.exec_():
+        def choose_rules(result):
+            current_df, meta = result
+            dlg = PhonePrioritizationDialog(meta, current_df, self)
+            if not dlg.exec_():
+                return
+            
             # Get the custom prioritization rules from dialog
             prioritization_rules = dlg.get_prioritization_rules()
+            original_phone_cols = phone_columns(current_df)
+            
+            def apply(df, context):
+                # Apply prioritization with custom rules
+                cleaned_df, _ = prioritize_phones_fast(df.copy(), prioritization_rules=prioritization_rules)
+                return cleaned_df
+            
+            def save(cleaned_df):
+                # Count remaining phone columns
+                remaining_phone_cols = phone_columns(cleaned_df)
+                
+                # Save version with custom rules info
+                rules_summary = f"Custom rules: Status={prioritization_rules['status_weights']['CORRECT']}, Type={prioritization_rules['type_weights']['MOBILE']}, Tags={prioritization_rules['tag_weights']['call_a01']}"
+                self.data_prep_editor.version_manager.save_version(
+                    cleaned_df, "Prioritize Phones (Custom Rules)", f"Applied custom prioritization rules: {rules_summary}",
+                    Operation('prioritize_phones', {'max_phones': 5, 'rules': prioritization_rules})
+                )
+                self.data_prep_editor._refresh_data_view()
+                
+                # Update status with clear feedback
+                reduced_count = len(original_phone_cols) - len(remaining_phone_cols)
+                self.status_label.setText(f'📞 Phone prioritization applied with custom rules: {len(original_phone_cols)} → {len(remaining_phone_cols)} columns ({reduced_count} removed)')
             
-            # Apply prioritization with custom rules
-            cleaned_df, meta = prioritize_phones_fast(current_df, prioritization_rules=prioritization_rules)
-            
-            # Count remaining phone columns
-            remaining_phone_cols = [col for col in cleaned_df.columns if col.startswith('Phone ') and not any(suffix in col for suffix in [' Status', ' Type', ' Tag'])]
-            
-            # Save version with custom rules info
-            rules_summary = f"Custom rules: Status={prioritization_rules['status_weights']['CORRECT']}, Type={prioritization_rules['type_weights']['MOBILE']}, Tags={prioritization_rules['tag_weights']['call_a01']}"
-            self.data_prep_editor.version_manager.save_version(
-                cleaned_df, "Prioritize Phones (Custom Rules)", f"Applied custom prioritization rules: {rules_summary}"
-            )
-            self.data_prep_editor._refresh_data_view()
-            
-            # Update status with clear feedback
-            reduced_count = len(original_phone_cols) - len(remaining_phone_cols)
-            self.status_label.setText(f'📞 Phone prioritization applied with custom rules: {len(original_phone_cols)} → {len(remaining_phone_cols)} columns ({reduced_count} removed)')
+            self.data_prep_editor.run_job('Prioritize phones', apply, save)
+        
+        self.data_prep_editor.run_job('Preview phone prioritization', preview, choose_rules)
 
     def _analyze_owners(self):
         """Analyze property ownership patterns and business entities."""
         from backend.utils.owner_analyzer import OwnerAnalyzer
-        from PyQt5.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout, QLabel
-        from PyQt5.QtCore import Qt
 
-        current_df = self.data_prep_editor.get_prepared_data()
-        if current_df is None:
-            return
+        analyzer = OwnerAnalyzer()
+        
+        def analyze(current_df, context):
+            results = analyzer.analyze_ownership(current_df.copy())
+            context.progress(90, 'Generating report')
+            return results, analyzer.generate_report(results)
+        
+        def failed(error):
+            QMessageBox.critical(self, "Analysis Error", f"Error during ownership analysis: {error}")
+            self.status_label.setText('❌ Ownership analysis failed')
+        
+        self.status_label.setText('⏳ Analyzing ownership...')
+        self.data_prep_editor.run_job(
+            'Owner analysis', analyze, lambda result: self._show_owner_analysis(*result), on_error=failed
+        )
+    
+    def _show_owner_analysis(self, results, report):
+        """Show the ownership analysis dialog."""
+        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout, QLabel
         
         try:
-            # Perform ownership analysis
-            analyzer = OwnerAnalyzer()
-            results = analyzer.analyze_ownership(current_df)
-            
             # Store results for preset saving
             self.last_owner_analysis_results = results
             
@@ -502,9 +500,6 @@ class DataToolsPanel(BaseComponent):
             analysis_text = QTextEdit()
             analysis_text.setReadOnly(True)
             
-            # Generate detailed report
-            report = analyzer.generate_report(results)
-            
             # Add key insights
             insights = f"""
 {report}
@@ -628,8 +623,12 @@ class DataToolsPanel(BaseComponent):
                 'prepared_shape': prepared_data.shape
             }
             
+            # Recorded edits, so the preset can be replayed on the next upload
+            operation_log = self.data_prep_editor.get_operation_log().to_list()
+            
             # Save comprehensive preset using user system
-            from backend.utils.user_manager import user_manager
+            from backend.utils.user_manager import get_user_manager
+            user_manager = get_user_manager()
             
             if user_manager.current_user:
                 preset_path = user_manager.save_user_preset(
@@ -638,7 +637,8 @@ class DataToolsPanel(BaseComponent):
                     prepared_df=prepared_data,
                     phone_prioritization_rules=phone_rules,
                     owner_analysis_results=owner_analysis,
-                    data_prep_summary=data_prep_summary
+                    data_prep_summary=data_prep_summary,
+                    operation_log=operation_log
                 )
             else:
                 # Fallback to direct preset manager
@@ -650,7 +650,8 @@ class DataToolsPanel(BaseComponent):
                     prepared_df=prepared_data,
                     phone_prioritization_rules=phone_rules,
                     owner_analysis_results=owner_analysis,
-                    data_prep_summary=data_prep_summary
+                    data_prep_summary=data_prep_summary,
+                    operation_log=operation_log
                 )
             
             QMessageBox.information(
@@ -752,4 +753,40 @@ class DataToolsPanel(BaseComponent):
             'prepared_shape': self.get_prepared_data().shape,
             'tools_used': [],  # TODO: Track which tools were used
             'version_summary': self.data_prep_editor.get_version_summary()
-        }
\ No newline at end of file
+        }
+
+
+def _deduplicate(current_df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
+    """Duplicate removal for one DuplicateRemovalDialog configuration."""
+    # Apply duplicate removal based on configuration
+    if config['method'] == 'all_columns':
+        # Remove duplicates based on all columns
+        return current_df.drop_duplicates(keep=config['keep'])
+    if config['method'] == 'selected_columns':
+        # Remove duplicates based on selected columns only
+        return current_df.drop_duplicates(subset=config['columns'], keep=config['keep'])
+    if config['method'] == 'ignore_case':
+        # Case-insensitive duplicate removal
+        if config.get('columns'):
+            # Create temporary columns with lowercase values for comparison
+            temp_df = current_df.copy()
+            for col in config['columns']:
+                if temp_df[col].dtype == 'object':  # String columns only
+                    temp_df[f'{col}_lower'] = temp_df[col].astype(str).str.lower()
+            
+            # Get original columns + temp lowercase columns
+            comparison_cols = config['columns'] + [f'{col}_lower' for col in config['columns'] if temp_df[col].dtype == 'object']
+            temp_df = temp_df.drop_duplicates(subset=comparison_cols, keep=config['keep'])
+            
+            # Remove temporary columns and return
+            temp_cols_to_drop = [f'{col}_lower' for col in config['columns'] if f'{col}_lower' in temp_df.columns]
+            return temp_df.drop(columns=temp_cols_to_drop)
+        return current_df.drop_duplicates(keep=config['keep'])
+    if config['method'] == 'address_based_grouping':
+        # Address-based grouping (basic version)
+        return current_df.drop_duplicates(subset=['Property address'], keep=config['keep'])
+    if config['method'] == 'smart_seller_creation':
+        # Smart seller creation with phone prioritization
+        from backend.utils.ownership_analysis import deduplicate_by_mailing_address
+        return deduplicate_by_mailing_address(current_df.copy())
+    return current_df.drop_duplicates(keep=config['keep'])
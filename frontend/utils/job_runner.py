@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Job Runner Utility
+
+Runs heavy data operations (duplicate removal, smart seller creation, phone
+prioritization, owner analysis, merges) on a ``QThreadPool`` so the GUI
+thread keeps painting.
+
+A job gets an immutable input snapshot (the read-only current version) and
+a :class:`JobContext` for progress reports and cooperative cancellation.
+Its result is delivered back on the GUI thread, where the caller saves the
+new version.  Jobs are keyed by dataset: while one heavy job runs for a
+dataset, further submissions for it are refused (backpressure), and a
+result computed from a snapshot that is no longer current can be
+discarded by the caller.
+"""
+
+import threading
+import traceback
+from itertools import count
+from typing import Any, Callable, Dict, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from loguru import logger
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+class JobContext:
+    """Handed to a job function: progress reporting and cancellation checks."""
+
+    def __init__(self, signals: "JobSignals", job_id: int):
+        self._signals = signals
+        self._job_id = job_id
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def check_cancelled(self):
+        """Raise :class:`JobCancelled` if cancellation was requested."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def progress(self, percent: int, message: str = ""):
+        """Report progress (0-100) and stop here if the job was cancelled."""
+        self.check_cancelled()
+        self._signals.progress.emit(self._job_id, int(percent), message)
+
+
+class JobSignals(QObject):
+    """Signals of one job (emitted from the worker thread, delivered on the GUI thread)."""
+
+    progress = pyqtSignal(int, int, str)  # job id, percent, message
+    finished = pyqtSignal(int, object)  # job id, result
+    failed = pyqtSignal(int, str)  # job id, error message
+    cancelled = pyqtSignal(int)  # job id
+
+
+class Job(QRunnable):
+    """One operation applied to one input snapshot."""
+
+    def __init__(self, job_id: int, key: str, name: str,
+                 fn: Callable[[Any, JobContext], Any], snapshot: Any):
+        super().__init__()
+        self.setAutoDelete(False)  # the runner keeps a reference until delivery
+        self.job_id = job_id
+        self.key = key
+        self.name = name
+        self.snapshot = snapshot
+        self.signals = JobSignals()
+        self.context = JobContext(self.signals, job_id)
+        self._fn = fn
+
+    def run(self):
+        try:
+            self.context.check_cancelled()
+            result = self._fn(self.snapshot, self.context)
+            self.context.check_cancelled()
+        except JobCancelled:
+            self.signals.cancelled.emit(self.job_id)
+        except Exception as e:
+            logger.error(f"Job '{self.name}' failed: {e}\n{traceback.format_exc()}")
+            self.signals.failed.emit(self.job_id, str(e))
+        else:
+            self.signals.finished.emit(self.job_id, result)
+
+
+class JobRunner(QObject):
+    """Submits jobs to a thread pool, at most one running job per key."""
+
+    job_started = pyqtSignal(str, str)  # key, job name
+    job_done = pyqtSignal(str)  # key (finished, failed or cancelled)
+
+    def __init__(self, pool: Optional[QThreadPool] = None, parent=None):
+        """
+        Args:
+            pool: Thread pool to run on (default: the global instance)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._active: Dict[str, Job] = {}
+        self._ids = count(1)
+
+    def submit(self, key: str, name: str, fn: Callable[[Any, JobContext], Any], snapshot: Any,
+               on_finished: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None,
+               on_progress: Optional[Callable[[int, str], None]] = None,
+               on_cancelled: Optional[Callable[[], None]] = None) -> Optional[Job]:
+        """
+        Run ``fn(snapshot, context)`` in the background.
+
+        Callbacks run on the GUI thread.  Returns the job, or ``None`` if a
+        job for *key* is still running.
+        """
+        if key in self._active:
+            logger.info(f"Job '{name}' refused: '{self._active[key].name}' is still running for {key}")
+            return None
+
+        job = Job(next(self._ids), key, name, fn, snapshot)
+        if on_progress:
+            job.signals.progress.connect(lambda _id, percent, message: on_progress(percent, message))
+        job.signals.finished.connect(lambda _id, result: self._deliver(job, on_finished, result))
+        job.signals.failed.connect(lambda _id, error: self._deliver(job, on_error, error))
+        job.signals.cancelled.connect(lambda _id: self._deliver(job, on_cancelled))
+
+        self._active[key] = job
+        self.job_started.emit(key, name)
+        self.pool.start(job)
+        return job
+
+    def _deliver(self, job: Job, callback: Optional[Callable], *args: Any):
+        self._active.pop(job.key, None)
+        self.job_done.emit(job.key)
+        if callback:
+            callback(*args)
+
+    def is_busy(self, key: str) -> bool:
+        return key in self._active
+
+    def active_job(self, key: str) -> Optional[Job]:
+        return self._active.get(key)
+
+    def cancel(self, key: str) -> bool:
+        """Request cancellation of the job running for *key*."""
+        job = self._active.get(key)
+        if job is None:
+            return False
+        job.context.cancel()
+        return True
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the pool is idle (for tests and shutdown)."""
+        return self.pool.waitForDone(msecs)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Owner Data Relay
+
+Qt side of the shared ``OwnerDataService``.  The service notifies its
+subscribers on the thread that loaded the dataset; the relay re-emits each
+new snapshot as a signal, which Qt queues onto the GUI thread for widgets.
+"""
+
+from typing import Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from backend.utils.owner_data_service import OwnerDataService, get_owner_data_service
+
+
+class OwnerDataRelay(QObject):
+    """Emits ``snapshot_changed`` for every owner dataset snapshot of the service."""
+
+    # OwnerDataSnapshot, or None when the dataset was released
+    snapshot_changed = pyqtSignal(object)
+
+    def __init__(self, service: Optional[OwnerDataService] = None, parent=None):
+        super().__init__(parent)
+        self.service = service or get_owner_data_service()
+        self._unsubscribe = unsubscribe = self.service.subscribe(self.snapshot_changed.emit)
+        self.destroyed.connect(lambda *_: unsubscribe())
+
+    @property
+    def snapshot(self):
+        """The service's current snapshot (None if nothing is loaded)."""
+        return self.service.snapshot
+
+    def close(self):
+        """Stop relaying snapshots."""
+        self._unsubscribe()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Progress Relay
+
+Brings pipeline progress events from a ``ProgressEventBus`` (filled by a
+worker thread) to the GUI thread.  A timer drains the bus at most
+``MAX_UPDATES_PER_SECOND`` times a second and emits the coalesced batch,
+so a stage that reports thousands of updates never floods the event loop.
+"""
+
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from backend.utils.progress_events import (
+    RUN_FAILED, RUN_FINISHED, ProgressEventBus, coalesce_events
+)
+
+MAX_UPDATES_PER_SECOND = 10
+
+
+class ProgressEventRelay(QObject):
+    """Drains a progress event bus on the GUI thread."""
+
+    # Coalesced list of ProgressEvent, oldest first (status changes are never dropped)
+    events_received = pyqtSignal(list)
+    run_finished = pyqtSignal(bool, str)  # success, message
+
+    def __init__(self, parent=None, updates_per_second: int = MAX_UPDATES_PER_SECOND):
+        super().__init__(parent)
+        self.bus: Optional[ProgressEventBus] = None
+        self.last_event = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000 / updates_per_second))
+        self._timer.timeout.connect(self.flush)
+
+    def watch(self, bus: ProgressEventBus):
+        """Start relaying the events of *bus*."""
+        self.bus = bus
+        self._timer.start()
+
+    def stop(self):
+        """Deliver what is still queued and stop relaying."""
+        self.flush()
+        self._timer.stop()
+        self.bus = None
+
+    def flush(self):
+        if self.bus is None:
+            return
+        events = coalesce_events(self.bus.drain())
+        if not events:
+            return
+        self.last_event = events[-1]
+        self.events_received.emit(events)
+        for event in events:
+            if event.status in (RUN_FINISHED, RUN_FAILED):
+                self.run_finished.emit(event.status == RUN_FINISHED, event.message)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Startup
+
+Keeps the GUI's startup path light and measures it.
+
+The main window only imports Qt and the small modules its first screen
+needs; pandas, polars and the backend analyzers are imported by the screens
+that use them.  ``preload_in_background`` imports them on a worker thread
+once the window is showing, so the first data screen usually finds them
+already loaded.
+
+``measure_startup`` runs ``python -X importtime -c "import <module>"`` in a
+fresh interpreter and reports the import time and which heavy libraries
+were loaded.  Run it as a benchmark with::
+
+    python -m frontend.utils.startup [--budget-ms 500] [--runs 3]
+
+It exits non-zero when the startup import exceeds the budget or loads one
+of ``HEAVY_MODULES``.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from loguru import logger
+
+STARTUP_MODULE = "frontend.main_window"
+STARTUP_BUDGET_MS = 500
+
+# Libraries the startup path must not import (they are loaded on demand)
+HEAVY_MODULES = ("pandas", "polars", "pyarrow", "matplotlib", "plotly", "gspread", "openpyxl")
+
+# Imported on a worker thread after the main window is shown. Only modules
+# without Qt widgets at import time: Qt objects belong to the GUI thread.
+PRELOAD_MODULES = (
+    "pandas",
+    "polars",
+    "pyarrow",
+    "backend.utils.data_standardizer",
+    "backend.utils.source_profiles",
+    "backend.utils.column_profiler",
+    "backend.utils.preset_manager",
+    "backend.utils.enhanced_owner_analyzer",
+    "backend.utils.owner_persistence_manager",
+    "backend.utils.phone_prioritizer",
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)\s*$")
+
+
+def preload_in_background(modules: Sequence[str] = PRELOAD_MODULES) -> threading.Thread:
+    """Import *modules* on a daemon thread; failures are logged, not raised."""
+    def preload():
+        start = time.perf_counter()
+        for name in modules:
+            try:
+                __import__(name)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not preload {name}: {e}")
+        logger.info(f"📦 Preloaded {len(modules)} modules in {time.perf_counter() - start:.2f}s")
+
+    thread = threading.Thread(target=preload, name="module-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+@dataclass
+class ImportProfile:
+    """Result of one ``-X importtime`` run."""
+
+    module: str
+    total_us: int  # cumulative import time of *module*
+    self_us: Dict[str, int] = field(default_factory=dict)  # module -> own import time
+    cumulative_us: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+    def loaded(self, prefixes: Sequence[str] = HEAVY_MODULES) -> List[str]:
+        """Top-level packages among *prefixes* that were imported."""
+        tops = {name.split(".", 1)[0] for name in self.self_us}
+        return [p for p in prefixes if p in tops]
+
+    def slowest(self, count: int = 10) -> List[tuple]:
+        """The *count* modules with the largest own import time (ms)."""
+        ranked = sorted(self.self_us.items(), key=lambda item: item[1], reverse=True)
+        return [(name, us / 1000) for name, us in ranked[:count]]
+
+
+def parse_importtime(output: str, module: str) -> ImportProfile:
+    """Parse the ``-X importtime`` lines of *output* for the import of *module*."""
+    profile = ImportProfile(module=module, total_us=0)
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        own, cumulative, name = int(match[1]), int(match[2]), match[3]
+        profile.self_us[name] = profile.self_us.get(name, 0) + own
+        profile.cumulative_us[name] = max(profile.cumulative_us.get(name, 0), cumulative)
+    profile.total_us = profile.cumulative_us.get(module, 0)
+    return profile
+
+
+def measure_startup(module: str = STARTUP_MODULE, python: Optional[str] = None,
+                    runs: int = 1) -> ImportProfile:
+    """Import *module* in fresh interpreters with ``-X importtime``.
+
+    Args:
+        module: Module to import
+        python: Interpreter to run (defaults to the current one)
+        runs: Number of runs; the fastest one is returned
+
+    Returns:
+        ImportProfile of the fastest run
+    """
+    best = None
+    for _ in range(max(runs, 1)):
+        result = subprocess.run(
+            [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+            env=_subprocess_env(),
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+        profile = parse_importtime(result.stderr, module)
+        if best is None or profile.total_us < best.total_us:
+            best = profile
+    return best
+
+
+def _subprocess_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the GUI startup import time")
+    parser.add_argument("--module", default=STARTUP_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    profile = measure_startup(args.module, runs=args.runs)
+    heavy = profile.loaded()
+    print(f"⏱️  import {profile.module}: {profile.total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, ms in profile.slowest():
+        print(f"   {ms:8.1f} ms  {name}")
+    if heavy:
+        print(f"❌ Startup imports heavy modules: {', '.join(heavy)}")
+    if profile.total_ms > args.budget_ms:
+        print("❌ Startup import time is over budget")
+    return 1 if heavy or profile.total_ms > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
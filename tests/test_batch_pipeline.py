@@ -0,0 +1,104 @@
+"""Tests for the headless batch pipeline and its ``cli.py pipeline run`` command."""
+
+import csv
+import json
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from backend.utils.batch_pipeline import STAGES, PipelineConfig, resolve_inputs, run_pipeline_batch
+from backend.utils.preset_manager import PresetManager
+
+
+def _upload(path, rows: int = 120, seed: int = 0):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["First Name", "Last Name", "Property address", "Property city", "Property state",
+                         "Property zip", "Phone 1", "Phone Status 1", "Phone Type 1", "Estimated value"])
+        for i in range(rows):
+            writer.writerow([f"F{(i + seed) % 30}", "Smith", f"{i} Oak St", "Tulsa", "OK", "74101",
+                             f"405555{i:04d}.0", "CORRECT", "MOBILE", 100000 + i])
+    return path
+
+
+def _config(tmp_path, **overrides) -> PipelineConfig:
+    return PipelineConfig(processed_dir=str(tmp_path / "data" / "processed"),
+                          presets_dir=str(tmp_path / "data" / "presets"),
+                          cache_dir=str(tmp_path / "data" / "cache"), **overrides)
+
+
+def test_inputs_and_config_are_resolved(tmp_path) -> None:
+    uploads = tmp_path / "upload"
+    (uploads / "old").mkdir(parents=True)
+    a, b = _upload(uploads / "a.csv"), _upload(uploads / "old" / "b.csv")
+    (uploads / "notes.txt").write_text("not an upload")
+
+    assert resolve_inputs([uploads]) == [a.resolve()]
+    assert resolve_inputs([str(uploads / "**" / "*.csv"), b]) == [a.resolve(), b.resolve()]
+    assert resolve_inputs([str(tmp_path / "missing" / "*.csv")]) == []
+
+    config_file = tmp_path / "nightly.json"
+    config_file.write_text(json.dumps({"export_formats": ["csv", "parquet"], "max_phones": 3}))
+    config = PipelineConfig.from_file(config_file)
+    assert config.max_phones == 3 and config.data_source == "REISIFT"
+    assert config.fingerprint() == PipelineConfig(export_formats=["csv", "parquet"], max_phones=3,
+                                                  workers=8).fingerprint() != PipelineConfig().fingerprint()
+    with pytest.raises(ValueError, match="Unknown pipeline config key"):
+        PipelineConfig.from_dict({"max_phone": 3})
+    with pytest.raises(ValueError, match="Unknown export format"):
+        PipelineConfig(export_formats=["pdf"])
+
+
+def test_batch_run_in_a_process_pool_writes_outputs_metrics_and_manifest(tmp_path) -> None:
+    uploads = tmp_path / "upload"
+    uploads.mkdir()
+    _upload(uploads / "county one.csv", rows=120)
+    _upload(uploads / "county two.csv", rows=80, seed=7)
+    (uploads / "empty.csv").write_text("")
+
+    config = _config(tmp_path, export_formats=["csv", "parquet"])
+    manifest = run_pipeline_batch([uploads], config, output_dir=tmp_path / "runs", workers=2, run_id="nightly")
+
+    run_dir = tmp_path / "runs" / "nightly"
+    assert json.loads((run_dir / "manifest.json").read_text()) == json.loads(json.dumps(manifest, default=str))
+    assert manifest['status'] == "failed" and manifest['workers'] == 2
+    assert manifest['totals'] == {'files': 3, 'succeeded': 2, 'failed': 1, 'rows_in': 200, 'rows_out': 200,
+                                  'owners': manifest['totals']['owners'], 'cache_hits': 0}
+    failed = next(f for f in manifest['files'] if f['status'] == "failed")
+    assert failed['name'] == "empty" and failed['error']['message']
+
+    metrics = json.loads((run_dir / "county_one" / "metrics.json").read_text())
+    assert list(metrics['stages']) == [stage.name for stage in STAGES]
+    assert all(stage['status'] == "completed" for stage in metrics['stages'].values())
+    assert metrics['rows_in'] == metrics['rows_out'] == 120 and metrics['owners'] > 0
+    export = pd.read_csv(metrics['outputs']['pete_export_csv'])
+    assert len(export) == 120 and len(pd.read_parquet(metrics['outputs']['pete_export_parquet'])) == 120
+    assert len(pd.read_csv(metrics['outputs']['owner_summary'])) == metrics['owners']
+    assert "Pipeline completed" in (run_dir / "county_one" / "nightly_county_one.jsonl").read_text()
+
+    # Both workers saved their preset and export log entry
+    presets = PresetManager(config.presets_dir)
+    assert sorted(p['preset_name'].split("_nightly")[0] for p in presets.list_presets()) == [
+        "pipeline_county_one", "pipeline_county_two"]
+    assert sorted(e['export_records'] for e in presets.list_exports()) == [80, 120]
+
+
+def test_pipeline_run_command_exit_codes(tmp_path) -> None:
+    from cli import cli
+
+    upload = _upload(tmp_path / "upload.csv", rows=30)
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({**_config(tmp_path, save_preset=False).to_dict(), "workers": 1}))
+    runner = CliRunner()
+    args = ["pipeline", "run", "-c", str(config_file), "-o", str(tmp_path / "runs")]
+
+    result = runner.invoke(cli, args + [str(upload), "--run-id", "ok"])
+    assert result.exit_code == 0, result.output
+    assert json.loads((tmp_path / "runs" / "ok" / "manifest.json").read_text())['status'] == "succeeded"
+
+    (tmp_path / "broken.csv").write_text("")
+    result = runner.invoke(cli, args + [str(tmp_path / "*.csv"), "--run-id", "broken"])
+    assert result.exit_code == 1 and "failed" in result.output
+
+    assert runner.invoke(cli, args + [str(tmp_path / "nothing" / "*.csv")]).exit_code == 2
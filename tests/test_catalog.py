@@ -0,0 +1,123 @@
+"""Tests for the SQLite catalog of datasets, presets, export logs and users."""
+
+import json
+import shutil
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from backend.utils.catalog import Catalog, preset_record
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject
+from backend.utils.owner_persistence_manager import OwnerPersistenceManager
+from backend.utils.preset_manager import PresetManager
+from frontend.utils.startup import _subprocess_env
+
+
+def _owners(n: int = 30):
+    return [EnhancedOwnerObject(individual_name=f"Owner {i}", property_count=1 + i % 3,
+                                total_property_value=1000.0 * i, confidence_score=(i % 10) / 10,
+                                is_business_owner=i % 3 == 0, is_individual_owner=i % 3 != 0)
+            for i in range(n)]
+
+
+def _frame(rows: int = 20) -> pd.DataFrame:
+    return pd.DataFrame({'Owner': [f"Owner {i}" for i in range(rows)], 'Phone': [None] * 5 + ["555"] * (rows - 5)})
+
+
+def test_datasets_are_indexed_on_save_and_resynced_from_disk(tmp_path) -> None:
+    manager = OwnerPersistenceManager(str(tmp_path / "processed"))
+    manager.save_owner_objects(_owners(), "first", create_backup=False)
+    manager.save_owner_objects(_owners(10), "second", create_backup=False)
+    assert manager.catalog.path == tmp_path / "catalog.sqlite"
+
+    assert manager.get_latest_dataset() == "second"
+    datasets = manager.list_saved_datasets()
+    assert sorted(datasets) == ["owner_objects_first", "owner_objects_second"]
+    assert datasets["owner_objects_first"]['total_owners'] == 30
+
+    # A dataset copied in without the manager is picked up; a deleted one disappears
+    owner_dir = tmp_path / "processed" / "owner_objects"
+    shutil.copytree(owner_dir / "first", owner_dir / "copied")
+    metadata = json.loads((owner_dir / "copied" / "metadata.json").read_text())
+    metadata['saved_at'] = "2999-01-01T00:00:00"
+    (owner_dir / "copied" / "metadata.json").write_text(json.dumps(metadata))
+    shutil.rmtree(owner_dir / "second")
+    assert manager.get_latest_dataset() == "copied"
+    assert sorted(manager.list_saved_datasets()) == ["owner_objects_copied", "owner_objects_first"]
+
+    # Metadata rewritten in place leaves the directory's own mtime unchanged
+    metadata['saved_at'] = "3000-01-01T00:00:00"
+    (owner_dir / "first" / "metadata.json").write_text(json.dumps(metadata))
+    assert manager.get_latest_dataset() == "first"
+
+    # Another root in the same catalog file is kept apart
+    other = OwnerPersistenceManager(str(tmp_path / "other"))
+    assert other.catalog.path == manager.catalog.path and other.get_latest_dataset() is None
+
+
+def test_presets_and_exports_are_indexed_transactionally(tmp_path) -> None:
+    manager = PresetManager(str(tmp_path / "presets"))
+    manager.save_comprehensive_preset("alice_weekly", "REISIFT", _frame(), _frame(),
+                                      export_data=_frame(12), user_id="alice",
+                                      owner_analysis_results={'total_owners': 12,
+                                                              'business_entities': {'business_count': 3}})
+    manager.save_comprehensive_preset("bob_monthly", "MLS", _frame(), _frame(), user_id="bob")
+
+    assert [p['preset_name'] for p in manager.list_presets()] == ["bob_monthly", "alice_weekly"]
+    assert [p['preset_name'] for p in manager.list_presets(user_id="alice")] == ["alice_weekly"]
+    assert [p['preset_name'] for p in manager.list_presets(data_source="MLS")] == ["bob_monthly"]
+    assert [e['export_records'] for e in manager.list_exports()] == [12, 0]
+    assert [e['export_records'] for e in manager.list_exports(limit=1)] == [0]
+
+    # A failed transaction leaves no partial records
+    record = preset_record({'preset_id': "broken", 'preset_name': "broken", 'data_source': "X",
+                            'created_at': "2999-01-01", 'summary': {}})
+    with pytest.raises(RuntimeError):
+        with manager.catalog.transaction() as conn:
+            manager.catalog.put_preset(conn, manager.base_dir, record)
+            manager.catalog.add_export(conn, manager.base_dir, {'preset_id': "broken"})
+            raise RuntimeError("disk full")
+    assert len(manager.list_presets()) == 2 and len(manager.list_exports()) == 2
+
+    indexes = {row[0] for row in manager.catalog._query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_presets_user", "idx_presets_source", "idx_presets_created",
+            "idx_exports_user", "idx_exports_timestamp", "idx_users_company"} <= indexes
+
+
+def test_dashboard_reads_the_catalog_in_one_query(tmp_path, monkeypatch) -> None:
+    from backend.utils.user_manager import UserManager
+
+    # Importing the user manager opens no catalog and creates no directories
+    result = subprocess.run([sys.executable, "-c", "import backend.utils.user_manager"], cwd=tmp_path,
+                            env=_subprocess_env(), capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.chdir(tmp_path)
+    user_manager = UserManager()
+    user_manager.login_user()
+    user_manager.save_user_preset("weekly", original_df=_frame(), prepared_df=_frame(), export_data=_frame(7),
+                                  phone_prioritization_rules={'status_weights': {'CORRECT': 100}})
+    OwnerPersistenceManager().save_owner_objects(_owners(), "latest", create_backup=False)
+
+    data = user_manager.get_dashboard_data()
+    assert data['presets']['total'] == 1
+    assert data['exports']['recent'][0]['export_records'] == 7
+    assert data['analysis']['phone_prioritization']['status_weights'] == {'CORRECT': 100}
+    assert data['analysis']['data_quality']['original_data_quality']['null_cells'] == 5
+    assert data['analysis']['owner_analysis']['total_owners'] == 30
+    assert data['analysis']['owner_analysis']['dataset_name'] == "latest"
+
+    queries = []
+    original = Catalog._query
+    monkeypatch.setattr(Catalog, "_query", lambda self, *args: queries.append(args) or original(self, *args))
+    assert user_manager.get_dashboard_data()['presets'] == data['presets']
+    assert len(queries) == 1
+
+    # Presets indexed from their files only get the same dashboard summary
+    with user_manager.catalog.transaction() as conn:
+        conn.execute("DELETE FROM presets")
+        conn.execute("DELETE FROM sources WHERE kind = 'presets'")
+    assert user_manager.get_dashboard_data()['analysis'] == data['analysis']
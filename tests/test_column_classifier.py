@@ -0,0 +1,144 @@
+"""Tests for the value-sampling column classifier."""
+
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.column_classifier import (
+    _estimate_rows,
+    _text_sample,
+    classify_columns,
+    sample_column_values,
+)
+from backend.utils.data_standardizer import DataStandardizer
+
+
+def _unknown_source(n: int = 2000) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    first = ["John", "Mary", "Robert", "Linda", "James", "Patricia", "Michael", "Jennifer"]
+    last = ["Smith", "Johnson", "Brown", "Jones", "Garcia", "Miller", "Davis", "Wilson"]
+    return pd.DataFrame(
+        {
+            "Col1": rng.integers(2_000_000_000, 9_999_999_999, n).astype(float),
+            "Col2": [f"user{i}@mail.com" if i % 3 else None for i in range(n)],
+            "Col3": [f"{rng.integers(1, 9999)} {rng.choice(['Main', 'Oak'])} {rng.choice(['St', 'Ave', 'Rd'])}"
+                     for _ in range(n)],
+            "Col4": [f"{z:05d}" for z in rng.integers(501, 99950, n)],
+            "Col5": [f"${v:,.2f}" for v in rng.uniform(1e4, 1e6, n)],
+            "Col6": [f"{m}/{d}/2019" for m, d in zip(rng.integers(1, 13, n), rng.integers(1, 29, n))],
+            "Col7": [f"{rng.choice(first)} {rng.choice(last)}" for _ in range(n)],
+            "Col8": [f"{rng.choice(last)} Properties {rng.choice(['LLC', 'Inc'])}" for _ in range(n)],
+            "Col9": rng.integers(1, 6, n),
+        }
+    )
+
+
+def test_classify_columns_detects_content_behind_generic_headers() -> None:
+    """Labels come from cell values, not from the (meaningless) header names."""
+    result = classify_columns(_unknown_source())
+
+    labels = {col: c.label for col, c in result.items()}
+    assert labels == {
+        "Col1": "phone",
+        "Col2": "email",
+        "Col3": "street_address",
+        "Col4": "zip",
+        "Col5": "currency",
+        "Col6": "date",
+        "Col7": "person_name",
+        "Col8": "business_name",
+        "Col9": None,
+    }
+    assert result["Col1"].confidence >= 0.9
+    assert result["Col1"].describe().startswith("phone (")
+
+
+def test_propose_mapping_uses_content_hints_for_unmatched_columns() -> None:
+    """Columns the name stages cannot place are mapped by detected content."""
+    df = _unknown_source(500)
+    standardizer = DataStandardizer(["Phone 1", "Email 1", "Property Zip"], {"fuzzy_threshold": 90})
+
+    mapping = standardizer.propose_mapping(list(df.columns), classify_columns(df))
+
+    assert mapping["Col1"][0] == "Phone 1"
+    assert mapping["Col1"][2].startswith("Content: phone")
+    assert mapping["Col2"][0] == "Email 1"
+    assert mapping["Col4"][0] == "Property Zip"
+    assert mapping["Col7"][0] is None  # no free name header
+
+
+def test_classify_columns_wide_frame_stays_within_budget() -> None:
+    """A 500-column frame is classified within the time budget."""
+    wide = pd.concat([_unknown_source(1000)] * 56, axis=1).iloc[:, :500]
+    wide.columns = [f"C{i}" for i in range(wide.shape[1])]
+
+    start = time.perf_counter()
+    result = classify_columns(wide, time_budget=5.0)
+    elapsed = time.perf_counter() - start
+
+    assert len(result) == 500
+    assert elapsed < 5.0 + 2.0
+    assert sum(1 for c in result.values() if c.label == "phone") >= 50
+
+
+def test_csv_source_is_sampled_over_the_whole_scan_within_budget(tmp_path) -> None:
+    """A CSV is sampled across all rows; columns past the time budget are omitted."""
+    n = 20_000
+    wide = pd.DataFrame({f"C{i}": [f"{i}-{r}" for r in range(n)] for i in range(120)})
+    wide.to_csv(tmp_path / "vendor.csv", index=False)
+
+    samples = sample_column_values(tmp_path / "vendor.csv", sample_size=50, max_cells=120 * 2_000)
+    assert len(samples) == 120 and len(samples["C0"]) == 50
+    rows = sorted(int(value.split("-")[1]) for value in samples["C0"])
+    assert rows[-1] > n // 2  # not a head slice of the file
+
+    result = classify_columns(tmp_path / "vendor.csv", time_budget=0.0)
+    assert list(result) == list(wide.columns)
+    assert all(c.reason == "time budget exceeded" for c in result.values())
+
+
+def test_csv_scan_is_bounded_without_counting_rows(tmp_path) -> None:
+    """The read keeps at most max_cells // n_columns rows, spread over the file."""
+    n = 50_000
+    pd.DataFrame({"A": [f"a-{r}" for r in range(n)], "B": [str(r) for r in range(n)]}).to_csv(
+        tmp_path / "long.csv", index=False)
+
+    assert abs(_estimate_rows(tmp_path / "long.csv") - n) < n * 0.2
+    frame = _text_sample(tmp_path / "long.csv", max_cells=2 * 1_000, seed=0)
+    assert 500 < frame.height <= 1_000
+    assert frame["B"].cast(int).max() > n * 0.9
+    assert frame["A"].to_list() == [f"a-{b}" for b in frame["B"]]  # whole lines only
+
+
+def test_columns_sampled_before_the_budget_runs_out_are_classified(tmp_path, monkeypatch) -> None:
+    """Running out of time mid-way keeps the classifications made so far."""
+    wide = pd.concat([_unknown_source(200)] * 12, axis=1).iloc[:, :100]
+    wide.columns = [f"C{i}" for i in range(wide.shape[1])]
+    wide.to_csv(tmp_path / "wide.csv", index=False)
+    clock = itertools.chain([0.0, 0.0, 0.0], itertools.repeat(10.0))  # expires after the first batch
+    monkeypatch.setattr(time, "perf_counter", lambda: next(clock))
+
+    result = classify_columns(tmp_path / "wide.csv", time_budget=1.0)
+
+    reasons = [c.reason for c in result.values()]
+    assert len(result) == 100
+    assert "time budget exceeded" not in reasons[:50]
+    assert set(reasons[50:]) == {"time budget exceeded"}
+    assert result["C0"].label == "phone"
+
+
+def test_mapping_ui_detects_content_off_the_gui_thread(qtbot) -> None:
+    """The mapping UI opens with name-based proposals; content hints fill in later."""
+    from frontend.components.mapping_ui import MappingUI
+
+    df = _unknown_source(500)
+    ui = MappingUI(df=df, pete_headers=["Phone 1", "Email 1", "Property Zip"],
+                   rules={"fuzzy_threshold": 90})
+    qtbot.addWidget(ui)
+
+    qtbot.waitUntil(lambda: bool(ui.content_hints), timeout=10_000)
+    assert ui.content_hints["Col1"].label == "phone"
+    assert ui.mapping["Col1"][0] == "Phone 1"
+    assert ui.mapping["Col2"][0] == "Email 1"
@@ -0,0 +1,93 @@
+"""Tests for the one-pass column profiler."""
+
+import numpy as np
+import pandas as pd
+
+from backend.utils import column_profiler as cp
+from backend.utils.column_profiler import dataset_fingerprint, invalidate_profile, profile_dataframe
+from backend.utils.data_type_converter import DataTypeConverter
+
+
+def _sample_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Phone": [4055551234.0, np.nan, 4055559999.0, 4055550000.0],
+            "Price": [1.5, 2.0, None, 3.25],
+            "Notes": [None, "", "   ", "call back"],
+            "Zip": ["73102", "73102", None, "01234"],
+            "Listed": pd.date_range("2024-01-01", periods=4),
+            "Empty": [None, None, None, None],
+        }
+    )
+
+
+def test_profile_counts_nulls_blanks_and_types() -> None:
+    """Every statistic comes from one scan, with blank strings counted."""
+    profile = profile_dataframe(_sample_df(), duplicates=True, use_cache=False)
+
+    notes = profile.columns["Notes"]
+    assert (notes.null_count, notes.empty_count, notes.whitespace_count) == (1, 1, 1)
+    assert notes.blank_ratio == 0.75
+    assert (notes.min_length, notes.max_length) == (0, 9)
+
+    assert profile.columns["Phone"].inferred_type == "int"
+    assert profile.columns["Price"].inferred_type == "float"
+    assert profile.columns["Zip"].inferred_type == "int"
+    assert profile.columns["Listed"].inferred_type == "datetime"
+    assert profile.columns["Zip"].distinct_count == 2
+    assert profile.duplicate_rows == 0
+    assert profile.empty_columns(0.75) == ["Notes", "Empty"]
+
+
+def test_profile_is_cached_per_frame() -> None:
+    """The same frame reuses its profile as a private copy; changed data gets a new one."""
+    cp._PROFILE_CACHE.clear()
+    df = _sample_df()
+
+    first = profile_dataframe(df)
+    first.profiles[0].null_count = 99  # callers cannot corrupt the cache
+    second = profile_dataframe(df)
+    assert second is not first and second.columns["Phone"].null_count == 1
+    assert len(cp._PROFILE_CACHE) == 1
+
+    changed = df.copy()
+    changed.loc[0, "Zip"] = "99999"
+    assert dataset_fingerprint(changed) != first.fingerprint
+    assert profile_dataframe(changed).columns["Zip"].distinct_count == 3
+
+    # An equal copy is another frame object and is profiled on its own
+    profile_dataframe(df.copy())
+    assert len(cp._PROFILE_CACHE) == 3
+
+    # In-place edits are seen through the sampled rows, or after invalidate_profile
+    large = pd.DataFrame({"Notes": [None] * 6_000, "Zip": ["73102"] * 6_000})
+    assert profile_dataframe(large).empty_columns(0.9) == ["Notes"]
+    large.loc[5:4_800, "Notes"] = "called"
+    assert profile_dataframe(large).empty_columns(0.9) == []
+    large.loc[5_000, "Zip"] = None  # between two sampled rows
+    invalidate_profile(large)
+    assert profile_dataframe(large).columns["Zip"].null_count == 1
+    assert profile_dataframe(large, use_cache=False).columns["Zip"].null_count == 1
+
+
+def test_repeated_names_and_empty_frames() -> None:
+    """Repeated column names keep one profile each; a frame without rows hides nothing."""
+    df = pd.DataFrame([[None, "x"], [None, "y"]], columns=["A", "A"])
+    profile = profile_dataframe(df, use_cache=False)
+
+    assert [col.null_count for col in profile.profiles] == [2, 0]
+    assert profile.empty_columns(0.9) == ["A"]
+    assert profile.non_empty_columns(0.9) == ["A"]
+
+    empty = profile_dataframe(pd.DataFrame({"A": [], "B": []}), use_cache=False)
+    assert empty.empty_columns(0.9) == []
+    assert empty.columns["A"].blank_ratio == 0.0
+
+
+def test_filter_empty_columns_treats_blank_strings_as_empty() -> None:
+    """Whitespace-only columns are dropped like all-NaN ones."""
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [None, None, None], "C": ["", " ", None]})
+
+    cleaned = DataTypeConverter.filter_empty_columns(df, threshold=0.9)
+
+    assert list(cleaned.columns) == ["A"]
@@ -128,7 +128,8 @@ def test_comprehensive_preset_system():
     
     # 4. Save comprehensive preset
     print("\n4. 💾 Saving Comprehensive Preset...")
-    from backend.utils.user_manager import user_manager
+    from backend.utils.user_manager import get_user_manager
+    user_manager = get_user_manager()
     
     try:
         preset_path = user_manager.save_user_preset(
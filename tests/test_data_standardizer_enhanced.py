@@ -0,0 +1,82 @@
+"""Tests for rule-table categorical standardization."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from backend.utils.data_standardizer_enhanced import DataStandardizerEnhanced
+from backend.utils.preset_manager import PresetManager
+
+
+def test_property_type_rules_first_match_wins() -> None:
+    """Each distinct value gets the first standard value whose pattern it contains."""
+    df = pd.DataFrame(
+        {
+            "Property Type": [
+                "SFR", "Duplex (2 units, any combination)", "Condominium", "Retail Stores",
+                "Residential - Vacant Land", "Single Family - vacant", "Farm", None, "SFR",
+            ]
+        }
+    )
+
+    out = DataStandardizerEnhanced().standardize_property_type(df, "Property Type")
+
+    assert out["Property Type"].tolist() == [
+        "Single Family Residential", "Multifamily", "Multifamily", "Commercial",
+        "Vacant Land", "Single Family Residential", "Farm", None, "Single Family Residential",
+    ]
+    assert df["Property Type"].iloc[0] == "SFR"  # input is not modified
+
+
+def test_standardize_dataframe_covers_all_rule_fields() -> None:
+    """Every rule field is standardized in one call; phone types only on opt-in."""
+    df = pd.DataFrame(
+        {
+            "Property Type": ["sfr", "Mobile Home"],
+            "Phone Type 1": ["Cell", "Residential"],
+            "Phone Type 2": ["wireless", None],
+            "Phone 1": ["4055551234", "4055559999"],
+        }
+    )
+
+    out = DataStandardizerEnhanced().standardize_dataframe(df)
+
+    assert out["Property Type"].tolist() == ["Single Family Residential", "Mobile/Manufactured Home"]
+    assert out["Phone Type 1"].tolist() == ["Cell", "Residential"]  # no built-in phone rules
+
+    rules = {"phone_type": {"columns": r"^Phone Type \d+$", "values": {"MOBILE": ["^cell$", "^wireless$"]}}}
+    out = DataStandardizerEnhanced(rules).standardize_dataframe(df)
+
+    assert out["Property Type"].tolist() == ["Single Family Residential", "Mobile/Manufactured Home"]
+    assert out["Phone Type 1"].tolist() == ["MOBILE", "Residential"]
+    assert out["Phone Type 2"].tolist() == ["MOBILE", None]
+    assert out["Phone 1"].tolist() == df["Phone 1"].tolist()
+
+
+def test_rules_round_trip_through_preset(tmp_path) -> None:
+    """A preset's standardization_rules.json replaces the default fields it names."""
+    manager = PresetManager(base_dir=str(tmp_path))
+    df = pd.DataFrame({"Property Type": ["Farm", "SFR"]})
+    rules = {"property_type": {"columns": "^Property Type$", "values": {"Agricultural": ["farm", "ranch"]}}}
+    preset_dir = manager.save_comprehensive_preset("rules", "REISIFT", df, df, standardization_rules=rules)
+
+    preset = manager.load_preset(Path(preset_dir).name)
+    out = DataStandardizerEnhanced(preset["standardization_rules"]).standardize_dataframe(df)
+
+    assert out["Property Type"].tolist() == ["Agricultural", "SFR"]
+
+
+def test_concatenate_emails_skips_blanks_of_the_first_max_emails_columns() -> None:
+    """Emails are trimmed and blanks dropped; only the first max_emails columns count."""
+    df = pd.DataFrame(
+        {
+            "Email 1": [" a@x.com", None, ""],
+            "Email 2": ["a@x.com", " ", None],
+            "Email 3": ["b@x.com", "c@x.com", None],
+            "Email 4": ["c@x.com", None, None],
+        }
+    )
+
+    out = DataStandardizerEnhanced().concatenate_emails(df, list(df.columns), max_emails=2)
+
+    assert out["Email"].tolist() == ["a@x.com; a@x.com", None, None]
@@ -0,0 +1,112 @@
+"""Tests for sample-based type inference and one-pass conversion."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.utils.data_type_converter import DataTypeConverter
+
+
+def test_suggest_column_types_on_mixed_frame() -> None:
+    """Typed columns go by dtype, text columns by what their values parse as."""
+    df = pd.DataFrame(
+        {
+            "Beds": [3, 2, 4, 3],
+            "Price": [1.5, 2.0, None, 4.25],
+            "Zip": ["73102", " 73103 ", "73104", ""],
+            "Sold": ["2020-01-01", "2021-02-03", None, "2022-03-04"],
+            "Owner": ["Ann", "Bob", "Cy", "Dee"],
+            "Active": [True, False, True, True],
+        }
+    )
+
+    assert DataTypeConverter.suggest_column_types(df) == {
+        "Beds": "int",
+        "Price": "float",
+        "Zip": "int",
+        "Sold": "datetime",
+        "Owner": "string",
+        "Active": "category",
+    }
+    assert DataTypeConverter.infer_type(df["Price"]) == "float"
+    assert DataTypeConverter.infer_type(pd.Series([1, 2, 3])) == "int"  # unnamed series
+
+
+def test_ambiguous_sample_escalates_to_full_scan() -> None:
+    """Columns the sample cannot decide are re-checked on every row."""
+    n = 10_000
+    df = pd.DataFrame(
+        {
+            # Only rows outside the sampled head/tail/random rows are filled
+            "Late": [None] * n,
+            "Status": ["Active", "Sold"] * (n // 2),
+            "Parcel": [f"P{i}" for i in range(n)],
+        }
+    )
+    df.loc[5000:5001, "Late"] = ["12", "13"]
+
+    types = DataTypeConverter.suggest_column_types(df)
+
+    assert types == {"Late": "int", "Status": "category", "Parcel": "string"}
+
+
+def test_wide_frame_is_inferred_quickly() -> None:
+    """200 text columns are typed from samples, not full scans."""
+    rng = np.random.default_rng(0)
+    wide = pd.DataFrame({f"C{i}": rng.integers(0, 10**6, 20_000).astype(str) for i in range(200)})
+
+    start = time.perf_counter()
+    types = DataTypeConverter.suggest_column_types(wide)
+
+    assert time.perf_counter() - start < 2.0
+    assert set(types.values()) == {"int"}
+
+
+def test_convert_dataframe_parses_numeric_columns_together() -> None:
+    """Int targets become nullable Int64; fractional values fall back to float."""
+    df = pd.DataFrame({"Beds": ["3", " 2 ", "", None], "Baths": ["1.5", "2", "x", "1"], "Name": list("abcd")})
+
+    out = DataTypeConverter.convert_dataframe(df, {"Beds": "int", "Baths": "int", "Name": "category"})
+
+    assert str(out["Beds"].dtype) == "Int64"
+    assert out["Beds"].tolist()[:2] == [3, 2] and out["Beds"].isna().tolist()[2:] == [True, True]
+    assert out["Baths"].dtype == "float64"
+    assert out["Baths"].tolist()[:2] == [1.5, 2.0] and np.isnan(out["Baths"].iloc[2])
+    assert out["Name"].dtype == "category"
+    assert df["Beds"].tolist()[0] == "3"  # input is not modified
+
+
+def test_convert_dataframe_raises_on_fractional_int_targets() -> None:
+    """With errors='raise' fractional values fail an int conversion instead of becoming float."""
+    df = pd.DataFrame({"Baths": ["1.5", "2", "3"]})
+
+    with pytest.raises(TypeError, match="fractional"):
+        DataTypeConverter.convert_dataframe(df, {"Baths": "int"}, errors="raise")
+    assert df["Baths"].tolist() == ["1.5", "2", "3"]
+    assert DataTypeConverter.convert_dataframe(df, {"Baths": "int"})["Baths"].dtype == "float64"
+
+
+def test_convert_dataframe_handles_booleans_and_infinity() -> None:
+    """Booleans parse as 1/0; infinite values are invalid for int targets."""
+    df = pd.DataFrame({"Active": [True, False, True], "Units": ["1", "inf", "3"], "Ratio": [1.0, np.inf, 2.0]})
+
+    out = DataTypeConverter.convert_dataframe(df, {"Active": "float", "Units": "int", "Ratio": "int"})
+
+    assert out["Active"].tolist() == [1.0, 0.0, 1.0]
+    assert str(out["Units"].dtype) == "Int64" and out["Units"].isna().tolist() == [False, True, False]
+    assert str(out["Ratio"].dtype) == "Int64" and out["Ratio"].tolist()[::2] == [1, 2]
+    with pytest.raises(TypeError, match="infinite"):
+        DataTypeConverter.convert_dataframe(df, {"Units": "int"}, errors="raise")
+
+
+def test_convert_dataframe_keeps_large_integers_exact() -> None:
+    """Integers above 2**53 survive an int conversion unchanged."""
+    df = pd.DataFrame({"Parcel ID": [" 12345678901234567", None, "3.0"], "Key": np.array([2**60 + 1, 5, 7], dtype="int64")})
+
+    out = DataTypeConverter.convert_dataframe(df, {"Parcel ID": "int", "Key": "int"})
+
+    assert str(out["Parcel ID"].dtype) == "Int64"
+    assert out["Parcel ID"][0] == 12345678901234567 and pd.isna(out["Parcel ID"][1]) and out["Parcel ID"][2] == 3
+    assert str(out["Key"].dtype) == "Int64" and out["Key"].tolist() == [2**60 + 1, 5, 7]
@@ -0,0 +1,81 @@
+"""Tests for the lazily formatted DataFrame table model."""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from frontend.components.dataframe_table_model import BLOCK_ROWS, DataFrameTableModel
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _frame(n: int = 5000) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "Owner": [f"Owner {i:05d}" for i in range(n)],
+            "Value": [float(i % 10) if i % 4 else None for i in range(n)],
+            "Zip": [f"{73000 + i % 100:05d}" for i in range(n)],
+        }
+    )
+
+
+def _column(model: DataFrameTableModel, column: int) -> list:
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+def test_cells_are_formatted_lazily_in_batches(app) -> None:
+    model = DataFrameTableModel(_frame(), batch_size=1000)
+
+    assert (model.rowCount(), model.columnCount(), model.total_rows()) == (1000, 3, 5000)
+    assert model.data(model.index(1, 1)) == "1.0"
+    assert model.data(model.index(0, 1)) == ""  # null
+    assert len(model._blocks) == 1  # only the block that was asked for
+
+    model.fetchMore()
+    assert model.rowCount() == 2000 and model.canFetchMore()
+    assert model.data(model.index(1999, 0)) == "Owner 01999"
+    assert model.headerData(2, Qt.Horizontal) == "Zip"
+
+
+def test_hidden_columns_and_sort_never_touch_the_frame(app) -> None:
+    df = _frame()
+    model = DataFrameTableModel(df)
+
+    model.set_visible_columns(["Zip", "Owner"])
+    assert model.columnCount() == 2 and model.column_name(0) == "Zip"
+    assert model.frame() is df
+
+    model.sort(0, Qt.DescendingOrder)
+    zips = _column(model, 0)
+    assert zips == sorted(zips, reverse=True)
+    assert model.data(model.index(0, 1)) == "Owner 00099"  # stable: first of the 73099 rows
+    assert model.source_row(0) == 99
+    assert df["Owner"][0] == "Owner 00000"
+
+    model.set_visible_columns(None)
+    assert model.visible_columns() == ["Owner", "Value", "Zip"] and model.sort_column == 2
+
+    model.sort(1, Qt.AscendingOrder)  # nulls last
+    values = _column(model, 1)
+    assert values[0] == "0.0" and values == sorted(values)
+    model.fetchMore(); model.fetchMore(); model.fetchMore(); model.fetchMore()
+    assert _column(model, 1)[-1] == ""
+
+
+def test_pandas_frames_are_read_without_conversion(app) -> None:
+    df = pd.DataFrame({"A": ["x", None, "z"], "B": [1.5, np.nan, 3.0], "C": [1, "two", 3.0]})
+    model = DataFrameTableModel(df, tooltip=lambda col, row, text: f"{col}:{row}:{text}")
+
+    assert _column(model, 0) == ["x", "", "z"]
+    assert _column(model, 1) == ["1.5", "", "3.0"]
+    assert model.data(model.index(2, 2), Qt.ToolTipRole) == "C:2:3.0"
+
+    model.sort(2, Qt.AscendingOrder)  # mixed object column sorts as text
+    assert _column(model, 2) == ["1", "3.0", "two"]
+    assert len(_column(model, 0)) <= BLOCK_ROWS
@@ -0,0 +1,76 @@
+"""Tests for the background job runner used by the data tools."""
+
+import threading
+
+import pandas as pd
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from frontend.utils.job_runner import JobRunner
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def test_result_and_progress_are_delivered_on_the_gui_thread(app, qtbot) -> None:
+    runner = JobRunner()
+    snapshot = pd.DataFrame({"a": [3, 1, 2]})
+    results, progress, threads = [], [], []
+
+    def job(df, context):
+        threads.append(threading.current_thread())
+        context.progress(50, "sorting")
+        return df.sort_values("a")
+
+    def finished(result):
+        threads.append(threading.current_thread())
+        results.append(result)
+
+    assert runner.submit("dataset", "Sort", job, snapshot, on_finished=finished,
+                         on_progress=lambda percent, message: progress.append((percent, message)))
+    qtbot.waitUntil(lambda: bool(results), timeout=5000)
+
+    assert results[0]["a"].tolist() == [1, 2, 3]
+    assert snapshot["a"].tolist() == [3, 1, 2]
+    assert progress == [(50, "sorting")]
+    assert threads[0] is not threading.main_thread() and threads[1] is threading.main_thread()
+    assert not runner.is_busy("dataset")
+
+
+def test_one_job_per_dataset_and_cooperative_cancellation(app, qtbot) -> None:
+    runner = JobRunner()
+    started, release = threading.Event(), threading.Event()
+    outcome = []
+
+    def slow(df, context):
+        started.set()
+        release.wait(5)
+        context.progress(10)  # raises once cancelled
+        return "done"
+
+    assert runner.submit("dataset", "Slow", slow, None,
+                         on_finished=outcome.append, on_cancelled=lambda: outcome.append("cancelled"))
+    assert runner.submit("dataset", "Second", lambda df, context: None, None) is None
+    assert runner.submit("other", "Other", lambda df, context: "other", None, on_finished=outcome.append)
+
+    started.wait(5)
+    assert runner.cancel("dataset")
+    release.set()
+    qtbot.waitUntil(lambda: len(outcome) == 2, timeout=5000)
+
+    assert sorted(outcome) == ["cancelled", "other"]
+    assert not runner.is_busy("dataset") and not runner.cancel("dataset")
+
+
+def test_failures_are_reported(app, qtbot) -> None:
+    runner = JobRunner()
+    errors = []
+
+    def broken(df, context):
+        raise ValueError("bad column")
+
+    runner.submit("dataset", "Broken", broken, None, on_error=errors.append)
+    qtbot.waitUntil(lambda: bool(errors), timeout=5000)
+    assert errors == ["bad column"]
@@ -0,0 +1,88 @@
+"""Tests for the single-pass mapping executor."""
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.data_standardizer import DataStandardizer
+from backend.utils.mapping_executor import ConcatRule, MappingPlan, benchmark_concat, concat_columns, execute_mapping
+from backend.utils.pete_header_mapper import PeteHeaderMapper
+
+
+def _sample_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "First Name": ["Bob", None, " Ann "],
+            "Last Name": ["Smith", "Jones", None],
+            "Email 1": [" bob@x.com ", None, ""],
+            "Email 2": ["b2@x.com", " ", None],
+            "Email 3": ["b2@x.com", None, None],
+            "Phone 1": ["4055551234", None, "4055559999"],
+            "Property Address": ["1 Main St", "2 Oak Ave", None],
+        }
+    )
+
+
+def test_execute_mapping_projects_concats_and_fills() -> None:
+    """Plans copy columns, concatenate text and fill unmapped headers."""
+    df = _sample_df()
+    plan = MappingPlan(headers=["Name", "Address", "Missing", "Empty"])
+    plan.assign("Name", ConcatRule(("First Name", "Last Name"), strip_result=True))
+    plan.assign("Address", "Property Address")
+    plan.assign("Empty", None)
+
+    out = execute_mapping(df, plan)
+
+    assert list(out.columns) == ["Name", "Address", "Missing", "Empty"]
+    assert out["Name"].tolist() == ["Bob Smith", "Jones", "Ann"]
+    assert out["Address"].tolist() == ["1 Main St", "2 Oak Ave", None]
+    assert out["Missing"].isna().all()
+    assert out["Empty"].tolist() == [None, None, None]
+
+
+def test_pete_ready_dataframe_concatenates_seller_fields() -> None:
+    """Seller 1 / Seller 1 Email / Seller 1 Phone are built in one pass."""
+    df = _sample_df()
+    mapper = PeteHeaderMapper()
+    pete_df = mapper.create_pete_ready_dataframe(df, mapper.suggest_mapping(df))
+
+    assert list(pete_df.columns) == PeteHeaderMapper.PETE_HEADERS
+    assert pete_df["Seller 1"].tolist() == ["Bob Smith", "Jones", "Ann"]
+    assert pete_df["Seller 1 Email"].tolist() == ["bob@x.com; b2@x.com; b2@x.com", None, None]  # repeats kept
+    assert pete_df["Seller 1 Phone"].tolist() == ["4055551234", None, "4055559999"]
+    assert pete_df["Property Address"].tolist() == ["1 Main St", "2 Oak Ave", None]
+
+
+def test_transform_data_concat_matches_row_wise_join() -> None:
+    """transform_data joins non-null values with str(), like apply(axis=1)."""
+    df = pd.DataFrame({"Beds": [1, 2, 3], "Baths": [np.nan, 2.5, 1.0]})
+    standardizer = DataStandardizer(
+        pete_headers=["Rooms", "Bedrooms", "Other"],
+        rules={"concat_fields": {"Rooms": ["beds", "baths"]}, "concat_separator": "/"},
+    )
+
+    out = standardizer.transform_data(df, {"Beds": "Bedrooms"})
+
+    # Rows are upcast to float64 before joining, exactly as apply(axis=1) does
+    assert out["Rooms"].tolist() == ["1.0", "2.0/2.5", "3.0/1.0"]
+    assert out["Bedrooms"].tolist() == [1, 2, 3]
+    assert out["Other"].dtype == np.float64 and out["Other"].isna().all()
+
+
+def test_concat_columns_dedupes_limits_and_labels() -> None:
+    """Engine options used by the merge dialog and email building."""
+    df = pd.DataFrame({"A": [" x ", "y", None], "B": ["x", " ", None], "C": ["z", "y", "w"]})
+
+    deduped = concat_columns(df, ConcatRule(("A", "B", "C"), "; ", strip_parts=True, skip_empty=True, dedupe=True))
+    limited = concat_columns(df, ConcatRule(("A", "B", "C"), "|", skip_empty=True, max_parts=1))
+    labelled = concat_columns(df, ConcatRule(("A", "B", "C"), ", ", fill_null="", labels=("A", "B", "C")))
+
+    assert deduped.tolist() == ["x; z", "y", "w"]
+    assert limited.tolist() == [" x ", "y", "w"]
+    assert labelled.tolist() == ["A:  x , B: x, C: z", "A: y, B:  , C: y", "A: , B: , C: w"]
+
+
+def test_benchmark_concat_reports_all_variants() -> None:
+    """The benchmark runs on a small frame and times every variant."""
+    timing = benchmark_concat(n_rows=500, n_columns=3)
+
+    assert set(timing) == {"engine", "row_apply", "iterrows"}
@@ -0,0 +1,102 @@
+"""Tests for recording and replaying data prep operations."""
+
+import pandas as pd
+import polars as pl
+
+from backend.utils.operation_log import Operation, OperationLog, replay_operations
+from frontend.data_prep.version_manager import DataVersionManager
+
+
+def _upload(path, n: int = 6) -> None:
+    pd.DataFrame(
+        {
+            "First Name": ["Bob", "Ann", None, "Cy", "Bob", "Dee"][:n],
+            "Last Name": ["Smith", " ", "Jones", "Lee", "Smith", "Ray"][:n],
+            "Parcel": [101.0, 102.0, None, 104.0, 101.0, 106.0][:n],
+            "Property Zip": ["73102.0", "73103-0001", "73104", None, "73102.0", "73105"][:n],
+        }
+    ).to_csv(path, index=False)
+
+
+def _log() -> OperationLog:
+    log = OperationLog()
+    log.append("merge", columns=["First Name", "Last Name"], new_name="Seller", delimiter=" ",
+               handle_empty=True, keep_original=False, include_headers=False)
+    log.append("hide_columns", columns=["Parcel"])
+    log.append("rename", mapping={"Property Zip": "Zip"})
+    log.append("drop_duplicates", method="all_columns", columns=[], keep="first")
+    log.append("strip_trailing_dot")
+    log.append("reorder", columns=["Zip", "Seller"])
+    return log
+
+
+def test_replay_applies_operations_in_order(tmp_path) -> None:
+    """A recorded log rebuilds the prepared frame from a raw file."""
+    path = tmp_path / "upload.csv"
+    _upload(path)
+
+    out = _log().replay(path)
+
+    assert list(out.columns) == ["Zip", "Seller"]  # Parcel is hidden, as in the editor
+    assert out["Seller"].tolist() == ["Bob Smith", "Ann", "Jones", "Cy Lee", "Dee Ray"]
+    assert out["Zip"].tolist() == ["73102", "73103-0001", "73104", None, "73105"]
+    assert _log().hidden_columns() == {"Parcel"}
+
+    out = _log().replay(path, keep_hidden=True)
+    assert list(out.columns) == ["Zip", "Seller", "Parcel"]
+    assert out["Parcel"].dtype == "float64"  # the editor's cleanup only touches text
+    assert out["Parcel"].fillna(0).tolist() == [101.0, 102.0, 0.0, 104.0, 106.0]
+
+
+def test_lazy_operations_compile_into_one_plan() -> None:
+    """Without data-dependent steps the log is a single unevaluated plan."""
+    source = pl.DataFrame({"First Name": ["Bob"], "Last Name": ["Smith"], "Property Zip": ["73102.0"]}).lazy()
+    log = _log()
+
+    plan = log.plan(source)
+
+    assert isinstance(plan, pl.LazyFrame)
+    assert plan.collect().to_dicts() == [{"Zip": "73102", "Seller": "Bob Smith"}]
+
+
+def test_version_history_yields_log_up_to_current_version(tmp_path) -> None:
+    """Undone and reset edits are not part of the replayed log, hiding is; JSON round-trips."""
+    df = pd.DataFrame({"A": ["x", "x"], "B": ["1", "2"]})
+    manager = DataVersionManager()
+    manager.save_version(df, "Initial Upload")
+    manager.save_version(df.rename(columns={"A": "C"}), "Renamed column", "",
+                         Operation("rename", {"mapping": {"A": "C"}}))
+    manager.save_version(df, "Reset to original", "", Operation("reset"))
+    manager.save_version(df.drop_duplicates(subset=["A"]), "Removed 1 duplicates", "",
+                         Operation("drop_duplicates", {"method": "selected_columns", "columns": ["A"], "keep": "first"}))
+    manager.save_version(df.rename(columns={"B": "D"}), "Renamed column", "",
+                         Operation("rename", {"mapping": {"B": "D"}}))
+    manager.record_operation(Operation("hide_columns", {"columns": ["A"]}))
+    manager.undo()  # the editor keeps hiding A
+
+    log = manager.get_operation_log()
+    path = tmp_path / "log.json"
+    log.save(path)
+
+    assert [op.kind for op in log.operations] == ["drop_duplicates", "hide_columns"]
+    assert log.hidden_columns() == {"A"}
+    assert OperationLog.load(path) == log
+    assert replay_operations(df, log.to_list()).to_dict("list") == {"B": ["1"]}
+
+
+def test_numeric_merge_replays_like_the_editor() -> None:
+    """Non-text merges render values with str() after the editor's row upcast."""
+    from backend.utils.mapping_executor import ConcatRule, concat_columns, row_dtype
+
+    df = pd.DataFrame({"Beds": [3, 4, 2], "Ratio": [1e-05, 2.5, None], "Name": ["a", "b", "c"]})
+    columns = ["Beds", "Ratio"]
+    live = concat_columns(df, ConcatRule(tuple(columns), separator=" | ", skip_empty=True,
+                                         as_dtype=row_dtype(df[columns])))
+    log = OperationLog()
+    log.append("merge", columns=columns, new_name="Merged", delimiter=" | ",
+               handle_empty=True, keep_original=False, include_headers=False)
+
+    out = log.replay(df)
+
+    assert out["Merged"].tolist() == live.tolist() == ["3.0 | 1e-05", "4.0 | 2.5", "2.0"]
+    assert list(out.columns) == ["Merged", "Name"]
@@ -0,0 +1,128 @@
+"""Tests for the shared owner data service and its GUI consumers."""
+
+import gc
+import os
+import threading
+import weakref
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject
+from backend.utils.owner_data_service import OwnerDataService, get_owner_data_service
+from backend.utils.owner_persistence_manager import OwnerPersistenceManager
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _owners(n: int = 200, offset: int = 0):
+    return [EnhancedOwnerObject(individual_name=f"Owner {offset + i}", mailing_address=f"{i} Oak Ave",
+                                property_count=1 + i % 3, total_property_value=1000.0 * i,
+                                confidence_score=(i % 10) / 10, is_business_owner=i % 4 == 0,
+                                is_individual_owner=i % 4 != 0)
+            for i in range(n)]
+
+
+def _save(base_dir, name, owners):
+    OwnerPersistenceManager(str(base_dir)).save_owner_objects(owners, name, create_backup=False)
+
+
+def test_dataset_is_loaded_once_until_it_changes(tmp_path) -> None:
+    _save(tmp_path, "ds1", _owners())
+    service = OwnerDataService(str(tmp_path))
+
+    first = service.load("ds1")
+    assert service.load("ds1") is first
+    assert {key: first.stats[key] for key in (
+        'total_owners', 'total_properties', 'total_value', 'business_owners', 'individual_owners',
+        'multi_property_owners', 'high_confidence_targets')} == {
+        'total_owners': 200,
+        'total_properties': sum(o.property_count for o in first.owners),
+        'total_value': sum(o.total_property_value for o in first.owners),
+        'business_owners': 50, 'individual_owners': 150,
+        'multi_property_owners': sum(o.property_count > 1 for o in first.owners),
+        'high_confidence_targets': sum(o.confidence_score >= 0.8 for o in first.owners),
+    }
+    assert first.column("property_count").tolist() == [o.property_count for o in first.owners]
+    assert first.search_index.search("owner 19").tolist() == [19] + list(range(190, 200))
+
+    # Concurrent requests share one load
+    pkl = tmp_path / "owner_objects" / "ds1" / "owner_objects.pkl"
+    stat = os.stat(pkl)
+    os.utime(pkl, (stat.st_atime, stat.st_mtime + 10))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.load("ds1"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(snapshot) for snapshot in results}) == 1
+    assert results[0].version == first.version + 1
+
+
+def test_switching_datasets_releases_the_previous_one(tmp_path) -> None:
+    _save(tmp_path, "ds1", _owners())
+    _save(tmp_path, "ds2", _owners(50, offset=1000))
+    service = OwnerDataService(str(tmp_path))
+    seen = []
+    unsubscribe = service.subscribe(lambda snapshot: seen.append(snapshot and snapshot.dataset_name))
+
+    service.load("ds1")
+    snapshot = service.load_in_background("ds2").result(timeout=30)
+    assert snapshot.dataset_name == "ds2" and len(snapshot) == 50
+    assert seen == ["ds1", None, "ds2"]
+
+    unsubscribe()
+    service.release()
+    assert service.snapshot is None and seen == ["ds1", None, "ds2"]
+    with pytest.raises(FileNotFoundError):
+        service.load("missing")
+
+
+def test_screens_share_the_loaded_snapshot(app, qtbot) -> None:
+    from frontend.components.custom_export.custom_export_ui import CustomExportUI
+    from frontend.components.owner_dashboard.owner_dashboard import OwnerDashboard
+
+    service = get_owner_data_service()
+    try:
+        first = service.set_owners(_owners())
+        dashboard = OwnerDashboard()
+        assert dashboard.owner_objects is first.owners
+        assert dashboard.table_model.total_rows() == 200
+
+        export_ui = CustomExportUI()
+        assert export_ui.owner_objects is first.owners
+        assert export_ui.facets_for(first.owners) is first.facets
+
+        # A snapshot published on a worker thread reaches the dashboard on the GUI thread
+        worker = threading.Thread(target=service.set_owners, args=(_owners(30),))
+        worker.start()
+        worker.join()
+        qtbot.waitUntil(lambda: len(dashboard.owner_objects) == 30, timeout=5000)
+        assert dashboard.snapshot_version == service.snapshot.version
+    finally:
+        service.release()
+
+
+def test_release_frees_the_owners_shown_by_the_dashboard(app, qtbot) -> None:
+    from frontend.components.owner_dashboard.owner_dashboard import OwnerDashboard
+
+    service = get_owner_data_service()
+    try:
+        service.set_owners(_owners())
+        dashboard = OwnerDashboard()
+        dashboard.search_input.setText("Owner 1")
+        dashboard.apply_filters()
+        assert 0 < dashboard.table_model.total_rows() < 200
+        assert dashboard.filtered_owners[0] is dashboard.table_model.record(0)
+        probe = weakref.ref(dashboard.owner_objects[0])
+    finally:
+        service.release()
+
+    qtbot.waitUntil(lambda: dashboard.snapshot_version is None, timeout=5000)
+    gc.collect()
+    assert probe() is None
+    assert dashboard.table_model.total_rows() == 0
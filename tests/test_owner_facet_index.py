@@ -0,0 +1,115 @@
+"""Tests for the owner facet index and the filters built on it."""
+
+import random
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject, PhoneData
+from backend.utils.hierarchical_owner_grouping import HierarchicalOwnerGroup, HierarchicalOwnerGrouper
+from backend.utils.owner_facet_index import OwnerFacetIndex
+from frontend.components.custom_export.custom_export_ui import CustomExportUI
+from frontend.components.owner_dashboard.owner_dashboard_utils import OwnerDataFilter
+
+STATUSES = ["CORRECT", "WRONG", "DEAD", "NO_ANSWER"]
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _owners(n: int = 1500):
+    rng = random.Random(11)
+    owners = []
+    for i in range(n):
+        business = rng.random() < 0.3
+        owners.append(EnhancedOwnerObject(
+            individual_name="" if business else f"Owner {i}",
+            business_name=f"Acme {i} LLC" if business else "",
+            mailing_address=f"{i} Oak Ave",
+            property_count=rng.randint(1, 5),
+            total_property_value=rng.choice([0.0, 85000.0, 250000.0, 1.2e6]),
+            phone_quality_score=round(rng.uniform(0, 10), 1),
+            confidence_score=rng.choice([0.2, 0.5, 0.8, 0.95]),
+            is_business_owner=business,
+            is_individual_owner=not business and rng.random() < 0.9,
+            all_phones=[PhoneData(number=f"555{i:04d}{k}", status=rng.choice(STATUSES))
+                        for k in range(rng.randint(0, 3))],
+        ))
+    return owners
+
+
+def test_masks_and_ranges_match_a_scan() -> None:
+    owners = _owners()
+    facets = OwnerFacetIndex(owners)
+
+    assert facets.select(facets.mask("business")) == [o for o in owners if o.is_business_owner]
+    assert facets.select(facets.mask("individual")) == [o for o in owners if o.is_individual_owner]
+    assert facets.select(facets.mask("multi_property")) == [o for o in owners if o.property_count > 1]
+    for status in STATUSES:
+        assert facets.select(facets.phone_status_mask(status)) == [
+            o for o in owners if any(p.status == status for p in o.all_phones)], status
+    assert facets.count(facets.phone_status_mask("MISSING")) == 0
+    assert facets.phone_statuses() == sorted(STATUSES)
+
+    mask = facets.range_mask("phone_quality_score", low=6.0, high=8.0) & facets.mask("business")
+    assert facets.select(mask) == [o for o in owners if 6.0 <= o.phone_quality_score < 8.0 and o.is_business_owner]
+    assert facets.count(facets.range_mask("total_property_value", low=250000)) == sum(
+        o.total_property_value >= 250000 for o in owners)
+    with pytest.raises(KeyError):
+        facets.mask("nonexistent")
+
+
+def test_nan_values_fail_open_ended_ranges() -> None:
+    owners = _owners(50)
+    owners[3].total_property_value = float("nan")
+    owners[7].confidence_score = float("nan")
+    facets = OwnerFacetIndex(owners)
+
+    assert owners[3] not in facets.select(facets.range_mask("total_property_value", low=100000))
+    assert owners[7] not in facets.select(facets.range_mask("confidence_score", low=0.8))
+    assert facets.values["total_property_value"][3] == 0.0
+
+    indexed = OwnerDataFilter()
+    indexed.set_indexes(owners)
+    filters = {'owner_type': "All Owners", 'value_min': 100000, 'confidence_min': 0.8}
+    assert indexed.apply_filters(owners, filters) == OwnerDataFilter().apply_filters(owners, filters)
+
+
+def test_dashboard_filter_combinations_match_the_plain_filters() -> None:
+    owners = _owners()
+    indexed = OwnerDataFilter()
+    indexed.set_indexes(owners)
+    plain = OwnerDataFilter()
+
+    for filters in [
+        {'owner_type': "Individual Owners", 'confidence_min': 0.5},
+        {'owner_type': "Multi-Property", 'value_min': 100000, 'search_term': "1 oak"},
+        {'owner_type': "High Confidence", 'property_count_min': 3},
+        {'owner_type': "All Owners", 'search_term': ""},
+    ]:
+        expected = plain.apply_filters(owners, filters)
+        assert indexed.apply_filters(owners, filters) == expected, filters
+        assert indexed.count_matches(owners, filters) == len(expected)
+
+
+def test_grouper_and_export_dialog_filter_through_facets(app) -> None:
+    groups = [HierarchicalOwnerGroup(owner_name=f"Owner {i}", is_business=i % 4 == 0,
+                                     confidence_score=(i % 10) / 10) for i in range(200)]
+    grouper = HierarchicalOwnerGrouper()
+    assert grouper.filter_owners_by_type(groups, "Business") == [g for g in groups if g.is_business]
+    assert grouper.filter_owners_by_type(groups, "individual") == [g for g in groups if not g.is_business]
+    assert grouper.filter_owners_by_type(groups, "all") is groups
+    assert grouper.filter_owners_by_confidence(groups, 0.7) == [g for g in groups if g.confidence_score >= 0.7]
+
+    owners = _owners(300)
+    dialog = CustomExportUI(owner_objects=owners)
+    dialog.owner_type_combo.setCurrentText("Individual")
+    dialog.phone_quality_combo.setCurrentText("Low (<6.0)")
+    dialog.phone_status_combo.setCurrentText("CORRECT")
+    expected = [o for o in owners if o.is_individual_owner and o.phone_quality_score < 6.0
+                and any(p.status == "CORRECT" for p in o.all_phones)]
+    assert dialog.filter_owners(owners) == expected
+    assert dialog.apply_filters(owners) == len(expected)
+    assert f"Filtered Owners: {len(expected):,}" in dialog.summary_text.toPlainText()
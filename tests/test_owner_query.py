@@ -0,0 +1,151 @@
+"""Tests for the columnar owner query engine, its CLI command and query panel."""
+
+import random
+import time
+
+import numpy as np
+import polars as pl
+import pytest
+from click.testing import CliRunner
+
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject, PhoneData
+from backend.utils.owner_persistence_manager import OwnerPersistenceManager
+from backend.utils.owner_query import OwnerQuery, OwnerQueryEngine, OwnerQueryError, ensure_owner_tables
+
+
+def _owners(n: int = 400, seed: int = 3):
+    rng = random.Random(seed)
+    owners = []
+    for i in range(n):
+        business = rng.random() < 0.5
+        phones = [PhoneData(number=f"405555{i:04d}{k}", status=rng.choice(["CORRECT", "WRONG", "UNKNOWN"]),
+                            phone_type=rng.choice(["MOBILE", "LANDLINE"]))
+                  for k in range(rng.randint(0, 3))]
+        owners.append(EnhancedOwnerObject(
+            individual_name="" if business else f"Owner {i}",
+            business_name=f"Holdings {i} {rng.choice(['LLC', 'INC', 'TRUST'])}" if business else "",
+            mailing_address=f"{i} Elm St, Tulsa, OK {rng.choice(['73101', '73120', '74104'])}",
+            is_business_owner=business, is_individual_owner=not business,
+            property_count=rng.randint(1, 9), total_property_value=float(rng.randint(0, 900) * 1000),
+            property_addresses=[f"{i}{k} Oak Ave, OK 7310{k}" for k in range(rng.randint(0, 2))],
+            all_phones=phones,
+        ))
+    return owners
+
+
+def test_queries_match_a_scan_of_the_owner_objects(tmp_path) -> None:
+    owners = _owners()
+    OwnerPersistenceManager(str(tmp_path)).save_owner_objects(owners, "ds", create_backup=False)
+    engine = OwnerQueryEngine.for_dataset(base_dir=str(tmp_path))
+
+    query = OwnerQuery.parse(where="entity_type=LLC; mailing_zip~73*; property_count>=5; "
+                                   "phones.status=CORRECT; phones.phone_type=MOBILE",
+                             order_by="-total_property_value, owner_id")
+    expected = [i for i, o in enumerate(owners)
+                if o.business_name.endswith("LLC") and o.mailing_address.endswith(("73101", "73120"))
+                and o.property_count >= 5
+                and any(p.status == "CORRECT" and p.phone_type == "MOBILE" for p in o.all_phones)]
+    expected.sort(key=lambda i: (-owners[i].total_property_value, i))
+    result = engine.run(query)
+    assert expected and result.frame["owner_id"].to_list() == expected
+
+    # Aggregates per group, ordered and limited
+    result = engine.run({"group_by": "mailing_zip",
+                         "aggregates": "owners=count(*), value=sum(total_property_value), top=max(property_count)",
+                         "order_by": "-owners", "limit": 2})
+    counts = {}
+    for o in owners:
+        counts[o.mailing_address[-5:]] = counts.get(o.mailing_address[-5:], 0) + 1
+    assert result.frame["owners"].to_list() == sorted(counts.values(), reverse=True)[:2]
+    top_zip = result.frame["mailing_zip"][0]
+    assert result.frame["value"][0] == sum(o.total_property_value for o in owners if o.mailing_address.endswith(top_zip))
+
+    phones = engine.run(OwnerQuery.parse(table="phones", where="status in CORRECT,UNKNOWN", aggregates="count(*)"))
+    assert phones.frame["count"][0] == sum(p.status != "WRONG" for o in owners for p in o.all_phones)
+    properties = engine.run(OwnerQuery.parse(table="properties", where="property_zip=73101", select="owner_id"))
+    assert properties.frame.height == sum(a.endswith("73101") for o in owners for a in o.property_addresses)
+
+    # Filters and projections are pushed down to the Parquet scan
+    plan = engine.explain(query)
+    assert "SELECTION" in plan and "PROJECT" in plan
+
+
+def test_query_parsing_errors_and_cli(tmp_path) -> None:
+    from cli import cli
+
+    condition = OwnerQuery.parse(where="phones.status != 'WRONG'; best_contact_method is not null").where
+    assert [(c.table, c.column, c.op, c.value) for c in condition] == [
+        ("phones", "status", "!=", "WRONG"), (None, "best_contact_method", "is_not_null", None)]
+
+    manager = OwnerPersistenceManager(str(tmp_path))
+    manager.save_owner_objects(_owners(50), "small", create_backup=False)
+    dataset_dir = manager.dataset_dir("small")
+    engine = OwnerQueryEngine(ensure_owner_tables(dataset_dir))
+    for spec, message in [({"where": "nope=1"}, "Unknown owners column"),
+                          ({"where": "property_count>=many"}, "needs a"),
+                          ({"aggregates": "avg(property_count)"}, "Cannot parse aggregate"),
+                          ({"order_by": "name", "group_by": "entity_type"}, "Cannot order by"),
+                          ({"table": "buildings"}, "Unknown table"),
+                          ({"where": "property_count"}, "Cannot parse condition")]:
+        with pytest.raises(OwnerQueryError, match=message):
+            engine.run(spec)
+
+    # Fractional bounds on integer columns are not truncated
+    counts = engine.run({"select": "property_count"}).frame["property_count"]
+    assert engine.run({"where": "property_count>=2.5"}).frame.height == (counts >= 3).sum()
+    assert engine.run({"where": "property_count<=2.5"}).frame.height == (counts <= 2).sum()
+    assert engine.run({"where": "property_count in 2,2.5"}).frame.height == (counts == 2).sum()
+
+    # Tables of datasets saved before they existed are built on first use
+    for path in (dataset_dir / "tables").iterdir():
+        path.unlink()
+    assert OwnerQueryEngine.for_dataset("small", base_dir=str(tmp_path)).run({}).frame.height == 50
+
+    runner = CliRunner()
+    output = tmp_path / "llcs.csv"
+    result = runner.invoke(cli, ["query", "--base-dir", str(tmp_path), "-w", "entity_type=LLC",
+                                 "-g", "mailing_zip", "-a", "owners=count(*)", "-o", "mailing_zip",
+                                 "--output", str(output)])
+    assert result.exit_code == 0, result.output
+    assert pl.read_csv(output)["owners"].sum() == engine.run({"where": "entity_type=LLC"}).frame.height
+    result = runner.invoke(cli, ["query", "--base-dir", str(tmp_path), "-w", "missing=1"])
+    assert result.exit_code == 1 and "Unknown owners column" in result.output
+
+
+def test_portfolio_queries_on_300k_owners_run_under_a_second(tmp_path) -> None:
+    rng = np.random.default_rng(0)
+    n = 300_000
+    tables = tmp_path / "tables"
+    tables.mkdir()
+    pl.DataFrame({
+        "owner_id": np.arange(n, dtype=np.int32),
+        "name": [f"Owner {i}" for i in range(n)],
+        "entity_type": rng.choice(["Individual", "LLC", "Corporation", "Trust"], n),
+        "mailing_address": [f"{i} Main St" for i in range(n)],
+        "mailing_zip": rng.integers(73000, 75000, n).astype(str),
+        "property_count": rng.integers(1, 20, n, dtype=np.int32),
+        "total_property_value": rng.random(n) * 1e6,
+        "confidence_score": rng.random(n),
+        "correct_phone_count": rng.integers(0, 3, n, dtype=np.int32),
+    }).write_parquet(tables / "owners.parquet")
+    m = 3 * n
+    pl.DataFrame({
+        "owner_id": rng.integers(0, n, m, dtype=np.int32),
+        "number": np.arange(m).astype(str),
+        "status": rng.choice(["CORRECT", "WRONG", "UNKNOWN"], m),
+        "phone_type": rng.choice(["MOBILE", "LANDLINE"], m),
+    }).write_parquet(tables / "phones.parquet")
+
+    engine = OwnerQueryEngine(tables)
+    queries = [
+        OwnerQuery.parse(where="entity_type=LLC; mailing_zip~73*; property_count>=5; "
+                               "phones.status=CORRECT; phones.phone_type=MOBILE",
+                         order_by="-total_property_value", limit=100),
+        OwnerQuery.parse(group_by="mailing_zip", aggregates="owners=count(*), value=sum(total_property_value)",
+                         order_by="-value", limit=20),
+        OwnerQuery.parse(where="name~*9999*", order_by="name"),
+    ]
+    for query in queries:
+        start = time.perf_counter()
+        result = engine.run(query)
+        assert time.perf_counter() - start < 1.0 and len(result) > 0
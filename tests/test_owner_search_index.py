@@ -0,0 +1,87 @@
+"""Tests for the trigram owner search index."""
+
+import os
+import pickle
+import random
+
+import numpy as np
+
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject
+from backend.utils.owner_search_index import (
+    INDEX_FILENAME, OwnerSearchIndex, load_or_build_search_index
+)
+from frontend.components.owner_dashboard.owner_dashboard_utils import OwnerDataFilter
+
+STREETS = ["Oak Ave", "Main St", "Elm St", "Café Blvd", "NW 23rd Pl"]
+
+
+def _owners(n: int = 2000):
+    rng = random.Random(7)
+    owners = []
+    for i in range(n):
+        count = rng.randint(1, 4)
+        owners.append(EnhancedOwnerObject(
+            individual_name=f"Owner {i} Smith" if i % 3 else "",
+            business_name=f"Acme {i} LLC" if i % 3 == 0 else "",
+            mailing_address=f"{rng.randint(1, 999)} {rng.choice(STREETS)}",
+            property_addresses=[f"{rng.randint(1, 999)} {rng.choice(STREETS)}" for _ in range(count)],
+            property_count=count,
+            is_business_owner=i % 3 == 0,
+        ))
+    return owners
+
+
+def _scan(owners, query):
+    return [i for i, owner in enumerate(owners) if OwnerDataFilter()._matches_search(owner, query)]
+
+
+def test_search_matches_a_full_scan() -> None:
+    owners = _owners()
+    index = OwnerSearchIndex.build(owners)
+
+    for query in ["oak", "OAK AVE", "12 m", "café", "acme 3", "smith", "1", "st", "zzz", "h o"]:
+        assert index.search(query).tolist() == _scan(owners, query), query
+    assert len(index.search("")) == len(owners)
+    assert index.search("t\0").tolist() == []
+
+
+def test_typing_narrows_from_the_previous_result() -> None:
+    owners = _owners()
+    index = OwnerSearchIndex.build(owners)
+
+    for query in ["1", "12", "12 ", "12 e", "12 el", "12 elm"]:
+        assert index.search(query).tolist() == _scan(owners, query), query
+    assert index.search("1").tolist() == _scan(owners, "1")  # deleting widens again
+
+
+def test_index_is_persisted_next_to_the_dataset(tmp_path) -> None:
+    owners = _owners(300)
+    with open(tmp_path / "owner_objects.pkl", "wb") as f:
+        pickle.dump(owners, f)
+
+    built = load_or_build_search_index(owners, tmp_path)
+    assert (tmp_path / INDEX_FILENAME).exists()
+    loaded = load_or_build_search_index(owners, tmp_path)
+    for name in ("trigrams", "posting_offsets", "postings", "doc_offsets"):
+        assert np.array_equal(getattr(built, name), getattr(loaded, name))
+    assert loaded.search("oak").tolist() == _scan(owners, "oak")
+
+    # A newer dataset file makes the persisted index stale
+    stat = os.stat(tmp_path / "owner_objects.pkl")
+    os.utime(tmp_path / "owner_objects.pkl", (stat.st_atime, stat.st_mtime + 10))
+    fewer = owners[:100]
+    rebuilt = load_or_build_search_index(fewer, tmp_path)
+    assert len(rebuilt) == 100
+
+
+def test_filter_uses_the_index_for_its_owner_list() -> None:
+    owners = _owners()
+    owner_filter = OwnerDataFilter()
+    owner_filter.set_indexes(owners, OwnerSearchIndex.build(owners))
+
+    filters = {'owner_type': "Business Entities", 'search_term': "Oak"}
+    result = owner_filter.apply_filters(owners, filters)
+    assert result == [o for o in owners if o.is_business_owner and owner_filter._matches_search(o, "Oak")]
+
+    other = owners[:50]  # not the indexed list: plain scan
+    assert owner_filter.apply_filters(other, filters) == [o for o in result if o in other]
@@ -0,0 +1,121 @@
+"""Tests for the precomputed owner summary sidecar and its consumers."""
+
+import os
+import pickle
+import random
+import time
+
+import pytest
+
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject
+from backend.utils.hierarchical_owner_grouping import HierarchicalOwnerGroup, HierarchicalOwnerGrouper
+from backend.utils.owner_facet_index import OwnerFacetIndex
+from backend.utils.owner_persistence_manager import OwnerPersistenceManager
+from backend.utils.owner_summary import OwnerRollup, read_owner_summary
+
+
+def _owners(n: int = 600, seed: int = 5):
+    rng = random.Random(seed)
+    owners = []
+    for i in range(n):
+        business = rng.random() < 0.3
+        owners.append(EnhancedOwnerObject(
+            individual_name=f"Owner {seed}-{i}", mailing_address=f"{i} Elm St",
+            property_count=rng.randint(0, 12),
+            total_property_value=rng.choice([0.0, 50000.0, 80000.0, 300000.0, 2e6]),
+            phone_quality_score=rng.choice([0.0, 0.3, 0.4, 0.65, 0.9]),
+            confidence_score=rng.choice([0.2, 0.5, 0.79, 0.8, 0.95]),
+            is_business_owner=business,
+            is_individual_owner=not business or rng.random() < 0.2,
+        ))
+    return owners
+
+
+def _comparable(summary):
+    return {key: value for key, value in summary.items()
+            if key not in ('total_value', 'average_value_per_owner', 'average_phone_quality',
+                           'format', 'source_mtime', 'generated_at')}
+
+
+def test_rollup_matches_a_scan_of_the_owners() -> None:
+    owners = _owners()
+    summary = OwnerRollup.from_owners(owners).summary()
+
+    assert summary['total_owners'] == len(owners)
+    assert summary['total_properties'] == sum(o.property_count for o in owners)
+    assert summary['total_value'] == pytest.approx(sum(o.total_property_value for o in owners))
+    assert summary['business_owners'] == sum(o.is_business_owner for o in owners)
+    assert summary['multi_property_owners'] == sum(o.property_count > 1 for o in owners)
+    assert summary['high_confidence_targets'] == sum(o.confidence_score >= 0.8 for o in owners)
+    breakdown = summary['confidence_breakdown']
+    assert breakdown['medium_confidence']['count'] == sum(0.5 <= o.confidence_score < 0.8 for o in owners)
+    assert breakdown['low_confidence']['percentage'] == pytest.approx(
+        sum(o.confidence_score < 0.5 for o in owners) / len(owners) * 100)
+    assert summary['owner_type_breakdown']['individual_business']['count'] == sum(
+        o.is_individual_owner and o.is_business_owner for o in owners)
+
+    histograms = summary['histograms']
+    assert histograms['total_property_value']['$0-$50K'] == sum(o.total_property_value <= 50000 for o in owners)
+    assert histograms['property_count']['10+ Properties'] == sum(o.property_count > 10 for o in owners)
+    assert histograms['phone_quality_score']['Low Quality'] == sum(
+        0 < o.phone_quality_score <= 0.4 for o in owners)
+    assert all(sum(counts.values()) == len(owners) for counts in histograms.values())
+    assert OwnerRollup.from_owners([]).summary()['average_value_per_owner'] == 0
+
+
+def test_sidecar_is_written_on_save_and_ignored_once_stale(tmp_path) -> None:
+    owners = _owners()
+    manager = OwnerPersistenceManager(str(tmp_path))
+    manager.save_owner_objects(owners, "ds1", create_backup=False)
+    dataset_dir = manager.dataset_dir("ds1")
+
+    saved = read_owner_summary(dataset_dir)
+    assert _comparable(saved) == _comparable(OwnerRollup.from_owners(owners).summary())
+
+    # Saving again rewrites the sidecar from the new owners
+    changed = owners[100:] + _owners(80, seed=9)
+    manager.save_owner_objects(changed, "ds1", create_backup=False)
+    assert read_owner_summary(dataset_dir)['total_owners'] == len(changed)
+
+    pkl = dataset_dir / "owner_objects.pkl"
+    with open(pkl, 'wb') as f:
+        pickle.dump(owners, f)
+    os.utime(pkl, (time.time() + 5, time.time() + 5))
+    assert read_owner_summary(dataset_dir) is None  # the sidecar no longer matches the pickle
+
+
+def test_dashboards_use_the_precomputed_summary(tmp_path, monkeypatch) -> None:
+    from backend.utils.user_manager import UserManager
+    from frontend.components.owner_dashboard.owner_dashboard_utils import OwnerDataAnalyzer
+
+    owners = _owners()
+    monkeypatch.chdir(tmp_path)
+    OwnerPersistenceManager().save_owner_objects(owners[:50], "old", create_backup=False)
+    OwnerPersistenceManager().save_owner_objects(owners, "latest", create_backup=False)
+
+    user_manager = UserManager()
+    user_manager.login_user()
+    owner_analysis = user_manager.get_dashboard_data()['analysis']['owner_analysis']
+    assert owner_analysis['total_owners'] == len(owners)
+    assert owner_analysis['business_entities'] == sum(o.is_business_owner for o in owners)
+    assert owner_analysis['dataset_name'] == "latest" and owner_analysis['loaded'] is False
+
+    # Filtered summary cards: a masked rollup equals the analysis of the filtered list
+    analyzer = OwnerDataAnalyzer()
+    facets = OwnerFacetIndex(owners)
+    mask = facets.mask("business")
+    masked = analyzer.analyze_owners(owners, facets=facets, mask=mask)
+    assert masked == analyzer.analyze_owners(facets.select(mask))
+    assert masked['confidence_distribution']['High (0.8+)'] == sum(
+        o.is_business_owner and o.confidence_score >= 0.8 for o in owners)
+
+    groups = [HierarchicalOwnerGroup(owner_name=f"G{i}", mailing_address="", is_business=i % 2 == 0,
+                                     properties=[], total_value=1000.0 * i, property_count=i % 4,
+                                     phone_quality=0.5, phone_count=2, correct_phones=1,
+                                     confidence_score=(i % 10) / 10)
+              for i in range(40)]
+    stats = HierarchicalOwnerGrouper().get_owner_summary_stats(groups)
+    assert (stats['business_owners'], stats['multi_property_owners']) == (20, 20)
+    assert (stats['high_confidence_targets'], stats['medium_confidence_targets'],
+            stats['low_confidence_targets']) == (8, 8, 24)
+    assert stats['avg_phone_quality'] == pytest.approx(0.5) and stats['phone_accuracy_rate'] == 50
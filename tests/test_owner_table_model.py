@@ -0,0 +1,108 @@
+"""Tests for the virtual owner table model."""
+
+import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QTableView
+
+from backend.utils.hierarchical_owner_grouping import HierarchicalOwnerGroup
+from frontend.components.owner_dashboard.owner_table_model import OwnerTableModel
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _groups(n: int = 2500):
+    return [
+        HierarchicalOwnerGroup(
+            owner_name=f"Owner {i:05d}",
+            mailing_address=f"{i} Main St",
+            property_count=i % 7 + 1,
+            total_value=1000.0 * i,
+            properties=[{"property_address": f"{i}-{p} Oak Ave"} for p in range(i % 7 + 1)],
+            phone_quality=(i % 10) or 0.0,
+            phone_count=3,
+            correct_phones=i % 4,
+            is_business=i % 2 == 0,
+            confidence_score=(i % 5) / 5,
+        )
+        for i in range(n)
+    ]
+
+
+def test_cells_are_formatted_like_the_old_table(app) -> None:
+    model = OwnerTableModel.from_owner_groups(_groups(10))
+    row = [model.data(model.index(4, col)) for col in range(model.columnCount())]
+
+    assert row == [
+        "Owner 00004", "4 Main St", "5", "$4,000", "4.0/10", "0/3", "Unknown",
+        "LLC/Business", "High", "4-0 Oak Ave, 4-1 Oak Ave, 4-2 Oak Ave (+2 more)",
+    ]
+    assert model.data(model.index(0, 3)) == "$0"
+    assert model.data(model.index(0, 4)) == "N/A"
+    assert model.data(model.index(0, 8)) == "Unknown"
+    assert model.data(model.index(3, 8)) == "Medium"
+    assert model.headerData(2, Qt.Horizontal) == "Property Count"
+
+
+def test_rows_are_fetched_in_batches(app) -> None:
+    model = OwnerTableModel.from_owner_groups(_groups(), batch_size=1000)
+
+    assert (model.rowCount(), model.total_rows()) == (1000, 2500)
+    assert model.canFetchMore()
+    model.fetchMore()
+    model.ensure_loaded(2499)
+    assert model.rowCount() == 2500 and not model.canFetchMore()
+
+
+def test_sort_permutes_rows_and_survives_filtering(app) -> None:
+    groups = _groups()
+    model = OwnerTableModel.from_owner_groups(groups)
+    view = QTableView()
+    view.setModel(model)
+
+    view.setSortingEnabled(True)
+    view.sortByColumn(3, Qt.DescendingOrder)  # Total Value
+    assert model.record(0) is groups[-1]
+    assert model.data(model.index(0, 0)) == "Owner 02499"
+    assert [g.owner_name for g in groups[:2]] == ["Owner 00000", "Owner 00001"]  # records untouched
+
+    model.sort(2, Qt.AscendingOrder)  # Property Count, stable within equal counts
+    counts = [model.record(row).property_count for row in range(model.rowCount())]
+    assert counts == sorted(counts)
+    assert model.record(0) is groups[0] and model.record(1) is groups[7]
+
+    model.set_rows([5, 3, 10])
+    assert [model.record(row).owner_name for row in range(model.rowCount())] == [
+        "Owner 00003", "Owner 00010", "Owner 00005",
+    ]
+
+    # Descending ties keep record order, like sorted(reverse=True)
+    model.set_rows(None)
+    model.sort(2, Qt.DescendingOrder)
+    expected = sorted(groups, key=lambda g: g.property_count, reverse=True)
+    model.ensure_loaded(len(groups) - 1)
+    assert [model.record(row) for row in range(model.rowCount())] == expected
+
+
+def test_sort_orders_are_cached_across_clicks_and_filters(app, monkeypatch) -> None:
+    import backend.utils.sort_permutations as sp
+
+    groups = _groups()
+    model = OwnerTableModel.from_owner_groups(groups)
+    extracted = []
+    original = sp.sort_values
+    monkeypatch.setattr(sp, "sort_values", lambda records, key, numeric=None: extracted.append(key)
+                        or original(records, key, numeric))
+
+    model.sort(0, Qt.DescendingOrder)  # Owner Name, case-insensitive
+    model.sort(0, Qt.AscendingOrder)
+    model.set_rows(range(0, len(groups), 3))
+    model.sort(3, Qt.AscendingOrder)
+    model.set_rows(range(1, len(groups), 2))
+    model.sort(0, Qt.DescendingOrder)
+
+    assert len(extracted) == 2  # one extraction per sorted column
+    names = [model.record(row).owner_name for row in range(model.rowCount())]
+    assert names == sorted((g.owner_name for g in groups[1::2]), key=str.lower, reverse=True)[:model.rowCount()]
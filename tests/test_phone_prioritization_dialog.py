@@ -44,12 +44,12 @@ def test_dialog_toggle_rows(qtbot, sample_meta):
     qtbot.addWidget(dlg)
     dlg.show()
 
-    assert dlg.table.rowCount() == 5  # default top-5
+    assert dlg.table.model().rowCount() == 5  # default top-5
 
     # Click toggle → show all 10
     qtbot.mouseClick(dlg.toggle_btn, Qt.LeftButton)
-    qtbot.waitUntil(lambda: dlg.table.rowCount() == len(sample_meta))
+    qtbot.waitUntil(lambda: dlg.table.model().rowCount() == len(sample_meta))
 
     # Click again → back to 5
     qtbot.mouseClick(dlg.toggle_btn, Qt.LeftButton)
-    qtbot.waitUntil(lambda: dlg.table.rowCount() == 5)
+    qtbot.waitUntil(lambda: dlg.table.model().rowCount() == 5)
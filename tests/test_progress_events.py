@@ -0,0 +1,85 @@
+"""Tests for pipeline progress events, the run log and the GUI relay."""
+
+import threading
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from backend.utils.progress_events import (
+    RUN_FINISHED, ProgressEvent, ProgressEventBus, coalesce_events, latest_run_log, read_events
+)
+from backend.utils.progress_tracker import ProgressTracker
+from frontend.utils.progress_relay import ProgressEventRelay
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _run(bus: ProgressEventBus, rows: int = 1000) -> None:
+    tracker = ProgressTracker("Test Pipeline")
+    tracker.add_step("Loading Data")
+    tracker.add_step("Cleaning Data")
+    bus.attach(tracker)
+    bus.start_run("Processing test.csv")
+    tracker.start_step("Loading Data", total_bytes=2048)
+    tracker.end_step(rows, bytes_processed=2048)
+    tracker.start_step("Cleaning Data", rows)
+    for done in range(0, rows, 100):
+        tracker.update_progress(done)
+    tracker.end_step(rows)
+    bus.finish_run(True, "Pipeline completed")
+
+
+def test_tracker_steps_become_events_in_the_run_log(tmp_path) -> None:
+    bus = ProgressEventBus(run_id="run-1", log_dir=tmp_path)
+    seen = []
+    bus.subscribe(seen.append)
+    _run(bus)
+
+    events = read_events(latest_run_log(tmp_path))
+    assert [e.to_dict() for e in events] == [e.to_dict() for e in seen]
+    assert [(e.stage, e.status) for e in events[:3]] == [
+        ("", "run_started"), ("Loading Data", "running"), ("Loading Data", "completed"),
+    ]
+    assert events[2].bytes_done == 2048 and events[2].rows_done == 1000
+    assert events[2].overall_percent == 50
+
+    running = [e for e in events if e.stage == "Cleaning Data" and e.status == "running"]
+    assert running[-1].rows_done == 900 and running[-1].rows_total == 1000
+    assert running[-1].stage_index == 1 and running[-1].stage_count == 2
+    assert running[-1].eta_seconds is not None
+    assert events[-1].status == RUN_FINISHED and events[-1].overall_percent == 100
+
+
+def test_coalescing_keeps_status_changes_and_latest_progress() -> None:
+    events = [ProgressEvent("r", "A", "running", rows_done=i, rows_total=10) for i in range(5)]
+    events.append(ProgressEvent("r", "A", "completed", rows_done=10, rows_total=10))
+    events += [ProgressEvent("r", "B", "running", rows_done=i, rows_total=10) for i in range(3)]
+
+    kept = coalesce_events(events)
+    assert [(e.stage, e.status, e.rows_done) for e in kept] == [
+        ("A", "running", 4), ("A", "completed", 10), ("B", "running", 2),
+    ]
+
+
+def test_relay_delivers_worker_events_on_the_gui_thread(app, qtbot) -> None:
+    bus = ProgressEventBus(log_dir=None)
+    relay = ProgressEventRelay()
+    batches, finished = [], []
+    relay.events_received.connect(lambda batch: batches.append((threading.current_thread(), batch)))
+    relay.run_finished.connect(lambda success, message: finished.append((success, message)))
+    relay.watch(bus)
+
+    worker = threading.Thread(target=_run, args=(bus,))
+    worker.start()
+    worker.join()
+    qtbot.waitUntil(lambda: bool(finished), timeout=5000)
+    relay.stop()
+
+    assert finished == [(True, "Pipeline completed")]
+    assert all(thread is threading.main_thread() for thread, _ in batches)
+    delivered = [event for _, batch in batches for event in batch]
+    assert len(delivered) < 15  # 10 running updates of "Cleaning Data" coalesced
+    assert relay.last_event.status == RUN_FINISHED
@@ -0,0 +1,44 @@
+"""Tests for DataStandardizer.propose_mapping (matrix fuzzy stage + memoization)."""
+
+from backend.utils import data_standardizer as ds
+from backend.utils.data_standardizer import DataStandardizer
+
+PETE_HEADERS = ["Seller 1", "Property Address", "Property City", "Phone 1"]
+
+
+def test_propose_mapping_rule_stages_and_fuzzy_assignment() -> None:
+    """Exact, explicit and fuzzy matches each claim a Pete header only once."""
+    rules = {"explicit_map": {"owner": "Seller 1"}, "fuzzy_threshold": 80}
+    standardizer = DataStandardizer(PETE_HEADERS, rules)
+
+    mapping = standardizer.propose_mapping(
+        ["Owner", "property address", "Property Adress", "Property Cty", "Zzz"]
+    )
+
+    assert mapping["Owner"][0] == "Seller 1"
+    assert mapping["property address"] == ("Property Address", 100.0, "Exact match (case-insensitive)")
+    # The address header is already used, so the typo column cannot claim it
+    assert mapping["Property Adress"][0] != "Property Address"
+    assert mapping["Property Cty"][0] == "Property City"
+    assert mapping["Property Cty"][2].startswith("Fuzzy")
+    assert mapping["Zzz"][0] is None
+
+
+def test_propose_mapping_is_memoized_by_columns_and_rules() -> None:
+    """Repeated proposals come from the cache; editing rules invalidates it."""
+    ds._PROPOSAL_CACHE.clear()
+    rules = {"fuzzy_threshold": 80}
+    standardizer = DataStandardizer(PETE_HEADERS, rules)
+    columns = ["Property Address", "Phone One"]
+
+    first = standardizer.propose_mapping(columns)
+    second = standardizer.propose_mapping(columns)
+    assert first == second
+    assert first is not second  # callers may edit their copy
+    assert len(ds._PROPOSAL_CACHE) == 1
+
+    # Rules are edited in place by the mapping UI
+    rules["never_map"] = ["phone"]
+    third = standardizer.propose_mapping(columns)
+    assert third["Phone One"][0] is None
+    assert len(ds._PROPOSAL_CACHE) == 2
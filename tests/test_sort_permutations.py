@@ -0,0 +1,89 @@
+"""Tests for cached sort permutations and the table sorters built on them."""
+
+import random
+
+import numpy as np
+import pytest
+from PyQt5.QtWidgets import QApplication, QTableWidget
+
+from backend.utils.efficient_table_manager import EfficientTableManager, SortOrder
+from backend.utils.enhanced_owner_analyzer import EnhancedOwnerObject
+from backend.utils.sort_permutations import SortPermutationCache
+from frontend.components.owner_dashboard.owner_dashboard_utils import OwnerDataSorter
+
+COLUMNS = [
+    {'name': 'Owner Name', 'key': 'individual_name'},
+    {'name': 'Property Count', 'key': 'property_count', 'numeric': True},
+    {'name': 'Total Value', 'key': 'total_property_value', 'numeric': True},
+]
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def _owners(n: int = 1000, seed: int = 3):
+    rng = random.Random(seed)
+    return [EnhancedOwnerObject(individual_name=rng.choice(["Ann", "bob", "Émile", "", "Zed"]) + str(rng.randint(0, 9)),
+                                property_count=rng.randint(1, 4),
+                                total_property_value=rng.choice([0.0, 5e4, 2.5e5]))
+            for _ in range(n)]
+
+
+def test_permutations_match_sorted_and_are_reused() -> None:
+    owners = _owners()
+    cache = SortPermutationCache()
+
+    order = cache.permutation(owners, "individual_name")
+    assert [owners[i] for i in order] == sorted(owners, key=lambda o: o.individual_name)
+    order = cache.permutation(owners, "total_property_value", numeric=True)
+    assert [owners[i] for i in order] == sorted(owners, key=lambda o: o.total_property_value)
+    descending = cache.permutation(owners, "total_property_value", numeric=True, descending=True)
+    assert [owners[i] for i in descending] == sorted(owners, key=lambda o: o.total_property_value, reverse=True)
+
+    rows = np.array([o.property_count > 2 for o in owners])
+    subset = cache.permutation(owners, "individual_name", rows=rows)
+    assert [owners[i] for i in subset] == sorted([o for o in owners if o.property_count > 2],
+                                                 key=lambda o: o.individual_name)
+
+    version = cache.version
+    cache.permutation(owners, "individual_name")
+    assert cache.version == version
+    cache.permutation(_owners(seed=4), "individual_name")  # same size, other dataset
+    assert cache.version == version + 1
+
+
+def test_multi_key_sort_uses_lexsort_of_ranks() -> None:
+    owners = _owners()
+    sorter = OwnerDataSorter()
+
+    order = sorter.sort_permutation(owners, [(1, SortOrder.DESCENDING), (0, SortOrder.ASCENDING)], COLUMNS)
+    assert [owners[i] for i in order] == sorted(owners, key=lambda o: (-o.property_count, o.individual_name))
+
+    other = _owners(seed=5)
+    assert sorter.sort_owners(other, 2, SortOrder.ASCENDING, COLUMNS) == sorted(
+        other, key=lambda o: o.total_property_value)
+    assert sorter.sort_owners(owners, 5, SortOrder.ASCENDING, COLUMNS) is owners
+
+
+def test_table_manager_sorts_filtered_rows_without_printing(app, capsys) -> None:
+    owners = _owners(300)
+    manager = EfficientTableManager(QTableWidget(), page_size=50)
+    manager.set_data(owners, COLUMNS)
+    manager._on_sort_changed(2, SortOrder.DESCENDING)
+    values = [o.total_property_value for o in manager.filtered_data]
+    assert values == sorted(values, reverse=True)
+
+    manager.apply_filter(lambda o: o.property_count == 1)
+    assert all(o.property_count == 1 for o in manager.filtered_data)
+    assert [o.total_property_value for o in manager.filtered_data] == sorted(
+        (o.total_property_value for o in manager.filtered_data), reverse=True)
+
+    manager._on_sort_changed(0, SortOrder.ASCENDING)
+    assert manager.filtered_data == sorted([o for o in owners if o.property_count == 1],
+                                           key=lambda o: o.individual_name)
+    manager.clear_filter()
+    assert len(manager.filtered_data) == len(owners)
+    assert manager.table.rowCount() == 50
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,61 @@
+"""Tests for read-time source profiles (schema overrides)."""
+
+import pandas as pd
+
+from backend.utils.high_performance_processor import HighPerformanceProcessor
+from backend.utils.source_profiles import REISIFT, cleanup_columns, detect_profile, read_source
+
+
+def _write_reisift_csv(path) -> None:
+    pd.DataFrame(
+        {
+            "Owner": ["Bob", "Ann", "Cy"],
+            "MLS Status": ["Active", "", "Sold"],
+            "Phone 1": ["4055551234", None, "4055559999"],
+            "Phone Type 1": ["MOBILE", "", "LANDLINE"],
+            "Property Zip": ["01234", "73102", None],
+            "Parcel ID": ["0012345", "0098765", "0011111"],
+            "Bedrooms": [3, None, 2],
+        }
+    ).to_csv(path, index=False)
+
+
+def test_reisift_profile_matches_identifier_columns() -> None:
+    """Phone N, ZIP and parcel headers are text; phone metadata is not."""
+    columns = ["Phone 1", "Phone 12", "Phone Type 1", "Mailing Zip", "APN", "Parcel ID", "Bedrooms"]
+
+    assert REISIFT.text_columns(columns) == ["Phone 1", "Phone 12", "Mailing Zip", "APN", "Parcel ID"]
+    assert detect_profile(["Owner", "MLS Status"]) is REISIFT
+    assert detect_profile(["Owner", "Phone 1"]) is None
+
+
+def test_read_source_keeps_identifiers_as_text(tmp_path) -> None:
+    """No trailing .0 and no lost leading zeros, so no cleanup is needed."""
+    path = tmp_path / "export.csv"
+    _write_reisift_csv(path)
+
+    df, profile = read_source(path)
+
+    assert profile is REISIFT
+    assert df["Phone 1"].tolist()[::2] == ["4055551234", "4055559999"]
+    assert df["Property Zip"].tolist()[:2] == ["01234", "73102"]
+    assert df["Parcel ID"].tolist() == ["0012345", "0098765", "0011111"]
+    assert df["Bedrooms"].dtype == "float64"  # untouched columns keep inference
+    assert "Phone 1" not in cleanup_columns(df, profile)
+
+    plain, none = read_source(path, profile=None)
+    assert none is None
+    assert plain["Phone 1"].dtype == "float64"
+
+
+def test_polars_loader_passes_schema_overrides(tmp_path) -> None:
+    """The Polars CSV loader reads profile columns as Utf8."""
+    path = tmp_path / "export.csv"
+    _write_reisift_csv(path)
+    processor = HighPerformanceProcessor()
+
+    df = processor.load_csv(path)
+
+    assert processor.source_profile is REISIFT
+    assert df["Phone 1"].tolist() == ["4055551234", None, "4055559999"]
+    assert df["Property Zip"].tolist() == ["01234", "73102", None]
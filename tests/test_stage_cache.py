@@ -0,0 +1,111 @@
+"""Tests for the Arrow IPC stage cache and cached reruns of the batch pipeline."""
+
+import csv
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.batch_pipeline import PipelineConfig, run_pipeline_batch
+from backend.utils.stage_cache import StageCache, stage_key
+
+
+def _upload(path, rows: int):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["First Name", "Last Name", "Property address", "Phone 1", "Phone Status 1",
+                         "Phone Type 1", "Phone 2", "Phone Status 2", "Phone Type 2", "Estimated value"])
+        for i in range(rows):
+            writer.writerow([f"F{i % 25}", "Jones", f"{i} Pine St", f"405555{i:04d}.0", "WRONG", "MOBILE",
+                             f"405777{i:04d}", "CORRECT", "LANDLINE", 90000 + i])
+
+
+def _frame(rows: int = 50) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Phone 1': [f"405555{i:04d}" if i % 5 else None for i in range(rows)],
+        'Value': [float(i) if i % 7 else np.nan for i in range(rows)],
+        'Count': np.arange(rows, dtype=np.int64),
+        'Flag': [i % 2 == 0 for i in range(rows)],
+    })
+
+
+def test_entries_round_trip_and_keys_follow_inputs_and_config(tmp_path) -> None:
+    cache = StageCache(tmp_path / "cache")
+    key = stage_key("prioritize", ["upstream"], {'max_phones': 5})
+    assert key == stage_key("prioritize", ["upstream"], {'max_phones': 5})
+    assert len({key, stage_key("prioritize", ["upstream"], {'max_phones': 4}),
+                stage_key("prioritize", ["other"], {'max_phones': 5}),
+                stage_key("filter", ["upstream"], {'max_phones': 5})}) == 4
+
+    frame = _frame()
+    assert cache.get(key) is None
+    assert cache.put(key, "prioritize", frame, {'mapped_columns': 3}, objects=[{'owner': 1}])
+    cached = cache.get(key)
+    pd.testing.assert_frame_equal(cached.frame, frame)
+    assert cached.meta == {'mapped_columns': 3} and cached.objects == [{'owner': 1}]
+    assert key in cache and cache.entries()[0]['rows'] == 50
+
+    # Frames Arrow cannot represent are not cached; damaged entries are dropped
+    mixed = pd.DataFrame({'mixed': [1, "two", 3.0]})
+    assert not cache.put("mixed", "map", mixed) and "mixed" not in cache
+    (tmp_path / "cache" / key / "frame.arrow").write_bytes(b"not arrow")
+    assert cache.get(key) is None and key not in cache
+    assert not [p for p in (tmp_path / "cache").iterdir()]
+
+
+def test_eviction_drops_expired_then_least_recently_used_entries(tmp_path) -> None:
+    cache = StageCache(tmp_path / "cache")
+    now = time.time()
+    for i, age_days in enumerate([30, 3, 2, 1]):
+        cache.put(f"k{i}", "load", _frame(2000))
+        os.utime(tmp_path / "cache" / f"k{i}" / "meta.json", (now, now - age_days * 86400))
+    size = cache.entries()[0]['size_bytes']
+
+    cache.get("k1")  # used now: most recent
+    result = cache.evict(max_bytes=2 * size, max_age_days=14)
+    assert result['removed'] == 2 and result['kept_bytes'] <= 2 * size
+    assert sorted(meta['key'] for meta in cache.entries()) == ["k1", "k3"]
+    assert cache.evict()['removed'] == 0
+
+
+def test_rerun_recomputes_only_from_the_first_changed_stage(tmp_path) -> None:
+    _upload(tmp_path / "leads.csv", rows=90)
+    config = dict(processed_dir=str(tmp_path / "processed"), presets_dir=str(tmp_path / "presets"),
+                  cache_dir=str(tmp_path / "cache"), save_preset=False)
+
+    def run(run_id, use_cache=True, **overrides):
+        manifest = run_pipeline_batch([tmp_path / "leads.csv"], PipelineConfig(**config, **overrides),
+                                      output_dir=tmp_path / "runs", workers=1, run_id=run_id,
+                                      use_cache=use_cache)
+        assert manifest['status'] == "succeeded"
+        stages = manifest['files'][0]['stages']
+        computed = [name for name, stage in stages.items() if stage['status'] == "completed" and not stage['cached']]
+        return computed, stages, tmp_path / "runs" / run_id / "leads" / "pete_export.csv"
+
+    computed, _, cold_export = run("cold")
+    assert computed == ["load", "clean", "filter", "prioritize", "owners", "map", "standardize", "preset", "export"]
+
+    computed, stages, warm_export = run("warm")
+    assert computed == ["preset", "export"]
+    assert [name for name, stage in stages.items() if stage['cached']] == ["load", "owners", "standardize"]
+    assert [name for name, stage in stages.items() if stage['status'] == "skipped"] == [
+        "clean", "filter", "prioritize", "map"]
+    assert warm_export.read_text() == cold_export.read_text()
+
+    columns = list(pd.read_csv(cold_export).columns[:3])
+    computed, _, export = run("columns", export_columns=columns)
+    assert computed == ["preset", "export"] and list(pd.read_csv(export).columns) == columns
+
+    weights = {'status_weights': {'CORRECT': 10, 'WRONG': 90}}
+    computed, stages, _ = run("weights", phone_prioritization_rules=weights)
+    assert computed == ["prioritize", "owners", "map", "standardize", "preset", "export"]
+    assert stages['filter']['cached'] and stages['clean']['status'] == "skipped"
+
+    before = sorted(p.name for p in (tmp_path / "cache").iterdir())
+    computed, _, export = run("no-cache", use_cache=False)
+    assert len(computed) == 9 and export.read_text() == cold_export.read_text()
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == before
+    manifest = json.loads((tmp_path / "runs" / "no-cache" / "manifest.json").read_text())
+    assert manifest['cache'] == {'dir': None} and manifest['totals']['cache_hits'] == 0
@@ -0,0 +1,74 @@
+"""Startup time budget and lazy imports of the GUI."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from frontend.utils.startup import (
+    HEAVY_MODULES, PROJECT_ROOT, STARTUP_BUDGET_MS, _subprocess_env,
+    measure_startup, parse_importtime, preload_in_background
+)
+
+
+def _run(code: str, cwd=PROJECT_ROOT) -> str:
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=_subprocess_env(),
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_main_window_import_stays_within_budget() -> None:
+    profile = measure_startup(runs=2)
+
+    assert profile.loaded() == [], profile.slowest()
+    assert 0 < profile.total_ms < STARTUP_BUDGET_MS, profile.slowest()
+
+
+def test_packages_import_components_on_first_use(tmp_path) -> None:
+    # A saved preset with a CSV sample: the dashboard summary must not read it
+    preset_dir = tmp_path / "data" / "presets" / "saved_presets" / "p1"
+    preset_dir.mkdir(parents=True)
+    (preset_dir / "metadata.json").write_text(json.dumps({
+        'preset_id': "p1", 'preset_name': "P1", 'data_source': "test",
+        'created_at': "2026-01-01T00:00:00", 'summary': {},
+    }))
+    (preset_dir / "original_data_sample.csv").write_text("a,b\n1,2\n")
+
+    heavy = repr(HEAVY_MODULES)
+    out = _run(
+        "import sys\n"
+        "from PyQt5.QtWidgets import QApplication\n"
+        "app = QApplication([])\n"
+        "from frontend.main_window import MainWindow\n"
+        "from frontend.components import StartupMenu\n"
+        "from frontend.dialogs import SettingsDialog\n"
+        "window = MainWindow()\n"
+        f"print(sorted(m for m in {heavy} if m in sys.modules))\n"
+        "from frontend.components import DataPrepEditor\n"
+        "print('pandas' in sys.modules)\n",
+        cwd=tmp_path,
+    )
+    assert out.splitlines()[-2:] == ["[]", "True"]
+
+    import frontend.components
+    with pytest.raises(AttributeError):
+        frontend.components.NoSuchComponent
+
+
+def test_importtime_parsing_and_preloading() -> None:
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     json.decoder",
+        "import time:       300 |        420 |   json",
+        "import time:        80 |        500 | app.main",
+    ])
+    profile = parse_importtime(output, "app.main")
+    assert profile.total_us == 500
+    assert profile.slowest(1) == [("json", 0.3)]
+    assert profile.loaded(("json", "pandas")) == ["json"]
+
+    thread = preload_in_background(["json", "no_such_module_for_preload"])
+    thread.join(timeout=10)
+    assert not thread.is_alive()
@@ -4,6 +4,7 @@ from typing import List
 
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 
 from backend.utils import trailing_dot_cleanup as tdc
@@ -47,3 +48,67 @@ def test_clean_dataframe_auto_detect() -> None:
     df = pd.DataFrame({"Col": [1.0, 2.0, 3.0], "Other": ["X", "Y", "Z"]})
     cleaned = tdc.clean_dataframe(df)
     assert cleaned["Col"].tolist() == ["1", "2", "3"]
+
+
+def test_strip_trailing_dot_zero_frame_single_pass() -> None:
+    """Text loses numeric .0; whole-number float columns become integer text."""
+    df = pl.DataFrame(
+        {
+            "Phone 1": [4098880401.0, None, 8702853184.0],
+            "Price": [1.5, 2.0, None],
+            "Zip": ["73034.0", "ABC.0", None],
+            "Skip": ["1.0", "2.0", "3.0"],
+        }
+    )
+
+    cleaned = tdc.strip_trailing_dot_zero_frame(df, columns=["Phone 1", "Price", "Zip"])
+
+    assert cleaned["Phone 1"].to_list() == ["4098880401", None, "8702853184"]
+    assert cleaned["Price"].dtype == pl.Float64  # not all whole numbers
+    assert cleaned["Zip"].to_list() == ["73034", "ABC.0", None]
+    assert cleaned["Skip"].to_list() == ["1.0", "2.0", "3.0"]
+
+    every_float = tdc.strip_trailing_dot_zero_frame(df, float_columns="all")
+    assert every_float["Price"].to_list() == ["1.5", "2", None]
+
+
+def test_benchmark_cleanup_reports_each_size() -> None:
+    """The micro-benchmark times every requested column count."""
+    results = tdc.benchmark_cleanup(column_counts=(3, 6), n_rows=50)
+    assert set(results) == {3, 6}
+    assert set(results[3]) == {"kernel", "per_column_loop", "cell_apply"}
+
+
+def _baseline_clean(series: pd.Series) -> List[str]:
+    """The original per-cell cleanup that clean_dataframe must reproduce."""
+    return series.apply(tdc.strip_trailing_dot_zero).tolist()
+
+
+def test_clean_dataframe_matches_per_cell_rendering() -> None:
+    """Floats render with str() and text keeps the str.isdigit() rule."""
+    df = pd.DataFrame(
+        {
+            "Float": [1e-05, 2.5e-07, -0.0, 0.0, 4098880401.0, 1e16, -4.0, 1.5, np.nan],
+            "Text": ["²3.0", "٣4.0", "123.0", "ABC.0", "-4.0", "1.0.0", "", None, "7"],
+        }
+    )
+
+    cleaned = tdc.clean_dataframe(df)
+
+    assert cleaned["Float"].tolist() == _baseline_clean(df["Float"])
+    assert cleaned["Float"].tolist()[:3] == ["1e-05", "2.5e-07", "-0.0"]
+    assert cleaned["Text"].tolist() == _baseline_clean(df["Text"])
+    assert cleaned["Text"].tolist()[0] == "²3"
+
+
+def test_fast_cleanup_keeps_float_columns_numeric() -> None:
+    """The fast processors only rewrite text columns; prices stay floats."""
+    from backend.utils.high_performance_processor import clean_dataframe_fast
+    from backend.utils.ultra_fast_processor import clean_dataframe_ultra_fast
+
+    df = pd.DataFrame({"Price": [100.0, 250.0], "Zip": ["73034.0", "ABC.0"]})
+
+    for clean in (clean_dataframe_fast, clean_dataframe_ultra_fast):
+        cleaned = clean(df)
+        assert pd.api.types.is_float_dtype(cleaned["Price"])
+        assert cleaned["Zip"].tolist() == ["73034", "ABC.0"]
@@ -0,0 +1,76 @@
+"""Tests for the copy-on-write data version history."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from frontend.data_prep.version_manager import DataVersionManager
+
+
+def _frame(n: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Owner": [f"Owner {i}" for i in range(n)],
+            "Phone 1": [f"405555{i:04d}" if i % 3 else None for i in range(n)],
+            "Value": np.arange(n, dtype=float),
+        }
+    )
+
+
+def test_unchanged_columns_are_shared_between_versions() -> None:
+    """Renames, merges and reorders only store the columns that changed."""
+    manager = DataVersionManager()
+    manager.save_version(_frame(), "Initial Upload")
+
+    current = manager.get_current_data()
+    renamed = current.rename(columns={"Owner": "Seller"})
+    manager.save_version(renamed, "Renamed column")
+    merged = renamed.assign(Notes=renamed["Seller"] + " / " + renamed["Value"].astype(str))
+    manager.save_version(merged[["Notes"] + list(renamed.columns)], "Merged 2 columns")
+
+    assert manager.get_summary()["stored_columns"] == 4
+    assert list(manager.get_current_data().columns) == ["Notes", "Seller", "Phone 1", "Value"]
+    assert manager.undo().columns.tolist() == ["Seller", "Phone 1", "Value"]
+    pd.testing.assert_frame_equal(manager.undo(), _frame())
+
+
+def test_current_data_is_read_only_without_copying() -> None:
+    """Readers share the stored arrays; writable=True returns a copy."""
+    manager = DataVersionManager()
+    manager.save_version(_frame(), "Initial Upload")
+
+    current = manager.get_current_data()
+    with pytest.raises(ValueError):
+        current.loc[0, "Value"] = -1.0
+    assert np.shares_memory(current["Value"].to_numpy(), manager.get_current_data()["Value"].to_numpy())
+
+    writable = manager.get_current_data(writable=True)
+    writable.loc[0, "Value"] = -1.0
+    assert manager.get_current_data()["Value"].iloc[0] == 0.0
+
+
+def test_old_versions_spill_to_disk_past_the_budget(tmp_path) -> None:
+    """Columns of distant versions are written as Arrow IPC and mapped back on undo."""
+    manager = DataVersionManager(memory_budget_mb=0.05, spill_dir=str(tmp_path))
+    original = _frame(2000)
+    original["Notes"] = pd.Series(["called", np.nan, None] * 666 + ["called", np.nan], dtype=object)
+    original["Units"] = pd.array([1, None] * 1000, dtype="Int64")
+    manager.save_version(original, "Initial Upload")
+    for i in range(3):
+        edited = manager.get_current_data(writable=True)
+        edited["Owner"] = edited["Owner"] + f" #{i}"
+        edited["Value"] = edited["Value"] + 1
+        edited["Notes"] = edited["Notes"].map(lambda v: v + "!" if isinstance(v, str) else v)
+        edited["Units"] = edited["Units"] + 1
+        manager.save_version(edited, f"Edit {i}")
+
+    assert manager.get_summary()["spilled_columns"] > 0
+    assert list(tmp_path.glob("*.arrow"))
+
+    while manager.can_undo():
+        restored = manager.undo()
+    assert restored["Owner"].tolist() == original["Owner"].tolist()
+    assert restored["Value"].tolist() == original["Value"].tolist()
+    assert restored["Phone 1"].isna().sum() == original["Phone 1"].isna().sum()
+    assert [type(v) for v in restored["Notes"]] == [type(v) for v in original["Notes"]]  # NaN stays NaN
+    assert restored["Units"].dtype == "Int64" and restored["Units"].equals(original["Units"])